@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Benchmark for button template matching
+
+Measures per-lookup latency of the template matcher on synthetic screenshots
+(no display, PyAutoGUI or Pillow needed): a full-screen search, a search with a
+configured search_region, and a repeated lookup that hits the learned region
+around the previous match.
+
+Usage:
+    python3 benchmark_template_matcher.py [width] [height]
+"""
+
+import random
+import sys
+import time
+
+from src.gh_pr_phase_monitor.template_matcher import GrayImage, TemplateMatcher, find_template
+
+
+def make_synthetic_screen(width: int, height: int, seed: int = 0) -> GrayImage:
+    """Build a synthetic screenshot: a light page with gray boxes and text-like noise
+
+    Args:
+        width: Screen width
+        height: Screen height
+        seed: Random seed
+
+    Returns:
+        Synthetic screenshot
+    """
+    rng = random.Random(seed)
+    rows = [bytearray([246]) * width for _ in range(height)]
+    # Panels and bars of various gray levels
+    for _ in range(60):
+        w, h = rng.randint(40, width // 3), rng.randint(8, height // 6)
+        x, y = rng.randint(0, width - w), rng.randint(0, height - h)
+        level = rng.randint(180, 240)
+        for row in rows[y : y + h]:
+            row[x : x + w] = bytes([level]) * w
+    # Text-like noise lines
+    for _ in range(250):
+        w = rng.randint(30, 300)
+        x, y = rng.randint(0, width - w), rng.randint(0, height - 10)
+        for row in rows[y : y + 8]:
+            row[x : x + w] = bytes(rng.choice((40, 90, 246, 246)) for _ in range(w))
+    return GrayImage(width, height, [bytes(row) for row in rows])
+
+
+def place_button(screen: GrayImage, left: int, top: int, width: int = 140, height: int = 32) -> GrayImage:
+    """Draw a green-ish (dark) button with a label-like pattern and return it as a template
+
+    Args:
+        screen: Screen image to draw on (modified in place)
+        left: Left edge of the button
+        top: Top edge of the button
+        width: Button width
+        height: Button height
+
+    Returns:
+        The button image (template)
+    """
+    for dy in range(height):
+        row = bytearray(screen.rows[top + dy])
+        for dx in range(width):
+            border = dy in (0, height - 1) or dx in (0, width - 1)
+            label = 10 <= dy < height - 10 and 20 <= dx < width - 20 and (dx // 3 + dy // 4) % 3 == 0
+            row[left + dx] = 30 if border else (250 if label else 70)
+        screen.rows[top + dy] = bytes(row)
+    return screen.crop(left, top, width, height)
+
+
+def _measure(label: str, lookup, runs: int = 5) -> None:
+    timings = []
+    result = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = lookup()
+        timings.append(time.perf_counter() - start)
+    found = f"found at ({result.left}, {result.top}) score={result.score:.3f}" if result else "not found"
+    print(f"  {label:<38} min {min(timings) * 1000:8.1f} ms  avg {sum(timings) / runs * 1000:8.1f} ms  {found}")
+
+
+def full_screen_lookup(matcher: TemplateMatcher):
+    """Look up the button on the entire screen, reusing the cached template but not the last hit"""
+    matcher._last_hits.clear()
+    return matcher.locate("button.png", 0.9)
+
+
+def main():
+    width = int(sys.argv[1]) if len(sys.argv) > 1 else 1920
+    height = int(sys.argv[2]) if len(sys.argv) > 2 else 1080
+    print(f"Template matching benchmark (synthetic {width}x{height} screen)")
+    print("=" * 60)
+
+    screen = make_synthetic_screen(width, height)
+    template = place_button(screen, int(width * 0.62), int(height * 0.71))
+
+    matcher = TemplateMatcher(
+        screen_provider=lambda region: screen if region is None else screen.crop(*region),
+        template_loader=lambda _path: template,
+    )
+    region = (width // 2, height // 2, width // 2, height // 2)
+
+    _measure("full screen (no cache)", lambda: find_template(screen, template, 0.9))
+    _measure(
+        "full screen (cached template)",
+        lambda: full_screen_lookup(matcher),
+    )
+    _measure("search_region (quarter screen)", lambda: find_template(screen.crop(*region), template, 0.9))
+    matcher.locate("button.png", 0.9)
+    _measure("learned region (last hit)", lambda: matcher.locate("button.png", 0.9))
+
+
+if __name__ == "__main__":
+    main()
@@ -9,7 +9,15 @@ from .comment_manager import (
     has_copilot_apply_comment,
     post_phase2_comment,
 )
-from .config import get_assign_to_copilot_config, get_config_mtime, get_phase3_merge_config, load_config, parse_interval
+from .config import (
+    CompiledConfig,
+    get_assign_to_copilot_config,
+    get_config_mtime,
+    get_duration_setting,
+    get_phase3_merge_config,
+    load_config,
+    parse_interval,
+)
 from .display import display_issues_from_repos_without_prs, display_status_summary
 from .github_client import (
     get_current_user,
@@ -43,7 +51,9 @@ __all__ = [
     "Colors",
     "colorize_phase",
     # Config
+    "CompiledConfig",
     "get_config_mtime",
+    "get_duration_setting",
     "load_config",
     "parse_interval",
     "get_phase3_merge_config",
@@ -0,0 +1,235 @@
+"""
+Parallel action executor for PR processing
+
+Runs the per-PR processing (mark ready, comment, notify, merge) for different
+PRs concurrently on a worker pool, while:
+
+- Keeping causal order within a PR: all actions of one PR run in a single task,
+  so the pre-merge comment is always posted before the merge.
+- Capping concurrent content-creating requests (comments, ready, merge) to
+  respect GitHub's secondary rate limits, which discourage concurrent mutations.
+- Serializing browser operations, which share the browser open cooldown and
+  the screen used by PyAutoGUI.
+- Recording per-action latency and printing a summary after each batch.
+
+Output printed while processing a PR is buffered per PR and written in the
+original PR order, so concurrent PRs do not interleave their lines.
+"""
+
+import io
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from .config import DEFAULT_MAX_PARALLEL_ACTIONS, DEFAULT_MAX_PARALLEL_CONTENT_REQUESTS
+
+# Semaphore limiting concurrent content-creating requests (resized by configure_action_limits)
+_content_request_semaphore = threading.BoundedSemaphore(DEFAULT_MAX_PARALLEL_CONTENT_REQUESTS)
+_content_request_limit = DEFAULT_MAX_PARALLEL_CONTENT_REQUESTS
+
+# Lock serializing browser operations (webbrowser + PyAutoGUI)
+_browser_lock = threading.RLock()
+
+# Set while actions are paused (control API); PRs are still fetched and displayed
+_actions_paused = threading.Event()
+
+# Called with the new paused flag on pause and resume (browser queue and browser worker)
+_pause_listeners: List[Callable[[bool], None]] = []
+
+# Per-action latencies of the current batch: action name -> list of seconds
+_action_latencies: Dict[str, List[float]] = {}
+_latency_lock = threading.Lock()
+
+
+def configure_action_limits(config: Optional[Dict[str, Any]]) -> None:
+    """Apply max_parallel_content_requests from the configuration
+
+    Args:
+        config: Configuration dictionary (can be None)
+    """
+    global _content_request_semaphore, _content_request_limit
+    limit = (config or {}).get("max_parallel_content_requests", DEFAULT_MAX_PARALLEL_CONTENT_REQUESTS)
+    if limit != _content_request_limit:
+        _content_request_semaphore = threading.BoundedSemaphore(limit)
+        _content_request_limit = limit
+
+
+def add_pause_listener(listener: Callable[[bool], None]) -> None:
+    """Register a function called with the paused flag whenever actions are paused or resumed
+
+    Args:
+        listener: Function taking the new paused flag
+    """
+    _pause_listeners.append(listener)
+
+
+def pause_actions() -> None:
+    """Stop running PR actions, issue auto-assignment and queued browser operations until resume_actions()"""
+    _actions_paused.set()
+    for listener in _pause_listeners:
+        listener(True)
+
+
+def resume_actions() -> None:
+    """Run actions again; PRs skipped while paused are processed by the next full reconcile"""
+    _actions_paused.clear()
+    for listener in _pause_listeners:
+        listener(False)
+
+
+def are_actions_paused() -> bool:
+    """Check if actions are paused"""
+    return _actions_paused.is_set()
+
+
+def record_action_latency(action_name: str, seconds: float) -> None:
+    """Record the latency of a single action
+
+    Args:
+        action_name: Action name (e.g., "comment", "merge")
+        seconds: Elapsed time in seconds
+    """
+    with _latency_lock:
+        _action_latencies.setdefault(action_name, []).append(seconds)
+
+
+@contextmanager
+def content_request(action_name: str) -> Iterator[None]:
+    """Run a content-creating request within the global concurrency limit
+
+    Args:
+        action_name: Action name used for latency reporting
+    """
+    semaphore = _content_request_semaphore
+    with semaphore:
+        start_time = time.monotonic()
+        try:
+            yield
+        finally:
+            record_action_latency(action_name, time.monotonic() - start_time)
+
+
+@contextmanager
+def browser_operation(action_name: str) -> Iterator[None]:
+    """Run a browser operation exclusively (one at a time across all workers)
+
+    Args:
+        action_name: Action name used for latency reporting
+    """
+    with _browser_lock:
+        start_time = time.monotonic()
+        try:
+            yield
+        finally:
+            record_action_latency(action_name, time.monotonic() - start_time)
+
+
+def get_action_latency_summary() -> Dict[str, Tuple[int, float, float]]:
+    """Get latency statistics for the actions recorded since the last reset
+
+    Returns:
+        Dictionary of action name -> (count, average seconds, max seconds)
+    """
+    with _latency_lock:
+        return {
+            name: (len(values), sum(values) / len(values), max(values))
+            for name, values in _action_latencies.items()
+            if values
+        }
+
+
+def reset_action_latencies() -> None:
+    """Clear the recorded action latencies"""
+    with _latency_lock:
+        _action_latencies.clear()
+
+
+def print_action_latency_summary() -> None:
+    """Print the per-action latency summary, if any actions were recorded"""
+    summary = get_action_latency_summary()
+    if not summary:
+        return
+    print("  Action latency:")
+    for name, (count, average, maximum) in sorted(summary.items()):
+        print(f"    {name}: {count} call(s), avg {average:.2f}s, max {maximum:.2f}s")
+
+
+class _PerThreadStdout(io.TextIOBase):
+    """stdout proxy that sends writes from worker threads to a per-thread buffer"""
+
+    def __init__(self, target):
+        self._target = target
+        self._local = threading.local()
+
+    def start_buffer(self) -> None:
+        self._local.buffer = io.StringIO()
+
+    def pop_buffer(self) -> str:
+        buffer = getattr(self._local, "buffer", None)
+        self._local.buffer = None
+        return buffer.getvalue() if buffer is not None else ""
+
+    def write(self, text: str) -> int:
+        buffer = getattr(self._local, "buffer", None)
+        if buffer is not None:
+            return buffer.write(text)
+        return self._target.write(text)
+
+    def flush(self) -> None:
+        if getattr(self._local, "buffer", None) is None:
+            self._target.flush()
+
+
+def execute_pr_actions(
+    items: List[Tuple[Dict[str, Any], str]],
+    config: Optional[Dict[str, Any]],
+    process: Callable[[Dict[str, Any], Optional[Dict[str, Any]], str], None],
+) -> None:
+    """Process PRs, running different PRs concurrently
+
+    Args:
+        items: List of (pr, phase) tuples to process, in display order
+        config: Configuration dictionary (can be None)
+        process: Per-PR processing function, called as process(pr, config, phase)
+    """
+    if items and are_actions_paused():
+        print(f"  Actions paused: skipping {len(items)} PR(s)")
+        return
+
+    configure_action_limits(config)
+    reset_action_latencies()
+    max_workers = (config or {}).get("max_parallel_actions", DEFAULT_MAX_PARALLEL_ACTIONS)
+
+    if max_workers == 1 or len(items) <= 1:
+        for pr, phase in items:
+            process(pr, config, phase)
+        print_action_latency_summary()
+        return
+
+    real_stdout = sys.stdout
+    proxy = _PerThreadStdout(real_stdout)
+
+    def run(pr: Dict[str, Any], phase: str) -> str:
+        proxy.start_buffer()
+        try:
+            process(pr, config, phase)
+        finally:
+            output = proxy.pop_buffer()
+        return output
+
+    sys.stdout = proxy
+    try:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items)), thread_name_prefix="pr-action") as pool:
+            futures = [pool.submit(run, pr, phase) for pr, phase in items]
+            # Write each PR's output in the original order as soon as it (and its predecessors) finish.
+            # An exception from a PR propagates to the caller, as with serial processing.
+            for future in futures:
+                real_stdout.write(future.result())
+                real_stdout.flush()
+    finally:
+        sys.stdout = real_stdout
+
+    print_action_latency_summary()
@@ -0,0 +1,220 @@
+"""
+Durable action journal (outbox) for side-effecting actions
+
+Every side-effecting action (ready, comment, ntfy, merge, assign) is written to
+an append-only JSON Lines journal before it runs and again when it finishes,
+under an idempotency key derived from (URL, phase, action). On startup the
+journal is replayed, so a crash, timeout or restart between two steps (e.g.,
+between the pre-merge comment and the merge) neither duplicates the comment
+nor loses the merge.
+
+- Non-idempotent actions (comments, ntfy, assign) run at most once: completed
+  and interrupted ("in doubt") entries are both skipped.
+- Idempotent actions (ready, merge) are always allowed to run again, since
+  GitHub rejects duplicates; the journal only records their outcome.
+
+The journal is disabled unless `action_journal` is set in the configuration.
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Optional, Set
+
+# Actions that must not be repeated once completed or interrupted
+AT_MOST_ONCE_ACTIONS = frozenset({"comment", "merge_comment", "ntfy", "assign"})
+
+# Completed entries older than this are dropped when the journal is compacted at startup
+JOURNAL_RETENTION_SECONDS = 30 * 24 * 60 * 60
+
+# Journal entry statuses
+STATUS_STARTED = "started"
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+
+
+def make_action_key(url: str, phase: str, action: str) -> str:
+    """Build the idempotency key of an action
+
+    Args:
+        url: URL of the PR or issue
+        phase: Phase the action belongs to (e.g., "phase3", "issue")
+        action: Action name (e.g., "merge_comment", "merge")
+
+    Returns:
+        Idempotency key
+    """
+    return f"{url}#{phase}#{action}"
+
+
+class ActionJournal:
+    """Append-only journal of side-effecting actions
+
+    Args:
+        path: Path of the JSON Lines journal file (created if missing)
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._completed: Set[str] = set()
+        self._in_doubt: Dict[str, str] = {}
+        self._replay()
+
+    def _replay(self) -> None:
+        """Load the journal, then compact it to the entries that still matter"""
+        last_entries: Dict[str, Dict[str, Any]] = {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        # A torn last line from a crash mid-write is ignored
+                        continue
+                    if isinstance(entry, dict) and "key" in entry:
+                        last_entries[entry["key"]] = entry
+        except FileNotFoundError:
+            return
+
+        for key, entry in last_entries.items():
+            status = entry.get("status")
+            if status == STATUS_DONE:
+                self._completed.add(key)
+            elif status == STATUS_STARTED:
+                self._in_doubt[key] = entry.get("action", "")
+
+        if self._in_doubt:
+            print(f"Action journal: {len(self._in_doubt)} action(s) were interrupted by a previous run")
+
+        # Rewrite the journal without superseded, failed and expired entries so it does not grow forever
+        cutoff = time.time() - JOURNAL_RETENTION_SECONDS
+        kept = [
+            entry
+            for key, entry in last_entries.items()
+            if entry.get("status") != STATUS_FAILED and (key in self._in_doubt or entry.get("time", 0) >= cutoff)
+        ]
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            for entry in kept:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.path)
+
+    def _append(self, key: str, status: str, action: str, url: str) -> None:
+        entry = {"key": key, "status": status, "action": action, "url": url, "time": time.time()}
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def begin(self, key: str, action: str, url: str) -> bool:
+        """Record that an action is about to run
+
+        Args:
+            key: Idempotency key (see make_action_key())
+            action: Action name
+            url: URL of the PR or issue
+
+        Returns:
+            True if the action should run. False for an at-most-once action that
+            already completed or was interrupted (idempotent actions always run)
+        """
+        with self._lock:
+            interrupted = self._in_doubt.pop(key, None) is not None
+            if action in AT_MOST_ONCE_ACTIONS:
+                if key in self._completed:
+                    return False
+                if interrupted:
+                    print(f"    Action journal: '{action}' was interrupted by a previous run; not repeating it")
+                    self._completed.add(key)
+                    self._append(key, STATUS_DONE, action, url)
+                    return False
+            self._append(key, STATUS_STARTED, action, url)
+            return True
+
+    def finish(self, key: str, action: str, url: str, success: bool) -> None:
+        """Record the outcome of an action started with begin()
+
+        Args:
+            key: Idempotency key
+            action: Action name
+            url: URL of the PR or issue
+            success: True if the action succeeded
+        """
+        with self._lock:
+            if success:
+                self._completed.add(key)
+            self._append(key, STATUS_DONE if success else STATUS_FAILED, action, url)
+
+    def is_done(self, key: str) -> bool:
+        """Check if an action with this key already completed
+
+        Args:
+            key: Idempotency key
+
+        Returns:
+            True if the action completed in this or a previous run
+        """
+        with self._lock:
+            return key in self._completed
+
+
+# Journal in use (None = journaling disabled)
+_journal: Optional[ActionJournal] = None
+
+
+def configure_action_journal(config: Optional[Dict[str, Any]], reopen: bool = False) -> Optional[ActionJournal]:
+    """Open (and replay) the journal configured by `action_journal`
+
+    The journal is only reopened when its path changes, e.g. on hot reload.
+
+    Args:
+        config: Configuration dictionary (can be None)
+        reopen: Replay the journal again even if its path is unchanged (e.g. after taking
+            over from another instance that wrote to it)
+
+    Returns:
+        The journal in use, or None if journaling is disabled
+    """
+    global _journal
+    path = (config or {}).get("action_journal", "")
+    if not path:
+        _journal = None
+    elif reopen or _journal is None or _journal.path != path:
+        _journal = ActionJournal(path)
+    return _journal
+
+
+def begin_action(url: str, phase: str, action: str) -> bool:
+    """Record that an action is about to run, if journaling is enabled
+
+    Args:
+        url: URL of the PR or issue
+        phase: Phase the action belongs to
+        action: Action name
+
+    Returns:
+        True if the action should run, False if the journal shows it must be skipped
+    """
+    if _journal is None:
+        return True
+    return _journal.begin(make_action_key(url, phase, action), action, url)
+
+
+def finish_action(url: str, phase: str, action: str, success: bool) -> None:
+    """Record the outcome of an action, if journaling is enabled
+
+    Args:
+        url: URL of the PR or issue
+        phase: Phase the action belongs to
+        action: Action name
+        success: True if the action succeeded
+    """
+    if _journal is not None:
+        _journal.finish(make_action_key(url, phase, action), action, url, success)
@@ -8,14 +8,16 @@ Important: Users must provide screenshots of the buttons they want to click.
 See README.ja.md for instructions on how to capture button screenshots.
 """
 
-import json
 import time
 import webbrowser
-from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, Optional
 
 from .config import DEFAULT_CHECK_PROCESS_BEFORE_AUTORAISE, is_process_running
+from .debug_artifacts import get_debug_artifact_store
+from .playwright_automation import assign_issue_to_copilot_playwright, is_playwright_backend, merge_pr_playwright
+from .readiness import DEFAULT_POLL_INTERVAL, DEFAULT_READY_TIMEOUT, record_time_to_ready, wait_for_ready
+from .template_matcher import GrayImage, Region, TemplateMatcher
 
 # PyAutoGUI imports are optional - will be imported only if automation is enabled
 try:
@@ -172,6 +174,28 @@ def _validate_button_delay(config: Dict[str, Any]) -> float:
     return button_delay
 
 
+def _validate_positive_seconds(config: Dict[str, Any], key: str, default: float) -> float:
+    """Validate and get a positive duration in seconds from configuration
+
+    Args:
+        config: Configuration dict
+        key: Setting name (e.g., "ready_timeout", "poll_interval")
+        default: Value used when the setting is missing or invalid
+
+    Returns:
+        Validated value in seconds
+    """
+    try:
+        value = float(config.get(key, default))
+        if value <= 0:
+            print(f"  ⚠ {key} must be positive, using default: {default}")
+            value = default
+    except (ValueError, TypeError):
+        print(f"  ⚠ Invalid {key} value in config, using default: {default}")
+        value = default
+    return value
+
+
 def _get_screenshot_path(button_name: str, config: Dict[str, Any]) -> Optional[Path]:
     """Get the path to the button screenshot image
 
@@ -198,10 +222,13 @@ def _get_screenshot_path(button_name: str, config: Dict[str, Any]) -> Optional[P
 def _save_debug_info(button_name: str, confidence: float, config: Dict[str, Any]) -> None:
     """Save debug information when image recognition fails
 
+    The screen (or the configured search_region) is captured here; encoding and
+    writing run in the background through the bounded debug artifact store.
+
     Args:
         button_name: Name of the button that failed to be found
         confidence: Confidence threshold that was used
-        config: Configuration dict with debug_dir setting
+        config: Configuration dict with debug_dir, debug_max_files, debug_max_bytes and debug_dedupe settings
     """
     if not PYAUTOGUI_AVAILABLE or pyautogui is None:
         return
@@ -217,44 +244,97 @@ def _save_debug_info(button_name: str, confidence: float, config: Dict[str, Any]
         print(f"  ⚠ Could not create debug directory '{debug_dir}': {e}")
         return
 
-    # Generate timestamp once for consistency between filename and JSON
-    now = datetime.now()
-    timestamp = now.strftime("%Y%m%d_%H%M%S_%f")  # Include microseconds for uniqueness
-
-    # Take screenshot of current screen
-    screenshot_filename = f"{button_name}_fail_{timestamp}.png"
-    screenshot_path = debug_dir / screenshot_filename
-
+    # Capture only the search region when one is configured
+    region = _get_search_region(config)
     try:
-        screenshot = pyautogui.screenshot()
-        screenshot.save(str(screenshot_path))
-        print(f"  ℹ Debug screenshot saved: {screenshot_path}")
+        screenshot = pyautogui.screenshot(region=region) if region else pyautogui.screenshot()
     except Exception as e:
         print(f"  ⚠ Could not save debug screenshot: {e}")
         return
 
-    # Save failure information to JSON
-    json_filename = f"{button_name}_fail_{timestamp}.json"
-    json_path = debug_dir / json_filename
-
     # Get template screenshot path and handle None case
     template_path = _get_screenshot_path(button_name, config)
     template_screenshot = str(template_path) if template_path else None
 
     failure_info = {
         "button_name": button_name,
-        "timestamp": now.isoformat(),  # Use the same datetime object for consistency
         "confidence": confidence,
-        "screenshot_path": str(screenshot_path),
         "template_screenshot": template_screenshot,
+        "search_region": list(region) if region else None,
     }
+    get_debug_artifact_store(debug_dir, config).submit(button_name, screenshot, failure_info)
 
-    try:
-        with open(json_path, "w", encoding="utf-8") as f:
-            json.dump(failure_info, f, indent=2, ensure_ascii=False)
-        print(f"  ℹ Debug info saved: {json_path}")
-    except Exception as e:
-        print(f"  ⚠ Could not save debug info JSON: {e}")
+
+# Image matchers for button lookups: pyautogui.locateOnScreen or the cached pyramid matcher
+IMAGE_MATCHER_PYAUTOGUI = "pyautogui"
+IMAGE_MATCHER_PYRAMID = "pyramid"
+
+# Pyramid matcher shared by all lookups, so decoded templates and last hit locations are reused
+_template_matcher: Optional[TemplateMatcher] = None
+
+
+def _capture_screen(region: Optional[Region]) -> GrayImage:
+    """Capture the screen (or a region clipped to the screen) as a grayscale image
+
+    Args:
+        region: (left, top, width, height), or None for the entire screen
+
+    Returns:
+        Grayscale screenshot
+    """
+    if region is not None:
+        screen_width, screen_height = pyautogui.size()
+        left, top = max(0, region[0]), max(0, region[1])
+        width = min(region[0] + region[2], screen_width) - left
+        height = min(region[1] + region[3], screen_height) - top
+        region = (left, top, max(1, width), max(1, height))
+    return GrayImage.from_pil(pyautogui.screenshot(region=region))
+
+
+def _get_search_region(config: Dict[str, Any]) -> Optional[Region]:
+    """Get the configured search_region for button lookups
+
+    Args:
+        config: Configuration dict with optional search_region = [left, top, width, height]
+
+    Returns:
+        Region tuple, or None to search the entire screen
+    """
+    region = config.get("search_region")
+    if region is None:
+        return None
+    if (
+        isinstance(region, (list, tuple))
+        and len(region) == 4
+        and all(isinstance(value, int) and not isinstance(value, bool) for value in region)
+        and region[2] > 0
+        and region[3] > 0
+    ):
+        return tuple(region)
+    print("  ⚠ search_region must be [left, top, width, height] with a positive size, searching the entire screen")
+    return None
+
+
+def _locate_button(screenshot_path: Path, confidence: float, config: Dict[str, Any]):
+    """Locate a button on screen with the configured image matcher
+
+    Args:
+        screenshot_path: Path to the button screenshot
+        confidence: Match confidence threshold
+        config: Configuration dict (image_matcher, search_region)
+
+    Returns:
+        Location with left/top/width/height (usable with pyautogui.center()), or None if not found
+    """
+    global _template_matcher
+    region = _get_search_region(config)
+    if config.get("image_matcher", IMAGE_MATCHER_PYAUTOGUI) == IMAGE_MATCHER_PYRAMID:
+        if _template_matcher is None:
+            _template_matcher = TemplateMatcher(_capture_screen)
+        return _template_matcher.locate(str(screenshot_path), confidence, region)
+    if region is not None:
+        return pyautogui.locateOnScreen(str(screenshot_path), confidence=confidence, region=region)
+    return pyautogui.locateOnScreen(str(screenshot_path), confidence=confidence)
 
 
 def _click_button_with_image(button_name: str, config: Dict[str, Any]) -> bool:
@@ -295,7 +375,7 @@ def _click_button_with_image(button_name: str, config: Dict[str, Any]) -> bool:
             "  ⚠ Make sure the correct GitHub browser window/tab is focused "
             "because the first matching button on the entire screen will be clicked."
         )
-        location = pyautogui.locateOnScreen(str(screenshot_path), confidence=confidence)
+        location = _locate_button(screenshot_path, confidence, config)
 
         if location is None:
             print(f"  ✗ Could not find button '{button_name}' on screen")
@@ -323,6 +403,75 @@ def _click_button_with_image(button_name: str, config: Dict[str, Any]) -> bool:
         return False
 
 
+def _wait_and_click_button(button_name: str, config: Dict[str, Any]) -> bool:
+    """Poll for a button until it appears, then click it immediately (readiness polling)
+
+    Args:
+        button_name: Name of the button screenshot file (without extension)
+        config: Configuration dict (ready_timeout, poll_interval, readiness_log and image settings)
+
+    Returns:
+        True if the button appeared before the deadline and was clicked, False otherwise
+    """
+    if not PYAUTOGUI_AVAILABLE or pyautogui is None:
+        print("  ✗ PyAutoGUI is not available")
+        return False
+
+    screenshot_path = _get_screenshot_path(button_name, config)
+    if screenshot_path is None:
+        print(f"  ✗ Screenshot not found for button '{button_name}'")
+        print(f"     Please save a screenshot as '{button_name}.png' in the screenshots directory")
+        print("     See README.ja.md for instructions")
+        return False
+
+    confidence = _validate_confidence(config)
+    ready_timeout = _validate_positive_seconds(config, "ready_timeout", DEFAULT_READY_TIMEOUT)
+    poll_interval = _validate_positive_seconds(config, "poll_interval", DEFAULT_POLL_INTERVAL)
+
+    try:
+        print(f"  → Waiting up to {ready_timeout:g} seconds for button '{button_name}'...")
+        location, elapsed = wait_for_ready(
+            lambda: _locate_button(screenshot_path, confidence, config), ready_timeout, poll_interval
+        )
+        record_time_to_ready(button_name, elapsed if location is not None else None, config.get("readiness_log", ""))
+
+        if location is None:
+            print(f"  ✗ Button '{button_name}' did not appear within {ready_timeout:g} seconds")
+            _save_debug_info(button_name, confidence, config)
+            return False
+
+        center = pyautogui.center(location)
+        pyautogui.click(center)
+        print(f"  ✓ Clicked button '{button_name}' at position {center} (ready after {elapsed:.1f}s)")
+        return True
+
+    except Exception as e:
+        print(f"  ✗ Error clicking button '{button_name}': {e}")
+        try:
+            _save_debug_info(button_name, confidence, config)
+        except Exception:
+            pass  # Silently ignore errors in debug info saving
+        return False
+
+
+def _click_step(button_name: str, config: Dict[str, Any], wait_seconds: float) -> bool:
+    """Wait for the page and click a button, with readiness polling or a fixed sleep
+
+    Args:
+        button_name: Name of the button screenshot file (without extension)
+        config: Configuration dict (readiness_polling enables polling)
+        wait_seconds: Fixed wait before the lookup when readiness polling is disabled
+
+    Returns:
+        True if the button was clicked, False otherwise
+    """
+    if config.get("readiness_polling", False):
+        return _wait_and_click_button(button_name, config)
+    print(f"  → Waiting {wait_seconds} seconds for the page to respond...")
+    time.sleep(wait_seconds)
+    return _click_button_with_image(button_name, config)
+
+
 def assign_issue_to_copilot_automated(issue_url: str, config: Optional[Dict[str, Any]] = None) -> bool:
     """Automatically assign an issue to Copilot by clicking buttons in browser
 
@@ -336,6 +485,10 @@ def assign_issue_to_copilot_automated(issue_url: str, config: Optional[Dict[str,
     default browser. You must be already logged into GitHub in that browser for the
     automation to work. The function does not handle authentication.
 
+    With automation_backend = "playwright" and a user_data_dir (and Playwright installed),
+    the buttons are clicked through DOM selectors in a persistent, logged-in browser
+    context instead (see playwright_automation.py); no screenshots are needed.
+
     Note: To prevent issues with opening multiple pages simultaneously, this function
     will only open a browser if at least 60 seconds have passed since the last browser
     was opened. If the cooldown has not elapsed, the function returns False and the
@@ -364,7 +517,13 @@ def assign_issue_to_copilot_automated(issue_url: str, config: Optional[Dict[str,
     Returns:
         True if automation was successful, False otherwise
     """
-    if not PYAUTOGUI_AVAILABLE:
+    if config is None:
+        config = {}
+
+    assign_config = config.get("assign_to_copilot", {})
+    use_playwright = is_playwright_backend(assign_config)
+
+    if not use_playwright and not PYAUTOGUI_AVAILABLE:
         print("  ✗ PyAutoGUI is not installed. Install with: pip install pyautogui pillow")
         return False
 
@@ -381,6 +540,11 @@ def assign_issue_to_copilot_automated(issue_url: str, config: Optional[Dict[str,
             # Enough time has passed, allow retry
             print(f"  ℹ Retrying assignment (last attempt was {elapsed / 3600:.1f} hours ago)")
 
+    # The Playwright backend works in its own persistent context, so the cooldown does not apply
+    if use_playwright:
+        _issue_assign_attempted[issue_url] = time.time()
+        return assign_issue_to_copilot_playwright(issue_url, assign_config)
+
     # Check if enough time has passed since the last browser open
     if not _can_open_browser():
         remaining = _get_remaining_cooldown()
@@ -389,12 +553,6 @@ def assign_issue_to_copilot_automated(issue_url: str, config: Optional[Dict[str,
         print("     Will retry in the next monitoring iteration.")
         return False
 
-    # Get configuration settings
-    if config is None:
-        config = {}
-
-    assign_config = config.get("assign_to_copilot", {})
-
     # Validate and get configuration values
     wait_seconds = _validate_wait_seconds(assign_config)
     button_delay = _validate_button_delay(assign_config)
@@ -425,25 +583,18 @@ def assign_issue_to_copilot_automated(issue_url: str, config: Optional[Dict[str,
     # The timestamp allows retries after 24 hours for temporary failures.
     _issue_assign_attempted[issue_url] = time.time()
 
-    # Wait for the configured time
-    print(f"  → Waiting {wait_seconds} seconds for page to load...")
-    time.sleep(wait_seconds)
-
-    # Click "Assign to Copilot" button
+    # Wait for the page to load (fixed wait_seconds, or poll for the button with readiness_polling)
+    # and click "Assign to Copilot" button
     print("  → Looking for 'Assign to Copilot' button...")
-    if not _click_button_with_image("assign_to_copilot", assign_config):
+    if not _click_step("assign_to_copilot", assign_config, wait_seconds):
         print("  ✗ Could not find or click 'Assign to Copilot' button")
         return False
 
     print("  ✓ Clicked 'Assign to Copilot' button")
 
-    # Wait for the assignment UI to appear
-    print(f"  → Waiting {button_delay} seconds for UI to respond...")
-    time.sleep(button_delay)
-
-    # Click "Assign" button
+    # Wait for the assignment UI to appear and click "Assign" button
     print("  → Looking for 'Assign' button...")
-    if not _click_button_with_image("assign", assign_config):
+    if not _click_step("assign", assign_config, button_delay):
         print("  ✗ Could not find or click 'Assign' button")
         return False
 
@@ -451,7 +602,8 @@ def assign_issue_to_copilot_automated(issue_url: str, config: Optional[Dict[str,
     print("  ✓ [PyAutoGUI] Successfully automated issue assignment to Copilot")
 
     # Wait before finishing
-    time.sleep(button_delay)
+    if not assign_config.get("readiness_polling", False):
+        time.sleep(button_delay)
 
     return True
 
@@ -470,6 +622,10 @@ def merge_pr_automated(pr_url: str, config: Optional[Dict[str, Any]] = None) ->
     default browser. You must be already logged into GitHub in that browser for the
     automation to work. The function does not handle authentication.
 
+    With automation_backend = "playwright" and a user_data_dir (and Playwright installed),
+    the buttons are clicked through DOM selectors in a persistent, logged-in browser
+    context instead (see playwright_automation.py); no screenshots are needed.
+
     Note: To prevent issues with opening multiple pages simultaneously, this function
     will only open a browser if at least 60 seconds have passed since the last browser
     was opened. If the cooldown has not elapsed, the function returns False and the
@@ -492,6 +648,15 @@ def merge_pr_automated(pr_url: str, config: Optional[Dict[str, Any]] = None) ->
     Returns:
         True if automation was successful, False otherwise
     """
+    if config is None:
+        config = {}
+
+    merge_config = config.get("phase3_merge", {})
+
+    # The Playwright backend works in its own persistent context, so the cooldown does not apply
+    if is_playwright_backend(merge_config):
+        return merge_pr_playwright(pr_url, merge_config)
+
     if not PYAUTOGUI_AVAILABLE:
         print("  ✗ PyAutoGUI is not installed. Install with: pip install pyautogui pillow")
         return False
@@ -504,12 +669,6 @@ def merge_pr_automated(pr_url: str, config: Optional[Dict[str, Any]] = None) ->
         print("     Will retry in the next monitoring iteration.")
         return False
 
-    # Get configuration settings
-    if config is None:
-        config = {}
-
-    merge_config = config.get("phase3_merge", {})
-
     # Validate and get configuration values
     wait_seconds = _validate_wait_seconds(merge_config)
     button_delay = _validate_button_delay(merge_config)
@@ -533,37 +692,26 @@ def merge_pr_automated(pr_url: str, config: Optional[Dict[str, Any]] = None) ->
     # Record the browser open time to enforce cooldown
     _record_browser_open()
 
-    # Wait for the configured time
-    print(f"  → Waiting {wait_seconds} seconds for page to load...")
-    time.sleep(wait_seconds)
-
-    # Click "Merge pull request" button
+    # Wait for the page to load (fixed wait_seconds, or poll for the button with readiness_polling)
+    # and click "Merge pull request" button
     print("  → Looking for 'Merge pull request' button...")
-    if not _click_button_with_image("merge_pull_request", merge_config):
+    if not _click_step("merge_pull_request", merge_config, wait_seconds):
         print("  ✗ Could not find or click 'Merge pull request' button")
         return False
 
     print("  ✓ Clicked 'Merge pull request' button")
 
-    # Wait for the confirmation UI to appear
-    print(f"  → Waiting {button_delay} seconds for UI to respond...")
-    time.sleep(button_delay)
-
-    # Click "Confirm merge" button
+    # Wait for the confirmation UI to appear and click "Confirm merge" button
     print("  → Looking for 'Confirm merge' button...")
-    if not _click_button_with_image("confirm_merge", merge_config):
+    if not _click_step("confirm_merge", merge_config, button_delay):
         print("  ✗ Could not find or click 'Confirm merge' button")
         return False
 
     print("  ✓ Clicked 'Confirm merge' button")
 
-    # Wait for merge to complete and delete branch button to appear
-    print(f"  → Waiting {button_delay + 1.0} seconds for merge to complete...")
-    time.sleep(button_delay + 1.0)
-
-    # Click "Delete branch" button (optional - don't fail if not found)
+    # Wait for merge to complete and click "Delete branch" button (optional - don't fail if not found)
     print("  → Looking for 'Delete branch' button...")
-    if not _click_button_with_image("delete_branch", merge_config):
+    if not _click_step("delete_branch", merge_config, button_delay + 1.0):
         print("  ⚠ Could not find or click 'Delete branch' button (may have already been deleted)")
     else:
         print("  ✓ Clicked 'Delete branch' button")
@@ -571,6 +719,7 @@ def merge_pr_automated(pr_url: str, config: Optional[Dict[str, Any]] = None) ->
     print("  ✓ [PyAutoGUI] Successfully automated PR merge")
 
     # Wait before finishing
-    time.sleep(button_delay)
+    if not merge_config.get("readiness_polling", False):
+        time.sleep(button_delay)
 
     return True
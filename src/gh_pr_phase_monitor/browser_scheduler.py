@@ -0,0 +1,292 @@
+"""
+Cooldown-aware scheduler for browser operations
+
+Browser opens are limited to one per BROWSER_OPEN_COOLDOWN_SECONDS. Without
+the scheduler, an operation refused by the cooldown (phase 3 review page,
+browser-automated merge, Copilot assignment) is retried in the next monitoring
+cycle, which can be an hour away in reduced frequency mode. With
+`[browser_queue] enabled = true`, such operations are queued instead and a
+dispatcher thread runs them exactly when the cooldown expires:
+
+- Operations are dispatched in priority order (lower value first, then FIFO),
+  configured per operation kind in `[browser_queue] priorities`.
+- `dedupe` controls duplicates: "operation" keeps one queued operation per
+  (kind, URL), "url" keeps one per URL (a higher priority operation replaces a
+  lower one) and "none" queues everything.
+- The queue contents are shown in the status summary.
+- While actions are paused (control API), queued operations stay queued.
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+from .action_executor import add_pause_listener, are_actions_paused, browser_operation
+from .browser_automation import _get_remaining_cooldown
+from .config import (
+    BROWSER_QUEUE_DEDUPE_OPERATION,
+    BROWSER_QUEUE_DEDUPE_URL,
+    DEFAULT_BROWSER_QUEUE_CONFIG,
+    get_browser_queue_config,
+)
+
+# Operation kinds
+OPERATION_REVIEW = "review"
+OPERATION_MERGE = "merge"
+OPERATION_ASSIGN = "assign"
+
+
+class ScheduledOperation:
+    """A browser operation waiting for the cooldown
+
+    Args:
+        kind: Operation kind (OPERATION_REVIEW, OPERATION_MERGE or OPERATION_ASSIGN)
+        url: URL of the PR or issue
+        priority: Dispatch priority (lower values run first)
+        run: Performs the operation and returns True on success
+        on_result: Called with the success flag after the operation ran
+    """
+
+    def __init__(
+        self,
+        kind: str,
+        url: str,
+        priority: int,
+        run: Callable[[], bool],
+        on_result: Optional[Callable[[bool], None]] = None,
+    ):
+        self.kind = kind
+        self.url = url
+        self.priority = priority
+        self.run = run
+        self.on_result = on_result
+        self.queued_at = time.time()
+        self.cancelled = False
+
+
+class BrowserScheduler:
+    """Priority queue of browser operations dispatched when the cooldown expires
+
+    Args:
+        priorities: Priority per operation kind (default: DEFAULT_BROWSER_QUEUE_CONFIG)
+        dedupe: Deduplication mode ("operation", "url" or "none")
+    """
+
+    def __init__(self, priorities: Optional[Mapping[str, int]] = None, dedupe: str = BROWSER_QUEUE_DEDUPE_OPERATION):
+        self._cond = threading.Condition()
+        self._heap: List[Tuple[int, int, ScheduledOperation]] = []
+        self._sequence = itertools.count()
+        self._thread: Optional[threading.Thread] = None
+        # False once the queue is disabled on hot reload: already queued operations still run
+        self.enabled = True
+        self.configure(priorities, dedupe)
+
+    def configure(self, priorities: Optional[Mapping[str, int]], dedupe: str) -> None:
+        """Update priorities and deduplication (applies to operations queued afterwards)
+
+        Args:
+            priorities: Priority per operation kind
+            dedupe: Deduplication mode
+        """
+        with self._cond:
+            self.priorities = dict(priorities or DEFAULT_BROWSER_QUEUE_CONFIG["priorities"])
+            self.dedupe = dedupe
+
+    def _queued(self) -> List[ScheduledOperation]:
+        return [op for _priority, _seq, op in self._heap if not op.cancelled]
+
+    def schedule(
+        self, kind: str, url: str, run: Callable[[], bool], on_result: Optional[Callable[[bool], None]] = None
+    ) -> bool:
+        """Queue an operation
+
+        Args:
+            kind: Operation kind
+            url: URL of the PR or issue
+            run: Performs the operation and returns True on success
+            on_result: Called with the success flag after the operation ran
+
+        Returns:
+            True if the operation was queued, False if it was deduplicated or the queue is disabled
+        """
+        priority = self.priorities.get(kind, max(self.priorities.values(), default=0) + 1)
+        with self._cond:
+            if not self.enabled:
+                return False
+            if self.dedupe == BROWSER_QUEUE_DEDUPE_OPERATION:
+                if any(op.kind == kind and op.url == url for op in self._queued()):
+                    return False
+            elif self.dedupe == BROWSER_QUEUE_DEDUPE_URL:
+                existing = [op for op in self._queued() if op.url == url]
+                if any(op.priority <= priority for op in existing):
+                    return False
+                for op in existing:
+                    op.cancelled = True
+
+            op = ScheduledOperation(kind, url, priority, run, on_result)
+            heapq.heappush(self._heap, (priority, next(self._sequence), op))
+            self._cond.notify()
+            return True
+
+    def is_scheduled(self, kind: str, url: str) -> bool:
+        """Check if an operation for (kind, url) is queued
+
+        Args:
+            kind: Operation kind
+            url: URL of the PR or issue
+
+        Returns:
+            True if the operation is waiting in the queue
+        """
+        with self._cond:
+            return any(op.kind == kind and op.url == url for op in self._queued())
+
+    def pending(self) -> List[ScheduledOperation]:
+        """Get the queued operations in dispatch order
+
+        Returns:
+            List of queued operations
+        """
+        with self._cond:
+            return [entry[2] for entry in sorted(self._heap, key=lambda entry: entry[:2]) if not entry[2].cancelled]
+
+    def _pop(self) -> Optional[ScheduledOperation]:
+        while self._heap:
+            _priority, _seq, op = heapq.heappop(self._heap)
+            if not op.cancelled:
+                return op
+        return None
+
+    def run_next(self) -> Optional[bool]:
+        """Run the highest priority operation if the cooldown has expired and actions are not paused
+
+        Returns:
+            The operation's success flag, or None if nothing was run
+        """
+        with browser_operation("scheduled_browser_open"):
+            with self._cond:
+                if are_actions_paused() or _get_remaining_cooldown() > 0:
+                    return None
+                op = self._pop()
+            if op is None:
+                return None
+
+            print(f"\n[Browser queue] Running {op.kind}: {op.url}")
+            try:
+                success = bool(op.run())
+            except Exception as e:
+                print(f"  ✗ Browser operation failed: {e}")
+                success = False
+
+        if op.on_result is not None:
+            op.on_result(success)
+        return success
+
+    def _dispatch_loop(self) -> None:
+        while True:
+            with self._cond:
+                while not self._queued() or are_actions_paused():
+                    self._cond.wait()
+                remaining = _get_remaining_cooldown()
+                if remaining > 0:
+                    self._cond.wait(remaining)
+                    continue
+            self.run_next()
+
+    def wake(self) -> None:
+        """Make the dispatcher re-check the queue (e.g. after actions were resumed)"""
+        with self._cond:
+            self._cond.notify_all()
+
+    def start(self) -> None:
+        """Start the dispatcher thread (once)"""
+        with self._cond:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._dispatch_loop, name="browser-queue", daemon=True)
+                self._thread.start()
+
+
+# Scheduler in use (created by configure_browser_scheduler() when the queue is first enabled, and kept
+# when it is disabled so its dispatcher finishes the queued operations and is reused if re-enabled)
+_scheduler: Optional[BrowserScheduler] = None
+
+
+def _on_pause_changed(paused: bool) -> None:
+    if _scheduler is not None and not paused:
+        _scheduler.wake()
+
+
+add_pause_listener(_on_pause_changed)
+
+
+def configure_browser_scheduler(config: Optional[Dict[str, Any]]) -> Optional[BrowserScheduler]:
+    """Create or reconfigure the browser queue from `[browser_queue]`
+
+    Already queued operations are kept when the queue is reconfigured on hot
+    reload; disabling the queue stops accepting new operations (queued ones
+    still run), and re-enabling it reuses the same dispatcher thread.
+
+    Args:
+        config: Configuration dictionary (can be None)
+
+    Returns:
+        The scheduler in use, or None if the queue is disabled
+    """
+    global _scheduler
+    queue_config = get_browser_queue_config(config or {})
+    if not queue_config["enabled"]:
+        if _scheduler is not None:
+            _scheduler.enabled = False
+        return None
+    if _scheduler is None:
+        _scheduler = BrowserScheduler(queue_config["priorities"], queue_config["dedupe"])
+        _scheduler.start()
+    else:
+        _scheduler.configure(queue_config["priorities"], queue_config["dedupe"])
+        _scheduler.enabled = True
+    return _scheduler
+
+
+def schedule_browser_operation(
+    kind: str, url: str, run: Callable[[], bool], on_result: Optional[Callable[[bool], None]] = None
+) -> bool:
+    """Queue a browser operation refused by the cooldown, if the queue is enabled
+
+    Args:
+        kind: Operation kind
+        url: URL of the PR or issue
+        run: Performs the operation and returns True on success
+        on_result: Called with the success flag after the operation ran
+
+    Returns:
+        True if the operation is (or already was) queued, False if the queue is disabled
+    """
+    if _scheduler is None or not _scheduler.enabled:
+        return False
+    if not _scheduler.schedule(kind, url, run, on_result):
+        print(f"    {kind} for this URL is already queued")
+    return True
+
+
+def is_browser_operation_scheduled(kind: str, url: str) -> bool:
+    """Check if a browser operation for (kind, url) is queued
+
+    Args:
+        kind: Operation kind
+        url: URL of the PR or issue
+
+    Returns:
+        True if the operation is waiting for the cooldown
+    """
+    return _scheduler is not None and _scheduler.is_scheduled(kind, url)
+
+
+def get_scheduled_browser_operations() -> List[ScheduledOperation]:
+    """Get the queued browser operations in dispatch order
+
+    Returns:
+        List of queued operations (empty if the queue is disabled)
+    """
+    return _scheduler.pending() if _scheduler is not None else []
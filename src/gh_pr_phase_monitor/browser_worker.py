@@ -0,0 +1,387 @@
+"""
+Browser automation worker process
+
+Browser-automated merges and issue assignments open a browser, wait
+`wait_seconds` for the page to load and click buttons, which blocks for many
+seconds. With `browser_worker = true` these jobs are sent to a dedicated worker
+process through a queue instead, so the monitor keeps polling and rendering:
+
+- The worker runs one job at a time and enforces BROWSER_OPEN_COOLDOWN_SECONDS
+  itself (it waits for the cooldown instead of failing the job).
+- Results are reported back through a result queue and are collected by
+  poll_browser_worker(), which runs the job's callback. The main loop calls it
+  around each check and the wait calls it every second, so results and hung
+  jobs are handled without waiting for the next check.
+- A job already queued for the same (kind, URL) is not queued again.
+- A job that does not finish within JOB_TIMEOUT_SECONDS is failed and the worker
+  is restarted, so a hung browser does not stop later jobs.
+- If the worker exits before starting the first queued job more than
+  MAX_RESTARTS_BEFORE_START times (e.g. it fails to start), that job is failed
+  instead of restarting the worker forever.
+- While actions are paused (control API), the worker does not start jobs; they
+  stay queued until actions are resumed.
+"""
+
+import contextlib
+import io
+import multiprocessing
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+from . import browser_automation
+from .action_executor import add_pause_listener, are_actions_paused
+
+# Job kinds
+JOB_KIND_MERGE = "merge"
+JOB_KIND_ASSIGN = "assign"
+
+# Maximum time (in seconds) a started job may take before the worker is considered hung
+JOB_TIMEOUT_SECONDS = 300
+
+# Worker restarts allowed for a job that has not started before the job is failed
+MAX_RESTARTS_BEFORE_START = 3
+
+# Period (in seconds) at which the worker re-checks the pause flag while it waits for the cooldown
+PAUSE_CHECK_SECONDS = 1.0
+
+# Messages sent from the worker to the monitor
+_MESSAGE_STARTED = "started"
+_MESSAGE_FINISHED = "finished"
+
+# Callback invoked in the monitor process with the job's success flag
+JobCallback = Callable[[bool], None]
+
+
+def _run_job(kind: str, url: str, config: Dict[str, Any]) -> bool:
+    """Run a browser automation job (in the worker process)
+
+    Args:
+        kind: Job kind (JOB_KIND_MERGE or JOB_KIND_ASSIGN)
+        url: URL of the PR or issue
+        config: Configuration passed to the automation function
+
+    Returns:
+        True if the automation succeeded, False otherwise
+    """
+    if kind == JOB_KIND_MERGE:
+        return browser_automation.merge_pr_automated(url, config)
+    if kind == JOB_KIND_ASSIGN:
+        return browser_automation.assign_issue_to_copilot_automated(url, config)
+    print(f"  ✗ Unknown browser job kind: {kind}")
+    return False
+
+
+def _to_plain_dict(value: Any) -> Any:
+    """Copy read-only mappings (e.g., from CompiledConfig) to dictionaries so they can be sent to the worker
+
+    Args:
+        value: Configuration value
+
+    Returns:
+        The value with every mapping replaced by a plain dictionary
+    """
+    if isinstance(value, Mapping):
+        return {key: _to_plain_dict(item) for key, item in value.items()}
+    return value
+
+
+def _worker_main(job_queue: Any, result_queue: Any, resumed: Any) -> None:
+    """Entry point of the worker process
+
+    Jobs are (job_id, kind, url, config, last_browser_open_time) tuples; None stops the worker.
+
+    Args:
+        job_queue: Queue of jobs sent by the monitor
+        result_queue: Queue of (job_id, message, success, output) tuples sent to the monitor
+        resumed: Event cleared by the monitor while actions are paused
+    """
+    while True:
+        job = job_queue.get()
+        if job is None:
+            return
+        job_id, kind, url, config, last_open_time = job
+
+        # Browsers opened by the monitor itself also count toward the cooldown
+        if last_open_time is not None:
+            previous = browser_automation._last_browser_open_time
+            browser_automation._last_browser_open_time = max(previous or 0.0, last_open_time)
+        while True:
+            resumed.wait()
+            remaining = browser_automation._get_remaining_cooldown()
+            if remaining <= 0:
+                break
+            time.sleep(min(remaining, PAUSE_CHECK_SECONDS))
+
+        result_queue.put((job_id, _MESSAGE_STARTED, None, ""))
+        output = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(output):
+                success = bool(_run_job(kind, url, config))
+        except Exception as e:
+            output.write(f"  ✗ Browser automation error: {e}\n")
+            success = False
+        result_queue.put((job_id, _MESSAGE_FINISHED, success, output.getvalue()))
+
+
+class _Job:
+    """A job submitted to the worker, tracked in the monitor process"""
+
+    def __init__(self, job_id: int, kind: str, url: str, config: Dict[str, Any], on_result: Optional[JobCallback]):
+        self.job_id = job_id
+        self.kind = kind
+        self.url = url
+        self.config = config
+        self.on_result = on_result
+        self.started_at: Optional[float] = None
+        # Times the worker exited while this job was the next one to start
+        self.restarts_before_start = 0
+
+
+class BrowserWorker:
+    """Monitor-side handle of the browser automation worker process
+
+    Args:
+        timeout_seconds: Maximum time a started job may take (default: JOB_TIMEOUT_SECONDS)
+    """
+
+    def __init__(self, timeout_seconds: float = JOB_TIMEOUT_SECONDS):
+        self.timeout_seconds = timeout_seconds
+        self._context = multiprocessing.get_context("spawn")
+        self._lock = threading.RLock()
+        # Cleared while actions are paused; shared with the worker process
+        self._resumed = self._context.Event()
+        self.set_paused(are_actions_paused())
+        self._process = None
+        self._job_queue = None
+        self._result_queue = None
+        self._next_job_id = 0
+        # Jobs not yet finished, in submission order: job_id -> job
+        self._jobs: Dict[int, _Job] = {}
+
+    def _start(self) -> None:
+        """Start a new worker process and (re)send every job that has not started yet"""
+        self._job_queue = self._context.Queue()
+        self._result_queue = self._context.Queue()
+        self._process = self._context.Process(
+            target=_worker_main,
+            args=(self._job_queue, self._result_queue, self._resumed),
+            name="browser-worker",
+            daemon=True,
+        )
+        self._process.start()
+        for job in self._jobs.values():
+            self._send(job)
+
+    def _send(self, job: _Job) -> None:
+        self._job_queue.put((job.job_id, job.kind, job.url, job.config, browser_automation._last_browser_open_time))
+
+    def set_paused(self, paused: bool) -> None:
+        """Hold (or release) jobs that have not started yet
+
+        Args:
+            paused: True to keep queued jobs from starting
+        """
+        if paused:
+            self._resumed.clear()
+        else:
+            self._resumed.set()
+
+    def submit(self, kind: str, url: str, config: Dict[str, Any], on_result: Optional[JobCallback] = None) -> bool:
+        """Queue a browser automation job
+
+        Args:
+            kind: Job kind (JOB_KIND_MERGE or JOB_KIND_ASSIGN)
+            url: URL of the PR or issue
+            config: Configuration passed to the automation function (mappings are copied to plain dictionaries)
+            on_result: Called with the success flag when poll() collects the result
+
+        Returns:
+            True if the job was queued, False if the same job is already queued or running
+        """
+        with self._lock:
+            if self.is_pending(kind, url):
+                return False
+            job = _Job(self._next_job_id, kind, url, _to_plain_dict(config), on_result)
+            self._next_job_id += 1
+            self._jobs[job.job_id] = job
+            if self._process is None or not self._process.is_alive():
+                self._start()
+            else:
+                self._send(job)
+            return True
+
+    def is_pending(self, kind: str, url: str) -> bool:
+        """Check if a job for (kind, url) is queued or running
+
+        Args:
+            kind: Job kind
+            url: URL of the PR or issue
+
+        Returns:
+            True if the job has not finished yet
+        """
+        with self._lock:
+            return any(job.kind == kind and job.url == url for job in self._jobs.values())
+
+    def pending_jobs(self) -> List[Tuple[str, str]]:
+        """Get the jobs that have not finished yet
+
+        Returns:
+            List of (kind, url) tuples in submission order
+        """
+        with self._lock:
+            return [(job.kind, job.url) for job in self._jobs.values()]
+
+    def _finish(self, job: _Job, success: bool, output: str) -> None:
+        self._jobs.pop(job.job_id, None)
+        status = "succeeded" if success else "failed"
+        print(f"\n[Browser worker] {job.kind} {status}: {job.url}")
+        if output:
+            print(output.rstrip("\n"))
+        if job.on_result is not None:
+            job.on_result(success)
+
+    def poll(self) -> int:
+        """Collect finished jobs without blocking and run their callbacks
+
+        Also fails a job that exceeded the timeout (or whose worker died), or the
+        next job once the worker exited more than MAX_RESTARTS_BEFORE_START times
+        without starting it, and restarts the worker for the remaining jobs.
+
+        Returns:
+            Number of jobs that finished
+        """
+        finished = 0
+        with self._lock:
+            if self._result_queue is None:
+                return 0
+            while True:
+                try:
+                    job_id, message, success, output = self._result_queue.get_nowait()
+                except queue.Empty:
+                    break
+                job = self._jobs.get(job_id)
+                if job is None:
+                    continue
+                if message == _MESSAGE_STARTED:
+                    job.started_at = time.monotonic()
+                    # The worker is opening a browser now; the monitor's own browser opens wait for it
+                    browser_automation._record_browser_open()
+                else:
+                    self._finish(job, success, output)
+                    finished += 1
+
+            running = next((job for job in self._jobs.values() if job.started_at is not None), None)
+            hung = running is not None and time.monotonic() - running.started_at > self.timeout_seconds
+            died = bool(self._jobs) and (self._process is None or not self._process.is_alive())
+            if hung or died:
+                reason = f"timed out after {self.timeout_seconds} seconds" if hung else "worker process exited"
+                self.stop()
+                if running is not None:
+                    self._finish(running, False, f"  ✗ Browser automation {reason}")
+                    finished += 1
+                else:
+                    head = next(iter(self._jobs.values()))
+                    head.restarts_before_start += 1
+                    if head.restarts_before_start > MAX_RESTARTS_BEFORE_START:
+                        message = (
+                            f"  ✗ Browser worker exited {head.restarts_before_start} times before starting the job"
+                        )
+                        self._finish(head, False, message)
+                        finished += 1
+                if self._jobs:
+                    self._start()
+        return finished
+
+    def stop(self) -> None:
+        """Stop the worker process (unfinished jobs stay tracked)"""
+        with self._lock:
+            if self._process is None:
+                return
+            if self._process.is_alive():
+                self._process.terminate()
+            self._process.join(timeout=5)
+            self._process = None
+
+
+# Worker in use (started on the first submitted job)
+_worker: Optional[BrowserWorker] = None
+
+
+def _on_pause_changed(paused: bool) -> None:
+    if _worker is not None:
+        _worker.set_paused(paused)
+
+
+add_pause_listener(_on_pause_changed)
+
+
+def is_browser_worker_enabled(config: Optional[Dict[str, Any]]) -> bool:
+    """Check if browser automation jobs should run in the worker process
+
+    Args:
+        config: Configuration dictionary (can be None)
+
+    Returns:
+        True if `browser_worker` is enabled
+    """
+    return bool((config or {}).get("browser_worker", False))
+
+
+def submit_browser_job(kind: str, url: str, config: Dict[str, Any], on_result: Optional[JobCallback] = None) -> bool:
+    """Queue a browser automation job on the shared worker
+
+    Args:
+        kind: Job kind (JOB_KIND_MERGE or JOB_KIND_ASSIGN)
+        url: URL of the PR or issue
+        config: Configuration passed to the automation function
+        on_result: Called with the success flag when the result is collected
+
+    Returns:
+        True if the job was queued, False if the same job is already queued or running
+    """
+    global _worker
+    if _worker is None:
+        _worker = BrowserWorker()
+    return _worker.submit(kind, url, config, on_result)
+
+
+def is_browser_job_pending(kind: str, url: str) -> bool:
+    """Check if a browser automation job for (kind, url) has not finished yet
+
+    Args:
+        kind: Job kind
+        url: URL of the PR or issue
+
+    Returns:
+        True if the job is queued or running
+    """
+    return _worker is not None and _worker.is_pending(kind, url)
+
+
+def get_pending_browser_jobs() -> List[Tuple[str, str]]:
+    """Get the browser automation jobs that have not finished yet
+
+    Returns:
+        List of (kind, url) tuples
+    """
+    return _worker.pending_jobs() if _worker is not None else []
+
+
+def poll_browser_worker() -> int:
+    """Collect finished browser automation jobs and run their callbacks
+
+    Returns:
+        Number of jobs that finished
+    """
+    return _worker.poll() if _worker is not None else 0
+
+
+def stop_browser_worker() -> None:
+    """Stop the worker process and forget its jobs"""
+    global _worker
+    if _worker is not None:
+        _worker.stop()
+        _worker = None
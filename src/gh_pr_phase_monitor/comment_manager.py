@@ -4,9 +4,15 @@ Comment management for posting and checking PR comments
 
 import subprocess
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
+from .action_executor import content_request
 from .github_client import get_existing_comments
+from .mutation_batch import MutationBatch, ResultCallback
+
+# PRs known to have the phase2 "@copilot apply changes" comment: set of PR URLs
+# Filled when this monitor posts the comment or finds it, so later cycles need no comment fetch
+_phase2_comment_known: Set[str] = set()
 
 
 def has_copilot_apply_comment(comments: List[Dict[str, Any]]) -> bool:
@@ -25,6 +31,55 @@ def has_copilot_apply_comment(comments: List[Dict[str, Any]]) -> bool:
     return False
 
 
+def phase2_comment_exists(pr: Dict[str, Any], repo_dir: Path = None) -> bool:
+    """Check if the phase2 comment already exists on a PR, using data already held when possible
+
+    The check is answered, in order, from the local index of known comments, then
+    from the comment slice fetched in the Phase 2 batch query. Comments are only
+    fetched with `gh pr view` when the PR has more comments than the fetched slice.
+
+    Args:
+        pr: PR data dictionary containing url (and commentNodes/comments from the Phase 2 query)
+        repo_dir: Repository directory (optional, not used when working with URLs)
+
+    Returns:
+        True if a "@copilot apply changes" comment exists
+    """
+    pr_url = pr.get("url", "")
+    if pr_url in _phase2_comment_known:
+        return True
+
+    comment_nodes = pr.get("commentNodes")
+    if comment_nodes is not None and all("body" in node for node in comment_nodes):
+        if has_copilot_apply_comment(comment_nodes):
+            _phase2_comment_known.add(pr_url)
+            return True
+        # The slice covers every comment, so the comment definitely does not exist
+        total_count = pr.get("comments", 0)
+        if isinstance(total_count, int) and total_count <= len(comment_nodes):
+            return False
+
+    # Older comments are not in the fetched slice; fetch them once
+    existing_comments = get_existing_comments(pr_url, repo_dir)
+    if has_copilot_apply_comment(existing_comments):
+        _phase2_comment_known.add(pr_url)
+        return True
+    return False
+
+
+def build_phase2_comment_body(pr_url: str) -> str:
+    """Build the phase2 comment asking Copilot to apply the review comments
+
+    Args:
+        pr_url: URL of the PR
+
+    Returns:
+        Comment body
+    """
+    # Reviews don't have direct URLs in the JSON, but we can link to the PR
+    return f"@copilot apply changes based on the comments in [this pull request]({pr_url})"
+
+
 def post_phase2_comment(pr: Dict[str, Any], repo_dir: Path = None) -> Optional[bool]:
     """Post a comment to PR when phase2 is detected
 
@@ -42,19 +97,18 @@ def post_phase2_comment(pr: Dict[str, Any], repo_dir: Path = None) -> Optional[b
         return False
 
     # Check if we already posted a comment
-    existing_comments = get_existing_comments(pr_url, repo_dir)
-    if has_copilot_apply_comment(existing_comments):
+    if phase2_comment_exists(pr, repo_dir):
         print("    Comment already exists, skipping")
         return None
 
-    # Construct comment body linking to the PR
-    # Reviews don't have direct URLs in the JSON, but we can link to the PR
-    comment_body = f"@copilot apply changes based on the comments in [this pull request]({pr_url})"
+    comment_body = build_phase2_comment_body(pr_url)
 
     cmd = ["gh", "pr", "comment", pr_url, "--body", comment_body]
 
     try:
-        subprocess.run(cmd, capture_output=True, text=True, encoding="utf-8", errors="replace", check=True)
+        with content_request("comment"):
+            subprocess.run(cmd, capture_output=True, text=True, encoding="utf-8", errors="replace", check=True)
+        _phase2_comment_known.add(pr_url)
         return True
     except subprocess.CalledProcessError as e:
         print(f"    Error posting comment: {e}")
@@ -83,10 +137,47 @@ def post_phase3_comment(pr: Dict[str, Any], comment_text: str, repo_dir: Path =
     cmd = ["gh", "pr", "comment", pr_url, "--body", comment_text]
 
     try:
-        subprocess.run(cmd, capture_output=True, text=True, encoding="utf-8", errors="replace", check=True)
+        with content_request("comment"):
+            subprocess.run(cmd, capture_output=True, text=True, encoding="utf-8", errors="replace", check=True)
         return True
     except subprocess.CalledProcessError as e:
         print(f"    Error posting comment: {e}")
         stderr = getattr(e, "stderr", "No stderr available")
         print(f"    stderr: {stderr}")
         return False
+
+
+def queue_phase2_comment(
+    pr: Dict[str, Any], batch: MutationBatch, on_result: Optional[ResultCallback] = None, repo_dir: Path = None
+) -> Optional[bool]:
+    """Queue the phase2 comment in a batched GraphQL mutation instead of posting it immediately
+
+    Args:
+        pr: PR data dictionary containing url and id
+        batch: Batch collecting this cycle's mutations
+        on_result: Callback invoked with the result once the batch is executed (optional)
+        repo_dir: Repository directory (optional, not used when working with URLs)
+
+    Returns:
+        True if the comment was queued
+        None if comment already exists (skipped)
+        False if the PR has no url or node id
+    """
+    pr_url = pr.get("url", "")
+    pr_id = pr.get("id", "")
+    if not pr_url or not pr_id:
+        return False
+
+    # Check if we already posted a comment
+    if phase2_comment_exists(pr, repo_dir):
+        print("    Comment already exists, skipping")
+        return None
+
+    def handle(success: bool, error: Optional[str]) -> None:
+        if success:
+            _phase2_comment_known.add(pr_url)
+        if on_result is not None:
+            on_result(success, error)
+
+    batch.add_comment(pr_id, pr_url, build_phase2_comment_body(pr_url), on_result=handle)
+    return True
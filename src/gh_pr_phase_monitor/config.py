@@ -5,10 +5,13 @@ Configuration loading and parsing utilities
 import os
 import re
 import subprocess
-from typing import Any, Dict
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Set, Tuple
 
 import tomli
 
+from .ruleset_index import RulesetIndex
+
 # Default configuration for phase3_merge feature (batteries included)
 DEFAULT_PHASE3_MERGE_CONFIG: Dict[str, Any] = {
     "comment": "agentによって、レビュー指摘対応が完了したと判断します。userの責任のもと、userレビューは省略します。PRをMergeします。",
@@ -28,14 +31,130 @@ DEFAULT_ASSIGN_TO_COPILOT_CONFIG: Dict[str, Any] = {
     "headless": False,
 }
 
+# Browser queue deduplication modes (see browser_scheduler.py)
+# "operation": one queued operation per (kind, URL); "url": one per URL; "none": no deduplication
+BROWSER_QUEUE_DEDUPE_OPERATION = "operation"
+BROWSER_QUEUE_DEDUPE_URL = "url"
+BROWSER_QUEUE_DEDUPE_NONE = "none"
+BROWSER_QUEUE_DEDUPE_MODES = (BROWSER_QUEUE_DEDUPE_OPERATION, BROWSER_QUEUE_DEDUPE_URL, BROWSER_QUEUE_DEDUPE_NONE)
+
+# Default configuration for the browser queue
+# Browser operations refused by the cooldown are queued and run when it expires
+# Lower priority values are dispatched first
+DEFAULT_BROWSER_QUEUE_CONFIG: Dict[str, Any] = {
+    "enabled": False,
+    "dedupe": BROWSER_QUEUE_DEDUPE_OPERATION,
+    "priorities": {"merge": 0, "review": 1, "assign": 2},
+}
+
+# Default settings of the asynchronous ntfy dispatcher (see notification_dispatcher.py)
+# Keys live in the [ntfy] section; async_dispatch = true sends notifications from a
+# background thread over a keep-alive connection, with retries and per-topic rate limiting
+DEFAULT_NTFY_DISPATCH_CONFIG: Dict[str, Any] = {
+    "async_dispatch": False,
+    "queue_size": 100,
+    "max_retries": 5,
+    "retry_backoff_seconds": 2.0,
+    "rate_limit_seconds": 1.0,
+}
+
+# Default settings of the adaptive polling controller (see polling_controller.py)
+# When enabled, the wait between checks follows the observed change rate instead of
+# switching between interval and reduced_frequency_interval after no_change_timeout
+DEFAULT_ADAPTIVE_POLLING_CONFIG: Dict[str, Any] = {
+    "enabled": False,
+    "min_interval": "30s",
+    "max_interval": "1h",
+    "rate_half_life": "30m",
+    "hot_window": "15m",
+    "rate_budget": 0.5,
+}
+
+# Duration keys of the [adaptive_polling] section
+ADAPTIVE_POLLING_DURATION_KEYS = ("min_interval", "max_interval", "rate_half_life", "hot_window")
+
+# Default settings of the per-repository and per-PR polling tiers (see polling_tiers.py)
+# Hot PRs are refetched every check, warm and cold ones after their interval
+DEFAULT_POLLING_TIERS_CONFIG: Dict[str, Any] = {
+    "enabled": False,
+    "warm_interval": "5m",
+    "cold_interval": "30m",
+    "idle_after": "1d",
+}
+
+# Duration keys of the [polling_tiers] section
+POLLING_TIERS_DURATION_KEYS = ("warm_interval", "cold_interval", "idle_after")
+
+# Default settings of the local control API (see control_api.py)
+# An empty socket serves HTTP on host:port; a socket path serves it on a Unix socket instead
+# A non-empty token is required as "Authorization: Bearer <token>" on every request
+DEFAULT_CONTROL_API_CONFIG: Dict[str, Any] = {
+    "enabled": False,
+    "host": "127.0.0.1",
+    "port": 8765,
+    "socket": "",
+    "token": "",
+}
+
+# Default settings of the thin client mode (see thin_client.py)
+# An empty server runs the monitor itself; a control API URL renders its event stream instead
+DEFAULT_THIN_CLIENT_CONFIG: Dict[str, Any] = {
+    "server": "",
+    "token": "",
+    "open_browser": True,
+    "reconnect_interval": "10s",
+}
+
+# Default settings of the cross-instance coordination (see coordination.py)
+# Instances sharing the database elect one leader; the lease expires lease_ttl after its last renewal
+DEFAULT_COORDINATION_CONFIG: Dict[str, Any] = {
+    "enabled": False,
+    "database": "~/.gh-pr-phase-monitor/coordination.db",
+    "lease_ttl": "1m",
+}
+
+# Shortest lease_ttl accepted (the lease is renewed every third of it)
+MIN_COORDINATION_LEASE_TTL_SECONDS = 3
+
 # Default maximum number of parallel PRs in "LLM working" state
 # When this limit is reached, auto-assignment of new issues is paused to avoid rate limits
 DEFAULT_MAX_LLM_WORKING_PARALLEL = 3
 
+# Default number of PRs whose actions are processed concurrently (see action_executor.py)
+DEFAULT_MAX_PARALLEL_ACTIONS = 4
+
+# Default number of concurrent content-creating requests (comment, ready, merge)
+# GitHub's secondary rate limits discourage concurrent mutating requests
+DEFAULT_MAX_PARALLEL_CONTENT_REQUESTS = 2
+
+# Action backends: one gh CLI process per action, or batched GraphQL mutations per cycle
+ACTION_BACKEND_GH = "gh"
+ACTION_BACKEND_GRAPHQL = "graphql"
+ACTION_BACKENDS = (ACTION_BACKEND_GH, ACTION_BACKEND_GRAPHQL)
+
+# Positive integer settings validated at load time, with their defaults
+POSITIVE_INT_SETTING_DEFAULTS: Dict[str, int] = {
+    "max_llm_working_parallel": DEFAULT_MAX_LLM_WORKING_PARALLEL,
+    "max_parallel_actions": DEFAULT_MAX_PARALLEL_ACTIONS,
+    "max_parallel_content_requests": DEFAULT_MAX_PARALLEL_CONTENT_REQUESTS,
+}
+
 # Default value for check_process_before_autoraise
 # When true, check if cat-window-watcher process is running and don't raise browser window if it is
 DEFAULT_CHECK_PROCESS_BEFORE_AUTORAISE = True
 
+# Duration settings (parsed with parse_interval) and their defaults
+# An empty no_change_timeout disables the reduced frequency mode
+DURATION_SETTING_DEFAULTS: Dict[str, str] = {
+    "interval": "1m",
+    "no_change_timeout": "30m",
+    "reduced_frequency_interval": "1h",
+    "full_reconcile_interval": "10m",
+}
+
+# Duration settings that may be set to an empty string to disable them
+DISABLEABLE_DURATION_SETTINGS = ("no_change_timeout",)
+
 
 def parse_interval(interval_str: str) -> int:
     """Parse interval string like '1m', '30s', '2h' to seconds
@@ -132,27 +251,7 @@ def is_process_running(process_name: str) -> bool:
         return False
 
 
-def _validate_boolean_flag(value: Any, flag_name: str) -> bool:
-    """Validate that a configuration flag is a boolean value
-
-    Args:
-        value: The value to validate
-        flag_name: Name of the flag for error messages
-
-    Returns:
-        The boolean value
-
-    Raises:
-        ValueError: If the value is not a boolean
-    """
-    if not isinstance(value, bool):
-        raise ValueError(
-            f"Configuration flag '{flag_name}' must be a boolean (true/false), got {type(value).__name__}: {value}"
-        )
-    return value
-
-
-def get_phase3_merge_config(config: Dict[str, Any]) -> Dict[str, Any]:
+def get_phase3_merge_config(config: Dict[str, Any]) -> Mapping[str, Any]:
     """Get phase3_merge configuration with defaults applied
 
     Args:
@@ -160,7 +259,11 @@ def get_phase3_merge_config(config: Dict[str, Any]) -> Dict[str, Any]:
 
     Returns:
         phase3_merge configuration with defaults for missing keys
+        (a read-only mapping precomputed at load time for configs from load_config())
     """
+    if isinstance(config, CompiledConfig):
+        return config.phase3_merge
+
     user_config = config.get("phase3_merge", {})
     if not isinstance(user_config, dict):
         user_config = {}
@@ -178,6 +281,31 @@ def validate_phase3_merge_config_required(config: Dict[str, Any], repo_owner: st
     configure the comment in the [phase3_merge] section of config.toml.
     This is a safety measure to ensure users consciously set the merge comment.
 
+    Args:
+        config: Global configuration dictionary
+        repo_owner: Repository owner
+        repo_name: Repository name
+
+    Raises:
+        SystemExit: If auto-merge is enabled but comment is not explicitly configured
+
+    Note:
+        For configs from load_config(), each repository is validated only once per
+        config version; later calls for the same repository return immediately.
+    """
+    compiled = config if isinstance(config, CompiledConfig) else None
+    if compiled is not None and (repo_owner, repo_name) in compiled._validated_repos:
+        return
+
+    _check_phase3_merge_comment_configured(config, repo_owner, repo_name)
+
+    if compiled is not None:
+        compiled._validated_repos.add((repo_owner, repo_name))
+
+
+def _check_phase3_merge_comment_configured(config: Dict[str, Any], repo_owner: str, repo_name: str) -> None:
+    """Fail fast if auto-merge is enabled for a repository but the merge comment is not configured
+
     Args:
         config: Global configuration dictionary
         repo_owner: Repository owner
@@ -228,7 +356,7 @@ def validate_phase3_merge_config_required(config: Dict[str, Any], repo_owner: st
         raise SystemExit(1)
 
 
-def get_assign_to_copilot_config(config: Dict[str, Any]) -> Dict[str, Any]:
+def get_assign_to_copilot_config(config: Dict[str, Any]) -> Mapping[str, Any]:
     """Get assign_to_copilot configuration with defaults applied
 
     Args:
@@ -236,7 +364,11 @@ def get_assign_to_copilot_config(config: Dict[str, Any]) -> Dict[str, Any]:
 
     Returns:
         assign_to_copilot configuration with defaults for missing keys
+        (a read-only mapping precomputed at load time for configs from load_config())
     """
+    if isinstance(config, CompiledConfig):
+        return config.assign_to_copilot
+
     user_config = config.get("assign_to_copilot", {})
     if not isinstance(user_config, dict):
         user_config = {}
@@ -247,6 +379,120 @@ def get_assign_to_copilot_config(config: Dict[str, Any]) -> Dict[str, Any]:
     return result
 
 
+def get_browser_queue_config(config: Dict[str, Any]) -> Dict[str, Any]:
+    """Get browser_queue configuration with defaults applied
+
+    Args:
+        config: Global configuration dictionary
+
+    Returns:
+        browser_queue configuration with defaults for missing keys
+        (priorities are merged per operation kind)
+    """
+    user_config = config.get("browser_queue", {})
+    if not isinstance(user_config, Mapping):
+        user_config = {}
+
+    result = dict(DEFAULT_BROWSER_QUEUE_CONFIG)
+    result.update(user_config)
+    priorities = dict(DEFAULT_BROWSER_QUEUE_CONFIG["priorities"])
+    user_priorities = user_config.get("priorities", {})
+    if isinstance(user_priorities, Mapping):
+        priorities.update(user_priorities)
+    result["priorities"] = priorities
+    return result
+
+
+def get_ntfy_dispatch_config(config: Dict[str, Any]) -> Dict[str, Any]:
+    """Get the ntfy dispatcher settings with defaults applied
+
+    Args:
+        config: Global configuration dictionary
+
+    Returns:
+        Dispatcher settings (DEFAULT_NTFY_DISPATCH_CONFIG keys) from the [ntfy] section
+    """
+    user_config = config.get("ntfy", {})
+    if not isinstance(user_config, Mapping):
+        user_config = {}
+    return {key: user_config.get(key, default) for key, default in DEFAULT_NTFY_DISPATCH_CONFIG.items()}
+
+
+def get_adaptive_polling_config(config: Dict[str, Any]) -> Dict[str, Any]:
+    """Get the adaptive polling settings with defaults applied
+
+    Args:
+        config: Global configuration dictionary
+
+    Returns:
+        Settings (DEFAULT_ADAPTIVE_POLLING_CONFIG keys) from the [adaptive_polling] section
+    """
+    user_config = config.get("adaptive_polling", {})
+    if not isinstance(user_config, Mapping):
+        user_config = {}
+    return {key: user_config.get(key, default) for key, default in DEFAULT_ADAPTIVE_POLLING_CONFIG.items()}
+
+
+def get_polling_tiers_config(config: Dict[str, Any]) -> Dict[str, Any]:
+    """Get the polling tier settings with defaults applied
+
+    Args:
+        config: Global configuration dictionary
+
+    Returns:
+        Settings (DEFAULT_POLLING_TIERS_CONFIG keys) from the [polling_tiers] section
+    """
+    user_config = config.get("polling_tiers", {})
+    if not isinstance(user_config, Mapping):
+        user_config = {}
+    return {key: user_config.get(key, default) for key, default in DEFAULT_POLLING_TIERS_CONFIG.items()}
+
+
+def get_control_api_config(config: Dict[str, Any]) -> Dict[str, Any]:
+    """Get the control API settings with defaults applied
+
+    Args:
+        config: Global configuration dictionary
+
+    Returns:
+        Settings (DEFAULT_CONTROL_API_CONFIG keys) from the [control_api] section
+    """
+    user_config = config.get("control_api", {})
+    if not isinstance(user_config, Mapping):
+        user_config = {}
+    return {key: user_config.get(key, default) for key, default in DEFAULT_CONTROL_API_CONFIG.items()}
+
+
+def get_thin_client_config(config: Dict[str, Any]) -> Dict[str, Any]:
+    """Get the thin client settings with defaults applied
+
+    Args:
+        config: Global configuration dictionary
+
+    Returns:
+        Settings (DEFAULT_THIN_CLIENT_CONFIG keys) from the [thin_client] section
+    """
+    user_config = config.get("thin_client", {})
+    if not isinstance(user_config, Mapping):
+        user_config = {}
+    return {key: user_config.get(key, default) for key, default in DEFAULT_THIN_CLIENT_CONFIG.items()}
+
+
+def get_coordination_config(config: Dict[str, Any]) -> Dict[str, Any]:
+    """Get the cross-instance coordination settings with defaults applied
+
+    Args:
+        config: Global configuration dictionary
+
+    Returns:
+        Settings (DEFAULT_COORDINATION_CONFIG keys) from the [coordination] section
+    """
+    user_config = config.get("coordination", {})
+    if not isinstance(user_config, Mapping):
+        user_config = {}
+    return {key: user_config.get(key, default) for key, default in DEFAULT_COORDINATION_CONFIG.items()}
+
+
 def get_config_mtime(config_path: str = "config.toml") -> float:
     """Get the modification time of the configuration file
 
@@ -262,33 +508,275 @@ def get_config_mtime(config_path: str = "config.toml") -> float:
     return os.path.getmtime(config_path)
 
 
-def load_config(config_path: str = "config.toml") -> Dict[str, Any]:
+def get_duration_setting(config: Optional[Dict[str, Any]], key: str) -> Tuple[str, int]:
+    """Get a duration setting (interval, no_change_timeout, reduced_frequency_interval)
+
+    Configs from load_config() return the value parsed at load time; plain
+    dictionaries are parsed on each call.
+
+    Args:
+        config: Configuration dictionary (can be None)
+        key: Setting name, one of DURATION_SETTING_DEFAULTS
+
+    Returns:
+        Tuple of (interval string, seconds). Disabled settings (empty string) return 0 seconds.
+
+    Raises:
+        ValueError: If the interval string format is invalid
+    """
+    if isinstance(config, CompiledConfig):
+        return config.durations[key]
+
+    value = (config or {}).get(key, DURATION_SETTING_DEFAULTS[key])
+    if key in DISABLEABLE_DURATION_SETTINGS and not value:
+        return value, 0
+    return value, parse_interval(value)
+
+
+class CompiledConfig(dict):
+    """Immutable, validated configuration snapshot produced by load_config()
+
+    Behaves like the raw TOML dictionary (so existing config.get(...) calls keep
+    working) but rejects modification, and carries values that are otherwise
+    re-derived on hot paths every cycle:
+
+    - durations: parsed interval, no_change_timeout, reduced_frequency_interval, ...
+    - phase3_merge / assign_to_copilot: section configs with defaults applied
+    - ruleset_index: compiled rulesets (see ruleset_index.py)
+
+    Hot reload builds a new CompiledConfig and swaps the reference, so a cycle
+    never observes a half-updated configuration. Nested values (e.g., rulesets)
+    are shared with the snapshot and must not be modified either.
+    """
+
+    def __init__(self, raw: Mapping[str, Any]):
+        """Validate and precompute a configuration snapshot
+
+        Args:
+            raw: Configuration dictionary parsed from TOML
+
+        Raises:
+            ValueError: If a duration setting or a ruleset repository pattern is invalid
+        """
+        super().__init__(raw)
+        self.durations: Dict[str, Tuple[str, int]] = {
+            key: get_duration_setting(raw, key) for key in DURATION_SETTING_DEFAULTS
+        }
+        self.phase3_merge: Mapping[str, Any] = MappingProxyType(get_phase3_merge_config(raw))
+        self.assign_to_copilot: Mapping[str, Any] = MappingProxyType(get_assign_to_copilot_config(raw))
+        self.ruleset_index = RulesetIndex(raw.get("rulesets", []))
+        # Repositories already checked by validate_phase3_merge_config_required()
+        self._validated_repos: Set[Tuple[str, str]] = set()
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("CompiledConfig is immutable; edit the config file to change settings")
+
+    __setitem__ = _readonly
+    __delitem__ = _readonly
+    __ior__ = _readonly
+    clear = _readonly
+    pop = _readonly
+    popitem = _readonly
+    setdefault = _readonly
+    update = _readonly
+
+
+def load_config(config_path: str = "config.toml") -> "CompiledConfig":
     """Load configuration from TOML file
 
     Args:
         config_path: Path to the TOML configuration file
 
     Returns:
-        Dictionary containing configuration data with validated settings
+        Immutable CompiledConfig snapshot with validated and precomputed settings
 
     Raises:
         FileNotFoundError: If the configuration file is not found
+        ValueError: If the TOML, a duration setting or a ruleset repository pattern is invalid
     """
     with open(config_path, "rb") as f:
         config = tomli.load(f)
 
-    # Validate max_llm_working_parallel setting
-    if "max_llm_working_parallel" in config:
-        value = config["max_llm_working_parallel"]
-        if not isinstance(value, int) or value < 1:
+    # Validate positive integer settings (max_llm_working_parallel, max_parallel_actions, ...)
+    for key, default in POSITIVE_INT_SETTING_DEFAULTS.items():
+        if key in config:
+            value = config[key]
+            if not isinstance(value, int) or value < 1:
+                print(
+                    f"Warning: {key} must be a positive integer, "
+                    f"got {type(value).__name__}: {value!r}. "
+                    f"Using default value: {default}"
+                )
+                config[key] = default
+
+    # Validate action_backend setting
+    if "action_backend" in config and config["action_backend"] not in ACTION_BACKENDS:
+        print(
+            f"Warning: action_backend must be one of {', '.join(ACTION_BACKENDS)}, "
+            f"got {config['action_backend']!r}. Using default value: {ACTION_BACKEND_GH}"
+        )
+        config["action_backend"] = ACTION_BACKEND_GH
+
+    # Validate browser_queue settings
+    browser_queue = config.get("browser_queue")
+    if isinstance(browser_queue, dict):
+        dedupe = browser_queue.get("dedupe", BROWSER_QUEUE_DEDUPE_OPERATION)
+        if dedupe not in BROWSER_QUEUE_DEDUPE_MODES:
+            print(
+                f"Warning: browser_queue.dedupe must be one of {', '.join(BROWSER_QUEUE_DEDUPE_MODES)}, "
+                f"got {dedupe!r}. Using default value: {BROWSER_QUEUE_DEDUPE_OPERATION}"
+            )
+            browser_queue["dedupe"] = BROWSER_QUEUE_DEDUPE_OPERATION
+        priorities = browser_queue.get("priorities", {})
+        if isinstance(priorities, dict):
+            for kind, priority in list(priorities.items()):
+                if not isinstance(priority, int) or isinstance(priority, bool):
+                    print(f"Warning: browser_queue.priorities.{kind} must be an integer, got {priority!r}. Ignoring it")
+                    del priorities[kind]
+
+    # Validate ntfy dispatcher settings
+    ntfy = config.get("ntfy")
+    if isinstance(ntfy, dict):
+        for key, minimum in (("queue_size", 1), ("max_retries", 0)):
+            value = ntfy.get(key)
+            if value is not None and (not isinstance(value, int) or isinstance(value, bool) or value < minimum):
+                default = DEFAULT_NTFY_DISPATCH_CONFIG[key]
+                print(
+                    f"Warning: ntfy.{key} must be an integer >= {minimum}, got {value!r}. Using default value: {default}"
+                )
+                ntfy[key] = default
+        for key in ("retry_backoff_seconds", "rate_limit_seconds"):
+            value = ntfy.get(key)
+            if value is not None and (not isinstance(value, (int, float)) or isinstance(value, bool) or value < 0):
+                default = DEFAULT_NTFY_DISPATCH_CONFIG[key]
+                print(
+                    f"Warning: ntfy.{key} must be a non-negative number, got {value!r}. Using default value: {default}"
+                )
+                ntfy[key] = default
+        server = ntfy.get("server")
+        if server is not None and not (isinstance(server, str) and server.startswith(("http://", "https://"))):
+            print(f"Warning: ntfy.server must start with http:// or https://, got {server!r}. Using https://ntfy.sh")
+            del ntfy["server"]
+        digest_window = ntfy.get("digest_window")
+        if digest_window is not None:
+            try:
+                parse_interval(digest_window)
+            except (TypeError, ValueError) as e:
+                print(f"Warning: Invalid ntfy.digest_window: {e}. Using default value: 0s")
+                ntfy["digest_window"] = "0s"
+
+    # Validate adaptive polling settings
+    adaptive_polling = config.get("adaptive_polling")
+    if isinstance(adaptive_polling, dict):
+        for key in ADAPTIVE_POLLING_DURATION_KEYS:
+            value = adaptive_polling.get(key)
+            if value is not None:
+                try:
+                    if parse_interval(value) < 1:
+                        raise ValueError(f"{key} must be at least 1 second")
+                except (TypeError, ValueError) as e:
+                    default = DEFAULT_ADAPTIVE_POLLING_CONFIG[key]
+                    print(f"Warning: Invalid adaptive_polling.{key}: {e}. Using default value: {default}")
+                    adaptive_polling[key] = default
+        settings = get_adaptive_polling_config(config)
+        if parse_interval(settings["min_interval"]) > parse_interval(settings["max_interval"]):
             print(
-                f"Warning: max_llm_working_parallel must be a positive integer, "
-                f"got {type(value).__name__}: {value!r}. "
-                f"Using default value: {DEFAULT_MAX_LLM_WORKING_PARALLEL}"
+                f"Warning: adaptive_polling.min_interval ({settings['min_interval']}) is longer than "
+                f"max_interval ({settings['max_interval']}). Using min_interval for both"
             )
-            config["max_llm_working_parallel"] = DEFAULT_MAX_LLM_WORKING_PARALLEL
+            adaptive_polling["max_interval"] = settings["min_interval"]
+        rate_budget = adaptive_polling.get("rate_budget")
+        if rate_budget is not None and (
+            not isinstance(rate_budget, (int, float)) or isinstance(rate_budget, bool) or not 0 < rate_budget <= 1
+        ):
+            default = DEFAULT_ADAPTIVE_POLLING_CONFIG["rate_budget"]
+            print(
+                f"Warning: adaptive_polling.rate_budget must be a number in (0, 1], got {rate_budget!r}. "
+                f"Using default value: {default}"
+            )
+            adaptive_polling["rate_budget"] = default
+
+    # Validate polling tier settings
+    polling_tiers = config.get("polling_tiers")
+    if isinstance(polling_tiers, dict):
+        for key in POLLING_TIERS_DURATION_KEYS:
+            value = polling_tiers.get(key)
+            if value is not None:
+                try:
+                    parse_interval(value)
+                except ValueError as e:
+                    default = DEFAULT_POLLING_TIERS_CONFIG[key]
+                    print(f"Warning: Invalid polling_tiers.{key}: {e}. Using default value: {default}")
+                    polling_tiers[key] = default
+        settings = get_polling_tiers_config(config)
+        if parse_interval(settings["warm_interval"]) > parse_interval(settings["cold_interval"]):
+            print(
+                f"Warning: polling_tiers.warm_interval ({settings['warm_interval']}) is longer than "
+                f"cold_interval ({settings['cold_interval']}). Using warm_interval for both"
+            )
+            polling_tiers["cold_interval"] = settings["warm_interval"]
+        if settings["enabled"] and config.get("pipelined_cycle", False):
+            print("Warning: pipelined_cycle is ignored while polling_tiers is enabled")
+
+    # Validate control API settings
+    control_api = config.get("control_api")
+    if isinstance(control_api, dict):
+        port = control_api.get("port")
+        if port is not None and (not isinstance(port, int) or isinstance(port, bool) or not 0 <= port <= 65535):
+            default = DEFAULT_CONTROL_API_CONFIG["port"]
+            print(
+                f"Warning: control_api.port must be an integer in 0-65535, got {port!r}. Using default value: {default}"
+            )
+            control_api["port"] = default
+        for key in ("host", "socket", "token"):
+            value = control_api.get(key)
+            if value is not None and not isinstance(value, str):
+                default = DEFAULT_CONTROL_API_CONFIG[key]
+                print(f"Warning: control_api.{key} must be a string, got {value!r}. Using default value: {default!r}")
+                control_api[key] = default
+
+    # Validate thin client settings
+    thin_client = config.get("thin_client")
+    if isinstance(thin_client, dict):
+        for key in ("server", "token"):
+            value = thin_client.get(key)
+            if value is not None and not isinstance(value, str):
+                default = DEFAULT_THIN_CLIENT_CONFIG[key]
+                print(f"Warning: thin_client.{key} must be a string, got {value!r}. Using default value: {default!r}")
+                thin_client[key] = default
+        reconnect_interval = thin_client.get("reconnect_interval")
+        if reconnect_interval is not None:
+            try:
+                if parse_interval(reconnect_interval) < 1:
+                    raise ValueError("reconnect_interval must be at least 1 second")
+            except (TypeError, ValueError) as e:
+                default = DEFAULT_THIN_CLIENT_CONFIG["reconnect_interval"]
+                print(f"Warning: Invalid thin_client.reconnect_interval: {e}. Using default value: {default}")
+                thin_client["reconnect_interval"] = default
+
+    # Validate cross-instance coordination settings
+    coordination = config.get("coordination")
+    if isinstance(coordination, dict):
+        database = coordination.get("database")
+        if database is not None and (not isinstance(database, str) or not database):
+            default = DEFAULT_COORDINATION_CONFIG["database"]
+            print(
+                f"Warning: coordination.database must be a non-empty string, got {database!r}. "
+                f"Using default value: {default!r}"
+            )
+            coordination["database"] = default
+        lease_ttl = coordination.get("lease_ttl")
+        if lease_ttl is not None:
+            try:
+                if parse_interval(lease_ttl) < MIN_COORDINATION_LEASE_TTL_SECONDS:
+                    raise ValueError(f"lease_ttl must be at least {MIN_COORDINATION_LEASE_TTL_SECONDS} seconds")
+            except (TypeError, ValueError) as e:
+                default = DEFAULT_COORDINATION_CONFIG["lease_ttl"]
+                print(f"Warning: Invalid coordination.lease_ttl: {e}. Using default value: {default}")
+                coordination["lease_ttl"] = default
 
-    return config
+    # Precompute durations, section configs and the ruleset index once per load
+    return CompiledConfig(config)
 
 
 def print_config(config: Dict[str, Any]) -> None:
@@ -307,12 +795,60 @@ def print_config(config: Dict[str, Any]) -> None:
     print(f"  issue_display_limit: {config.get('issue_display_limit', 10)}")
     print(f"  no_change_timeout: {config.get('no_change_timeout', '30m')}")
     print(f"  reduced_frequency_interval: {config.get('reduced_frequency_interval', '1h')}")
+    print(f"  full_reconcile_interval: {config.get('full_reconcile_interval', '10m')}")
     print(f"  max_llm_working_parallel: {config.get('max_llm_working_parallel', DEFAULT_MAX_LLM_WORKING_PARALLEL)}")
+    print(f"  max_parallel_actions: {config.get('max_parallel_actions', DEFAULT_MAX_PARALLEL_ACTIONS)}")
+    print(f"  action_backend: {config.get('action_backend', ACTION_BACKEND_GH)}")
+    print(f"  pipelined_cycle: {config.get('pipelined_cycle', False)}")
+    print(f"  event_driven_wait: {config.get('event_driven_wait', False)}")
+    polling_tiers = get_polling_tiers_config(config)
+    print(f"  polling_tiers: {polling_tiers['enabled']}")
+    if polling_tiers["enabled"]:
+        for key in POLLING_TIERS_DURATION_KEYS:
+            print(f"    {key}: {polling_tiers[key]}")
+    adaptive_polling = get_adaptive_polling_config(config)
+    print(f"  adaptive_polling: {adaptive_polling['enabled']}")
+    if adaptive_polling["enabled"]:
+        for key in (*ADAPTIVE_POLLING_DURATION_KEYS, "rate_budget"):
+            print(f"    {key}: {adaptive_polling[key]}")
+    print(f"  action_journal: {config.get('action_journal', '') or '(disabled)'}")
+    print(f"  browser_worker: {config.get('browser_worker', False)}")
+    print(
+        f"  max_parallel_content_requests: {config.get('max_parallel_content_requests', DEFAULT_MAX_PARALLEL_CONTENT_REQUESTS)}"
+    )
     print(f"  verbose: {config.get('verbose', False)}")
+
     print(
         f"  check_process_before_autoraise: {config.get('check_process_before_autoraise', DEFAULT_CHECK_PROCESS_BEFORE_AUTORAISE)}"
     )
 
+    # Print control API settings
+    control_api = get_control_api_config(config)
+    if control_api["enabled"]:
+        print("\n[Control API]")
+        if control_api["socket"]:
+            print(f"  socket: {control_api['socket']}")
+        else:
+            print(f"  host: {control_api['host']}")
+            print(f"  port: {control_api['port']}")
+        print(f"  token: {'(set)' if control_api['token'] else '(none)'}")
+
+    # Print thin client settings
+    thin_client = get_thin_client_config(config)
+    if thin_client["server"]:
+        print("\n[Thin Client]")
+        print(f"  server: {thin_client['server']}")
+        print(f"  token: {'(set)' if thin_client['token'] else '(none)'}")
+        print(f"  open_browser: {thin_client['open_browser']}")
+        print(f"  reconnect_interval: {thin_client['reconnect_interval']}")
+
+    # Print cross-instance coordination settings
+    coordination = get_coordination_config(config)
+    if coordination["enabled"]:
+        print("\n[Coordination]")
+        print(f"  database: {coordination['database']}")
+        print(f"  lease_ttl: {coordination['lease_ttl']}")
+
     # Print rulesets
     rulesets = config.get("rulesets", [])
     if rulesets and isinstance(rulesets, list):
@@ -344,9 +880,26 @@ def print_config(config: Dict[str, Any]) -> None:
         print("\n[ntfy.sh Notification Settings]")
         print(f"  enabled: {ntfy.get('enabled', False)}")
         if ntfy.get("enabled", False):
+            print(f"  server: {ntfy.get('server', 'https://ntfy.sh')}")
             print(f"  topic: {ntfy.get('topic', 'N/A')}")
             print(f"  message: {ntfy.get('message', 'N/A')}")
             print(f"  priority: {ntfy.get('priority', 4)}")
+            for key, value in get_ntfy_dispatch_config(config).items():
+                print(f"  {key}: {value}")
+            print(f"  digest: {ntfy.get('digest', False)}")
+            if ntfy.get("digest", False):
+                print(f"  digest_window: {ntfy.get('digest_window', '0s')}")
+
+    # Print notification sinks
+    sinks = config.get("notification_sinks")
+    if sinks and isinstance(sinks, list):
+        print("\n[Notification Sinks]")
+        for index, sink in enumerate(sinks):
+            if not isinstance(sink, dict):
+                continue
+            target = sink.get("url") or sink.get("path") or sink.get("server") or sink.get("command") or ""
+            name = sink.get("name") or f"{sink.get('type')}#{index + 1}"
+            print(f"  {name}: type={sink.get('type', 'N/A')} {target}".rstrip())
 
     # Print phase3_merge settings
     phase3_merge = config.get("phase3_merge")
@@ -359,6 +912,7 @@ def print_config(config: Dict[str, Any]) -> None:
             print(f"  wait_seconds: {phase3_merge.get('wait_seconds', 10)}")
             print(f"  browser: {phase3_merge.get('browser', 'chromium')}")
             print(f"  headless: {phase3_merge.get('headless', False)}")
+            print(f"  user_data_dir: {phase3_merge.get('user_data_dir', 'N/A')}")
 
     # Print assign_to_copilot settings
     assign_to_copilot = config.get("assign_to_copilot")
@@ -369,19 +923,51 @@ def print_config(config: Dict[str, Any]) -> None:
         print(f"  wait_seconds: {assign_to_copilot.get('wait_seconds', 10)}")
         print(f"  browser: {assign_to_copilot.get('browser', 'chromium')}")
         print(f"  headless: {assign_to_copilot.get('headless', False)}")
+        print(f"  user_data_dir: {assign_to_copilot.get('user_data_dir', 'N/A')}")
+
+    # Print browser_queue settings
+    browser_queue = config.get("browser_queue")
+    if browser_queue and isinstance(browser_queue, dict):
+        queue_config = get_browser_queue_config(config)
+        print("\n[Browser Queue Settings]")
+        print(f"  enabled: {queue_config['enabled']}")
+        print(f"  dedupe: {queue_config['dedupe']}")
+        print(f"  priorities: {queue_config['priorities']}")
 
     print("\n" + "=" * 50)
 
 
+def get_ruleset_index(config: Dict[str, Any]) -> RulesetIndex:
+    """Get the compiled ruleset index for a configuration
+
+    Configurations returned by load_config() carry an index compiled at load time,
+    so it is only rebuilt when the config file changes (hot reload). For plain
+    dictionaries (e.g., built in code), the index is compiled on the fly.
+
+    Args:
+        config: Configuration dictionary
+
+    Returns:
+        Compiled RulesetIndex for the configuration's rulesets
+
+    Raises:
+        ValueError: If a ruleset contains an invalid regex pattern
+    """
+    if isinstance(config, CompiledConfig):
+        return config.ruleset_index
+    return RulesetIndex(config.get("rulesets", []))
+
+
 def resolve_execution_config_for_repo(config: Dict[str, Any], repo_owner: str, repo_name: str) -> Dict[str, Any]:
     """Resolve execution configuration for a specific repository using rulesets
 
     This function applies rulesets in order, with later rulesets overriding earlier ones.
     Global execution flags are no longer supported - all settings must be in rulesets.
+    Lookups go through the pre-compiled ruleset index (see ruleset_index.py).
 
     Args:
         config: Configuration dictionary loaded from TOML
-        repo_owner: Repository owner (kept for compatibility, but not used in matching)
+        repo_owner: Repository owner (used by "owner/name" patterns)
         repo_name: Repository name
 
     Returns:
@@ -393,72 +979,7 @@ def resolve_execution_config_for_repo(config: Dict[str, Any], repo_owner: str, r
         - assign_good_first_old: Assign one old "good first issue"
         - assign_old: Assign one old issue (any issue)
     """
-    # Start with all flags disabled (no global defaults)
-    result = {
-        "enable_execution_phase1_to_phase2": False,
-        "enable_execution_phase2_to_phase3": False,
-        "enable_execution_phase3_send_ntfy": False,
-        "enable_execution_phase3_to_merge": False,
-        "assign_good_first_old": False,  # Assign one old "good first issue"
-        "assign_old": False,  # Assign one old issue (any issue)
-    }
-
-    # Apply rulesets if they exist
-    rulesets = config.get("rulesets", [])
-    if not isinstance(rulesets, list):
-        return result
-
-    for ruleset in rulesets:
-        if not isinstance(ruleset, dict):
-            continue
-
-        # Get target repositories for this ruleset
-        repositories = ruleset.get("repositories", [])
-        if not isinstance(repositories, list):
-            continue
-
-        # Check if this ruleset applies to the current repository
-        applies = False
-        for repo_pattern in repositories:
-            if not isinstance(repo_pattern, str):
-                continue
-            # "all" matches all repositories
-            if repo_pattern.lower() == "all":
-                applies = True
-                break
-            # Match by repository name only
-            if repo_pattern == repo_name:
-                applies = True
-                break
-
-        # If this ruleset applies, override execution flags with validation
-        if applies:
-            if "enable_execution_phase1_to_phase2" in ruleset:
-                result["enable_execution_phase1_to_phase2"] = _validate_boolean_flag(
-                    ruleset["enable_execution_phase1_to_phase2"], "enable_execution_phase1_to_phase2"
-                )
-            if "enable_execution_phase2_to_phase3" in ruleset:
-                result["enable_execution_phase2_to_phase3"] = _validate_boolean_flag(
-                    ruleset["enable_execution_phase2_to_phase3"], "enable_execution_phase2_to_phase3"
-                )
-            if "enable_execution_phase3_send_ntfy" in ruleset:
-                result["enable_execution_phase3_send_ntfy"] = _validate_boolean_flag(
-                    ruleset["enable_execution_phase3_send_ntfy"], "enable_execution_phase3_send_ntfy"
-                )
-            if "enable_execution_phase3_to_merge" in ruleset:
-                result["enable_execution_phase3_to_merge"] = _validate_boolean_flag(
-                    ruleset["enable_execution_phase3_to_merge"], "enable_execution_phase3_to_merge"
-                )
-
-            # Apply auto-assign flags
-            if "assign_good_first_old" in ruleset:
-                result["assign_good_first_old"] = _validate_boolean_flag(
-                    ruleset["assign_good_first_old"], "assign_good_first_old"
-                )
-            if "assign_old" in ruleset:
-                result["assign_old"] = _validate_boolean_flag(ruleset["assign_old"], "assign_old")
-
-    return result
+    return get_ruleset_index(config).resolve(repo_owner, repo_name)
 
 
 def print_repo_execution_config(repo_owner: str, repo_name: str, exec_config: Dict[str, Any]) -> None:
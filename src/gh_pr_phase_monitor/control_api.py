@@ -0,0 +1,411 @@
+"""
+Local control API
+
+With `[control_api] enabled = true`, a small HTTP server on 127.0.0.1 (or on a
+Unix socket when `socket` is set) exposes the monitor to editors, status bars
+and scripts, so they do not have to run their own `gh` queries against the
+same API budget:
+
+- GET  /state   Snapshot of the last check as JSON: PRs with phase, time in
+                phase and pending actions, the GraphQL rate limit, when the
+                next check is due and whether actions are paused
+- POST /refresh End the current wait and check right away
+- POST /pause   Pause PR actions and issue auto-assignment (PRs are still
+                fetched and displayed)
+- POST /resume  Resume actions; the next check is a full reconcile so PRs
+                skipped while paused are processed
+- GET  /events  Server-sent events: a "snapshot" event with the state above on
+                connect, then a "delta" event per check with the PRs that were
+                added or changed and the URLs of the PRs that were removed
+
+/events lets one monitor do all the fetching for any number of screens (see
+thin_client.py): the GraphQL cost does not grow with the number of clients.
+
+The snapshot is serialized once per check, so GET /state only writes cached
+bytes. Requests carrying an Origin header (sent by web browsers) are refused,
+so web pages cannot drive the API. Without a token, requests must also name a
+loopback host or the configured host in their Host header, so a web page on a
+domain that resolves to 127.0.0.1 (DNS rebinding) cannot read the state. When
+`token` is set, every request must carry it as "Authorization: Bearer <token>"
+(needed to serve other machines).
+"""
+
+import hmac
+import json
+import os
+import queue
+import socket
+import socketserver
+import stat
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+
+from .action_executor import are_actions_paused, pause_actions, resume_actions
+from .config import get_control_api_config
+from .pr_actions import has_pending_actions
+from .pr_fetcher import get_last_rate_limit
+from .snapshot_diff import request_full_reconcile
+from .state_tracker import get_pr_state_time
+from .wait_events import request_immediate_check
+
+# Snapshot served by GET /state, and its serialized form
+_state: Dict[str, Any] = {"check": 0, "prs": []}
+_state_body = b""
+_state_lock = threading.Lock()
+
+# Running server and the settings it was started with
+_server: Optional[ThreadingHTTPServer] = None
+_server_settings: Optional[Tuple[str, int, str]] = None
+_token = ""
+
+# Event queues of the connected /events clients (None closes a stream)
+_subscribers: List["queue.Queue[Optional[bytes]]"] = []
+
+# Events buffered per client; a client that falls this far behind is disconnected
+# and gets a fresh snapshot when it reconnects
+SUBSCRIBER_QUEUE_SIZE = 100
+
+# Seconds between keep-alive comments on idle event streams
+EVENT_KEEPALIVE_SECONDS = 15
+
+LOOPBACK_HOSTS = ("127.0.0.1", "::1", "localhost")
+
+
+def _iso_time(timestamp: float) -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(timestamp))
+
+
+def _serialize_state() -> None:
+    """Refresh the cached body of GET /state (called with _state_lock held)"""
+    global _state_body
+    _state["paused"] = are_actions_paused()
+    _state_body = json.dumps(_state, ensure_ascii=False).encode("utf-8")
+
+
+def _format_event(event: str, body: bytes) -> bytes:
+    return b"event: " + event.encode("ascii") + b"\ndata: " + body + b"\n\n"
+
+
+def _close_subscriber(subscriber: "queue.Queue[Optional[bytes]]") -> None:
+    """Drop the buffered events of a client and end its stream"""
+    while True:
+        try:
+            subscriber.get_nowait()
+        except queue.Empty:
+            break
+    subscriber.put_nowait(None)
+
+
+def _broadcast_delta(changed: List[Dict[str, Any]], removed: List[str]) -> None:
+    """Send a delta event to every /events client (called with _state_lock held)"""
+    if not _subscribers:
+        return
+    delta = {key: value for key, value in _state.items() if key != "prs"}
+    delta.update({"changed": changed, "removed": removed})
+    event = _format_event("delta", json.dumps(delta, ensure_ascii=False).encode("utf-8"))
+    for subscriber in list(_subscribers):
+        try:
+            subscriber.put_nowait(event)
+        except queue.Full:
+            _subscribers.remove(subscriber)
+            _close_subscriber(subscriber)
+
+
+def _subscribe() -> "queue.Queue[Optional[bytes]]":
+    """Register an /events client; its first event is a snapshot of the current state"""
+    subscriber: "queue.Queue[Optional[bytes]]" = queue.Queue(SUBSCRIBER_QUEUE_SIZE)
+    with _state_lock:
+        if not _state_body:
+            _serialize_state()
+        subscriber.put_nowait(_format_event("snapshot", _state_body))
+        _subscribers.append(subscriber)
+    return subscriber
+
+
+def _unsubscribe(subscriber: "queue.Queue[Optional[bytes]]") -> None:
+    with _state_lock:
+        if subscriber in _subscribers:
+            _subscribers.remove(subscriber)
+
+
+def _comparable(entry: Dict[str, Any]) -> Dict[str, Any]:
+    # The time in phase grows every check; a PR only changes when it enters another phase
+    return {key: value for key, value in entry.items() if key != "time_in_phase_seconds"}
+
+
+def publish_state(
+    all_prs: List[Dict[str, Any]],
+    pr_phases: List[str],
+    check: int,
+    next_check_seconds: Optional[int] = None,
+    now: Optional[float] = None,
+) -> None:
+    """Store the state of the last check for GET /state
+
+    Args:
+        all_prs: PRs of the check
+        pr_phases: Phase of each PR
+        check: Check number
+        next_check_seconds: Seconds until the next check (None if unknown)
+        now: Current time (epoch seconds, defaults to time.time())
+    """
+    now = time.time() if now is None else now
+    prs = []
+    for pr, phase in zip(all_prs, pr_phases):
+        url = pr.get("url", "")
+        repository = pr.get("repository", {})
+        entered_at = get_pr_state_time(url, phase)
+        prs.append(
+            {
+                "url": url,
+                "title": pr.get("title", ""),
+                "repository": f"{repository.get('owner', '')}/{repository.get('name', '')}",
+                "phase": phase,
+                "entered_phase_at": _iso_time(entered_at) if entered_at is not None else None,
+                "time_in_phase_seconds": round(now - entered_at) if entered_at is not None else 0,
+                "pending_actions": has_pending_actions(url),
+            }
+        )
+    with _state_lock:
+        previous = {entry["url"]: _comparable(entry) for entry in _state.get("prs", [])}
+        changed = [entry for entry in prs if previous.get(entry["url"]) != _comparable(entry)]
+        current_urls = {entry["url"] for entry in prs}
+        removed = [url for url in previous if url not in current_urls]
+        _state.clear()
+        _state.update(
+            {
+                "check": check,
+                "checked_at": _iso_time(now),
+                "next_check_at": _iso_time(now + next_check_seconds) if next_check_seconds is not None else None,
+                "prs": prs,
+                "rate_limit": get_last_rate_limit(),
+            }
+        )
+        _serialize_state()
+        _broadcast_delta(changed, removed)
+
+
+def get_state() -> Dict[str, Any]:
+    """Get a copy of the snapshot served by GET /state"""
+    with _state_lock:
+        return json.loads(_state_body) if _state_body else dict(_state)
+
+
+def _set_paused(paused: bool) -> None:
+    if paused:
+        pause_actions()
+    else:
+        resume_actions()
+        # PRs whose actions were skipped while paused are unchanged for the snapshot diff
+        request_full_reconcile()
+    with _state_lock:
+        _serialize_state()
+        _broadcast_delta([], [])
+
+
+class _ControlRequestHandler(BaseHTTPRequestHandler):
+    """Routes of the control API"""
+
+    server_version = "gh-pr-phase-monitor"
+
+    def _send_json(self, status: int, body: bytes) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_result(self, status: int, **fields: Any) -> None:
+        self._send_json(status, json.dumps(fields).encode("utf-8"))
+
+    def _from_allowed_client(self) -> bool:
+        """Refuse requests from web pages (Origin header, or unexpected Host without a token); sends 403"""
+        if self.headers.get("Origin"):
+            self._send_result(403, error="requests from web pages are not allowed")
+            return False
+        host_header = self.headers.get("Host", "")
+        if _token or not host_header or isinstance(self.server, _UnixHTTPServer):
+            return True
+        if host_header.startswith("["):
+            host = host_header[1:].split("]", 1)[0]
+        else:
+            host = host_header.rsplit(":", 1)[0] if host_header.count(":") == 1 else host_header
+        configured_host = _server_settings[0] if _server_settings else ""
+        if host.lower() in LOOPBACK_HOSTS or host.lower() == configured_host.lower():
+            return True
+        self._send_result(403, error="unexpected Host header")
+        return False
+
+    def _authorized(self) -> bool:
+        """Check the bearer token (if one is configured); sends 401 otherwise"""
+        if not _token or hmac.compare_digest(self.headers.get("Authorization", ""), f"Bearer {_token}"):
+            return True
+        self._send_result(401, error="unauthorized")
+        return False
+
+    def _stream_events(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream; charset=utf-8")
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        subscriber = _subscribe()
+        try:
+            while True:
+                try:
+                    event = subscriber.get(timeout=EVENT_KEEPALIVE_SECONDS)
+                except queue.Empty:
+                    event = b": keepalive\n\n"
+                if event is None:
+                    break
+                self.wfile.write(event)
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            # The client went away
+            pass
+        finally:
+            _unsubscribe(subscriber)
+
+    def do_GET(self) -> None:
+        if not self._from_allowed_client() or not self._authorized():
+            return
+        route = self.path.split("?", 1)[0]
+        if route == "/events":
+            self._stream_events()
+            return
+        if route != "/state":
+            self._send_result(404, error="not found")
+            return
+        with _state_lock:
+            if not _state_body:
+                _serialize_state()
+            body = _state_body
+        self._send_json(200, body)
+
+    def do_POST(self) -> None:
+        if not self._from_allowed_client() or not self._authorized():
+            return
+        route = self.path.split("?", 1)[0]
+        if route == "/refresh":
+            request_immediate_check()
+        elif route in ("/pause", "/resume"):
+            _set_paused(route == "/pause")
+        else:
+            self._send_result(404, error="not found")
+            return
+        self._send_result(200, ok=True, paused=are_actions_paused())
+
+    def log_message(self, format: str, *args: Any) -> None:
+        # Requests are frequent (status bars) and would flood the monitor output
+        pass
+
+
+class _UnixHTTPServer(ThreadingHTTPServer):
+    """HTTP server on a Unix domain socket"""
+
+    address_family = getattr(socket, "AF_UNIX", socket.AF_INET)
+
+    def server_bind(self) -> None:
+        # Create the socket file without access for other users, instead of restricting it after the bind
+        old_umask = os.umask(0o177)
+        try:
+            socketserver.TCPServer.server_bind(self)
+        finally:
+            os.umask(old_umask)
+        os.chmod(self.server_address, 0o600)
+        self.server_name = "localhost"
+        self.server_port = 0
+
+
+def _remove_stale_socket(socket_path: str) -> None:
+    """Remove a socket file left behind by a previous run
+
+    Raises:
+        OSError: If the path is not a socket, or another instance is still listening on it
+    """
+    try:
+        mode = os.lstat(socket_path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise OSError(f"{socket_path} exists and is not a socket")
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.settimeout(1)
+        probe.connect(socket_path)
+    except OSError:
+        # Nobody is listening: left behind by a previous run
+        os.unlink(socket_path)
+        return
+    finally:
+        probe.close()
+    raise OSError(f"{socket_path} is in use by another running instance")
+
+
+def _create_server(host: str, port: int, socket_path: str) -> ThreadingHTTPServer:
+    if socket_path:
+        if not hasattr(socket, "AF_UNIX"):
+            raise OSError("Unix sockets are not supported on this system")
+        _remove_stale_socket(socket_path)
+        return _UnixHTTPServer(socket_path, _ControlRequestHandler)
+    return ThreadingHTTPServer((host, port), _ControlRequestHandler)
+
+
+def get_control_api_address() -> Optional[str]:
+    """Address of the running control API (URL or socket path), or None if not running"""
+    if _server is None:
+        return None
+    if isinstance(_server, _UnixHTTPServer):
+        return str(_server.server_address)
+    host, port = _server.server_address[:2]
+    return f"http://{host}:{port}"
+
+
+def stop_control_api() -> None:
+    """Stop the control API server"""
+    global _server, _server_settings
+    if _server is None:
+        return
+    with _state_lock:
+        for subscriber in _subscribers:
+            _close_subscriber(subscriber)
+        _subscribers.clear()
+    _server.shutdown()
+    _server.server_close()
+    if isinstance(_server, _UnixHTTPServer) and os.path.exists(_server.server_address):
+        os.unlink(_server.server_address)
+    _server = None
+    _server_settings = None
+
+
+def configure_control_api(config: Dict[str, Any]) -> None:
+    """Start, restart or stop the control API according to [control_api]
+
+    Called at startup and on hot reload. Failing to bind only prints a warning.
+
+    Args:
+        config: Configuration dictionary
+    """
+    global _server, _server_settings, _token
+    settings = get_control_api_config(config)
+    if not settings["enabled"]:
+        stop_control_api()
+        return
+
+    _token = settings["token"]
+    if not settings["socket"] and settings["host"] not in LOOPBACK_HOSTS and not _token:
+        print(f"Warning: The control API on {settings['host']} is reachable from other machines without a token")
+
+    wanted = (settings["host"], settings["port"], settings["socket"])
+    if _server is not None and wanted == _server_settings:
+        return
+    stop_control_api()
+    try:
+        _server = _create_server(*wanted)
+    except OSError as e:
+        print(f"Warning: Could not start the control API: {e}")
+        return
+    _server_settings = wanted
+    threading.Thread(target=_server.serve_forever, args=(0.5,), name="control-api", daemon=True).start()
+    print(f"Control API listening on {get_control_api_address()}")
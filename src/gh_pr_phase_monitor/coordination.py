@@ -0,0 +1,365 @@
+"""
+Cross-instance coordination
+
+Two monitors running against the same account (two terminals, or a restart
+overlapping the previous run) would both post comments, merge and open
+browsers. With `[coordination] enabled = true`, instances sharing the same
+SQLite `database` elect a leader through a lease:
+
+- The leader holds the lease, renewing it from a heartbeat thread every third
+  of `lease_ttl` as long as the monitoring loop makes progress: the loop reports
+  progress at the start of each check and before each wait, and the lease is
+  only renewed while the last report is younger than `lease_ttl` plus the
+  interval of that wait. Only the leader fetches from GitHub and runs actions,
+  and it writes the state of each check (the GET /state snapshot of control_api)
+  to the database.
+- The other instances are read-only followers: each check, they display the
+  leader's snapshot instead of querying GitHub, and run no actions.
+- When the leader exits, its lease is released. When it dies, the lease expires
+  after `lease_ttl`; when it hangs (e.g. in a `gh` call or a browser step), it
+  stops renewing once its last progress report is too old, and the lease
+  expires `lease_ttl` after that. The next follower to check takes over,
+  replays the action journal (so comments and merges recorded by the previous
+  leader are not repeated) and processes every PR once.
+
+Only the leader opens the action journal: opening it replays and compacts the
+file, which would drop entries the leader appends meanwhile if a follower did it.
+
+Leadership is checked at the start of each check; a leader that loses its lease
+while a check is running (e.g. after the machine slept longer than lease_ttl)
+finishes that check and becomes a follower at the next one.
+
+SQLite locking needs a local disk; do not put the database on a network share.
+"""
+
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import closing
+from typing import Any, Dict, List, Optional, Tuple
+
+from .action_journal import configure_action_journal
+from .config import get_coordination_config, parse_interval
+from .snapshot_diff import request_full_reconcile
+from .thin_client import ThinClientState
+
+# Name of the lease and of the shared snapshot row
+LEASE_NAME = "monitor"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS lease (
+    name TEXT PRIMARY KEY,
+    holder TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS snapshot (
+    name TEXT PRIMARY KEY,
+    holder TEXT NOT NULL,
+    written_at REAL NOT NULL,
+    body TEXT NOT NULL
+);
+"""
+
+
+class InstanceLease:
+    """Lease and shared snapshot stored in a SQLite database
+
+    Args:
+        database: Path of the database file (created if missing)
+        ttl_seconds: Seconds a lease stays valid after its last renewal
+        holder: Identifier of this instance (defaults to host, PID and a random suffix)
+    """
+
+    def __init__(self, database: str, ttl_seconds: int, holder: Optional[str] = None):
+        self.database = os.path.expanduser(database)
+        self.ttl_seconds = ttl_seconds
+        self.holder = holder or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        directory = os.path.dirname(self.database)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with closing(self._connect()) as connection:
+            connection.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        # Autocommit mode, so transactions are started explicitly with BEGIN IMMEDIATE
+        return sqlite3.connect(self.database, timeout=10, isolation_level=None)
+
+    def try_acquire(self, now: Optional[float] = None) -> bool:
+        """Acquire or renew the lease
+
+        Args:
+            now: Current time (epoch seconds, defaults to time.time())
+
+        Returns:
+            True if this instance holds the lease
+        """
+        now = time.time() if now is None else now
+        connection = self._connect()
+        try:
+            # Take the write lock before reading, so two instances cannot both see an expired lease
+            connection.execute("BEGIN IMMEDIATE")
+            row = connection.execute("SELECT holder, expires_at FROM lease WHERE name = ?", (LEASE_NAME,)).fetchone()
+            acquired = row is None or row[0] == self.holder or row[1] <= now
+            if acquired:
+                connection.execute(
+                    "INSERT OR REPLACE INTO lease (name, holder, expires_at) VALUES (?, ?, ?)",
+                    (LEASE_NAME, self.holder, now + self.ttl_seconds),
+                )
+            connection.execute("COMMIT")
+            return acquired
+        finally:
+            connection.close()
+
+    def release(self) -> None:
+        """Give up the lease if this instance holds it"""
+        with closing(self._connect()) as connection:
+            connection.execute("DELETE FROM lease WHERE name = ? AND holder = ?", (LEASE_NAME, self.holder))
+
+    def current_holder(self, now: Optional[float] = None) -> Optional[str]:
+        """Holder of the unexpired lease, or None"""
+        now = time.time() if now is None else now
+        with closing(self._connect()) as connection:
+            row = connection.execute("SELECT holder, expires_at FROM lease WHERE name = ?", (LEASE_NAME,)).fetchone()
+        return row[0] if row is not None and row[1] > now else None
+
+    def write_snapshot(self, body: str, now: Optional[float] = None) -> None:
+        """Store the leader's snapshot (JSON)"""
+        now = time.time() if now is None else now
+        with closing(self._connect()) as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO snapshot (name, holder, written_at, body) VALUES (?, ?, ?, ?)",
+                (LEASE_NAME, self.holder, now, body),
+            )
+
+    def read_snapshot(self) -> Optional[Tuple[str, float, str]]:
+        """Latest snapshot as (holder, written_at, JSON body), or None if no leader wrote one yet"""
+        with closing(self._connect()) as connection:
+            row = connection.execute(
+                "SELECT holder, written_at, body FROM snapshot WHERE name = ?", (LEASE_NAME,)
+            ).fetchone()
+        return (row[0], row[1], row[2]) if row is not None else None
+
+
+class Coordinator:
+    """Elects this instance as leader or follower and keeps the lease alive while leading
+
+    Args:
+        lease: Lease shared with the other instances
+        config: Configuration dictionary (used to replay the action journal on takeover)
+    """
+
+    def __init__(self, lease: InstanceLease, config: Dict[str, Any]):
+        self.lease = lease
+        self.config = config
+        self.is_leader = False
+        # None until the first check, so starting as leader is not reported as a takeover
+        self._was_leader: Optional[bool] = None
+        # Last progress report of the monitoring loop, and how long it may take until the next one
+        self._progress_at = time.time()
+        self._progress_allowance = 0
+        self._stalled = False
+        self._stop = threading.Event()
+        self._heartbeat = threading.Thread(target=self._renew_lease, name="coordination-heartbeat", daemon=True)
+        self._heartbeat.start()
+
+    def check(self) -> bool:
+        """Decide the role of this instance for the next check
+
+        Returns:
+            True if this instance leads (fetches and runs actions)
+        """
+        self.report_progress()
+        self.is_leader = self.lease.try_acquire()
+        if self.is_leader and self._was_leader is False:
+            print("Coordination: took over as leader; replaying the action journal and processing every PR")
+            configure_action_journal(self.config, reopen=True)
+            request_full_reconcile()
+        elif self.is_leader and self._was_leader is None:
+            print("Coordination: this instance is the leader")
+            configure_action_journal(self.config, reopen=True)
+        elif not self.is_leader and self._was_leader is not False:
+            print(f"Coordination: following {self.lease.current_holder() or 'another instance'} (read-only)")
+            configure_action_journal(None)
+        self._was_leader = self.is_leader
+        return self.is_leader
+
+    def report_progress(self, next_report_within: Optional[int] = None, now: Optional[float] = None) -> None:
+        """Record that the monitoring loop is making progress
+
+        Args:
+            next_report_within: Seconds until the next report is expected, e.g. the interval of
+                the wait that follows (None keeps the previous value)
+            now: Current time (epoch seconds, defaults to time.time())
+        """
+        self._progress_at = time.time() if now is None else now
+        if next_report_within is not None:
+            self._progress_allowance = next_report_within
+        self._stalled = False
+
+    def renew_if_progressing(self, now: Optional[float] = None) -> bool:
+        """Renew the lease, unless the monitoring loop stopped reporting progress
+
+        Args:
+            now: Current time (epoch seconds, defaults to time.time())
+
+        Returns:
+            True if the lease was renewed
+        """
+        now = time.time() if now is None else now
+        if now - self._progress_at >= self.lease.ttl_seconds + self._progress_allowance:
+            if not self._stalled:
+                self._stalled = True
+                print("\nWarning: The monitoring loop is not making progress; letting the coordination lease expire")
+            return False
+        if self.lease.try_acquire(now=now):
+            return True
+        self.is_leader = False
+        # Another instance led in the meantime, so leading again is a takeover
+        self._was_leader = False
+        print("\nWarning: Lost the coordination lease; this instance becomes a follower at the next check")
+        return False
+
+    def _renew_lease(self) -> None:
+        interval = max(1, self.lease.ttl_seconds // 3)
+        while not self._stop.wait(interval):
+            if not self.is_leader:
+                continue
+            try:
+                self.renew_if_progressing()
+            except sqlite3.Error as e:
+                print(f"\nWarning: Could not renew the coordination lease: {e}")
+
+    def stop(self) -> None:
+        """Stop the heartbeat and release the lease, so a follower can take over at once"""
+        self._stop.set()
+        if self.is_leader:
+            self.lease.release()
+            self.is_leader = False
+
+
+_coordinator: Optional[Coordinator] = None
+_coordinator_settings: Optional[Tuple[str, int]] = None
+
+
+def configure_coordination(config: Dict[str, Any]) -> None:
+    """Start, restart or stop coordination according to [coordination]
+
+    Called at startup and on hot reload. If the database cannot be opened, a warning
+    is printed and the instance runs uncoordinated.
+
+    Args:
+        config: Configuration dictionary
+    """
+    global _coordinator, _coordinator_settings
+    settings = get_coordination_config(config)
+    wanted = (settings["database"], parse_interval(settings["lease_ttl"])) if settings["enabled"] else None
+    if _coordinator is not None and wanted == _coordinator_settings:
+        _coordinator.config = config
+        return
+    stop_coordination()
+    if wanted is None:
+        return
+    try:
+        _coordinator = Coordinator(InstanceLease(*wanted), config)
+    except (OSError, sqlite3.Error) as e:
+        print(f"Warning: Could not open the coordination database: {e}")
+        return
+    _coordinator_settings = wanted
+
+
+def configure_coordinated_journal(config: Dict[str, Any]) -> None:
+    """Open the action journal, unless another instance may be writing to it
+
+    Without coordination, or while leading, this is configure_action_journal(config).
+    Followers keep the journal closed; it is opened when they become leader.
+
+    Args:
+        config: Configuration dictionary
+    """
+    if _coordinator is None or _coordinator.is_leader:
+        configure_action_journal(config)
+    else:
+        configure_action_journal(None)
+
+
+def check_leadership() -> bool:
+    """Check whether this instance should fetch and run actions in this check
+
+    Returns:
+        True if coordination is disabled or this instance is the leader
+    """
+    if _coordinator is None:
+        return True
+    try:
+        return _coordinator.check()
+    except sqlite3.Error as e:
+        # Without the database nobody can be elected; keep the previous role
+        print(f"Warning: Could not check the coordination lease: {e}")
+        return _coordinator.is_leader
+
+
+def report_coordination_progress(next_report_within: int) -> None:
+    """Tell the heartbeat that the monitoring loop is alive (called before each wait)
+
+    Args:
+        next_report_within: Seconds until the next check starts (the wait interval)
+    """
+    if _coordinator is not None:
+        _coordinator.report_progress(next_report_within)
+
+
+def share_snapshot(state: Dict[str, Any]) -> None:
+    """Store the state of this check for the followers (leader only)
+
+    Args:
+        state: Snapshot of the check (control_api.get_state())
+    """
+    if _coordinator is None or not _coordinator.is_leader:
+        return
+    try:
+        _coordinator.lease.write_snapshot(json.dumps(state, ensure_ascii=False))
+    except sqlite3.Error as e:
+        print(f"Warning: Could not share the snapshot with the other instances: {e}")
+
+
+def read_leader_snapshot() -> Tuple[List[Dict[str, Any]], List[str]]:
+    """Load the leader's last snapshot (followers)
+
+    Returns:
+        Tuple of (PRs, phases) in the shape of fetched PR data, empty if no snapshot is available
+    """
+    if _coordinator is None:
+        return [], []
+    try:
+        snapshot = _coordinator.lease.read_snapshot()
+    except sqlite3.Error as e:
+        print(f"Warning: Could not read the leader's snapshot: {e}")
+        return [], []
+    if snapshot is None:
+        print("  The leader has not shared a snapshot yet")
+        return [], []
+
+    holder, written_at, body = snapshot
+    state = ThinClientState()
+    state.apply("snapshot", json.loads(body))
+    state.sync_phase_times()
+    written_time = time.strftime("%H:%M:%S", time.localtime(written_at))
+    print(f"  Following {holder}: snapshot of check #{state.info.get('check', 0)} written at {written_time}")
+    return state.prs_and_phases()
+
+
+def stop_coordination() -> None:
+    """Stop coordination and release the lease (on exit)"""
+    global _coordinator, _coordinator_settings
+    if _coordinator is not None:
+        try:
+            _coordinator.stop()
+        except sqlite3.Error:
+            # The lease expires by itself after lease_ttl
+            pass
+    _coordinator = None
+    _coordinator_settings = None
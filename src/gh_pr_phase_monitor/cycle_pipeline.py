@@ -0,0 +1,172 @@
+"""
+Pipelined monitoring cycle
+
+Without the pipeline, a cycle fetches the PR details of every repository
+batch, then classifies all PRs, then runs all actions. With
+`pipelined_cycle = true`, the stages overlap:
+
+- A fetch thread runs the Phase 2 GraphQL queries batch by batch and hands
+  each batch over through a bounded queue (at most PIPELINE_QUEUE_SIZE batches
+  ahead of the actions, so a slow action stage does not buffer every batch)
+- Each batch is classified and its added/changed PRs are dispatched to the
+  action executor as soon as it arrives, while the next batch is fetched
+- Once the last batch is classified and all PRs are "LLM working", the fetch
+  of repositories with open issues starts in the background, overlapping the
+  last batch's actions
+
+The time from the start of a cycle to the first action drops to roughly the
+latency of one batch.
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .action_executor import execute_pr_actions
+from .github_client import get_repositories_with_no_prs_and_open_issues, iter_pr_details_batches
+from .mutation_batch import batched_mutations
+from .phase_detector import PHASE_LLM_WORKING, determine_phase
+from .pr_actions import has_pending_actions
+from .pr_fetcher import count_pr_detail_batches
+from .snapshot_diff import is_pr_delta
+
+# Maximum number of fetched batches waiting for the action stage
+PIPELINE_QUEUE_SIZE = 2
+
+# Marks the end of the fetched batches
+_DONE = object()
+
+
+class PipelineResult:
+    """Outcome of a pipelined cycle
+
+    Attributes:
+        all_prs: All fetched PRs, in fetch order
+        pr_phases: Phase of each PR
+        processed_count: PRs whose actions were run
+        skipped_count: Unchanged PRs skipped until the next full reconcile
+        time_to_first_action: Seconds from the start of the cycle to the first dispatched action (None if none)
+        issue_prefetch: Background fetch of repositories with open issues (only when all PRs are "LLM working")
+    """
+
+    def __init__(self):
+        self.all_prs: List[Dict[str, Any]] = []
+        self.pr_phases: List[str] = []
+        self.processed_count = 0
+        self.skipped_count = 0
+        self.time_to_first_action: Optional[float] = None
+        self.issue_prefetch: Optional[Future] = None
+
+    def prefetched_repos_with_issues(self) -> Optional[List[Dict[str, Any]]]:
+        """Wait for the issue prefetch
+
+        Returns:
+            Repositories with open issues, or None if not prefetched or the fetch failed
+        """
+        if self.issue_prefetch is None:
+            return None
+        try:
+            return self.issue_prefetch.result()
+        except Exception as e:
+            print(f"  ⚠ Prefetching repositories with open issues failed: {e}")
+            return None
+
+
+def _fetch_batches(repos: List[Dict[str, Any]], batches: "queue.Queue[Any]", stop: threading.Event) -> None:
+    """Fetch thread: put each batch of PRs (or the error) on the queue, then _DONE"""
+
+    def put(item: Any) -> bool:
+        while not stop.is_set():
+            try:
+                batches.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    try:
+        for batch_prs in iter_pr_details_batches(repos):
+            if not put(batch_prs):
+                return
+    except Exception as e:
+        put(e)
+        return
+    put(_DONE)
+
+
+def run_pipelined_cycle(
+    repos_with_prs: List[Dict[str, Any]],
+    config: Optional[Dict[str, Any]],
+    process: Callable[[Dict[str, Any], Optional[Dict[str, Any]], str], None],
+    full_reconcile: bool,
+    batch_mutations: bool = False,
+) -> PipelineResult:
+    """Fetch, classify and act on the PRs of repos_with_prs as an overlapping pipeline
+
+    Args:
+        repos_with_prs: Repositories with open PRs (Phase 1 result)
+        config: Configuration dictionary
+        process: Per-PR processing function, called as process(pr, config, phase)
+        full_reconcile: Process every PR instead of only added/changed ones
+        batch_mutations: Send each batch's actions as batched GraphQL mutations
+
+    Returns:
+        PipelineResult (call diff_snapshot with its PRs afterwards to store the new baseline)
+
+    Raises:
+        Exception: Errors of the GraphQL queries are raised in the calling thread
+    """
+    start_time = time.monotonic()
+    result = PipelineResult()
+    total_batches = count_pr_detail_batches(repos_with_prs)
+    batches: "queue.Queue[Any]" = queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+    stop = threading.Event()
+    fetcher = threading.Thread(
+        target=_fetch_batches, args=(repos_with_prs, batches, stop), name="pr-fetch", daemon=True
+    )
+    prefetch_executor: Optional[ThreadPoolExecutor] = None
+    fetcher.start()
+
+    try:
+        batch_index = 0
+        while True:
+            item = batches.get()
+            if item is _DONE:
+                break
+            if isinstance(item, Exception):
+                raise item
+
+            batch_phases = [determine_phase(pr) for pr in item]
+            result.all_prs.extend(item)
+            result.pr_phases.extend(batch_phases)
+            batch_index += 1
+
+            # The LLM working condition is known once the last batch is classified
+            if batch_index == total_batches and result.pr_phases:
+                if all(phase == PHASE_LLM_WORKING for phase in result.pr_phases):
+                    prefetch_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="issue-prefetch")
+                    result.issue_prefetch = prefetch_executor.submit(get_repositories_with_no_prs_and_open_issues)
+
+            to_process: List[Tuple[Dict[str, Any], str]] = []
+            for pr, phase in zip(item, batch_phases):
+                url = pr.get("url", "")
+                if full_reconcile or is_pr_delta(pr, phase) or has_pending_actions(url):
+                    to_process.append((pr, phase))
+                else:
+                    result.skipped_count += 1
+            if not to_process:
+                continue
+
+            if result.time_to_first_action is None:
+                result.time_to_first_action = time.monotonic() - start_time
+            result.processed_count += len(to_process)
+            with batched_mutations(batch_mutations):
+                execute_pr_actions(to_process, config, process)
+    finally:
+        stop.set()
+        if prefetch_executor is not None:
+            prefetch_executor.shutdown(wait=False)
+
+    return result
@@ -0,0 +1,258 @@
+"""
+Bounded store of debug artifacts for browser automation failures
+
+When a button lookup fails, a screenshot and a JSON description are saved to
+`debug_dir`. This store keeps that cheap and bounded:
+- PNG encoding and file writes run on a background thread, so the monitoring
+  loop only pays for the screen capture
+- Identical failures (same button, perceptually similar screen) are recorded
+  once; repeats only increment `occurrences` in the existing JSON
+- The directory is a ring capped by artifact count and total bytes; the oldest
+  artifacts are deleted first
+"""
+
+import json
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# Default maximum number of artifacts (screenshot + JSON pairs) kept in debug_dir
+DEFAULT_DEBUG_MAX_FILES = 50
+
+# Default maximum total size (in bytes) of the artifacts kept in debug_dir
+DEFAULT_DEBUG_MAX_BYTES = 100 * 1024 * 1024
+
+# Maximum Hamming distance between two perceptual hashes considered the same failure
+DUPLICATE_HASH_DISTANCE = 4
+
+# Captures waiting to be encoded; further failures are dropped while the backlog is full
+MAX_PENDING_CAPTURES = 8
+
+# File name marker of debug artifacts: {button_name}_fail_{timestamp}.png / .json
+ARTIFACT_MARKER = "_fail_"
+
+
+def perceptual_hash(image: Any) -> Optional[int]:
+    """Compute a 64-bit difference hash (dHash) of a PIL image
+
+    The image is reduced to 9x8 grayscale pixels and each bit records whether a
+    pixel is brighter than its right neighbour, so small rendering differences
+    (cursor blink, clock) do not change the hash.
+
+    Args:
+        image: PIL image
+
+    Returns:
+        Hash, or None if it could not be computed
+    """
+    try:
+        pixels = list(image.convert("L").resize((9, 8)).getdata())
+    except Exception:
+        return None
+    if len(pixels) != 72:
+        return None
+    value = 0
+    for row in range(8):
+        for col in range(8):
+            value = (value << 1) | (pixels[row * 9 + col] > pixels[row * 9 + col + 1])
+    return value
+
+
+class DebugArtifactStore:
+    """Ring of debug artifacts in one directory, written in the background"""
+
+    def __init__(
+        self,
+        debug_dir: Path,
+        max_files: int = DEFAULT_DEBUG_MAX_FILES,
+        max_bytes: int = DEFAULT_DEBUG_MAX_BYTES,
+        dedupe: bool = True,
+    ):
+        """
+        Args:
+            debug_dir: Directory the artifacts are written to (created if missing)
+            max_files: Maximum number of artifacts kept
+            max_bytes: Maximum total size of the artifacts kept
+            dedupe: Record perceptually identical failures of a button only once
+        """
+        self.debug_dir = debug_dir
+        self.max_files = max_files
+        self.max_bytes = max_bytes
+        self.dedupe = dedupe
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="debug-artifacts")
+        self._pending: List[Future] = []
+        # Artifacts kept, oldest first: (stem, size in bytes, button name, perceptual hash)
+        self._artifacts: List[Tuple[str, int, str, Optional[int]]] = self._scan()
+
+    def _scan(self) -> List[Tuple[str, int, str, Optional[int]]]:
+        """Index the artifacts already in debug_dir (from previous runs), oldest first"""
+        sizes: Dict[str, int] = {}
+        mtimes: Dict[str, float] = {}
+        try:
+            paths = [path for path in self.debug_dir.iterdir() if ARTIFACT_MARKER in path.name]
+        except OSError:
+            return []
+        for path in paths:
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            sizes[path.stem] = sizes.get(path.stem, 0) + stat.st_size
+            mtimes[path.stem] = max(mtimes.get(path.stem, 0.0), stat.st_mtime)
+        stems = sorted(sizes, key=lambda stem: mtimes[stem])
+        return [(stem, sizes[stem], stem.split(ARTIFACT_MARKER)[0], None) for stem in stems]
+
+    def submit(self, button_name: str, image: Any, info: Dict[str, Any], now: Optional[datetime] = None) -> bool:
+        """Queue a failure capture for background encoding
+
+        Args:
+            button_name: Name of the button that was not found
+            image: PIL screenshot
+            info: Failure information written to the JSON file
+            now: Time of the failure (default: now)
+
+        Returns:
+            True if queued, False if dropped because the backlog is full
+        """
+        now = now or datetime.now()
+        with self._lock:
+            self._pending = [future for future in self._pending if not future.done()]
+            if len(self._pending) >= MAX_PENDING_CAPTURES:
+                print(f"  ⚠ Debug capture for '{button_name}' dropped ({MAX_PENDING_CAPTURES} captures pending)")
+                return False
+            self._pending.append(self._executor.submit(self._write, button_name, image, info, now))
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """Wait until every queued capture has been written
+
+        Args:
+            timeout: Maximum seconds to wait (None = no limit)
+        """
+        with self._lock:
+            pending = list(self._pending)
+        wait(pending, timeout=timeout)
+
+    def _find_duplicate(self, button_name: str, image_hash: Optional[int]) -> Optional[str]:
+        if not self.dedupe or image_hash is None:
+            return None
+        for stem, _size, name, other_hash in reversed(self._artifacts):
+            if name == button_name and other_hash is not None:
+                if bin(image_hash ^ other_hash).count("1") <= DUPLICATE_HASH_DISTANCE:
+                    return stem
+        return None
+
+    def _write(self, button_name: str, image: Any, info: Dict[str, Any], now: datetime) -> None:
+        """Encode and write one capture, or record it as a repeat of an earlier one (background thread)"""
+        image_hash = perceptual_hash(image)
+        duplicate = self._find_duplicate(button_name, image_hash)
+        if duplicate is not None:
+            self._record_repeat(duplicate, now)
+            return
+
+        stem = f"{button_name}{ARTIFACT_MARKER}{now.strftime('%Y%m%d_%H%M%S_%f')}"
+        screenshot_path = self.debug_dir / f"{stem}.png"
+        json_path = self.debug_dir / f"{stem}.json"
+        try:
+            image.save(str(screenshot_path), optimize=True)
+            print(f"  ℹ Debug screenshot saved: {screenshot_path}")
+        except Exception as e:
+            print(f"  ⚠ Could not save debug screenshot: {e}")
+            return
+
+        failure_info = {
+            **info,
+            "timestamp": now.isoformat(),
+            "screenshot_path": str(screenshot_path),
+            "occurrences": 1,
+            "last_seen": now.isoformat(),
+        }
+        try:
+            with open(json_path, "w", encoding="utf-8") as f:
+                json.dump(failure_info, f, indent=2, ensure_ascii=False)
+            print(f"  ℹ Debug info saved: {json_path}")
+        except Exception as e:
+            print(f"  ⚠ Could not save debug info JSON: {e}")
+
+        size = sum(path.stat().st_size for path in (screenshot_path, json_path) if path.exists())
+        self._artifacts.append((stem, size, button_name, image_hash))
+        self._evict()
+
+    def _record_repeat(self, stem: str, now: datetime) -> None:
+        json_path = self.debug_dir / f"{stem}.json"
+        try:
+            with open(json_path, "r", encoding="utf-8") as f:
+                failure_info = json.load(f)
+            failure_info["occurrences"] = failure_info.get("occurrences", 1) + 1
+            failure_info["last_seen"] = now.isoformat()
+            with open(json_path, "w", encoding="utf-8") as f:
+                json.dump(failure_info, f, indent=2, ensure_ascii=False)
+            print(f"  ℹ Same failure as {json_path.name} (seen {failure_info['occurrences']} times)")
+        except Exception as e:
+            print(f"  ⚠ Could not update debug info JSON: {e}")
+
+    def _evict(self) -> None:
+        """Delete the oldest artifacts until the ring is within its count and byte limits"""
+        total = sum(size for _stem, size, _name, _hash in self._artifacts)
+        while self._artifacts and (len(self._artifacts) > self.max_files or total > self.max_bytes):
+            stem, size, _name, _hash = self._artifacts.pop(0)
+            total -= size
+            for suffix in (".png", ".json"):
+                try:
+                    (self.debug_dir / f"{stem}{suffix}").unlink()
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    print(f"  ⚠ Could not delete old debug artifact '{stem}{suffix}': {e}")
+
+    def stats(self) -> Tuple[int, int]:
+        """Return (number of artifacts kept, total bytes)"""
+        return len(self._artifacts), sum(size for _stem, size, _name, _hash in self._artifacts)
+
+
+# Stores by resolved debug_dir
+_stores: Dict[Path, DebugArtifactStore] = {}
+_stores_lock = threading.Lock()
+
+
+def _get_limit(config: Dict[str, Any], key: str, default: int) -> int:
+    value = config.get(key, default)
+    if not isinstance(value, int) or isinstance(value, bool) or value < 1:
+        print(f"  ⚠ {key} must be a positive integer, using default {default}")
+        return default
+    return value
+
+
+def get_debug_artifact_store(debug_dir: Path, config: Dict[str, Any]) -> DebugArtifactStore:
+    """Get the store of a debug directory, applying the configured limits
+
+    Args:
+        debug_dir: Resolved debug directory (must exist)
+        config: Configuration section (debug_max_files, debug_max_bytes, debug_dedupe)
+
+    Returns:
+        Store for the directory
+    """
+    with _stores_lock:
+        store = _stores.get(debug_dir)
+        if store is None:
+            store = _stores[debug_dir] = DebugArtifactStore(debug_dir)
+    store.max_files = _get_limit(config, "debug_max_files", DEFAULT_DEBUG_MAX_FILES)
+    store.max_bytes = _get_limit(config, "debug_max_bytes", DEFAULT_DEBUG_MAX_BYTES)
+    store.dedupe = bool(config.get("debug_dedupe", True))
+    return store
+
+
+def flush_debug_artifacts(timeout: Optional[float] = None) -> None:
+    """Wait until all queued debug captures have been written
+
+    Args:
+        timeout: Maximum seconds to wait per store (None = no limit)
+    """
+    with _stores_lock:
+        stores = list(_stores.values())
+    for store in stores:
+        store.flush(timeout)
@@ -6,6 +6,22 @@ import time
 import traceback
 from typing import Any, Dict, List, Optional
 
+from .action_executor import are_actions_paused
+from .action_journal import begin_action, finish_action
+from .browser_automation import _can_open_browser, _get_remaining_cooldown
+from .browser_scheduler import (
+    OPERATION_ASSIGN,
+    get_scheduled_browser_operations,
+    is_browser_operation_scheduled,
+    schedule_browser_operation,
+)
+from .browser_worker import (
+    JOB_KIND_ASSIGN,
+    get_pending_browser_jobs,
+    is_browser_job_pending,
+    is_browser_worker_enabled,
+    submit_browser_job,
+)
 from .colors import colorize_phase
 from .config import (
     DEFAULT_MAX_LLM_WORKING_PARALLEL,
@@ -17,6 +33,10 @@ from .github_client import (
     get_issues_from_repositories,
     get_repositories_with_no_prs_and_open_issues,
 )
+from .notification_digest import get_digest_pending
+from .notification_dispatcher import get_notification_summary
+from .notification_sinks import get_sink_summary
+from .playwright_automation import is_playwright_backend
 from .state_tracker import cleanup_old_pr_states, get_pr_state_time, set_pr_state_time
 from .time_utils import format_elapsed_time
 
@@ -39,6 +59,21 @@ def display_status_summary(
     print("Status Summary:")
     print(f"{'=' * 50}")
 
+    # Browser automation jobs still queued or running in the browser worker
+    for kind, url in get_pending_browser_jobs():
+        print(f"  [browser worker] {kind} in progress: {url}")
+    # Browser operations waiting for the cooldown in the browser queue
+    for op in get_scheduled_browser_operations():
+        print(f"  [browser queue] {op.kind} (priority {op.priority}) queued: {op.url}")
+    # Delivery outcomes of the asynchronous ntfy dispatcher
+    for line in get_notification_summary():
+        print(f"  [ntfy] {line}")
+    digest_pending = get_digest_pending()
+    if digest_pending:
+        print(f"  [ntfy digest] {len(digest_pending)} PR(s) waiting for the digest")
+    for line in get_sink_summary():
+        print(f"  [sink] {line}")
+
     if not all_prs:
         print("  No open PRs to monitor")
         cleanup_old_pr_states([])
@@ -109,17 +144,67 @@ def _resolve_assign_to_copilot_config(issue: Dict[str, Any], config: Dict[str, A
         return {"assign_to_copilot": {}}
 
 
-def display_issues_from_repos_without_prs(config: Optional[Dict[str, Any]] = None, llm_working_count: int = 0):
+def _assign_issue_with_journal(issue: Dict[str, Any], assign_config: Dict[str, Any], use_worker: bool = False) -> None:
+    """Assign an issue to Copilot, recording the attempt in the action journal
+
+    Args:
+        issue: Issue dictionary with 'url' field
+        assign_config: Repository-specific assign_to_copilot configuration
+        use_worker: If True, queue the assignment on the browser worker instead of running it here
+    """
+    issue_url = issue.get("url", "")
+    if use_worker and is_browser_job_pending(JOB_KIND_ASSIGN, issue_url):
+        print("  Assignment in progress (browser worker), waiting for its result")
+        return
+    if is_browser_operation_scheduled(OPERATION_ASSIGN, issue_url):
+        print("  Assignment queued, waiting for the browser cooldown")
+        return
+    if not begin_action(issue_url, "issue", "assign"):
+        print("  Assignment already attempted (action journal), skipping")
+        return
+
+    def handle_result(success: bool) -> None:
+        finish_action(issue_url, "issue", "assign", success)
+
+    if use_worker and issue_url:
+        print("  Queueing assignment (browser worker)...")
+        submit_browser_job(JOB_KIND_ASSIGN, issue_url, assign_config, handle_result)
+        return
+
+    uses_browser_cooldown = not is_playwright_backend(assign_config.get("assign_to_copilot", {}))
+    if (
+        uses_browser_cooldown
+        and not _can_open_browser()
+        and schedule_browser_operation(
+            OPERATION_ASSIGN, issue_url, lambda: assign_issue_to_copilot(issue, assign_config), handle_result
+        )
+    ):
+        print(f"  ⏳ Browser cooldown in effect, assignment queued for {int(_get_remaining_cooldown())} seconds")
+        return
+
+    success = assign_issue_to_copilot(issue, assign_config)
+    handle_result(success)
+    if not success:
+        print("  Assignment failed - will retry on next iteration")
+
+
+def display_issues_from_repos_without_prs(
+    config: Optional[Dict[str, Any]] = None,
+    llm_working_count: int = 0,
+    repos_with_issues: Optional[List[Dict[str, Any]]] = None,
+):
     """Display issues from repositories with no open PRs
 
     Args:
         config: Configuration dictionary (optional)
         llm_working_count: Number of PRs currently in "LLM working" state (default: 0)
+        repos_with_issues: Repositories already fetched by the pipelined cycle (default: fetch them now)
     """
     print("Checking for repositories with no open PRs but with open issues...")
 
     try:
-        repos_with_issues = get_repositories_with_no_prs_and_open_issues()
+        if repos_with_issues is None:
+            repos_with_issues = get_repositories_with_no_prs_and_open_issues()
 
         if not repos_with_issues:
             print("  No repositories found with open issues and no open PRs")
@@ -174,6 +259,8 @@ def display_issues_from_repos_without_prs(config: Optional[Dict[str, Any]] = Non
                 print("レートリミット回避のため、新しいissueの自動assignを保留します。")
                 print(f"{'=' * 50}")
                 # Skip assignment but continue to display issues
+            elif are_actions_paused():
+                print("\n  Actions paused: skipping issue auto-assignment")
             else:
                 # Always try to check for issues to assign (batteries-included)
                 # Individual repositories must explicitly enable via rulesets for actual assignment
@@ -204,9 +291,7 @@ def display_issues_from_repos_without_prs(config: Optional[Dict[str, Any]] = Non
                         temp_config = _resolve_assign_to_copilot_config(issue, config)
 
                         # Assign the issue to Copilot and check the result
-                        success = assign_issue_to_copilot(issue, temp_config)
-                        if not success:
-                            print("  Assignment failed - will retry on next iteration")
+                        _assign_issue_with_journal(issue, temp_config, is_browser_worker_enabled(config))
                     else:
                         print("  No 'good first issue' issues found in repositories without open PRs")
                 elif any_old:
@@ -233,9 +318,7 @@ def display_issues_from_repos_without_prs(config: Optional[Dict[str, Any]] = Non
                         temp_config = _resolve_assign_to_copilot_config(issue, config)
 
                         # Assign the issue to Copilot and check the result
-                        success = assign_issue_to_copilot(issue, temp_config)
-                        if not success:
-                            print("  Assignment failed - will retry on next iteration")
+                        _assign_issue_with_journal(issue, temp_config, is_browser_worker_enabled(config))
                     else:
                         print("  No issues found in repositories without open PRs")
 
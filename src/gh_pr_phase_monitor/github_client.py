@@ -20,7 +20,7 @@ from .github_auth import get_current_user
 from .issue_fetcher import assign_issue_to_copilot, get_issues_from_repositories
 
 # Re-export PR functions
-from .pr_fetcher import get_pr_data, get_pr_details_batch
+from .pr_fetcher import get_pr_data, get_pr_details_batch, get_prs_by_node_ids, iter_pr_details_batches
 
 # Re-export repository functions
 from .repository_fetcher import (
@@ -35,6 +35,8 @@ __all__ = [
     "get_all_repositories",
     "get_repositories_with_no_prs_and_open_issues",
     "get_pr_details_batch",
+    "get_prs_by_node_ids",
+    "iter_pr_details_batches",
     "get_pr_data",
     "get_issues_from_repositories",
     "assign_issue_to_copilot",
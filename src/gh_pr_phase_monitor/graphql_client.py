@@ -43,3 +43,42 @@ def execute_graphql_query(query: str, variables: Dict[str, Any] = None) -> Dict[
         if e.stderr:
             print(f"stderr: {e.stderr}")
         raise RuntimeError(error_message) from e
+
+
+def execute_graphql_mutation(query: str) -> Dict[str, Any]:
+    """Execute a GraphQL mutation document using gh CLI, keeping partial results
+
+    Unlike execute_graphql_query(), a response that contains per-field errors is
+    returned instead of raised, so that callers can map failures back to aliases.
+
+    Args:
+        query: GraphQL mutation document
+
+    Returns:
+        Parsed JSON response from GitHub API (may contain both "data" and "errors")
+
+    Raises:
+        RuntimeError: If the request fails without a parseable response
+    """
+    cmd = ["gh", "api", "graphql", "-f", f"query={query}"]
+
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, encoding="utf-8", errors="replace", check=True)
+        stdout = result.stdout
+    except subprocess.CalledProcessError as e:
+        # gh exits non-zero when the response contains errors, but still prints the response body
+        stdout = e.stdout or ""
+        if not stdout.strip():
+            error_message = f"Error executing GraphQL mutation: {e}"
+            if e.stderr:
+                error_message += f"\nstderr: {e.stderr}"
+            raise RuntimeError(error_message) from e
+
+    try:
+        response = json.loads(stdout)
+    except json.JSONDecodeError as e:
+        raise RuntimeError(f"Error parsing JSON response from gh CLI: {e}\nRaw output from gh:\n{stdout}") from e
+
+    if not isinstance(response, dict):
+        raise RuntimeError(f"Unexpected GraphQL response: {stdout}")
+    return response
@@ -7,6 +7,7 @@ from typing import Any, Dict, List, Optional
 
 from .browser_automation import assign_issue_to_copilot_automated, is_pyautogui_available
 from .graphql_client import execute_graphql_query
+from .playwright_automation import is_playwright_backend
 
 # GraphQL pagination constants
 REPOSITORIES_BATCH_SIZE = 10
@@ -150,7 +151,8 @@ def get_issues_from_repositories(
 def assign_issue_to_copilot(issue: Dict[str, Any], config: Optional[Dict[str, Any]] = None) -> bool:
     """Assign an issue to GitHub Copilot using browser automation
 
-    This function uses Selenium or Playwright to automatically:
+    This function uses PyAutoGUI image recognition, or Playwright DOM selectors
+    (automation_backend = "playwright" with a user_data_dir), to automatically:
     1. Open the issue in a browser
     2. Wait for the configured time (default 10 seconds)
     3. Click the "Assign to Copilot" button
@@ -183,7 +185,7 @@ def assign_issue_to_copilot(issue: Dict[str, Any], config: Optional[Dict[str, An
     # Always use automated assignment
     print(f"  → Attempting automated assignment for issue #{issue_number}: {owner}/{repo_name}")
 
-    if not is_pyautogui_available():
+    if not is_pyautogui_available() and not is_playwright_backend((config or {}).get("assign_to_copilot", {})):
         print("  ✗ PyAutoGUI is not available")
         print("  → To enable automation, install PyAutoGUI:")
         print("     pip install pyautogui pillow")
@@ -7,18 +7,43 @@ import sys
 import time
 import traceback
 
+from .action_executor import execute_pr_actions
+from .browser_scheduler import configure_browser_scheduler
+from .browser_worker import poll_browser_worker
 from .config import (
+    ACTION_BACKEND_GRAPHQL,
+    CompiledConfig,
     get_config_mtime,
+    get_duration_setting,
     load_config,
-    parse_interval,
     print_config,
     validate_phase3_merge_config_required,
 )
+from .control_api import configure_control_api, get_state, publish_state, stop_control_api
+from .coordination import (
+    check_leadership,
+    configure_coordinated_journal,
+    configure_coordination,
+    read_leader_snapshot,
+    report_coordination_progress,
+    share_snapshot,
+    stop_coordination,
+)
+from .cycle_pipeline import run_pipelined_cycle
 from .display import display_issues_from_repos_without_prs, display_status_summary
 from .github_client import get_pr_details_batch, get_repositories_with_open_prs
 from .monitor import check_no_state_change_timeout
+from .mutation_batch import batched_mutations, get_action_backend
+from .notification_digest import flush_notification_digest, notify_all_phase3_transition
+from .notification_dispatcher import configure_notification_dispatcher
+from .notification_sinks import configure_notification_sinks
 from .phase_detector import PHASE_LLM_WORKING, determine_phase
-from .pr_actions import process_pr
+from .polling_controller import decide_next_interval, is_adaptive_polling_enabled
+from .polling_tiers import fetch_due_pr_details, is_polling_tiers_enabled, update_polling_tiers
+from .pr_actions import has_pending_actions, process_pr
+from .snapshot_diff import diff_snapshot, is_full_reconcile_due, request_full_reconcile
+from .thin_client import is_thin_client_enabled, run_thin_client
+from .wait_events import install_immediate_check_signal
 from .wait_handler import wait_with_countdown
 
 
@@ -30,7 +55,7 @@ def main():
         config_path = sys.argv[1]
 
     # Load config if it exists, otherwise use defaults
-    config = {}
+    config = CompiledConfig({})
     config_mtime = 0.0
     try:
         config = load_config(config_path)
@@ -41,16 +66,22 @@ def main():
         print("Expected format:")
         print('interval = "1m"  # Check interval (e.g., "30s", "1m", "5m")')
         print()
+    except ValueError as e:
+        # Invalid TOML, interval format or ruleset repository pattern (e.g., bad regex)
+        print(f"Error: Invalid configuration in '{config_path}': {e}")
+        sys.exit(1)
 
-    # Get interval setting (default to 1 minute if not specified)
+    # With [thin_client] server, follow another monitor's event stream instead of querying GitHub
+    if is_thin_client_enabled(config):
+        if config.get("verbose", False):
+            print_config(config)
+        run_thin_client(config)
+        return
+
+    # Get interval setting (default to 1 minute if not specified, parsed once at load time)
     # Keep the normal interval separate from the current interval to prevent the normal
     # interval from being overwritten by reduced frequency interval values during mode switches
-    normal_interval_str = config.get("interval", "1m")
-    try:
-        normal_interval_seconds = parse_interval(normal_interval_str)
-    except ValueError as e:
-        print(f"Error: {e}")
-        sys.exit(1)
+    normal_interval_str, normal_interval_seconds = get_duration_setting(config, "interval")
 
     print("GitHub PR Phase Monitor")
     print("=" * 50)
@@ -63,13 +94,31 @@ def main():
     if config.get("verbose", False):
         print_config(config)
 
+    # [coordination] elects one of the instances sharing the database to fetch and run actions
+    configure_coordination(config)
+    # Replay the action journal so actions interrupted by a previous run are not duplicated
+    # (with coordination, only once this instance becomes leader)
+    configure_coordinated_journal(config)
+    # Browser operations refused by the cooldown are queued and run when it expires
+    configure_browser_scheduler(config)
+    # ntfy notifications are sent in the background when async_dispatch is enabled
+    configure_notification_dispatcher(config)
+    # [[notification_sinks]] receive notifications concurrently, each on its own thread
+    configure_notification_sinks(config)
+    # [control_api] serves the state of the last check and accepts refresh/pause/resume requests
+    configure_control_api(config)
+
     # Set up signal handler for graceful interruption
     def signal_handler(_signum, _frame):
         print("\n\nMonitoring interrupted by user (CTRL+C)")
         print("Exiting...")
+        stop_control_api()
+        stop_coordination()
         sys.exit(0)
 
     signal.signal(signal.SIGINT, signal_handler)
+    # SIGUSR1 ends the current wait so the next check starts right away (event_driven_wait)
+    install_immediate_check_signal()
 
     # Infinite monitoring loop
     iteration = 0
@@ -80,52 +129,115 @@ def main():
         print(f"Check #{iteration} - {time.strftime('%Y-%m-%d %H:%M:%S')}")
         print(f"{'=' * 50}")
 
+        # Apply the results of browser automation jobs finished by the browser worker
+        poll_browser_worker()
+
         # Initialize variables to track status for summary
         all_prs = []
         pr_phases = []
         repos_with_prs = []
+        snapshot_diff = None
 
-        try:
-            # Phase 1: Get all repositories with open PRs (lightweight query)
-            print("\nPhase 1: Fetching repositories with open PRs...")
-            repos_with_prs = get_repositories_with_open_prs()
-
-            if not repos_with_prs:
-                print("  No repositories with open PRs found")
-                # Display issues when no repositories with open PRs are found
-                # No PRs means llm_working_count = 0
-                display_issues_from_repos_without_prs(config, llm_working_count=0)
-            else:
-                print(f"  Found {len(repos_with_prs)} repositories with open PRs:")
-                for repo in repos_with_prs:
-                    print(f"    - {repo['name']}: {repo['openPRCount']} open PR(s)")
-
-                # Validate phase3_merge configuration for all repositories
-                # This must be done before processing PRs to fail fast
-                print("\nValidating phase3_merge configuration...")
-                for repo in repos_with_prs:
-                    repo_owner = repo.get("owner", "")
-                    repo_name = repo.get("name", "")
-                    if repo_owner and repo_name:
-                        validate_phase3_merge_config_required(config, repo_owner, repo_name)
-
-                # Phase 2: Get PR details for repositories with open PRs (detailed query)
-                print(f"\nPhase 2: Fetching PR details for {len(repos_with_prs)} repositories...")
-                all_prs = get_pr_details_batch(repos_with_prs)
-
-                if not all_prs:
-                    print("  No PRs found")
+        # With [coordination], only the leader fetches and runs actions
+        leading = check_leadership()
+
+        if not leading:
+            # Followers show the leader's last snapshot instead of querying GitHub
+            print("\nFollower: reading the leader's snapshot...")
+            all_prs, pr_phases = read_leader_snapshot()
+        else:
+            try:
+                # Phase 1: Get all repositories with open PRs (lightweight query)
+                print("\nPhase 1: Fetching repositories with open PRs...")
+                repos_with_prs = get_repositories_with_open_prs()
+
+                if not repos_with_prs:
+                    print("  No repositories with open PRs found")
+                    snapshot_diff = diff_snapshot([], [])
+                    # Display issues when no repositories with open PRs are found
+                    # No PRs means llm_working_count = 0
+                    display_issues_from_repos_without_prs(config, llm_working_count=0)
                 else:
-                    print(f"\n  Found {len(all_prs)} open PR(s) total")
-                    print(f"\n{'=' * 50}")
-                    print("Processing PRs:")
-                    print(f"{'=' * 50}")
+                    print(f"  Found {len(repos_with_prs)} repositories with open PRs:")
+                    for repo in repos_with_prs:
+                        print(f"    - {repo['name']}: {repo['openPRCount']} open PR(s)")
+
+                    # Validate phase3_merge configuration for all repositories
+                    # This must be done before processing PRs to fail fast
+                    print("\nValidating phase3_merge configuration...")
+                    for repo in repos_with_prs:
+                        repo_owner = repo.get("owner", "")
+                        repo_name = repo.get("name", "")
+                        if repo_owner and repo_name:
+                            validate_phase3_merge_config_required(config, repo_owner, repo_name)
+
+                    _reconcile_str, reconcile_seconds = get_duration_setting(config, "full_reconcile_interval")
+                    full_reconcile = is_full_reconcile_due(reconcile_seconds)
+                    prefetched_repos_with_issues = None
+                    # With polling tiers, only the due repositories and PRs are fetched (not pipelined)
+                    polling_tiers = is_polling_tiers_enabled(config)
+                    pipelined = config.get("pipelined_cycle", False) and not polling_tiers
+
+                    if pipelined:
+                        # Phase 2 and the PR actions overlap: each batch is processed as soon as it arrives
+                        print(f"\nPhase 2: Fetching and processing PRs of {len(repos_with_prs)} repositories...")
+                        print("Processing PRs (full reconcile):" if full_reconcile else "Processing PRs:")
+                        pipeline = run_pipelined_cycle(
+                            repos_with_prs,
+                            config,
+                            process_pr,
+                            full_reconcile,
+                            batch_mutations=get_action_backend(config) == ACTION_BACKEND_GRAPHQL,
+                        )
+                        all_prs, pr_phases = pipeline.all_prs, pipeline.pr_phases
+                        snapshot_diff = diff_snapshot(all_prs, pr_phases)
+                        if all_prs:
+                            print(f"\n  Found {len(all_prs)} open PR(s) total")
+                            print(f"  Changes since last check: {snapshot_diff.format_summary()}")
+                        if pipeline.time_to_first_action is not None:
+                            print(f"  Time to first action: {pipeline.time_to_first_action:.2f}s")
+                        if pipeline.skipped_count:
+                            print(f"  ({pipeline.skipped_count} unchanged PR(s) skipped until the next full reconcile)")
+                        prefetched_repos_with_issues = pipeline.prefetched_repos_with_issues()
+                    else:
+                        # Phase 2: Get PR details for repositories with open PRs (detailed query)
+                        print(f"\nPhase 2: Fetching PR details for {len(repos_with_prs)} repositories...")
+                        if polling_tiers:
+                            all_prs = fetch_due_pr_details(repos_with_prs, config)
+                        else:
+                            all_prs = get_pr_details_batch(repos_with_prs)
+
+                        # Track phases to detect if all PRs are in "LLM working"
+                        pr_phases = [determine_phase(pr) for pr in all_prs]
+
+                        # Diff against the previous cycle so only added/changed PRs are processed
+                        snapshot_diff = diff_snapshot(all_prs, pr_phases)
+                        if polling_tiers:
+                            update_polling_tiers(config, all_prs, pr_phases, snapshot_diff)
+
+                    if not all_prs:
+                        print("  No PRs found")
+                    elif not pipelined:
+                        print(f"\n  Found {len(all_prs)} open PR(s) total")
+                        print(f"  Changes since last check: {snapshot_diff.format_summary()}")
+                        print(f"\n{'=' * 50}")
+                        print("Processing PRs (full reconcile):" if full_reconcile else "Processing PRs:")
+                        print(f"{'=' * 50}")
 
-                    # Track phases to detect if all PRs are in "LLM working"
-                    for pr in all_prs:
-                        phase = determine_phase(pr)
-                        pr_phases.append(phase)
-                        process_pr(pr, config, phase)
+                        to_process = []
+                        skipped_count = 0
+                        for pr, phase in zip(all_prs, pr_phases):
+                            url = pr.get("url", "")
+                            if full_reconcile or snapshot_diff.is_delta(url) or has_pending_actions(url):
+                                to_process.append((pr, phase))
+                            else:
+                                skipped_count += 1
+                        # Different PRs run concurrently; actions within a PR keep their order
+                        # With action_backend = "graphql", the actions are sent as batched mutations afterwards
+                        with batched_mutations(get_action_backend(config) == ACTION_BACKEND_GRAPHQL):
+                            execute_pr_actions(to_process, config, process_pr)
+                        if skipped_count:
+                            print(f"  ({skipped_count} unchanged PR(s) skipped until the next full reconcile)")
 
                     # Count how many PRs are in "LLM working" phase
                     # This count is used for rate limit protection - when too many PRs are being
@@ -141,25 +253,35 @@ def main():
                         print(f"{'=' * 50}")
                         # Display issues and potentially auto-assign new work
                         # Throttling is applied inside the function based on llm_working_count
-                        display_issues_from_repos_without_prs(config, llm_working_count=llm_working_count)
-
-            # Reset consecutive-failure counter on a successful iteration
-            consecutive_failures = 0
+                        display_issues_from_repos_without_prs(
+                            config, llm_working_count=llm_working_count, repos_with_issues=prefetched_repos_with_issues
+                        )
 
-        except RuntimeError as e:
-            print(f"\nError: {e}")
-            print("Please ensure you are authenticated with gh CLI")
-            sys.exit(1)
-        except Exception as e:
-            print(f"\nUnexpected error: {e}")
-            traceback.print_exc()
+                    # Send the phase3 notifications collected in digest mode as one message,
+                    # then the all-phase3 message if every PR has just reached phase3
+                    flush_notification_digest(config)
+                    notify_all_phase3_transition(config, all_prs, pr_phases)
 
-            # Track consecutive unexpected failures to avoid infinite error loops
-            consecutive_failures += 1
+                # Reset consecutive-failure counter on a successful iteration
+                consecutive_failures = 0
 
-            if consecutive_failures >= 3:
-                print("\nEncountered 3 consecutive unexpected errors; exiting to avoid an infinite error loop.")
+            except RuntimeError as e:
+                print(f"\nError: {e}")
+                print("Please ensure you are authenticated with gh CLI")
                 sys.exit(1)
+            except Exception as e:
+                print(f"\nUnexpected error: {e}")
+                traceback.print_exc()
+
+                # Track consecutive unexpected failures to avoid infinite error loops
+                consecutive_failures += 1
+
+                if consecutive_failures >= 3:
+                    print("\nEncountered 3 consecutive unexpected errors; exiting to avoid an infinite error loop.")
+                    sys.exit(1)
+
+        # Collect results of jobs that finished while this cycle was processed
+        poll_browser_worker()
 
         # Display status summary before waiting
         # This helps users understand the current state at a glance,
@@ -169,40 +291,61 @@ def main():
         # state that was successfully retrieved before the error.
         display_status_summary(all_prs, pr_phases, repos_with_prs)
 
+        if not leading:
+            # Followers reread the shared snapshot and retry the lease every interval
+            current_interval_seconds = normal_interval_seconds
+            current_interval_str = normal_interval_str
+        elif is_adaptive_polling_enabled(config):
+            # The interval follows the observed change rate, transitions in progress and the rate budget
+            decision = decide_next_interval(config, all_prs, pr_phases, snapshot_diff)
+            current_interval_seconds = decision.interval_seconds
+            current_interval_str = decision.interval_str
+            if config.get("verbose", False):
+                print(decision.format_reasoning())
         # Check if PR state has not changed for too long and switch to reduced frequency mode
-        use_reduced_frequency = check_no_state_change_timeout(all_prs, pr_phases, config)
-
-        # Determine which interval to use
-        if use_reduced_frequency:
-            # Use reduced frequency interval (default: 1h)
-            reduced_interval_str = (config or {}).get("reduced_frequency_interval", "1h")
-            try:
-                reduced_interval_seconds = parse_interval(reduced_interval_str)
-                current_interval_seconds = reduced_interval_seconds
-                current_interval_str = reduced_interval_str
-            except ValueError as e:
-                print(f"Error: Invalid reduced_frequency_interval format: {e}")
-                sys.exit(1)
+        elif check_no_state_change_timeout(all_prs, pr_phases, config, snapshot_diff):
+            # Use reduced frequency interval (default: 1h, validated at load time)
+            current_interval_str, current_interval_seconds = get_duration_setting(config, "reduced_frequency_interval")
         else:
             # Use normal interval (preserved separately to avoid contamination)
             current_interval_seconds = normal_interval_seconds
             current_interval_str = normal_interval_str
 
+        # Publish the state of this check for the control API (GET /state)
+        publish_state(all_prs, pr_phases, iteration, current_interval_seconds)
+        # The leader shares the same snapshot with the followers
+        share_snapshot(get_state())
+        # The lease is kept while the next check starts within the interval (a hung loop loses it)
+        report_coordination_progress(current_interval_seconds)
+
         # Wait with countdown display and check for config changes
         new_config, new_interval_seconds, new_interval_str, new_config_mtime = wait_with_countdown(
-            current_interval_seconds, current_interval_str, config_path, config_mtime
+            current_interval_seconds,
+            current_interval_str,
+            config_path,
+            config_mtime,
+            event_driven=config.get("event_driven_wait", False),
         )
 
         # Update config and interval based on what was returned from wait
-        # Config will be non-empty only if successfully reloaded during wait
+        # Config will be a CompiledConfig only if successfully reloaded during wait;
+        # swapping the reference replaces the whole validated snapshot at once
         config_reloaded = new_config_mtime != config_mtime
-        if config_reloaded and new_config:
+        if config_reloaded and isinstance(new_config, CompiledConfig):
             config = new_config
             # Update normal interval only on hot reload (config change).
             # This prevents the normal interval from being contaminated by reduced frequency
             # interval values that may be returned from wait_with_countdown().
             normal_interval_seconds = new_interval_seconds
             normal_interval_str = new_interval_str
+            # Rulesets may have changed, so re-evaluate every PR in the next cycle
+            request_full_reconcile()
+            configure_coordination(config)
+            configure_coordinated_journal(config)
+            configure_browser_scheduler(config)
+            configure_notification_dispatcher(config)
+            configure_notification_sinks(config)
+            configure_control_api(config)
         # Always update mtime
         config_mtime = new_config_mtime
 
@@ -0,0 +1,88 @@
+"""
+Merge pre-flight checks for phase 3 PRs
+
+Before posting the pre-merge comment and merging, the merge state fetched in
+the Phase 2 batch query (mergeable, mergeStateStatus and the head commit's
+statusCheckRollup state) is checked. A merge only goes ahead when GitHub
+reports the PR as cleanly mergeable. Otherwise the PR waits, and the decision
+is cached per PR fingerprint, so it is only re-evaluated when the PR changes.
+"""
+
+from typing import Any, Dict, Optional, Tuple
+
+from .snapshot_diff import pr_fingerprint
+
+# mergeStateStatus values that allow an immediate merge
+# (HAS_HOOKS is clean, with pre-receive hooks configured)
+MERGEABLE_STATE_STATUSES = frozenset({"CLEAN", "HAS_HOOKS"})
+
+# statusCheckRollup states that allow an immediate merge (None = no checks configured)
+PASSING_CHECK_STATES = frozenset({"SUCCESS"})
+
+# PRs waiting for a mergeable state: PR URL -> (fingerprint, reason)
+_merge_waiting: Dict[str, Tuple[str, str]] = {}
+
+
+def _evaluate_merge_state(pr: Dict[str, Any]) -> Optional[str]:
+    """Evaluate the fetched merge state of a PR
+
+    Args:
+        pr: PR data dictionary
+
+    Returns:
+        Reason the merge must wait, or None if the PR can be merged now
+    """
+    mergeable = pr.get("mergeable")
+    if mergeable and mergeable != "MERGEABLE":
+        return f"mergeable={mergeable}"
+
+    merge_state_status = pr.get("mergeStateStatus")
+    if merge_state_status not in MERGEABLE_STATE_STATUSES:
+        return f"mergeStateStatus={merge_state_status or 'UNKNOWN'}"
+
+    check_state = pr.get("statusCheckRollup")
+    if check_state is not None and check_state not in PASSING_CHECK_STATES:
+        return f"checks={check_state}"
+
+    return None
+
+
+def is_mergeable_now(pr: Dict[str, Any]) -> bool:
+    """Check if the fetched merge state shows the PR as mergeable right now
+
+    Args:
+        pr: PR data dictionary
+
+    Returns:
+        True if the PR has merge state information and nothing blocks the merge
+    """
+    return "mergeStateStatus" in pr and _evaluate_merge_state(pr) is None
+
+
+def get_merge_block_reason(pr: Dict[str, Any]) -> Optional[str]:
+    """Check if a PR's merge must wait, re-evaluating only when the PR changed
+
+    PRs without merge state information (e.g., not fetched by the Phase 2
+    batch query) are not gated.
+
+    Args:
+        pr: PR data dictionary
+
+    Returns:
+        Reason the merge must wait, or None if the merge may proceed
+    """
+    if "mergeStateStatus" not in pr:
+        return None
+
+    url = pr.get("url", "")
+    fingerprint = pr_fingerprint(pr)
+    waiting = _merge_waiting.get(url)
+    if waiting is not None and waiting[0] == fingerprint:
+        return waiting[1]
+
+    reason = _evaluate_merge_state(pr)
+    if reason is None:
+        _merge_waiting.pop(url, None)
+    else:
+        _merge_waiting[url] = (fingerprint, reason)
+    return reason
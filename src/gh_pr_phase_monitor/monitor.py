@@ -5,13 +5,17 @@ Monitoring logic for state changes and frequency adjustment
 import time
 from typing import Any, Dict, List, Optional
 
-from .config import parse_interval
+from .config import get_duration_setting
+from .snapshot_diff import SnapshotDiff
 from .state_tracker import get_last_state, is_reduced_frequency_mode, set_last_state, set_reduced_frequency_mode
 from .time_utils import format_elapsed_time
 
 
 def check_no_state_change_timeout(
-    all_prs: List[Dict[str, Any]], pr_phases: List[str], config: Optional[Dict[str, Any]] = None
+    all_prs: List[Dict[str, Any]],
+    pr_phases: List[str],
+    config: Optional[Dict[str, Any]] = None,
+    snapshot_diff: Optional[SnapshotDiff] = None,
 ) -> bool:
     """Check if the overall PR state has not changed for too long and switch to reduced frequency mode
 
@@ -24,36 +28,44 @@ def check_no_state_change_timeout(
         all_prs: List of all PRs
         pr_phases: List of phase strings corresponding to all_prs
         config: Configuration dictionary (optional)
+        snapshot_diff: Diff computed for this cycle by diff_snapshot() (optional).
+            When given, it is used for change detection instead of rebuilding the state snapshot.
 
     Returns:
         True if monitoring should switch to reduced frequency mode, False otherwise
     """
-    # Get timeout setting from config with default of "30m"
-    timeout_str = (config or {}).get("no_change_timeout", "30m")
-
     # Get reduced frequency interval setting from config with default of "1h"
+    # (only used for display here, so the raw string is enough)
     reduced_interval_str = (config or {}).get("reduced_frequency_interval", "1h")
 
-    # If timeout is explicitly set to empty string (disabled), don't check
-    if not timeout_str:
+    # Get timeout setting from config with default of "30m"
+    # Configs from load_config() carry the value parsed at load time
+    try:
+        timeout_str, timeout_seconds = get_duration_setting(config, "no_change_timeout")
+    except ValueError as e:
+        print(f"Warning: Invalid no_change_timeout format: {e}")
         set_last_state(None)
         set_reduced_frequency_mode(False)
         return False
 
-    # Parse timeout to seconds
-    try:
-        timeout_seconds = parse_interval(timeout_str)
-    except ValueError as e:
-        print(f"Warning: Invalid no_change_timeout format: {e}")
+    # If timeout is explicitly set to empty string (disabled), don't check
+    if not timeout_str:
         set_last_state(None)
         set_reduced_frequency_mode(False)
         return False
 
     current_time = time.time()
 
+    last_state = get_last_state()
+
+    if snapshot_diff is not None and last_state is not None and not snapshot_diff.phases_changed:
+        # The cycle diff already tells us nothing was added, removed or changed phase
+        current_state = last_state[0]
+    elif snapshot_diff is not None:
+        current_state = frozenset(snapshot_diff.phases.items())
     # Create a snapshot of current state
     # Validate that all_prs and pr_phases have the same length
-    if all_prs and pr_phases and len(all_prs) == len(pr_phases):
+    elif all_prs and pr_phases and len(all_prs) == len(pr_phases):
         # Create frozenset of (url, phase) tuples to represent current state
         current_state = frozenset((pr.get("url", ""), phase) for pr, phase in zip(all_prs, pr_phases))
     else:
@@ -61,7 +73,6 @@ def check_no_state_change_timeout(
         current_state = frozenset()
 
     # Check if state has changed
-    last_state = get_last_state()
     if last_state is None:
         # First check - initialize the state
         set_last_state((current_state, current_time))
@@ -0,0 +1,345 @@
+"""
+Batched GraphQL mutations for PR actions
+
+Instead of spawning `gh pr ready` / `gh pr comment` / `gh pr merge` for every
+action, the actions decided in a cycle are collected and sent as one aliased
+GraphQL mutation document (markPullRequestReadyForReview, addComment,
+mergePullRequest with squash, enablePullRequestAutoMerge, deleteRef).
+Results are mapped back per alias.
+
+Actions may depend on another action (e.g., merge depends on the pre-merge
+comment). Dependent actions are sent in a later round, only if the action they
+depend on succeeded, so a cycle needs one round trip per dependency level
+instead of one process per action.
+"""
+
+import json
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from .action_executor import content_request
+from .config import ACTION_BACKEND_GH
+from .graphql_client import execute_graphql_mutation
+
+# Callback invoked with (success, error message) once an action's result is known
+ResultCallback = Callable[[bool, Optional[str]], None]
+
+
+class BatchedAction:
+    """A single mutation queued in a MutationBatch
+
+    Attributes:
+        key: Unique key of the action within the batch (also used as GraphQL alias)
+        pr_url: URL of the PR the action belongs to (for reporting)
+        description: Human-readable action description
+        field: GraphQL mutation field text (without alias)
+        depends_on: Key of an action that must succeed first (optional)
+        on_result: Callback invoked with the result (optional)
+    """
+
+    def __init__(
+        self,
+        key: str,
+        pr_url: str,
+        description: str,
+        field: str,
+        depends_on: Optional[str] = None,
+        on_result: Optional[ResultCallback] = None,
+    ):
+        self.key = key
+        self.pr_url = pr_url
+        self.description = description
+        self.field = field
+        self.depends_on = depends_on
+        self.on_result = on_result
+
+
+def _literal(value: str) -> str:
+    """Encode a string as a GraphQL string literal (prevents GraphQL injection)"""
+    return json.dumps(value, ensure_ascii=False)
+
+
+class MutationBatch:
+    """Collects PR mutations and executes them as aliased GraphQL documents
+
+    Safe to fill from multiple worker threads (see action_executor.py).
+    """
+
+    def __init__(self):
+        self._actions: List[BatchedAction] = []
+        self._lock = threading.Lock()
+        self.request_count = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._actions)
+
+    def _add(
+        self,
+        pr_url: str,
+        description: str,
+        field: str,
+        depends_on: Optional[str],
+        on_result: Optional[ResultCallback],
+    ) -> str:
+        with self._lock:
+            key = f"a{len(self._actions)}"
+            self._actions.append(BatchedAction(key, pr_url, description, field, depends_on, on_result))
+        return key
+
+    def add_mark_ready(
+        self,
+        pr_id: str,
+        pr_url: str,
+        depends_on: Optional[str] = None,
+        on_result: Optional[ResultCallback] = None,
+    ) -> str:
+        """Queue markPullRequestReadyForReview
+
+        Args:
+            pr_id: GraphQL node id of the PR
+            pr_url: URL of the PR
+            depends_on: Key of an action that must succeed first (optional)
+            on_result: Result callback (optional)
+
+        Returns:
+            Key of the queued action
+        """
+        field = f"markPullRequestReadyForReview(input: {{pullRequestId: {_literal(pr_id)}}}) {{ clientMutationId }}"
+        return self._add(pr_url, "mark ready", field, depends_on, on_result)
+
+    def add_comment(
+        self,
+        subject_id: str,
+        pr_url: str,
+        body: str,
+        depends_on: Optional[str] = None,
+        on_result: Optional[ResultCallback] = None,
+    ) -> str:
+        """Queue addComment
+
+        Args:
+            subject_id: GraphQL node id of the PR
+            pr_url: URL of the PR
+            body: Comment body
+            depends_on: Key of an action that must succeed first (optional)
+            on_result: Result callback (optional)
+
+        Returns:
+            Key of the queued action
+        """
+        field = (
+            f"addComment(input: {{subjectId: {_literal(subject_id)}, body: {_literal(body)}}}) {{ clientMutationId }}"
+        )
+        return self._add(pr_url, "comment", field, depends_on, on_result)
+
+    def add_merge(
+        self,
+        pr_id: str,
+        pr_url: str,
+        depends_on: Optional[str] = None,
+        on_result: Optional[ResultCallback] = None,
+    ) -> str:
+        """Queue mergePullRequest with the squash merge method
+
+        Args:
+            pr_id: GraphQL node id of the PR
+            pr_url: URL of the PR
+            depends_on: Key of an action that must succeed first (optional)
+            on_result: Result callback (optional)
+
+        Returns:
+            Key of the queued action
+        """
+        field = (
+            f"mergePullRequest(input: {{pullRequestId: {_literal(pr_id)}, mergeMethod: SQUASH}}) "
+            "{ pullRequest { merged } }"
+        )
+        return self._add(pr_url, "merge", field, depends_on, on_result)
+
+    def add_enable_auto_merge(
+        self,
+        pr_id: str,
+        pr_url: str,
+        depends_on: Optional[str] = None,
+        on_result: Optional[ResultCallback] = None,
+    ) -> str:
+        """Queue enablePullRequestAutoMerge with the squash merge method
+
+        Args:
+            pr_id: GraphQL node id of the PR
+            pr_url: URL of the PR
+            depends_on: Key of an action that must succeed first (optional)
+            on_result: Result callback (optional)
+
+        Returns:
+            Key of the queued action
+        """
+        field = (
+            f"enablePullRequestAutoMerge(input: {{pullRequestId: {_literal(pr_id)}, mergeMethod: SQUASH}}) "
+            "{ clientMutationId }"
+        )
+        return self._add(pr_url, "enable auto-merge", field, depends_on, on_result)
+
+    def add_delete_ref(
+        self,
+        ref_id: str,
+        pr_url: str,
+        depends_on: Optional[str] = None,
+        on_result: Optional[ResultCallback] = None,
+    ) -> str:
+        """Queue deleteRef (used to delete the head branch after a merge)
+
+        Args:
+            ref_id: GraphQL node id of the branch ref
+            pr_url: URL of the PR
+            depends_on: Key of an action that must succeed first (optional)
+            on_result: Result callback (optional)
+
+        Returns:
+            Key of the queued action
+        """
+        field = f"deleteRef(input: {{refId: {_literal(ref_id)}}}) {{ clientMutationId }}"
+        return self._add(pr_url, "delete branch", field, depends_on, on_result)
+
+    def execute(self) -> Dict[str, bool]:
+        """Execute all queued actions, one GraphQL request per dependency level
+
+        Actions whose dependency failed are not sent and are reported as failed.
+
+        Returns:
+            Dictionary of action key -> success
+        """
+        with self._lock:
+            pending = list(self._actions)
+            self._actions = []
+
+        results: Dict[str, bool] = {}
+        while pending:
+            runnable = []
+            waiting = []
+            for action in pending:
+                if action.depends_on is None:
+                    runnable.append(action)
+                elif action.depends_on not in results:
+                    waiting.append(action)
+                elif results[action.depends_on]:
+                    runnable.append(action)
+                else:
+                    results[action.key] = False
+                    _notify(action, False, "skipped because a previous action failed")
+
+            if not runnable:
+                # Unknown dependency keys can never be satisfied
+                for action in waiting:
+                    results[action.key] = False
+                    _notify(action, False, f"unknown dependency {action.depends_on}")
+                break
+
+            for action, (success, error) in zip(runnable, self._execute_round(runnable)):
+                results[action.key] = success
+                _notify(action, success, error)
+            pending = waiting
+
+        return results
+
+    def _execute_round(self, actions: List[BatchedAction]) -> List[Tuple[bool, Optional[str]]]:
+        """Send one aliased mutation document and map the results back per alias"""
+        document = build_mutation_document(actions)
+        self.request_count += 1
+        try:
+            with content_request("batch_mutation"):
+                response = execute_graphql_mutation(document)
+        except RuntimeError as e:
+            return [(False, str(e))] * len(actions)
+
+        data = response.get("data") or {}
+        errors_by_alias: Dict[str, str] = {}
+        for error in response.get("errors") or []:
+            path = error.get("path") or []
+            if path:
+                errors_by_alias.setdefault(str(path[0]), error.get("message", "Unknown error"))
+
+        outcomes = []
+        for action in actions:
+            if action.key in errors_by_alias:
+                outcomes.append((False, errors_by_alias[action.key]))
+            elif data.get(action.key) is None:
+                outcomes.append((False, "no result returned"))
+            else:
+                outcomes.append((True, None))
+        return outcomes
+
+
+def _notify(action: BatchedAction, success: bool, error: Optional[str]) -> None:
+    """Invoke an action's result callback, if any"""
+    if action.on_result is not None:
+        action.on_result(success, error)
+
+
+def build_mutation_document(actions: List[BatchedAction]) -> str:
+    """Build a single GraphQL mutation document with one alias per action
+
+    Args:
+        actions: Actions to include
+
+    Returns:
+        GraphQL mutation document
+    """
+    fields = "\n".join(f"  {action.key}: {action.field}" for action in actions)
+    return f"mutation {{\n{fields}\n}}"
+
+
+# Batch collecting the actions of the current cycle (None = actions run immediately via gh)
+_active_batch: Optional[MutationBatch] = None
+
+
+def get_active_batch() -> Optional[MutationBatch]:
+    """Get the batch collecting the current cycle's actions
+
+    Returns:
+        The active MutationBatch, or None if actions should run immediately
+    """
+    return _active_batch
+
+
+@contextmanager
+def batched_mutations(enabled: bool) -> Iterator[Optional[MutationBatch]]:
+    """Collect PR actions during the block and execute them as batched mutations on exit
+
+    Args:
+        enabled: True to batch actions (action_backend = "graphql"), False to run them immediately
+
+    Yields:
+        The active MutationBatch, or None when batching is disabled
+    """
+    global _active_batch
+    if not enabled:
+        yield None
+        return
+
+    batch = MutationBatch()
+    _active_batch = batch
+    try:
+        yield batch
+    finally:
+        _active_batch = None
+        action_count = len(batch)
+        if action_count:
+            print(f"\nExecuting {action_count} batched action(s) via GraphQL...")
+            results = batch.execute()
+            failed = sum(1 for success in results.values() if not success)
+            print(f"  Batched actions: {len(results)} action(s) in {batch.request_count} request(s), {failed} failed")
+
+
+def get_action_backend(config: Optional[Dict[str, Any]]) -> str:
+    """Get the configured action backend
+
+    Args:
+        config: Configuration dictionary (can be None)
+
+    Returns:
+        "gh" (one gh CLI process per action) or "graphql" (batched mutations)
+    """
+    return (config or {}).get("action_backend", ACTION_BACKEND_GH)
@@ -0,0 +1,259 @@
+"""
+Coalescing of phase3 notifications into digests
+
+Without a digest, every PR reaching phase3 triggers its own ntfy push, so a
+burst of PRs becomes a burst of phone notifications. With `[ntfy] digest = true`:
+
+- Phase3 notifications are collected instead of sent, and flushed as one
+  message at the end of the cycle, or once no new PR was added for
+  `digest_window` (a debounce window such as "5m")
+- The digest has a summary line, one line per PR and up to three "Open PR"
+  action buttons (the ntfy limit)
+- When every open PR reaches phase3, the all-phase3 message
+  (`all_phase3_message`) is sent once on that transition
+"""
+
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .config import parse_interval, resolve_execution_config_for_repo
+from .notification_dispatcher import dispatch_notification, get_ntfy_server, is_notification_dispatcher_enabled
+from .notification_sinks import fan_out_notification, has_notification_sinks
+from .notifier import (
+    build_all_phase3_notification,
+    build_ntfy_headers,
+    build_phase3_notification,
+    is_valid_topic,
+    send_all_phase3_notification,
+    send_ntfy_notification,
+)
+from .phase_detector import PHASE_3
+
+# Maximum number of action buttons in one ntfy notification
+MAX_NTFY_ACTIONS = 3
+
+# Maximum length of an action button label
+MAX_ACTION_LABEL_LENGTH = 40
+
+# A collected notification: (PR URL, PR title, result callback)
+DigestItem = Tuple[str, str, Optional[Callable[[bool], None]]]
+
+
+class NotificationDigest:
+    """Phase3 notifications collected until the digest is flushed"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._items: List[DigestItem] = []
+        self._last_added: Optional[float] = None
+
+    def add(self, pr_url: str, pr_title: str, on_result: Optional[Callable[[bool], None]] = None) -> None:
+        """Collect a notification (a PR already collected is not added twice)"""
+        with self._lock:
+            if any(url == pr_url for url, _title, _on_result in self._items):
+                return
+            self._items.append((pr_url, pr_title, on_result))
+            self._last_added = time.monotonic()
+
+    def pending(self) -> List[str]:
+        """URLs of the collected notifications"""
+        with self._lock:
+            return [url for url, _title, _on_result in self._items]
+
+    def take_if_due(self, window_seconds: int, now: Optional[float] = None) -> List[DigestItem]:
+        """Remove and return the collected notifications if none was added for window_seconds
+
+        Args:
+            window_seconds: Debounce window (0 = always due)
+            now: Current monotonic time (default: now)
+
+        Returns:
+            Collected notifications, or an empty list if not due yet
+        """
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            if not self._items or (self._last_added is not None and now - self._last_added < window_seconds):
+                return []
+            items, self._items = self._items, []
+            self._last_added = None
+            return items
+
+
+_digest = NotificationDigest()
+
+# Whether all open PRs were in phase3 at the previous check
+_all_phase3 = False
+
+
+def is_digest_enabled(config: Dict[str, Any]) -> bool:
+    """Check if phase3 notifications are coalesced into digests
+
+    Args:
+        config: Configuration dictionary
+
+    Returns:
+        True if ntfy and its digest mode are enabled
+    """
+    ntfy_config = (config or {}).get("ntfy", {})
+    return bool(ntfy_config.get("enabled", False) and ntfy_config.get("digest", False))
+
+
+def add_to_digest(pr_url: str, pr_title: str, on_result: Optional[Callable[[bool], None]] = None) -> None:
+    """Collect a phase3 notification for the next digest
+
+    Args:
+        pr_url: PR URL
+        pr_title: PR title
+        on_result: Called with True/False once the digest was sent
+    """
+    _digest.add(pr_url, pr_title, on_result)
+
+
+def get_digest_pending() -> List[str]:
+    """URLs of the PRs waiting in the digest"""
+    return _digest.pending()
+
+
+def _action_label(title: str) -> str:
+    # Commas and semicolons separate fields and actions in the ntfy Actions header
+    label = re.sub(r"[,;\s]+", " ", title).strip() or "Open PR"
+    if len(label) > MAX_ACTION_LABEL_LENGTH:
+        label = label[: MAX_ACTION_LABEL_LENGTH - 1] + "…"
+    return label
+
+
+def build_digest_notification(config: Dict[str, Any], items: Sequence[DigestItem]) -> Optional[Dict[str, Any]]:
+    """Build one notification for the collected PRs
+
+    A single PR gets the usual phase3 notification.
+
+    Args:
+        config: Configuration dictionary
+        items: Collected notifications
+
+    Returns:
+        topic, message, title, priority and actions, or None if ntfy is not configured
+    """
+    if len(items) == 1:
+        url, title, _on_result = items[0]
+        return build_phase3_notification(config, url, title)
+
+    first = build_phase3_notification(config, items[0][0], items[0][1])
+    if first is None:
+        return None
+    shown = items[:MAX_NTFY_ACTIONS]
+    summary = f"{len(items)} PRs are ready for review"
+    if len(items) > len(shown):
+        summary += f" (buttons for the first {len(shown)})"
+    lines = [summary] + [f"- {title}: {url}" for url, title, _on_result in items]
+    actions = "; ".join(f"view, {_action_label(title)}, {url}" for url, title, _on_result in shown)
+    return {
+        "topic": first["topic"],
+        "message": "\n".join(lines),
+        "title": f"{len(items)} PRs ready for review",
+        "priority": first["priority"],
+        "actions": actions,
+    }
+
+
+def _digest_window_seconds(config: Dict[str, Any]) -> int:
+    window = (config or {}).get("ntfy", {}).get("digest_window", "0s")
+    try:
+        return parse_interval(window) if window else 0
+    except ValueError:
+        return 0
+
+
+def _deliver(config: Dict[str, Any], notification: Dict[str, Any], on_result: Callable[[bool], None]) -> bool:
+    """Send a notification through the sinks or the dispatcher if enabled, otherwise synchronously"""
+    if has_notification_sinks():
+        return fan_out_notification(notification, on_result)
+    if is_notification_dispatcher_enabled() and is_valid_topic(notification["topic"]):
+        headers = build_ntfy_headers(notification["title"], notification["priority"], notification["actions"])
+        return dispatch_notification(notification["topic"], notification["message"].encode("utf-8"), headers, on_result)
+    sent = send_ntfy_notification(
+        notification["topic"],
+        notification["message"],
+        title=notification["title"],
+        priority=notification["priority"],
+        actions=notification["actions"],
+        server=get_ntfy_server(config),
+    )
+    on_result(sent)
+    return True
+
+
+def flush_notification_digest(config: Dict[str, Any], now: Optional[float] = None) -> int:
+    """Send the collected phase3 notifications as one digest if the debounce window has passed
+
+    Called at the end of each monitoring cycle.
+
+    Args:
+        config: Configuration dictionary
+        now: Current monotonic time (default: now)
+
+    Returns:
+        Number of PRs included in the digest sent (0 if nothing was due)
+    """
+    items = _digest.take_if_due(_digest_window_seconds(config), now)
+    if not items:
+        return 0
+
+    def handle(success: bool) -> None:
+        for _url, _title, on_result in items:
+            if on_result is not None:
+                on_result(success)
+
+    notification = build_digest_notification(config, items)
+    if notification is None:
+        handle(False)
+        return 0
+    print(f"\nSending ntfy digest for {len(items)} PR(s)...")
+    if not _deliver(config, notification, handle):
+        print("  Failed to queue ntfy digest")
+        handle(False)
+    return len(items)
+
+
+def notify_all_phase3_transition(config: Dict[str, Any], all_prs: List[Dict[str, Any]], pr_phases: List[str]) -> bool:
+    """Send the all-phase3 message when every open PR has just reached phase3
+
+    The message is only sent in digest mode and when ntfy execution is enabled
+    (enable_execution_phase3_send_ntfy) for at least one of the PRs' repositories.
+
+    Args:
+        config: Configuration dictionary
+        all_prs: All open PRs
+        pr_phases: Phase of each PR
+
+    Returns:
+        True if the all-phase3 message was sent
+    """
+    global _all_phase3
+    all_phase3 = bool(pr_phases) and all(phase == PHASE_3 for phase in pr_phases)
+    transitioned = all_phase3 and not _all_phase3
+    _all_phase3 = all_phase3
+    if not transitioned or not is_digest_enabled(config):
+        return False
+
+    execution_enabled = any(
+        resolve_execution_config_for_repo(
+            config, pr.get("repository", {}).get("owner", ""), pr.get("repository", {}).get("name", "")
+        ).get("enable_execution_phase3_send_ntfy", False)
+        for pr in all_prs
+    )
+    if not execution_enabled:
+        print("[DRY-RUN] Would send all-phase3 ntfy notification (enable_execution_phase3_send_ntfy=false)")
+        return False
+
+    if has_notification_sinks():
+        notification = build_all_phase3_notification(config)
+        print("\nAll PRs are in phase3, sending notification to the notification sinks...")
+        return notification is not None and fan_out_notification(notification)
+
+    print("\nAll PRs are in phase3, sending ntfy notification...")
+    sent = send_all_phase3_notification(config)
+    print("  All-phase3 notification sent" if sent else "  Failed to send all-phase3 notification")
+    return sent
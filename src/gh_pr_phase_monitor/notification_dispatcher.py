@@ -0,0 +1,335 @@
+"""
+Asynchronous ntfy.sh notification dispatcher
+
+Sending a notification synchronously opens a fresh HTTPS connection per push
+and blocks the PR loop for up to the request timeout. With
+`[ntfy] async_dispatch = true`, notifications are queued instead and a
+background thread delivers them:
+
+- One keep-alive HTTP connection to the ntfy server is reused across pushes
+  (reconnecting after errors or when the server closes it)
+- The queue is bounded (`queue_size`); notifications beyond it are refused
+- Failed pushes (network errors, 429 and 5xx responses) are retried with
+  exponential backoff up to `max_retries` times; other 4xx responses fail at once
+- Pushes to the same topic are spaced by at least `rate_limit_seconds`
+- Delivery outcomes (sent/retried/failed/dropped, last error) are kept for the
+  status summary, and each notification's result callback is called with the
+  final outcome
+"""
+
+import http.client
+import threading
+import time
+import urllib.parse
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from .config import DEFAULT_NTFY_DISPATCH_CONFIG, get_ntfy_dispatch_config
+
+# Public ntfy server (default of [ntfy] server)
+NTFY_SERVER = "https://ntfy.sh"
+
+# Timeout (in seconds) of one HTTP request
+REQUEST_TIMEOUT_SECONDS = 10
+
+# Upper bound (in seconds) of the retry backoff
+MAX_BACKOFF_SECONDS = 300.0
+
+
+class QueuedNotification:
+    """A notification waiting to be delivered
+
+    Args:
+        topic: ntfy topic
+        body: Message body (UTF-8)
+        headers: Request headers (Title, Priority, Actions, ...)
+        on_result: Called with True/False once the notification was delivered or given up
+    """
+
+    def __init__(
+        self,
+        topic: str,
+        body: bytes,
+        headers: Dict[str, str],
+        on_result: Optional[Callable[[bool], None]] = None,
+    ):
+        self.topic = topic
+        self.body = body
+        self.headers = headers
+        self.on_result = on_result
+        self.attempts = 0
+        self.not_before = 0.0
+
+
+class NotificationDispatcher:
+    """Background sender of ntfy notifications over one keep-alive connection
+
+    Args:
+        server: Base URL of the ntfy server
+        queue_size: Maximum number of queued notifications
+        max_retries: Retries after the first failed attempt
+        retry_backoff_seconds: Delay before the first retry (doubled per retry)
+        rate_limit_seconds: Minimum interval between two pushes to the same topic
+    """
+
+    def __init__(
+        self,
+        server: str = NTFY_SERVER,
+        queue_size: int = DEFAULT_NTFY_DISPATCH_CONFIG["queue_size"],
+        max_retries: int = DEFAULT_NTFY_DISPATCH_CONFIG["max_retries"],
+        retry_backoff_seconds: float = DEFAULT_NTFY_DISPATCH_CONFIG["retry_backoff_seconds"],
+        rate_limit_seconds: float = DEFAULT_NTFY_DISPATCH_CONFIG["rate_limit_seconds"],
+    ):
+        self.server = server
+        parsed = urllib.parse.urlsplit(server)
+        self._scheme = parsed.scheme
+        self._netloc = parsed.netloc
+        self._base_path = parsed.path.rstrip("/")
+        self.queue_size = queue_size
+        self.max_retries = max_retries
+        self.retry_backoff_seconds = retry_backoff_seconds
+        self.rate_limit_seconds = rate_limit_seconds
+        self._cond = threading.Condition()
+        self._queue: Deque[QueuedNotification] = deque()
+        self._in_flight = 0
+        self._last_sent: Dict[str, float] = {}
+        self._connection: Optional[http.client.HTTPConnection] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+        self.outcomes: Dict[str, int] = {"sent": 0, "retried": 0, "failed": 0, "dropped": 0}
+        self.last_error: Optional[str] = None
+        self.connections_opened = 0
+
+    def submit(self, notification: QueuedNotification) -> bool:
+        """Queue a notification
+
+        Args:
+            notification: Notification to deliver
+
+        Returns:
+            True if queued, False if the queue is full
+        """
+        with self._cond:
+            if len(self._queue) >= self.queue_size:
+                self.outcomes["dropped"] += 1
+                return False
+            self._queue.append(notification)
+            self._start()
+            self._cond.notify_all()
+        return True
+
+    def pending(self) -> int:
+        """Number of notifications queued or being sent"""
+        with self._cond:
+            return len(self._queue) + self._in_flight
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until the queue is empty
+
+        Args:
+            timeout: Maximum seconds to wait (None = no limit)
+
+        Returns:
+            True if every notification was delivered or given up
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self._queue or self._in_flight:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def stop(self) -> None:
+        """Stop the dispatcher thread and close the connection"""
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=REQUEST_TIMEOUT_SECONDS)
+        self._close_connection()
+
+    def _start(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._dispatch_loop, name="ntfy-dispatcher", daemon=True)
+            self._thread.start()
+
+    def _ready_at(self, notification: QueuedNotification) -> float:
+        last_sent = self._last_sent.get(notification.topic)
+        rate_limited_until = last_sent + self.rate_limit_seconds if last_sent is not None else 0.0
+        return max(notification.not_before, rate_limited_until)
+
+    def _next_ready(self) -> Optional[QueuedNotification]:
+        """Pop the first notification that may be sent now, or wait for one (called with the lock held)"""
+        while not self._stopped:
+            now = time.monotonic()
+            wake_at = None
+            for notification in self._queue:
+                ready_at = self._ready_at(notification)
+                if ready_at <= now:
+                    self._queue.remove(notification)
+                    self._in_flight += 1
+                    return notification
+                wake_at = ready_at if wake_at is None else min(wake_at, ready_at)
+            self._cond.wait(None if wake_at is None else wake_at - now)
+        return None
+
+    def _dispatch_loop(self) -> None:
+        while True:
+            with self._cond:
+                notification = self._next_ready()
+            if notification is None:
+                return
+            outcome = self._deliver(notification)
+            with self._cond:
+                self._in_flight -= 1
+                if outcome is None:
+                    # Retry later, keeping its place ahead of newer notifications
+                    self._queue.appendleft(notification)
+                self._cond.notify_all()
+            if outcome is not None and notification.on_result is not None:
+                try:
+                    notification.on_result(outcome)
+                except Exception as e:
+                    print(f"  ⚠ Notification result handler failed: {e}")
+
+    def _deliver(self, notification: QueuedNotification) -> Optional[bool]:
+        """Send one notification
+
+        Returns:
+            True if delivered, False if given up, None if it should be retried
+        """
+        notification.attempts += 1
+        retryable = True
+        try:
+            status = self._post(notification)
+            if status == 200:
+                self.outcomes["sent"] += 1
+                return True
+            error = f"HTTP {status}"
+            retryable = status == 429 or status >= 500
+        except (OSError, http.client.HTTPException) as e:
+            self._close_connection()
+            error = str(e) or type(e).__name__
+        finally:
+            with self._cond:
+                self._last_sent[notification.topic] = time.monotonic()
+
+        self.last_error = f"{notification.topic}: {error}"
+        if retryable and notification.attempts <= self.max_retries:
+            backoff = min(self.retry_backoff_seconds * 2 ** (notification.attempts - 1), MAX_BACKOFF_SECONDS)
+            notification.not_before = time.monotonic() + backoff
+            self.outcomes["retried"] += 1
+            return None
+        print(f"    Error sending ntfy notification: {error} (after {notification.attempts} attempts)")
+        self.outcomes["failed"] += 1
+        return False
+
+    def _post(self, notification: QueuedNotification) -> int:
+        """POST a notification over the keep-alive connection and return the response status"""
+        if self._connection is None:
+            connection_class = http.client.HTTPSConnection if self._scheme == "https" else http.client.HTTPConnection
+            self._connection = connection_class(self._netloc, timeout=REQUEST_TIMEOUT_SECONDS)
+            self.connections_opened += 1
+        path = f"{self._base_path}/{notification.topic}"
+        self._connection.request("POST", path, body=notification.body, headers=notification.headers)
+        response = self._connection.getresponse()
+        response.read()
+        if response.will_close:
+            self._close_connection()
+        return response.status
+
+    def _close_connection(self) -> None:
+        if self._connection is not None:
+            try:
+                self._connection.close()
+            except Exception:
+                pass
+            self._connection = None
+
+
+def get_ntfy_server(config: Dict[str, Any]) -> str:
+    """Get the base URL of the ntfy server ([ntfy] server, e.g. a self-hosted instance)
+
+    Args:
+        config: Configuration dictionary
+
+    Returns:
+        Base URL without trailing slash (default: https://ntfy.sh)
+    """
+    server = (config or {}).get("ntfy", {}).get("server") or NTFY_SERVER
+    return server.rstrip("/")
+
+
+# Dispatcher shared by all notifications (None when async_dispatch is disabled)
+_dispatcher: Optional[NotificationDispatcher] = None
+
+
+def configure_notification_dispatcher(config: Dict[str, Any]) -> None:
+    """Enable, reconfigure or disable the dispatcher from the [ntfy] settings
+
+    Called at startup and after a config hot reload. Queued notifications are kept
+    when the dispatcher stays enabled.
+
+    Args:
+        config: Global configuration dictionary
+    """
+    global _dispatcher
+    settings = get_ntfy_dispatch_config(config)
+    server = get_ntfy_server(config)
+    if _dispatcher is not None and (not settings["async_dispatch"] or _dispatcher.server != server):
+        _dispatcher.flush(timeout=REQUEST_TIMEOUT_SECONDS)
+        _dispatcher.stop()
+        _dispatcher = None
+    if not settings["async_dispatch"]:
+        return
+    if _dispatcher is None:
+        _dispatcher = NotificationDispatcher(server)
+    _dispatcher.queue_size = settings["queue_size"]
+    _dispatcher.max_retries = settings["max_retries"]
+    _dispatcher.retry_backoff_seconds = settings["retry_backoff_seconds"]
+    _dispatcher.rate_limit_seconds = settings["rate_limit_seconds"]
+
+
+def is_notification_dispatcher_enabled() -> bool:
+    """Check if notifications are sent by the background dispatcher"""
+    return _dispatcher is not None
+
+
+def dispatch_notification(
+    topic: str, body: bytes, headers: Dict[str, str], on_result: Optional[Callable[[bool], None]] = None
+) -> bool:
+    """Queue a notification on the dispatcher
+
+    Args:
+        topic: Validated ntfy topic
+        body: Message body
+        headers: Request headers
+        on_result: Called with the final delivery outcome
+
+    Returns:
+        True if queued, False if the dispatcher is disabled or its queue is full
+    """
+    if _dispatcher is None:
+        return False
+    return _dispatcher.submit(QueuedNotification(topic, body, headers, on_result))
+
+
+def get_notification_summary() -> List[str]:
+    """Describe the dispatcher state for the status summary
+
+    Returns:
+        Summary lines (empty when the dispatcher is disabled)
+    """
+    if _dispatcher is None:
+        return []
+    outcomes = _dispatcher.outcomes
+    line = (
+        f"sent {outcomes['sent']}, pending {_dispatcher.pending()}, retried {outcomes['retried']}, "
+        f"failed {outcomes['failed']}, dropped {outcomes['dropped']}"
+    )
+    lines = [line]
+    if _dispatcher.last_error and (outcomes["failed"] or outcomes["retried"]):
+        lines.append(f"last error: {_dispatcher.last_error}")
+    return lines
@@ -0,0 +1,411 @@
+"""
+Pluggable notification sinks
+
+Besides ntfy, phase3 notifications can be delivered to other destinations,
+configured as `[[notification_sinks]]` tables:
+
+- `type = "ntfy"`: ntfy server given by `server` (self-hosted or a local
+  stand-in; default `[ntfy] server`, then https://ntfy.sh) and `topic`
+  (default `[ntfy] topic`)
+- `type = "webhook"`: JSON POST of title, message, priority and action links to `url`
+- `type = "file"`: one JSON line appended to `path` (a regular file or a FIFO;
+  a FIFO without a reader counts as a failed delivery instead of blocking)
+- `type = "desktop"`: desktop notification via `notify-send`
+
+Each sink has its own `timeout`, `max_retries` and `retry_backoff_seconds`,
+and its own worker thread. When sinks are configured, a notification is
+fanned out to all of them concurrently, so a slow endpoint delays neither the
+other sinks nor the monitoring loop.
+"""
+
+import abc
+import errno
+import json
+import os
+import shutil
+import stat
+import subprocess
+import threading
+import time
+import urllib.request
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from .notification_dispatcher import get_ntfy_server
+from .notifier import build_phase3_notification, send_ntfy_notification
+
+# Default per-sink delivery policy
+DEFAULT_SINK_TIMEOUT_SECONDS = 10.0
+DEFAULT_SINK_MAX_RETRIES = 2
+DEFAULT_SINK_RETRY_BACKOFF_SECONDS = 1.0
+
+
+def parse_actions(actions: Optional[str]) -> List[Dict[str, str]]:
+    """Parse an ntfy Actions header ("view, label, url; ...") into label/url pairs
+
+    Args:
+        actions: ntfy Actions header value
+
+    Returns:
+        List of {"label": ..., "url": ...} for the view actions
+    """
+    links = []
+    for action in (actions or "").split(";"):
+        fields = [field.strip() for field in action.split(",")]
+        if len(fields) >= 3 and fields[0] == "view":
+            links.append({"label": fields[1], "url": fields[2]})
+    return links
+
+
+class NotificationSink(abc.ABC):
+    """Destination of notifications with its own timeout and retry policy
+
+    Subclasses implement _send_once, which returns True on success and returns
+    False or raises on failure.
+
+    Args:
+        name: Name shown in logs and the status summary
+        timeout: Timeout (in seconds) of one delivery attempt
+        max_retries: Retries after the first failed attempt
+        retry_backoff_seconds: Delay before the first retry (doubled per retry)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        timeout: float = DEFAULT_SINK_TIMEOUT_SECONDS,
+        max_retries: int = DEFAULT_SINK_MAX_RETRIES,
+        retry_backoff_seconds: float = DEFAULT_SINK_RETRY_BACKOFF_SECONDS,
+    ):
+        self.name = name
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.retry_backoff_seconds = retry_backoff_seconds
+        self.outcomes: Dict[str, int] = {"sent": 0, "failed": 0}
+        self.last_error: Optional[str] = None
+
+    def send(self, notification: Dict[str, Any]) -> bool:
+        """Deliver a notification, retrying according to the sink's policy
+
+        Args:
+            notification: topic, message, title, priority and actions
+
+        Returns:
+            True if delivered
+        """
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                time.sleep(self.retry_backoff_seconds * 2 ** (attempt - 1))
+            try:
+                if self._send_once(notification):
+                    self.outcomes["sent"] += 1
+                    return True
+                self.last_error = "delivery failed"
+            except Exception as e:
+                self.last_error = str(e) or type(e).__name__
+        self.outcomes["failed"] += 1
+        print(f"    Error sending notification to {self.name}: {self.last_error} (after {attempt + 1} attempts)")
+        return False
+
+    @abc.abstractmethod
+    def _send_once(self, notification: Dict[str, Any]) -> bool:
+        """Make one delivery attempt
+
+        Args:
+            notification: topic, message, title, priority and actions
+
+        Returns:
+            True if delivered (failures may also raise)
+        """
+
+
+class NtfySink(NotificationSink):
+    """ntfy server (public, self-hosted or a local stand-in)"""
+
+    def __init__(self, name: str, server: str, topic: Optional[str], **policy):
+        super().__init__(name, **policy)
+        self.server = server
+        self.topic = topic
+
+    def _send_once(self, notification: Dict[str, Any]) -> bool:
+        return send_ntfy_notification(
+            self.topic or notification.get("topic"),
+            notification["message"],
+            title=notification.get("title"),
+            priority=notification.get("priority"),
+            actions=notification.get("actions"),
+            server=self.server,
+            timeout=self.timeout,
+        )
+
+
+class WebhookSink(NotificationSink):
+    """Generic JSON webhook"""
+
+    def __init__(self, name: str, url: str, headers: Optional[Dict[str, str]] = None, **policy):
+        super().__init__(name, **policy)
+        self.url = url
+        self.headers = dict(headers or {})
+
+    def _send_once(self, notification: Dict[str, Any]) -> bool:
+        payload = {
+            "title": notification.get("title"),
+            "message": notification["message"],
+            "priority": notification.get("priority"),
+            "actions": parse_actions(notification.get("actions")),
+        }
+        headers = {**self.headers, "Content-Type": "application/json"}
+        req = urllib.request.Request(
+            self.url, data=json.dumps(payload, ensure_ascii=False).encode("utf-8"), headers=headers, method="POST"
+        )
+        with urllib.request.urlopen(req, timeout=self.timeout) as response:
+            return 200 <= response.status < 300
+
+
+class FileSink(NotificationSink):
+    """JSON lines appended to a local file or FIFO"""
+
+    def __init__(self, name: str, path: str, **policy):
+        super().__init__(name, **policy)
+        self.path = path
+
+    def _send_once(self, notification: Dict[str, Any]) -> bool:
+        record = {"time": time.strftime("%Y-%m-%dT%H:%M:%S"), **notification}
+        line = (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+        try:
+            # O_NONBLOCK: opening a FIFO without a reader fails (ENXIO) instead of blocking
+            flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_NONBLOCK", 0)
+            fd = os.open(self.path, flags, 0o644)
+        except OSError as e:
+            if e.errno == errno.ENXIO:
+                raise OSError(f"no reader on FIFO {self.path}") from e
+            raise
+        try:
+            if stat.S_ISFIFO(os.fstat(fd).st_mode):
+                # Lines up to PIPE_BUF are written atomically, so concurrent writers do not interleave
+                os.set_blocking(fd, True)
+            os.write(fd, line)
+        finally:
+            os.close(fd)
+        return True
+
+
+class DesktopSink(NotificationSink):
+    """Desktop notification via notify-send"""
+
+    def __init__(self, name: str, command: str = "notify-send", **policy):
+        super().__init__(name, **policy)
+        self.command = command
+
+    @staticmethod
+    def _urgency(priority: Optional[int]) -> str:
+        if priority is None:
+            return "normal"
+        if priority >= 5:
+            return "critical"
+        return "low" if priority <= 2 else "normal"
+
+    def _send_once(self, notification: Dict[str, Any]) -> bool:
+        args = [self.command, "--urgency", self._urgency(notification.get("priority"))]
+        args += [notification.get("title") or "gh-pr-phase-monitor", notification["message"]]
+        result = subprocess.run(args, capture_output=True, timeout=self.timeout)
+        return result.returncode == 0
+
+
+SINK_TYPES = ("ntfy", "webhook", "file", "desktop")
+
+
+def _policy(entry: Dict[str, Any], name: str) -> Dict[str, Any]:
+    """Read the timeout and retry policy of a sink entry, falling back to defaults on invalid values"""
+    policy = {}
+    for key, default, minimum in (
+        ("timeout", DEFAULT_SINK_TIMEOUT_SECONDS, 0.001),
+        ("max_retries", DEFAULT_SINK_MAX_RETRIES, 0),
+        ("retry_backoff_seconds", DEFAULT_SINK_RETRY_BACKOFF_SECONDS, 0),
+    ):
+        value = entry.get(key, default)
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or value < minimum:
+            print(f"Warning: notification sink '{name}': invalid {key} {value!r}. Using default value: {default}")
+            value = default
+        if key == "max_retries":
+            value = int(value)
+        policy[key] = value
+    return policy
+
+
+def build_notification_sinks(config: Dict[str, Any]) -> List[NotificationSink]:
+    """Create the sinks of the [[notification_sinks]] tables
+
+    Invalid entries are reported and skipped.
+
+    Args:
+        config: Configuration dictionary
+
+    Returns:
+        Configured sinks
+    """
+    entries = (config or {}).get("notification_sinks") or []
+    if not isinstance(entries, list):
+        print("Warning: notification_sinks must be an array of tables ([[notification_sinks]]). Ignoring it")
+        return []
+    ntfy_config = (config or {}).get("ntfy", {})
+    sinks: List[NotificationSink] = []
+    for index, entry in enumerate(entries):
+        if not isinstance(entry, dict):
+            print(f"Warning: notification_sinks[{index}] must be a table. Ignoring it")
+            continue
+        sink_type = entry.get("type")
+        name = str(entry.get("name") or f"{sink_type}#{index + 1}")
+        if sink_type not in SINK_TYPES:
+            print(f"Warning: notification sink '{name}': type must be one of {', '.join(SINK_TYPES)}. Ignoring it")
+            continue
+        policy = _policy(entry, name)
+        if sink_type == "ntfy":
+            server = entry.get("server") or get_ntfy_server(config)
+            topic = entry.get("topic") or ntfy_config.get("topic")
+            if not topic:
+                print(f"Warning: notification sink '{name}': no topic (set topic or [ntfy] topic). Ignoring it")
+                continue
+            sinks.append(NtfySink(name, server, topic, **policy))
+        elif sink_type == "webhook":
+            if not str(entry.get("url", "")).startswith(("http://", "https://")):
+                print(f"Warning: notification sink '{name}': url must start with http:// or https://. Ignoring it")
+                continue
+            sinks.append(WebhookSink(name, entry["url"], entry.get("headers"), **policy))
+        elif sink_type == "file":
+            if not entry.get("path"):
+                print(f"Warning: notification sink '{name}': path is required. Ignoring it")
+                continue
+            sinks.append(FileSink(name, os.path.expanduser(entry["path"]), **policy))
+        else:
+            command = entry.get("command", "notify-send")
+            if shutil.which(command) is None:
+                print(f"Warning: notification sink '{name}': '{command}' not found. Ignoring it")
+                continue
+            sinks.append(DesktopSink(name, command, **policy))
+    return sinks
+
+
+class NotificationFanOut:
+    """Delivers each notification to every sink concurrently, one worker thread per sink"""
+
+    def __init__(self, sinks: List[NotificationSink]):
+        self.sinks = sinks
+        self._executors = [
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"notification-sink-{index}")
+            for index in range(len(sinks))
+        ]
+
+    def submit(self, notification: Dict[str, Any], on_result: Optional[Callable[[bool], None]] = None) -> List[Future]:
+        """Start delivering a notification to all sinks without waiting
+
+        Args:
+            notification: topic, message, title, priority and actions
+            on_result: Called once every sink finished, with True if at least one delivered it
+
+        Returns:
+            One future per sink
+        """
+        lock = threading.Lock()
+        remaining = [len(self.sinks)]
+        results: List[bool] = []
+
+        def done(future: Future) -> None:
+            try:
+                delivered = bool(future.result())
+            except Exception:
+                delivered = False
+            with lock:
+                results.append(delivered)
+                remaining[0] -= 1
+                finished = remaining[0] == 0
+            if finished and on_result is not None:
+                try:
+                    on_result(any(results))
+                except Exception as e:
+                    print(f"  ⚠ Notification result handler failed: {e}")
+
+        futures = [executor.submit(sink.send, notification) for sink, executor in zip(self.sinks, self._executors)]
+        for future in futures:
+            future.add_done_callback(done)
+        return futures
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Stop the worker threads (pending deliveries finish when wait is True)"""
+        for executor in self._executors:
+            executor.shutdown(wait=wait)
+
+
+# Fan-out of the configured sinks (None when no [[notification_sinks]] are configured)
+_fan_out: Optional[NotificationFanOut] = None
+
+
+def configure_notification_sinks(config: Dict[str, Any]) -> None:
+    """Create the sinks from the configuration (startup and hot reload)
+
+    Args:
+        config: Configuration dictionary
+    """
+    global _fan_out
+    sinks = build_notification_sinks(config)
+    if _fan_out is not None:
+        _fan_out.shutdown(wait=False)
+    _fan_out = NotificationFanOut(sinks) if sinks else None
+
+
+def has_notification_sinks() -> bool:
+    """Check if notifications are delivered through [[notification_sinks]]"""
+    return _fan_out is not None
+
+
+def fan_out_notification(notification: Dict[str, Any], on_result: Optional[Callable[[bool], None]] = None) -> bool:
+    """Deliver a notification to all configured sinks in the background
+
+    Args:
+        notification: topic, message, title, priority and actions
+        on_result: Called with True if at least one sink delivered it
+
+    Returns:
+        True if delivery started, False if no sinks are configured
+    """
+    if _fan_out is None:
+        return False
+    _fan_out.submit(notification, on_result)
+    return True
+
+
+def fan_out_phase3_notification(
+    config: Dict[str, Any], pr_url: str, pr_title: str, on_result: Optional[Callable[[bool], None]] = None
+) -> bool:
+    """Deliver the phase3 notification of a PR to all configured sinks in the background
+
+    Args:
+        config: Configuration dictionary
+        pr_url: PR URL
+        pr_title: PR title
+        on_result: Called with True if at least one sink delivered it
+
+    Returns:
+        True if delivery started
+    """
+    notification = build_phase3_notification(config, pr_url, pr_title)
+    if notification is None:
+        return False
+    return fan_out_notification(notification, on_result)
+
+
+def get_sink_summary() -> List[str]:
+    """Describe the sink outcomes for the status summary
+
+    Returns:
+        One line per sink (empty when no sinks are configured)
+    """
+    if _fan_out is None:
+        return []
+    lines = []
+    for sink in _fan_out.sinks:
+        line = f"{sink.name}: sent {sink.outcomes['sent']}, failed {sink.outcomes['failed']}"
+        if sink.outcomes["failed"] and sink.last_error:
+            line += f" (last error: {sink.last_error})"
+        lines.append(line)
+    return lines
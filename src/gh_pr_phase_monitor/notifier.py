@@ -55,10 +55,16 @@ Features
 Limitations
 -----------
 
-* Uses public ntfy.sh service with HTTPS; no authentication configured
+* Uses public ntfy.sh service with HTTPS by default; ``[ntfy] server`` points
+  to a self-hosted instance instead. No authentication configured
 * ntfy.sh may apply rate limiting or message size limits
 * Network errors return False and print error messages; no exceptions raised
 * 10 second timeout on HTTP requests
+* With ``[ntfy] async_dispatch = true``, :func:`queue_phase3_notification`
+  hands notifications to the background dispatcher (keep-alive connection,
+  retries, per-topic rate limiting; see notification_dispatcher.py)
+* With ``[[notification_sinks]]``, notifications are fanned out to ntfy,
+  webhook, file and desktop sinks instead (see notification_sinks.py)
 * Notifications track per (URL, phase) to prevent duplicates
 * Action buttons are supported by ntfy mobile app and some clients
 """
@@ -66,7 +72,9 @@ Limitations
 import base64
 import re
 import urllib.request
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
+
+from .notification_dispatcher import REQUEST_TIMEOUT_SECONDS, dispatch_notification, get_ntfy_server
 
 
 def encode_header_value(value: str) -> str:
@@ -120,8 +128,42 @@ def is_valid_topic(topic: str) -> bool:
     return bool(re.match(r"^[a-zA-Z0-9_.-]+$", topic))
 
 
+def build_ntfy_headers(
+    title: Optional[str] = None, priority: Optional[int] = None, actions: Optional[str] = None
+) -> Dict[str, str]:
+    """Build the ntfy request headers
+
+    Args:
+        title: Optional title for the notification
+        priority: Optional priority (1=min, 3=default, 5=max)
+        actions: Optional actions header for clickable buttons
+
+    Returns:
+        Headers with newlines stripped and non-ASCII values encoded
+    """
+    headers = {}
+    if title:
+        # Sanitize title to prevent header injection via newline/control characters
+        sanitized_title = re.sub(r"[\r\n]+", " ", title)
+        # Encode non-ASCII characters for HTTP headers
+        headers["Title"] = encode_header_value(sanitized_title)
+    if priority is not None:
+        headers["Priority"] = str(priority)
+    if actions:
+        # Sanitize actions to prevent header injection via newline/control characters
+        sanitized_actions = re.sub(r"[\r\n]+", " ", actions)
+        headers["Actions"] = sanitized_actions
+    return headers
+
+
 def send_ntfy_notification(
-    topic: str, message: str, title: Optional[str] = None, priority: Optional[int] = None, actions: Optional[str] = None
+    topic: str,
+    message: str,
+    title: Optional[str] = None,
+    priority: Optional[int] = None,
+    actions: Optional[str] = None,
+    server: Optional[str] = None,
+    timeout: float = REQUEST_TIMEOUT_SECONDS,
 ) -> bool:
     """Send a notification via ntfy.sh
 
@@ -131,6 +173,8 @@ def send_ntfy_notification(
         title: Optional title for the notification
         priority: Optional priority (1=min, 3=default, 5=max)
         actions: Optional actions header for clickable buttons (e.g., "view,Open PR,https://github.com/...")
+        server: Base URL of the ntfy server (default: https://ntfy.sh)
+        timeout: Request timeout in seconds
 
     Returns:
         True if notification was sent successfully, False otherwise
@@ -143,28 +187,15 @@ def send_ntfy_notification(
         print(f"    Error: Invalid ntfy topic name: {topic}")
         return False
 
-    url = f"https://ntfy.sh/{topic}"
-
-    # Prepare headers
-    headers = {}
-    if title:
-        # Sanitize title to prevent header injection via newline/control characters
-        sanitized_title = re.sub(r"[\r\n]+", " ", title)
-        # Encode non-ASCII characters for HTTP headers
-        headers["Title"] = encode_header_value(sanitized_title)
-    if priority is not None:
-        headers["Priority"] = str(priority)
-    if actions:
-        # Sanitize actions to prevent header injection via newline/control characters
-        sanitized_actions = re.sub(r"[\r\n]+", " ", actions)
-        headers["Actions"] = sanitized_actions
+    url = f"{(server or get_ntfy_server({})).rstrip('/')}/{topic}"
+    headers = build_ntfy_headers(title, priority, actions)
 
     try:
         # Create request with message as body
         req = urllib.request.Request(url, data=message.encode("utf-8"), headers=headers, method="POST")
 
         # Send request
-        with urllib.request.urlopen(req, timeout=10) as response:
+        with urllib.request.urlopen(req, timeout=timeout) as response:
             return response.status == 200
 
     except Exception as e:
@@ -196,18 +227,45 @@ def send_phase3_notification(config: Dict[str, Any], pr_url: str, pr_title: str)
     Returns:
         True if notification was sent successfully, False otherwise
     """
+    notification = build_phase3_notification(config, pr_url, pr_title)
+    if notification is None:
+        return False
+
+    # Send notification with PR title as the notification title and action button
+    return send_ntfy_notification(
+        notification["topic"],
+        notification["message"],
+        title=notification["title"],
+        priority=notification["priority"],
+        actions=notification["actions"],
+        server=get_ntfy_server(config),
+    )
+
+
+def build_phase3_notification(config: Dict[str, Any], pr_url: str, pr_title: str) -> Optional[Dict[str, Any]]:
+    """Build the keyword arguments of send_ntfy_notification for a phase3 PR
+
+    Args:
+        config: Configuration dictionary
+        pr_url: PR URL
+        pr_title: PR title
+
+    Returns:
+        topic, message, title, priority and actions, or None if ntfy is disabled or has no topic
+        (the topic is optional when [[notification_sinks]] are configured)
+    """
     # Check if ntfy is configured and enabled
     ntfy_config = config.get("ntfy", {})
     if not ntfy_config.get("enabled", False):
-        return False
+        return None
 
     topic = ntfy_config.get("topic")
     message_template = ntfy_config.get("message", "PR is ready for review: {url}")
     priority = ntfy_config.get("priority", 4)  # Default to 4 (high), configurable
 
-    if not topic:
+    if not topic and not config.get("notification_sinks"):
         print("    Warning: ntfy.topic not configured")
-        return False
+        return None
 
     # Format message with PR URL
     message = format_notification_message(message_template, pr_url)
@@ -216,32 +274,82 @@ def send_phase3_notification(config: Dict[str, Any], pr_url: str, pr_title: str)
     # Format: action_type,label,url
     actions = f"view,Open PR,{pr_url}"
 
-    # Send notification with PR title as the notification title and action button
-    return send_ntfy_notification(topic, message, title=pr_title, priority=priority, actions=actions)
+    return {"topic": topic, "message": message, "title": pr_title, "priority": priority, "actions": actions}
 
 
-def send_all_phase3_notification(config: Dict[str, Any]) -> bool:
-    """Send notification when all PRs become phase3
+def queue_phase3_notification(
+    config: Dict[str, Any], pr_url: str, pr_title: str, on_result: Optional[Callable[[bool], None]] = None
+) -> bool:
+    """Queue the phase3 notification on the background dispatcher (async_dispatch)
 
     Args:
         config: Configuration dictionary
+        pr_url: PR URL
+        pr_title: PR title
+        on_result: Called with the final delivery outcome (after retries)
 
     Returns:
-        True if notification was sent successfully, False otherwise
+        True if queued, False if ntfy is not configured, the topic is invalid or the queue is full
+    """
+    notification = build_phase3_notification(config, pr_url, pr_title)
+    if notification is None or not notification["message"]:
+        return False
+    if not is_valid_topic(notification["topic"]):
+        print(f"    Error: Invalid ntfy topic name: {notification['topic']}")
+        return False
+    headers = build_ntfy_headers(notification["title"], notification["priority"], notification["actions"])
+    return dispatch_notification(notification["topic"], notification["message"].encode("utf-8"), headers, on_result)
+
+
+def build_all_phase3_notification(config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Build the notification sent when all PRs become phase3
+
+    Args:
+        config: Configuration dictionary
+
+    Returns:
+        topic, message, title, priority and actions, or None if ntfy is disabled or has no topic
     """
     # Check if ntfy is configured and enabled
     ntfy_config = config.get("ntfy", {})
     if not ntfy_config.get("enabled", False):
-        return False
+        return None
 
     topic = ntfy_config.get("topic")
     message = ntfy_config.get("all_phase3_message", "All PRs are now in phase3 (ready for review)")
     priority = ntfy_config.get("priority", 4)  # Default to 4 (high), configurable
 
-    if not topic:
+    if not topic and not config.get("notification_sinks"):
         print("    Warning: ntfy.topic not configured")
+        return None
+
+    # Default title, no action button
+    return {
+        "topic": topic,
+        "message": message,
+        "title": "All PRs Ready for Review",
+        "priority": priority,
+        "actions": None,
+    }
+
+
+def send_all_phase3_notification(config: Dict[str, Any]) -> bool:
+    """Send notification when all PRs become phase3
+
+    Args:
+        config: Configuration dictionary
+
+    Returns:
+        True if notification was sent successfully, False otherwise
+    """
+    notification = build_all_phase3_notification(config)
+    if notification is None:
         return False
 
-    # Send notification with default title
-    title = "All PRs Ready for Review"
-    return send_ntfy_notification(topic, message, title=title, priority=priority)
+    return send_ntfy_notification(
+        notification["topic"],
+        notification["message"],
+        title=notification["title"],
+        priority=notification["priority"],
+        server=get_ntfy_server(config),
+    )
@@ -0,0 +1,312 @@
+"""
+DOM-based browser automation with Playwright
+
+Clicks the "Assign to Copilot", "Merge pull request" (or "Squash and merge" /
+"Rebase and merge") and "Confirm merge" buttons
+through DOM selectors in one persistent browser context that is kept alive across
+operations (`automation_backend = "playwright"` with a `user_data_dir`).
+
+Compared to screen-image clicking this needs no screenshots, no screen focus and
+no fixed waits, and runs headless: the context stays logged in to GitHub through
+its profile directory, so an operation only loads the page and clicks.
+
+Playwright's sync API must be used from the thread that started it, so every
+operation runs on one dedicated thread that owns the context.
+"""
+
+import atexit
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .readiness import DEFAULT_READY_TIMEOUT, record_time_to_ready
+
+# Playwright is optional - the PyAutoGUI backend is used when it is not installed
+try:
+    from playwright.sync_api import sync_playwright
+
+    PLAYWRIGHT_AVAILABLE = True
+except ImportError:
+    PLAYWRIGHT_AVAILABLE = False
+    sync_playwright = None  # Set to None when not available
+
+AUTOMATION_BACKEND_PLAYWRIGHT = "playwright"
+
+# Default DOM selectors of the buttons, overridable with a `selectors` table in the config section.
+# The merge buttons are labelled after the repository's merge method (merge commit, squash or rebase).
+DEFAULT_SELECTORS: Dict[str, str] = {
+    "assign_to_copilot": 'button:has-text("Assign to Copilot")',
+    "assign": 'button:text-is("Assign")',
+    "merge_pull_request": (
+        'button:has-text("Merge pull request"), '
+        'button:has-text("Squash and merge"):not(:has-text("Confirm")), '
+        'button:has-text("Rebase and merge"):not(:has-text("Confirm"))'
+    ),
+    "confirm_merge": (
+        'button:has-text("Confirm merge"), '
+        'button:has-text("Confirm squash and merge"), '
+        'button:has-text("Confirm rebase and merge")'
+    ),
+    "delete_branch": 'button:has-text("Delete branch")',
+}
+
+# Maximum time (in seconds) to wait for an optional button (e.g. "Delete branch", absent when
+# the repository deletes head branches automatically), instead of the full ready_timeout
+OPTIONAL_READY_TIMEOUT = 5.0
+
+# Browser names accepted in the `browser` setting: name -> (Playwright browser type, channel)
+BROWSER_TYPES: Dict[str, Tuple[str, Optional[str]]] = {
+    "chromium": ("chromium", None),
+    "chrome": ("chromium", "chrome"),
+    "msedge": ("chromium", "msedge"),
+    "edge": ("chromium", "msedge"),
+    "firefox": ("firefox", None),
+    "webkit": ("webkit", None),
+}
+
+
+def is_playwright_available() -> bool:
+    """Check if Playwright is available for use
+
+    Returns:
+        True if Playwright is installed and available, False otherwise
+    """
+    return PLAYWRIGHT_AVAILABLE
+
+
+def is_playwright_backend(config: Dict[str, Any]) -> bool:
+    """Check if an automation config section selects the Playwright backend
+
+    The backend is used when automation_backend is "playwright" (the default),
+    a persistent profile directory (user_data_dir) is configured and Playwright
+    is installed. Otherwise the screen-image (PyAutoGUI) backend is used.
+
+    Args:
+        config: phase3_merge or assign_to_copilot config section
+
+    Returns:
+        True if the Playwright backend should be used
+    """
+    return (
+        PLAYWRIGHT_AVAILABLE
+        and config.get("automation_backend", AUTOMATION_BACKEND_PLAYWRIGHT) == AUTOMATION_BACKEND_PLAYWRIGHT
+        and bool(config.get("user_data_dir"))
+    )
+
+
+class PlaywrightSession:
+    """One persistent browser context, started lazily and reused across operations"""
+
+    def __init__(self, user_data_dir: str, browser: str = "chromium", headless: bool = False):
+        """
+        Args:
+            user_data_dir: Profile directory of the persistent context (keeps the GitHub login)
+            browser: Browser name (see BROWSER_TYPES)
+            headless: Run the browser without a window
+        """
+        if browser not in BROWSER_TYPES:
+            raise ValueError(f"Unsupported browser '{browser}' (expected one of {', '.join(BROWSER_TYPES)})")
+        self.user_data_dir = str(Path(user_data_dir).expanduser())
+        self.browser = browser
+        self.headless = headless
+        self._playwright = None
+        self._context = None
+
+    @property
+    def key(self) -> Tuple[str, str, bool]:
+        return (self.user_data_dir, self.browser, self.headless)
+
+    def context(self):
+        """Return the persistent context, launching the browser on first use or after it was closed"""
+        if self._context is None:
+            browser_type_name, channel = BROWSER_TYPES[self.browser]
+            if self._playwright is None:
+                self._playwright = sync_playwright().start()
+            launch_options: Dict[str, Any] = {"headless": self.headless}
+            if channel:
+                launch_options["channel"] = channel
+            browser_type = getattr(self._playwright, browser_type_name)
+            self._context = browser_type.launch_persistent_context(self.user_data_dir, **launch_options)
+            self._context.on("close", lambda _context: self._forget_context())
+        return self._context
+
+    def _forget_context(self) -> None:
+        self._context = None
+
+    def close(self) -> None:
+        """Close the context and stop Playwright"""
+        if self._context is not None:
+            try:
+                self._context.close()
+            except Exception:
+                pass
+            self._context = None
+        if self._playwright is not None:
+            try:
+                self._playwright.stop()
+            except Exception:
+                pass
+            self._playwright = None
+
+
+# Session shared by all operations, and the single thread that owns it
+_session: Optional[PlaywrightSession] = None
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _run_on_session_thread(func: Callable[[], Any]) -> Any:
+    """Run a callable on the thread that owns the Playwright session and wait for its result"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="playwright")
+    return _executor.submit(func).result()
+
+
+def _get_session(config: Dict[str, Any]) -> PlaywrightSession:
+    """Return the shared session, replacing it when the browser settings changed (session thread only)"""
+    global _session
+    requested = PlaywrightSession(
+        config["user_data_dir"], config.get("browser", "chromium"), bool(config.get("headless", False))
+    )
+    if _session is None or _session.key != requested.key:
+        if _session is not None:
+            _session.close()
+        _session = requested
+    return _session
+
+
+def close_playwright_session() -> None:
+    """Close the shared browser context (called at exit)"""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is None:
+        return
+
+    def close():
+        global _session
+        if _session is not None:
+            _session.close()
+            _session = None
+
+    try:
+        executor.submit(close).result(timeout=10)
+    except Exception:
+        pass
+    executor.shutdown(wait=False)
+
+
+atexit.register(close_playwright_session)
+
+
+def _get_ready_timeout_ms(config: Dict[str, Any]) -> float:
+    ready_timeout = config.get("ready_timeout", DEFAULT_READY_TIMEOUT)
+    if not isinstance(ready_timeout, (int, float)) or isinstance(ready_timeout, bool) or ready_timeout <= 0:
+        ready_timeout = DEFAULT_READY_TIMEOUT
+    return float(ready_timeout) * 1000
+
+
+def _click(page, button_name: str, config: Dict[str, Any], required: bool = True) -> bool:
+    """Wait for a button to become visible and click it
+
+    Args:
+        page: Playwright page
+        button_name: Button name (key of DEFAULT_SELECTORS)
+        config: Config section (selectors, ready_timeout, readiness_log)
+        required: False for a button that may be absent; it is waited for at most
+            OPTIONAL_READY_TIMEOUT seconds and its absence is not recorded as a timeout
+
+    Returns:
+        True if the button was clicked, False if it did not appear before the deadline
+    """
+    selector = {**DEFAULT_SELECTORS, **(config.get("selectors") or {})}[button_name]
+    timeout_ms = _get_ready_timeout_ms(config)
+    if not required:
+        timeout_ms = min(timeout_ms, OPTIONAL_READY_TIMEOUT * 1000)
+    start = time.monotonic()
+    try:
+        locator = page.locator(selector).first
+        locator.wait_for(state="visible", timeout=timeout_ms)
+        elapsed = time.monotonic() - start
+        locator.click()
+    except Exception as e:
+        if not required:
+            print(f"  - Optional button '{button_name}' not shown; skipped")
+            return False
+        record_time_to_ready(button_name, None, config.get("readiness_log", ""))
+        print(f"  ✗ Button '{button_name}' ({selector}) not clickable: {str(e).splitlines()[0] if str(e) else e}")
+        return False
+    record_time_to_ready(button_name, elapsed, config.get("readiness_log", ""))
+    print(f"  ✓ Clicked button '{button_name}' (ready after {elapsed:.1f}s)")
+    return True
+
+
+def _run_steps(url: str, steps: Tuple[Tuple[str, bool], ...], config: Dict[str, Any]) -> bool:
+    """Open a URL in a new page of the persistent context and click buttons in order
+
+    Args:
+        url: Page URL
+        steps: (button name, required) pairs; a missing optional button does not fail the operation
+        config: Config section
+
+    Returns:
+        True if every required button was clicked
+    """
+    page = _get_session(config).context().new_page()
+    try:
+        page.goto(url, wait_until="domcontentloaded")
+        for button_name, required in steps:
+            if not _click(page, button_name, config, required) and required:
+                return False
+        return True
+    finally:
+        try:
+            page.close()
+        except Exception:
+            pass
+
+
+def _run_operation(label: str, url: str, steps: Tuple[Tuple[str, bool], ...], config: Dict[str, Any]) -> bool:
+    print(f"  → [Playwright] {label}...")
+    try:
+        succeeded = _run_on_session_thread(lambda: _run_steps(url, steps, config))
+    except Exception as e:
+        print(f"  ✗ [Playwright] Automation failed for '{url}': {e}")
+        return False
+    if succeeded:
+        print(f"  ✓ [Playwright] {label} done")
+    return succeeded
+
+
+def assign_issue_to_copilot_playwright(issue_url: str, config: Dict[str, Any]) -> bool:
+    """Assign an issue to Copilot by clicking "Assign to Copilot" and "Assign"
+
+    Args:
+        issue_url: The URL of the GitHub issue
+        config: assign_to_copilot config section (user_data_dir, browser, headless, selectors, ready_timeout)
+
+    Returns:
+        True if both buttons were clicked, False otherwise
+    """
+    steps = (("assign_to_copilot", True), ("assign", True))
+    return _run_operation("Assigning issue to Copilot", issue_url, steps, config)
+
+
+def merge_pr_playwright(pr_url: str, config: Dict[str, Any]) -> bool:
+    """Merge a PR by clicking "Merge pull request", "Confirm merge" and (optionally) "Delete branch"
+
+    The squash and rebase variants of the merge buttons are matched as well.
+
+    Args:
+        pr_url: The URL of the GitHub PR
+        config: phase3_merge config section (user_data_dir, browser, headless, selectors, ready_timeout)
+
+    Returns:
+        True if the merge was confirmed, False otherwise
+    """
+    steps = (("merge_pull_request", True), ("confirm_merge", True), ("delete_branch", False))
+    return _run_operation("Merging PR", pr_url, steps, config)
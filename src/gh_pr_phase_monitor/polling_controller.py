@@ -0,0 +1,239 @@
+"""
+Adaptive polling controller
+
+Without it, the wait between checks is `interval` until the PR state has not
+changed for `no_change_timeout`, then `reduced_frequency_interval`, with
+nothing in between. With `[adaptive_polling] enabled = true`, the next
+interval is computed every cycle from:
+
+- The observed change rate: an exponentially weighted average of changed PRs
+  per second (half-life `rate_half_life`). The interval aims at about
+  TARGET_CHANGES_PER_CHECK changes per check, and grows by at most
+  MAX_GROWTH_FACTOR per quiet cycle
+- Proximity to transitions: after a cycle with changes, or while "LLM working"
+  PRs have commits younger than `hot_window` or PRs have pending actions, the
+  interval is not longer than the normal `interval`
+- Bounds: `min_interval` .. `max_interval`
+- The rate budget: GraphQL points consumed per check (estimated from the
+  remaining points between checks) may use at most `rate_budget` of the points
+  remaining until the rate limit resets; this floor wins over max_interval
+"""
+
+import time
+from typing import Any, Dict, List, Optional
+
+from .config import get_adaptive_polling_config, get_duration_setting, parse_interval
+from .phase_detector import PHASE_LLM_WORKING
+from .pr_actions import has_pending_actions
+from .pr_fetcher import get_last_rate_limit
+from .snapshot_diff import SnapshotDiff
+from .time_utils import format_elapsed_time, parse_github_timestamp
+
+# Expected number of PR changes between two checks at the observed change rate
+TARGET_CHANGES_PER_CHECK = 0.5
+
+# Maximum factor by which the interval grows from one quiet cycle to the next
+MAX_GROWTH_FACTOR = 1.5
+
+
+def count_hot_prs(
+    all_prs: List[Dict[str, Any]], pr_phases: List[str], hot_window_seconds: int, now: float
+) -> Dict[str, int]:
+    """Count PRs that are likely to change soon
+
+    Args:
+        all_prs: PRs of this cycle
+        pr_phases: Phase of each PR
+        hot_window_seconds: Age below which a commit counts as fresh
+        now: Current time (epoch seconds)
+
+    Returns:
+        Dict with 'fresh_commits' ("LLM working" PRs with a fresh head commit) and
+        'pending_actions' (PRs whose last action failed or was deferred)
+    """
+    counts = {"fresh_commits": 0, "pending_actions": 0}
+    for pr, phase in zip(all_prs, pr_phases):
+        if has_pending_actions(pr.get("url", "")):
+            counts["pending_actions"] += 1
+        elif phase == PHASE_LLM_WORKING:
+            committed_at = parse_github_timestamp(pr.get("lastCommitAt"))
+            if committed_at is not None and now - committed_at <= hot_window_seconds:
+                counts["fresh_commits"] += 1
+    return counts
+
+
+class PollingDecision:
+    """Next interval chosen by the controller, with the reasoning behind it
+
+    Attributes:
+        interval_seconds: Seconds to wait until the next check
+        change_rate: Smoothed change rate (changed PRs per hour)
+        reasons: Steps that shaped the interval, in the order they were applied
+    """
+
+    def __init__(self, interval_seconds: int, change_rate: float, reasons: List[str]):
+        self.interval_seconds = interval_seconds
+        self.change_rate = change_rate
+        self.reasons = reasons
+
+    @property
+    def interval_str(self) -> str:
+        return format_elapsed_time(self.interval_seconds)
+
+    def format_reasoning(self) -> str:
+        """Format the decision and its reasons as one line"""
+        return f"Adaptive polling: next check in {self.interval_str} ({'; '.join(self.reasons)})"
+
+
+class AdaptivePollingController:
+    """Chooses the next polling interval from the history of observed changes"""
+
+    def __init__(self):
+        self.change_rate = 0.0
+        self.last_observed_at: Optional[float] = None
+        self.last_interval: Optional[float] = None
+        self.last_remaining: Optional[int] = None
+        self.last_reset_at: Optional[str] = None
+        self.points_per_check: Optional[int] = None
+
+    def _observe_changes(self, changes: int, now: float, half_life_seconds: int) -> None:
+        """Update the smoothed change rate with the changes seen since the previous check"""
+        if self.last_observed_at is not None:
+            elapsed = max(now - self.last_observed_at, 1.0)
+            weight = 1 - 0.5 ** (elapsed / half_life_seconds)
+            self.change_rate += weight * (changes / elapsed - self.change_rate)
+        self.last_observed_at = now
+
+    def _budget_floor(self, rate_limit: Optional[Dict[str, Any]], rate_budget: float, now: float) -> Optional[float]:
+        """Shortest interval that keeps the checks within rate_budget of the remaining points"""
+        if not rate_limit or not isinstance(rate_limit.get("remaining"), int):
+            return None
+        remaining = rate_limit["remaining"]
+        reset_at = rate_limit.get("resetAt")
+        # Points consumed between two checks (including other clients of the same token)
+        if self.last_remaining is not None and reset_at == self.last_reset_at and remaining < self.last_remaining:
+            self.points_per_check = self.last_remaining - remaining
+        self.last_remaining, self.last_reset_at = remaining, reset_at
+
+        reset_time = parse_github_timestamp(reset_at)
+        points_per_check = self.points_per_check or rate_limit.get("cost")
+        if reset_time is None or not points_per_check or reset_time <= now:
+            return None
+        checks_allowed = remaining * rate_budget / points_per_check
+        if checks_allowed < 1:
+            return reset_time - now
+        return (reset_time - now) / checks_allowed
+
+    def decide(
+        self,
+        config: Dict[str, Any],
+        changes: int,
+        hot_prs: Dict[str, int],
+        rate_limit: Optional[Dict[str, Any]] = None,
+        now: Optional[float] = None,
+    ) -> PollingDecision:
+        """Choose the interval until the next check
+
+        Args:
+            config: Configuration dictionary
+            changes: PRs added, removed or changed since the previous check
+            hot_prs: Result of count_hot_prs() for this cycle
+            rate_limit: GraphQL rateLimit of this cycle (cost, remaining, resetAt)
+            now: Current time (epoch seconds, defaults to time.time())
+
+        Returns:
+            PollingDecision
+        """
+        now = time.time() if now is None else now
+        settings = get_adaptive_polling_config(config)
+        _interval_str, base_interval = get_duration_setting(config, "interval")
+        min_interval = parse_interval(settings["min_interval"])
+        max_interval = parse_interval(settings["max_interval"])
+        first_check = self.last_observed_at is None
+        self._observe_changes(changes, now, parse_interval(settings["rate_half_life"]))
+        rate_per_hour = self.change_rate * 3600
+        reasons = []
+
+        if first_check:
+            interval = float(base_interval)
+            reasons.append(f"first check: interval {format_elapsed_time(base_interval)}")
+        else:
+            interval = TARGET_CHANGES_PER_CHECK / self.change_rate if self.change_rate > 0 else float(max_interval)
+            reasons.append(f"change rate {rate_per_hour:.2f}/h -> {format_elapsed_time(interval)}")
+            if self.last_interval is not None and interval > self.last_interval * MAX_GROWTH_FACTOR:
+                interval = self.last_interval * MAX_GROWTH_FACTOR
+                reasons.append(f"growth limited to x{MAX_GROWTH_FACTOR} -> {format_elapsed_time(interval)}")
+
+        hot = []
+        if changes:
+            hot.append(f"{changes} change(s) this check")
+        if hot_prs.get("fresh_commits"):
+            hot.append(f"{hot_prs['fresh_commits']} LLM working PR(s) with fresh commits")
+        if hot_prs.get("pending_actions"):
+            hot.append(f"{hot_prs['pending_actions']} PR(s) with pending actions")
+        if hot and interval > base_interval:
+            interval = float(base_interval)
+            reasons.append(f"{', '.join(hot)} -> {format_elapsed_time(interval)}")
+
+        if interval < min_interval:
+            interval = float(min_interval)
+            reasons.append(f"min_interval {settings['min_interval']}")
+        elif interval > max_interval:
+            interval = float(max_interval)
+            reasons.append(f"max_interval {settings['max_interval']}")
+
+        budget_floor = self._budget_floor(rate_limit, settings["rate_budget"], now)
+        if budget_floor is not None and budget_floor > interval:
+            interval = budget_floor
+            reasons.append(f"rate budget ({self.last_remaining} points left) -> {format_elapsed_time(interval)}")
+
+        self.last_interval = interval
+        return PollingDecision(max(1, round(interval)), rate_per_hour, reasons)
+
+
+# Controller shared across cycles (reset on restart)
+_controller = AdaptivePollingController()
+
+
+def is_adaptive_polling_enabled(config: Optional[Dict[str, Any]]) -> bool:
+    """Check if [adaptive_polling] enabled = true"""
+    return bool(get_adaptive_polling_config(config or {})["enabled"])
+
+
+def decide_next_interval(
+    config: Dict[str, Any],
+    all_prs: List[Dict[str, Any]],
+    pr_phases: List[str],
+    snapshot_diff: Optional[SnapshotDiff],
+    now: Optional[float] = None,
+) -> PollingDecision:
+    """Choose the interval until the next check from this cycle's results
+
+    Args:
+        config: Configuration dictionary
+        all_prs: PRs of this cycle
+        pr_phases: Phase of each PR
+        snapshot_diff: Diff computed for this cycle (None if the cycle failed)
+        now: Current time (epoch seconds, defaults to time.time())
+
+    Returns:
+        PollingDecision
+    """
+    now = time.time() if now is None else now
+    changes = 0
+    if snapshot_diff is not None:
+        changes = (
+            len(snapshot_diff.added)
+            + len(snapshot_diff.removed)
+            + len(snapshot_diff.phase_changed)
+            + len(snapshot_diff.changed)
+        )
+    hot_window = parse_interval(get_adaptive_polling_config(config)["hot_window"])
+    hot_prs = count_hot_prs(all_prs, pr_phases, hot_window, now)
+    return _controller.decide(config, changes, hot_prs, get_last_rate_limit(), now)
+
+
+def reset_polling_controller() -> None:
+    """Forget the observed history (for testing)"""
+    global _controller
+    _controller = AdaptivePollingController()
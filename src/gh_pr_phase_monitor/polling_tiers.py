@@ -0,0 +1,297 @@
+"""
+Per-repository and per-PR polling tiers
+
+Without tiers, every check fetches the details of every open PR. With
+`[polling_tiers] enabled = true`, each check only fetches what is due:
+
+- Each PR gets a tier from its phase and recent activity:
+  - hot: phase2 and "LLM working" (Copilot is expected to push), PRs that
+    changed in the last check and PRs with pending actions; refetched every check
+  - warm: phase1, and "LLM working" PRs whose head commit is older than
+    `idle_after`; refetched every `warm_interval`
+  - cold: phase3 (waiting on a human); refetched every `cold_interval`
+- Each repository gets a tier from how recently its set of open PRs changed:
+  warm if a PR was opened or closed within `idle_after`, cold otherwise. Its PR
+  list is refetched when that interval expires, or at once when Phase 1 reports
+  a different open PR count
+- Due PRs of repositories that are not due are refetched by node id; the other
+  PRs are reused from their previous fetch (so the snapshot diff sees them as
+  unchanged). A refetched PR that is no longer open makes its repository due
+"""
+
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from .config import get_polling_tiers_config, parse_interval
+from .github_client import get_pr_details_batch, get_prs_by_node_ids
+from .phase_detector import PHASE_2, PHASE_3, PHASE_LLM_WORKING
+from .pr_actions import has_pending_actions
+from .snapshot_diff import SnapshotDiff
+from .time_utils import parse_github_timestamp
+
+TIER_HOT = "hot"
+TIER_WARM = "warm"
+TIER_COLD = "cold"
+TIERS = (TIER_HOT, TIER_WARM, TIER_COLD)
+
+
+def classify_pr_tier(pr: Dict[str, Any], phase: str, changed: bool, idle_after_seconds: int, now: float) -> str:
+    """Assign a polling tier to a PR
+
+    Args:
+        pr: PR data
+        phase: Phase of the PR
+        changed: Whether the PR was added or changed in this check
+        idle_after_seconds: Age of the head commit after which an "LLM working" PR is no longer hot
+        now: Current time (epoch seconds)
+
+    Returns:
+        TIER_HOT, TIER_WARM or TIER_COLD
+    """
+    if changed or has_pending_actions(pr.get("url", "")) or phase == PHASE_2:
+        return TIER_HOT
+    if phase == PHASE_LLM_WORKING:
+        committed_at = parse_github_timestamp(pr.get("lastCommitAt"))
+        if committed_at is not None and now - committed_at > idle_after_seconds:
+            return TIER_WARM
+        return TIER_HOT
+    if phase == PHASE_3:
+        return TIER_COLD
+    return TIER_WARM
+
+
+class _PrEntry:
+    """Last fetched data and tier of a PR"""
+
+    def __init__(self, pr: Dict[str, Any], fetched_at: float):
+        self.pr = pr
+        self.fetched_at = fetched_at
+        self.tier = TIER_HOT
+
+
+class _RepoEntry:
+    """Last fetched PR list and tier of a repository"""
+
+    def __init__(self, open_pr_count: int, urls: List[str], fetched_at: float):
+        self.open_pr_count = open_pr_count
+        self.urls = urls
+        self.fetched_at = fetched_at
+        # None until the PR set changes while being monitored
+        self.pr_set_changed_at: Optional[float] = None
+        self.tier = TIER_COLD
+
+
+class FetchPlan:
+    """What a check has to fetch
+
+    Attributes:
+        repos: Repositories whose PR list is refetched
+        node_ids: PRs refetched individually by node id
+        cached_count: PRs reused from their previous fetch
+    """
+
+    def __init__(self):
+        self.repos: List[Dict[str, Any]] = []
+        self.node_ids: List[str] = []
+        self.cached_count = 0
+
+    def format_summary(self) -> str:
+        return (
+            f"{len(self.repos)} repositories, {len(self.node_ids)} PR(s) by node id, "
+            f"{self.cached_count} PR(s) from the previous fetch"
+        )
+
+
+def _repo_key(repo: Dict[str, Any]) -> Tuple[str, str]:
+    return repo.get("owner", ""), repo.get("name", "")
+
+
+class PollingTierScheduler:
+    """Tracks fetched PRs and decides which repositories and PRs are due"""
+
+    def __init__(self):
+        self._repos: Dict[Tuple[str, str], _RepoEntry] = {}
+        self._prs: Dict[str, _PrEntry] = {}
+
+    @staticmethod
+    def tier_interval(tier: str, settings: Dict[str, Any]) -> int:
+        """Seconds between two fetches of a tier (0 = every check)"""
+        if tier == TIER_HOT:
+            return 0
+        return parse_interval(settings[f"{tier}_interval"])
+
+    def plan(self, repos_with_prs: List[Dict[str, Any]], settings: Dict[str, Any], now: float) -> FetchPlan:
+        """Decide what to fetch for repos_with_prs (Phase 1 result)"""
+        plan = FetchPlan()
+        for repo in repos_with_prs:
+            entry = self._repos.get(_repo_key(repo))
+            if (
+                entry is None
+                or entry.open_pr_count != repo.get("openPRCount")
+                or now - entry.fetched_at >= self.tier_interval(entry.tier, settings)
+            ):
+                plan.repos.append(repo)
+                continue
+
+            due_ids = []
+            for url in entry.urls:
+                pr_entry = self._prs[url]
+                if now - pr_entry.fetched_at < self.tier_interval(pr_entry.tier, settings):
+                    continue
+                if not pr_entry.pr.get("id"):
+                    # Without a node id, the PR can only be refetched with its repository
+                    due_ids = None
+                    break
+                due_ids.append(pr_entry.pr["id"])
+            if due_ids is None:
+                plan.repos.append(repo)
+            else:
+                plan.node_ids.extend(due_ids)
+                plan.cached_count += len(entry.urls) - len(due_ids)
+        return plan
+
+    def record_repo_fetch(self, repos: List[Dict[str, Any]], prs: List[Dict[str, Any]], now: float) -> None:
+        """Store the PR lists fetched for repos"""
+        prs_by_repo: Dict[Tuple[str, str], List[Dict[str, Any]]] = {_repo_key(repo): [] for repo in repos}
+        for pr in prs:
+            repository = pr.get("repository", {})
+            prs_by_repo.setdefault((repository.get("owner", ""), repository.get("name", "")), []).append(pr)
+
+        for repo in repos:
+            key = _repo_key(repo)
+            urls = [pr.get("url", "") for pr in prs_by_repo[key]]
+            entry = self._repos.get(key)
+            if entry is None:
+                entry = self._repos[key] = _RepoEntry(repo.get("openPRCount", len(urls)), urls, now)
+            else:
+                if set(urls) != set(entry.urls):
+                    entry.pr_set_changed_at = now
+                for url in set(entry.urls) - set(urls):
+                    self._prs.pop(url, None)
+                entry.open_pr_count = repo.get("openPRCount", len(urls))
+                entry.urls = urls
+                entry.fetched_at = now
+            for pr in prs_by_repo[key]:
+                previous = self._prs.get(pr.get("url", ""))
+                self._prs[pr.get("url", "")] = _PrEntry(pr, now)
+                if previous is not None:
+                    self._prs[pr.get("url", "")].tier = previous.tier
+
+    def record_node_fetch(self, node_ids: List[str], prs: List[Dict[str, Any]], now: float) -> None:
+        """Store PRs refetched by node id; closed, merged or deleted PRs make their repository due"""
+        entries_by_id = {entry.pr.get("id"): (url, entry) for url, entry in self._prs.items()}
+        returned = {pr.get("id") for pr in prs}
+        for pr in prs:
+            url, entry = entries_by_id.get(pr.get("id"), (pr.get("url", ""), None))
+            if pr.get("state", "OPEN") == "OPEN" and entry is not None:
+                entry.pr = pr
+                entry.fetched_at = now
+            else:
+                self._drop_pr(url)
+        for node_id in node_ids:
+            if node_id not in returned and node_id in entries_by_id:
+                self._drop_pr(entries_by_id[node_id][0])
+
+    def _drop_pr(self, url: str) -> None:
+        """Forget a PR that is no longer open and refetch its repository in the next check"""
+        entry = self._prs.pop(url, None)
+        if entry is None:
+            return
+        repo_entry = self._repos.get(_repo_key(entry.pr.get("repository", {})))
+        if repo_entry is not None:
+            repo_entry.urls = [other for other in repo_entry.urls if other != url]
+            repo_entry.fetched_at = float("-inf")
+
+    def current_prs(self, repos_with_prs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Latest data of every PR of repos_with_prs, forgetting repositories without open PRs"""
+        keys = {_repo_key(repo) for repo in repos_with_prs}
+        for key in set(self._repos) - keys:
+            for url in self._repos.pop(key).urls:
+                self._prs.pop(url, None)
+        return [self._prs[url].pr for repo in repos_with_prs for url in self._repos[_repo_key(repo)].urls]
+
+    def update_tiers(
+        self,
+        all_prs: List[Dict[str, Any]],
+        pr_phases: List[str],
+        snapshot_diff: Optional[SnapshotDiff],
+        settings: Dict[str, Any],
+        now: float,
+    ) -> None:
+        """Reassign the tiers from this check's phases and changes"""
+        idle_after = parse_interval(settings["idle_after"])
+        for pr, phase in zip(all_prs, pr_phases):
+            entry = self._prs.get(pr.get("url", ""))
+            if entry is not None:
+                changed = snapshot_diff is not None and snapshot_diff.is_delta(pr.get("url", ""))
+                entry.tier = classify_pr_tier(pr, phase, changed, idle_after, now)
+        for entry in self._repos.values():
+            recently_changed = entry.pr_set_changed_at is not None and now - entry.pr_set_changed_at < idle_after
+            entry.tier = TIER_WARM if recently_changed else TIER_COLD
+
+    def tier_counts(self) -> Dict[str, int]:
+        """Number of PRs per tier"""
+        counts = {tier: 0 for tier in TIERS}
+        for entry in self._prs.values():
+            counts[entry.tier] += 1
+        return counts
+
+
+# Scheduler shared across checks (reset on restart, so the first check fetches everything)
+_scheduler = PollingTierScheduler()
+
+
+def is_polling_tiers_enabled(config: Optional[Dict[str, Any]]) -> bool:
+    """Check if [polling_tiers] enabled = true"""
+    return bool(get_polling_tiers_config(config or {})["enabled"])
+
+
+def fetch_due_pr_details(
+    repos_with_prs: List[Dict[str, Any]], config: Dict[str, Any], now: Optional[float] = None
+) -> List[Dict[str, Any]]:
+    """Fetch the due repositories and PRs (Phase 2 with polling tiers)
+
+    Args:
+        repos_with_prs: Repositories with open PRs (Phase 1 result)
+        config: Configuration dictionary
+        now: Current time (epoch seconds, defaults to time.time())
+
+    Returns:
+        Latest data of all open PRs, like get_pr_details_batch(repos_with_prs)
+    """
+    now = time.time() if now is None else now
+    plan = _scheduler.plan(repos_with_prs, get_polling_tiers_config(config), now)
+    print(f"  Polling tiers: fetching {plan.format_summary()}")
+    if plan.repos:
+        _scheduler.record_repo_fetch(plan.repos, get_pr_details_batch(plan.repos), now)
+    if plan.node_ids:
+        _scheduler.record_node_fetch(plan.node_ids, get_prs_by_node_ids(plan.node_ids), now)
+    return _scheduler.current_prs(repos_with_prs)
+
+
+def update_polling_tiers(
+    config: Dict[str, Any],
+    all_prs: List[Dict[str, Any]],
+    pr_phases: List[str],
+    snapshot_diff: Optional[SnapshotDiff],
+    now: Optional[float] = None,
+) -> None:
+    """Reassign tiers after the PRs of a check were classified
+
+    Args:
+        config: Configuration dictionary
+        all_prs: PRs returned by fetch_due_pr_details()
+        pr_phases: Phase of each PR
+        snapshot_diff: Diff computed for this check
+        now: Current time (epoch seconds, defaults to time.time())
+    """
+    now = time.time() if now is None else now
+    _scheduler.update_tiers(all_prs, pr_phases, snapshot_diff, get_polling_tiers_config(config), now)
+    counts = _scheduler.tier_counts()
+    print(f"  Polling tiers: {', '.join(f'{counts[tier]} {tier}' for tier in TIERS)}")
+
+
+def reset_polling_tiers() -> None:
+    """Forget all fetched PRs (for testing)"""
+    global _scheduler
+    _scheduler = PollingTierScheduler()
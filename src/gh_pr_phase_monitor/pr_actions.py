@@ -5,8 +5,10 @@ PR actions such as marking ready and opening browser
 import subprocess
 import webbrowser
 from pathlib import Path
-from typing import Any, Dict, Optional, Set, Tuple
+from typing import Any, Callable, Dict, Optional, Set, Tuple
 
+from .action_executor import browser_operation, content_request
+from .action_journal import begin_action, finish_action
 from .browser_automation import (
     _can_open_browser,
     _get_remaining_cooldown,
@@ -14,14 +16,28 @@ from .browser_automation import (
     _should_autoraise_window,
     merge_pr_automated,
 )
+from .browser_scheduler import (
+    OPERATION_MERGE,
+    OPERATION_REVIEW,
+    is_browser_operation_scheduled,
+    schedule_browser_operation,
+)
+from .browser_worker import JOB_KIND_MERGE, is_browser_job_pending, is_browser_worker_enabled, submit_browser_job
 from .colors import colorize_phase
 from .comment_manager import (
     post_phase2_comment,
     post_phase3_comment,
+    queue_phase2_comment,
 )
 from .config import get_phase3_merge_config, print_repo_execution_config, resolve_execution_config_for_repo
-from .notifier import send_phase3_notification
+from .merge_preflight import get_merge_block_reason, is_mergeable_now
+from .mutation_batch import MutationBatch, ResultCallback, get_active_batch
+from .notification_digest import add_to_digest, is_digest_enabled
+from .notification_dispatcher import is_notification_dispatcher_enabled
+from .notification_sinks import fan_out_phase3_notification, has_notification_sinks
+from .notifier import queue_phase3_notification, send_phase3_notification
 from .phase_detector import PHASE_1, PHASE_2, PHASE_3, determine_phase
+from .playwright_automation import is_playwright_backend
 
 # Track which PRs have had their browser opened: set of (url, phase) tuples
 _browser_opened: Set[Tuple[str, str]] = set()
@@ -32,6 +48,201 @@ _notifications_sent: Set[Tuple[str, str]] = set()
 # Track which PRs have been merged: set of PR URLs
 _merged_prs: Set[str] = set()
 
+# Track PRs whose pre-merge comment was posted by this monitor: set of PR URLs
+# A failed merge or auto-merge step is retried without posting the comment again
+_merge_comment_posted: Set[str] = set()
+
+# Track PRs for which GitHub auto-merge was enabled by this monitor: set of PR URLs
+# Covers the gap until the next fetch reports autoMergeRequest
+_auto_merge_enabled: Set[str] = set()
+
+# Track PRs with an action that failed or was deferred (e.g., browser cooldown): set of PR URLs
+# These PRs are processed again in the next cycle even if their snapshot did not change
+_actions_pending: Set[str] = set()
+
+
+def has_pending_actions(pr_url: str) -> bool:
+    """Check if a PR has an action that failed or was deferred in its last processing
+
+    Args:
+        pr_url: URL of the PR
+
+    Returns:
+        True if the PR should be processed again even without changes
+    """
+    return pr_url in _actions_pending
+
+
+def _batch_result_handler(
+    pr_url: str,
+    success_message: str,
+    failure_message: str,
+    on_success: Optional[Callable[[], None]] = None,
+    retry_on_failure: bool = True,
+    journal_action: Optional[Tuple[str, str]] = None,
+) -> ResultCallback:
+    """Create a callback reporting the result of a batched mutation
+
+    Args:
+        pr_url: URL of the PR
+        success_message: Message printed on success
+        failure_message: Message printed on failure
+        on_success: Function called on success (optional)
+        retry_on_failure: True to process the PR again in the next cycle on failure
+        journal_action: (phase, action) recorded in the action journal (optional)
+
+    Returns:
+        Callback invoked with (success, error message)
+    """
+
+    def handle(success: bool, error: Optional[str]) -> None:
+        if journal_action is not None:
+            finish_action(pr_url, *journal_action, success)
+        if success:
+            print(f"    {success_message}: {pr_url}")
+            if on_success is not None:
+                on_success()
+        else:
+            print(f"    {failure_message}: {pr_url} ({error})")
+            if retry_on_failure:
+                _actions_pending.add(pr_url)
+
+    return handle
+
+
+def _queue_merge(pr: Dict[str, Any], merge_comment: str, batch: MutationBatch, auto_merge: bool = False) -> None:
+    """Queue the pre-merge comment, the merge and the branch deletion as batched mutations
+
+    The merge is only sent if the comment succeeded, and the branch is only
+    deleted if the merge succeeded. With auto_merge, GitHub auto-merge is enabled
+    instead of merging, and branch deletion is left to the repository setting.
+
+    Args:
+        pr: PR data dictionary (with node ids)
+        merge_comment: Pre-merge comment text
+        batch: Batch collecting this cycle's mutations
+        auto_merge: True to enable GitHub auto-merge instead of merging now
+    """
+    url = pr.get("url", "")
+    pr_id = pr["id"]
+    comment_key = None
+    if url in _merge_comment_posted:
+        print("    Pre-merge comment already posted, queueing the merge only")
+    elif begin_action(url, PHASE_3, "merge_comment"):
+        comment_key = batch.add_comment(
+            pr_id,
+            url,
+            merge_comment,
+            on_result=_batch_result_handler(
+                url,
+                "Pre-merge comment posted",
+                "Failed to post pre-merge comment",
+                on_success=lambda: _merge_comment_posted.add(url),
+                journal_action=(PHASE_3, "merge_comment"),
+            ),
+        )
+    else:
+        print("    Pre-merge comment already posted (action journal), queueing the merge only")
+
+    if auto_merge:
+        begin_action(url, PHASE_3, "auto_merge")
+        batch.add_enable_auto_merge(
+            pr_id,
+            url,
+            depends_on=comment_key,
+            on_result=_batch_result_handler(
+                url,
+                "Auto-merge enabled via GraphQL",
+                "Failed to enable auto-merge via GraphQL",
+                on_success=lambda: _auto_merge_enabled.add(url),
+                journal_action=(PHASE_3, "auto_merge"),
+            ),
+        )
+        return
+
+    begin_action(url, PHASE_3, "merge")
+    merge_key = batch.add_merge(
+        pr_id,
+        url,
+        depends_on=comment_key,
+        on_result=_batch_result_handler(
+            url,
+            "PR merged successfully via GraphQL",
+            "Failed to merge PR via GraphQL",
+            on_success=lambda: _merged_prs.add(url),
+            journal_action=(PHASE_3, "merge"),
+        ),
+    )
+    if pr.get("headRefId"):
+        # Equivalent of `gh pr merge --delete-branch`; a failed deletion does not retry the merge
+        batch.add_delete_ref(
+            pr["headRefId"],
+            url,
+            depends_on=merge_key,
+            on_result=_batch_result_handler(url, "Branch deleted", "Failed to delete branch", retry_on_failure=False),
+        )
+
+
+def _review_open_result_handler(browser_key: Tuple[str, str]) -> Callable[[bool], None]:
+    """Build the callback that applies the result of a review page open run by the browser queue
+
+    Args:
+        browser_key: (PR URL, phase) tuple tracked in _browser_opened
+
+    Returns:
+        Callback taking the operation's success flag
+    """
+
+    def handle(success: bool) -> None:
+        if success:
+            _browser_opened.add(browser_key)
+        else:
+            _actions_pending.add(browser_key[0])
+
+    return handle
+
+
+def _merge_job_result_handler(pr_url: str, phase: str) -> Callable[[bool], None]:
+    """Build the callback that applies the result of a browser-automated merge run by the browser worker or queue
+
+    Args:
+        pr_url: URL of the PR
+        phase: Phase the merge belongs to (for the action journal)
+
+    Returns:
+        Callback taking the job's success flag
+    """
+
+    def handle(success: bool) -> None:
+        finish_action(pr_url, phase, "merge", success)
+        if success:
+            _merged_prs.add(pr_url)
+            _actions_pending.discard(pr_url)
+        else:
+            _actions_pending.add(pr_url)
+
+    return handle
+
+
+def _notification_result_handler(pr_url: str, phase: str) -> Callable[[bool], None]:
+    """Build the callback that applies the delivery outcome of a dispatched notification
+
+    Args:
+        pr_url: URL of the PR
+        phase: Phase the notification belongs to
+
+    Returns:
+        Callback taking the delivery outcome (called on the dispatcher thread)
+    """
+
+    def handle(success: bool) -> None:
+        finish_action(pr_url, phase, "ntfy", success)
+        if not success:
+            # Given up after retries: allow a new attempt in a later cycle
+            _notifications_sent.discard((pr_url, phase))
+
+    return handle
+
 
 def mark_pr_ready(pr_url: str, repo_dir: Path = None) -> bool:
     """Mark a draft PR as ready for review using gh command
@@ -46,7 +257,8 @@ def mark_pr_ready(pr_url: str, repo_dir: Path = None) -> bool:
     cmd = ["gh", "pr", "ready", pr_url]
 
     try:
-        subprocess.run(cmd, capture_output=True, text=True, encoding="utf-8", errors="replace", check=True)
+        with content_request("mark_ready"):
+            subprocess.run(cmd, capture_output=True, text=True, encoding="utf-8", errors="replace", check=True)
         return True
     except subprocess.CalledProcessError as e:
         print(f"    Error marking PR as ready: {e}")
@@ -73,7 +285,8 @@ def merge_pr(pr_url: str, repo_dir: Path = None) -> bool:
     cmd = ["gh", "pr", "merge", pr_url, "--squash", "--delete-branch"]
 
     try:
-        subprocess.run(cmd, capture_output=True, text=True, encoding="utf-8", errors="replace", check=True)
+        with content_request("merge"):
+            subprocess.run(cmd, capture_output=True, text=True, encoding="utf-8", errors="replace", check=True)
         return True
     except subprocess.CalledProcessError as e:
         print(f"    Error merging PR: {e}")
@@ -82,6 +295,37 @@ def merge_pr(pr_url: str, repo_dir: Path = None) -> bool:
         return False
 
 
+def enable_auto_merge(pr_url: str, repo_dir: Path = None) -> bool:
+    """Enable GitHub auto-merge (squash) for a PR using gh command
+
+    GitHub then merges the PR server-side once required checks pass and the
+    branch is up to date, so the monitor does not retry failing merges.
+
+    Args:
+        pr_url: URL of the PR
+        repo_dir: Repository directory (optional, not used when working with URLs)
+
+    Returns:
+        True if auto-merge was enabled, False otherwise
+
+    Note:
+        `gh pr merge --auto` calls the enablePullRequestAutoMerge mutation. The head
+        branch is deleted according to the repository's "Automatically delete head
+        branches" setting.
+    """
+    cmd = ["gh", "pr", "merge", pr_url, "--auto", "--squash"]
+
+    try:
+        with content_request("auto_merge"):
+            subprocess.run(cmd, capture_output=True, text=True, encoding="utf-8", errors="replace", check=True)
+        return True
+    except subprocess.CalledProcessError as e:
+        print(f"    Error enabling auto-merge: {e}")
+        stderr = getattr(e, "stderr", "No stderr available")
+        print(f"    stderr: {stderr}")
+        return False
+
+
 def open_browser(url: str, config: Optional[Dict[str, Any]] = None) -> bool:
     """Open URL in browser
 
@@ -131,6 +375,9 @@ def process_pr(pr: Dict[str, Any], config: Dict[str, Any] = None, phase: str = N
     if phase is None:
         phase = determine_phase(pr)
 
+    # Re-marked below if any action fails or is deferred again
+    _actions_pending.discard(url)
+
     # Display phase with colors
     phase_display = colorize_phase(phase)
     print(f"  [{repo_name}] {phase_display} {title}")
@@ -155,12 +402,27 @@ def process_pr(pr: Dict[str, Any], config: Dict[str, Any] = None, phase: str = N
     if phase == PHASE_1:
         # Check if execution is enabled
         execution_enabled = exec_config["enable_execution_phase1_to_phase2"]
-        if execution_enabled:
+        batch = get_active_batch()
+        if execution_enabled and batch is not None and pr.get("id"):
+            print("    Queueing mark ready for review (batched GraphQL mutation)...")
+            begin_action(url, phase, "ready")
+            batch.add_mark_ready(
+                pr["id"],
+                url,
+                on_result=_batch_result_handler(
+                    url, "PR marked as ready", "Failed to mark PR as ready", journal_action=(phase, "ready")
+                ),
+            )
+        elif execution_enabled:
             print("    Marking PR as ready for review...")
-            if mark_pr_ready(url, None):
+            begin_action(url, phase, "ready")
+            marked_ready = mark_pr_ready(url, None)
+            finish_action(url, phase, "ready", marked_ready)
+            if marked_ready:
                 print("    PR marked as ready successfully")
             else:
                 print("    Failed to mark PR as ready")
+                _actions_pending.add(url)
         else:
             print("    [DRY-RUN] Would mark PR as ready for review (enable_execution_phase1_to_phase2=false)")
 
@@ -168,13 +430,34 @@ def process_pr(pr: Dict[str, Any], config: Dict[str, Any] = None, phase: str = N
     if phase == PHASE_2:
         # Check if execution is enabled
         execution_enabled = exec_config["enable_execution_phase2_to_phase3"]
-        if execution_enabled:
+        batch = get_active_batch()
+        if execution_enabled and not begin_action(url, phase, "comment"):
+            print("    Comment already posted (action journal), skipping")
+        elif execution_enabled and batch is not None and pr.get("id"):
+            print("    Queueing comment for phase2 (batched GraphQL mutation)...")
+            result = queue_phase2_comment(
+                pr,
+                batch,
+                on_result=_batch_result_handler(
+                    url, "Phase2 comment posted", "Failed to post phase2 comment", journal_action=(phase, "comment")
+                ),
+            )
+            if result is not True:
+                # An existing comment counts as done; a queued comment is recorded by its callback
+                finish_action(url, phase, "comment", result is None)
+            if result is False:
+                print("    Failed to queue comment")
+                _actions_pending.add(url)
+        elif execution_enabled:
             print("    Posting comment for phase2...")
             result = post_phase2_comment(pr, None)
+            # An existing comment (None) counts as done
+            finish_action(url, phase, "comment", result is not False)
             if result is True:
                 print("    Comment posted successfully")
             elif result is False:
                 print("    Failed to post comment")
+                _actions_pending.add(url)
             # If result is None, post_phase2_comment already printed "Comment already exists, skipping"
             # (see implementation in comment_manager.py)
         else:
@@ -184,13 +467,23 @@ def process_pr(pr: Dict[str, Any], config: Dict[str, Any] = None, phase: str = N
     if phase == PHASE_3:
         # Check if browser was already opened for this PR in this phase
         browser_key = (url, phase)
-        if browser_key not in _browser_opened:
+        if browser_key in _browser_opened:
+            print("    Browser already opened for this PR, skipping")
+        elif is_browser_operation_scheduled(OPERATION_REVIEW, url):
+            print("    Browser open queued, waiting for the cooldown")
+        elif not _can_open_browser() and schedule_browser_operation(
+            OPERATION_REVIEW, url, lambda: open_browser(url, config), _review_open_result_handler(browser_key)
+        ):
+            print(f"    ⏳ Browser cooldown in effect, queued to open in {int(_get_remaining_cooldown())} seconds")
+        else:
             print("    Opening browser...")
-            if open_browser(url, config):
+            with browser_operation("open_browser"):
+                opened = open_browser(url, config)
+            if opened:
                 _browser_opened.add(browser_key)
-            # If cooldown prevented opening, will retry in next iteration
-        else:
-            print("    Browser already opened for this PR, skipping")
+            else:
+                # Cooldown prevented opening, will retry in next iteration
+                _actions_pending.add(url)
 
         # Send notification if configured and not already attempted
         # Note: Notifications are tracked per (url, phase) tuple, meaning if a PR
@@ -208,11 +501,34 @@ def process_pr(pr: Dict[str, Any], config: Dict[str, Any] = None, phase: str = N
             if notification_key not in _notifications_sent:
                 # Mark as attempted to avoid repeated sends
                 _notifications_sent.add(notification_key)
-                print("    Sending ntfy notification...")
-                if send_phase3_notification(config, url, title):
-                    print("    Notification sent successfully")
+                if not begin_action(url, phase, "ntfy"):
+                    print("    Notification already sent (action journal), skipping")
+                elif is_digest_enabled(config):
+                    # Sent with the other phase3 PRs of this cycle as one digest
+                    add_to_digest(url, title, _notification_result_handler(url, phase))
+                    print("    ntfy notification added to the digest")
+                elif has_notification_sinks():
+                    if fan_out_phase3_notification(config, url, title, _notification_result_handler(url, phase)):
+                        print("    Notification sent to the notification sinks in the background")
+                    else:
+                        print("    Failed to send notification")
+                        _notification_result_handler(url, phase)(False)
+                elif is_notification_dispatcher_enabled():
+                    if queue_phase3_notification(config, url, title, _notification_result_handler(url, phase)):
+                        print("    ntfy notification queued")
+                    else:
+                        print("    Failed to queue notification")
+                        _notification_result_handler(url, phase)(False)
                 else:
-                    print("    Failed to send notification")
+                    print("    Sending ntfy notification...")
+                    notification_sent = send_phase3_notification(config, url, title)
+                    finish_action(url, phase, "ntfy", notification_sent)
+                    if notification_sent:
+                        print("    Notification sent successfully")
+                    else:
+                        print("    Failed to send notification")
+                        # Not marked as sent, so a later cycle retries it
+                        _notifications_sent.discard(notification_key)
         elif ntfy_configured and not execution_enabled:
             print("    [DRY-RUN] Would send ntfy notification (enable_execution_phase3_send_ntfy=false)")
 
@@ -229,25 +545,106 @@ def process_pr(pr: Dict[str, Any], config: Dict[str, Any] = None, phase: str = N
                 # before this code is reached. get_phase3_merge_config() applies defaults, ensuring
                 # merge_comment is always present (either from user config or DEFAULT_PHASE3_MERGE_CONFIG)
                 merge_comment = phase3_merge_config.get("comment")
-                print(f"    Posting pre-merge comment: '{merge_comment}'...")
-                comment_posted = post_phase3_comment(pr, merge_comment, None)
-
-                if not comment_posted:
-                    print("    Failed to post pre-merge comment")
-                    print("    Skipping merge because pre-merge comment could not be posted")
-                    return  # Early return - do not add to merged_prs, allow retry
 
-                print("    Pre-merge comment posted successfully")
+                # Native GitHub auto-merge (not used with browser-automated merges)
+                auto_merge = phase3_merge_config.get("auto_merge", False) and not phase3_merge_config.get(
+                    "automated", False
+                )
+                if auto_merge and (pr.get("autoMergeRequest") or url in _auto_merge_enabled):
+                    print("    Auto-merge already enabled, GitHub will merge when requirements are met")
+                    return
+                # GitHub refuses to enable auto-merge on a PR that is already mergeable
+                # ("Pull request is in clean status"), so such PRs are merged right away
+                if auto_merge and is_mergeable_now(pr):
+                    print("    PR is already mergeable, merging now instead of enabling auto-merge")
+                    auto_merge = False
+
+                if is_browser_job_pending(JOB_KIND_MERGE, url) or is_browser_operation_scheduled(OPERATION_MERGE, url):
+                    print("    Browser-automated merge in progress (browser worker), waiting for its result")
+                    return
+
+                # Immediate merges only go ahead when GitHub reports the PR as cleanly mergeable,
+                # so no comment is wasted on a merge that would fail (auto-merge waits server-side)
+                if not auto_merge:
+                    block_reason = get_merge_block_reason(pr)
+                    if block_reason:
+                        print(f"    Merge on hold ({block_reason}), re-evaluated when the PR changes")
+                        return
+
+                # Browser-automated merges cannot be batched and always run immediately
+                batch = get_active_batch()
+                if batch is not None and pr.get("id") and not phase3_merge_config.get("automated", False):
+                    action_name = "auto-merge" if auto_merge else "merge"
+                    print(
+                        f"    Queueing pre-merge comment '{merge_comment}' and {action_name} (batched GraphQL mutation)..."
+                    )
+                    _queue_merge(pr, merge_comment, batch, auto_merge)
+                    return
+
+                # The journal prevents a duplicate comment if a previous run stopped before the merge
+                if url in _merge_comment_posted:
+                    print("    Pre-merge comment already posted, skipping it")
+                elif begin_action(url, phase, "merge_comment"):
+                    print(f"    Posting pre-merge comment: '{merge_comment}'...")
+                    comment_posted = post_phase3_comment(pr, merge_comment, None)
+                    finish_action(url, phase, "merge_comment", comment_posted)
+
+                    if not comment_posted:
+                        print("    Failed to post pre-merge comment")
+                        print("    Skipping merge because pre-merge comment could not be posted")
+                        _actions_pending.add(url)
+                        return  # Early return - do not add to merged_prs, allow retry
+
+                    print("    Pre-merge comment posted successfully")
+                    _merge_comment_posted.add(url)
+                else:
+                    print("    Pre-merge comment already posted (action journal), skipping it")
+
+                if auto_merge:
+                    print("    Enabling auto-merge (GitHub merges once requirements are met)...")
+                    begin_action(url, phase, "auto_merge")
+                    auto_merge_enabled = enable_auto_merge(url, None)
+                    finish_action(url, phase, "auto_merge", auto_merge_enabled)
+                    if auto_merge_enabled:
+                        print("    Auto-merge enabled successfully")
+                        _auto_merge_enabled.add(url)
+                    else:
+                        print("    Failed to enable auto-merge")
+                        _actions_pending.add(url)
+                    return
 
                 # Check if automated merge is enabled
                 merge_automated = phase3_merge_config.get("automated", False)
 
                 merge_success = False
+                begin_action(url, phase, "merge")
+                if merge_automated and is_browser_worker_enabled(config):
+                    print("    Queueing browser-automated merge (browser worker)...")
+                    temp_config = {"phase3_merge": phase3_merge_config}
+                    submit_browser_job(JOB_KIND_MERGE, url, temp_config, _merge_job_result_handler(url, phase))
+                    return
                 if merge_automated:
-                    print("    Merging PR using browser automation...")
                     # Create a temporary config dict with the global phase3_merge settings
                     temp_config = {"phase3_merge": phase3_merge_config}
-                    if merge_pr_automated(url, temp_config):
+                    uses_browser_cooldown = not is_playwright_backend(phase3_merge_config)
+                    if (
+                        uses_browser_cooldown
+                        and not _can_open_browser()
+                        and schedule_browser_operation(
+                            OPERATION_MERGE,
+                            url,
+                            lambda: merge_pr_automated(url, temp_config),
+                            _merge_job_result_handler(url, phase),
+                        )
+                    ):
+                        print(
+                            f"    ⏳ Browser cooldown in effect, merge queued for {int(_get_remaining_cooldown())} seconds"
+                        )
+                        return
+                    print("    Merging PR using browser automation...")
+                    with browser_operation("merge_automated"):
+                        merged = merge_pr_automated(url, temp_config)
+                    if merged:
                         print("    PR merged successfully via browser automation")
                         merge_success = True
                     else:
@@ -260,9 +657,13 @@ def process_pr(pr: Dict[str, Any], config: Dict[str, Any] = None, phase: str = N
                     else:
                         print("    Failed to merge PR via gh CLI")
 
+                finish_action(url, phase, "merge", merge_success)
+
                 # Only mark as merged if the merge was successful
                 if merge_success:
                     _merged_prs.add(merge_key)
+                else:
+                    _actions_pending.add(url)
 
 
 def process_repository(repo_dir: Path, config: Dict[str, Any] = None) -> None:
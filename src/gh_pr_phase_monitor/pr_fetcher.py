@@ -5,12 +5,204 @@ PR fetching module for GitHub pull requests
 import json
 import subprocess
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Optional
 
 from .graphql_client import execute_graphql_query
 
 # GraphQL pagination constants
 REPOSITORIES_BATCH_SIZE = 10
+# Maximum number of PR node ids per nodes(ids:) query
+PR_NODES_BATCH_SIZE = 50
+
+# Fields fetched for each pull request (shared by the repository and node id queries)
+# Note: We fetch only the first 100 review threads; PRs with more than 100
+# threads will be truncated unless pagination is added.
+PR_DETAIL_FIELDS = """
+id
+title
+url
+headRef {
+  id
+}
+isDraft
+author {
+  login
+}
+reviews(last: 50) {
+  nodes {
+    author {
+      login
+    }
+    state
+    body
+  }
+}
+latestReviews(first: 50) {
+  nodes {
+    author {
+      login
+    }
+    state
+  }
+}
+reviewRequests(first: 10) {
+  nodes {
+    requestedReviewer {
+      ... on User {
+        login
+      }
+      ... on Team {
+        name
+      }
+    }
+  }
+}
+comments(last: 10) {
+  totalCount
+  nodes {
+    body
+    author {
+      login
+    }
+    reactionGroups {
+      content
+      users {
+        totalCount
+      }
+    }
+  }
+}
+reviewThreads(first: 100) {
+  nodes {
+    isResolved
+    isOutdated
+  }
+}
+commits(last: 1) {
+  totalCount
+  nodes {
+    commit {
+      committedDate
+      statusCheckRollup {
+        state
+      }
+    }
+  }
+}
+autoMergeRequest {
+  enabledAt
+}
+mergeable
+mergeStateStatus
+reviewDecision
+state
+"""
+
+# rateLimit (cost, remaining, resetAt) reported by the most recent PR details query
+_last_rate_limit: Optional[Dict[str, Any]] = None
+
+
+def get_last_rate_limit() -> Optional[Dict[str, Any]]:
+    """Get the GraphQL rate limit reported by the most recent PR details query
+
+    Returns:
+        Dict with 'cost', 'remaining' and 'resetAt', or None if no query returned it yet
+    """
+    return _last_rate_limit
+
+
+def _transform_pr(pr: Dict[str, Any], repo_name: str, owner: str) -> Dict[str, Any]:
+    """Transform a GraphQL pull request node (PR_DETAIL_FIELDS) to the format expected by determine_phase()
+
+    Args:
+        pr: Pull request node
+        repo_name: Repository name
+        owner: Repository owner login
+
+    Returns:
+        PR data with repository info
+    """
+    # Transform reviews - handle null authors
+    reviews = []
+    for review in pr.get("reviews", {}).get("nodes", []):
+        author_data = review.get("author")
+        if author_data is None:
+            # Deleted account - use placeholder
+            author = {"login": "[deleted]"}
+        else:
+            author = {"login": author_data.get("login", "")}
+        reviews.append({"author": author, "state": review.get("state", ""), "body": review.get("body", "")})
+
+    # Transform latestReviews - handle null authors
+    latest_reviews = []
+    for review in pr.get("latestReviews", {}).get("nodes", []):
+        author_data = review.get("author")
+        if author_data is None:
+            # Deleted account - use placeholder
+            author = {"login": "[deleted]"}
+        else:
+            author = {"login": author_data.get("login", "")}
+        latest_reviews.append({"author": author, "state": review.get("state", "")})
+
+    # Transform reviewRequests
+    review_requests = []
+    for req in pr.get("reviewRequests", {}).get("nodes", []):
+        reviewer = req.get("requestedReviewer", {})
+        login = reviewer.get("login") or reviewer.get("name", "")
+        if login:
+            review_requests.append({"login": login})
+
+    # Handle null PR author
+    author_data = pr.get("author")
+    if author_data is None:
+        # Deleted account - use placeholder
+        author = {"login": "[deleted]"}
+    else:
+        author = {"login": author_data.get("login", "")}
+
+    # Extract comment nodes with reactionGroups
+    comments_data = pr.get("comments", {})
+    comment_nodes = comments_data.get("nodes", [])
+
+    # Extract review threads
+    review_threads_data = pr.get("reviewThreads", {})
+    review_threads = review_threads_data.get("nodes", [])
+
+    # Add repository info to PR
+    # Combined check state of the head commit (None when there are no checks)
+    commits_data = pr.get("commits", {})
+    commit_nodes = commits_data.get("nodes") or []
+    head_commit = (commit_nodes[0].get("commit") or {}) if commit_nodes else {}
+    rollup = head_commit.get("statusCheckRollup")
+    status_check_state = rollup.get("state") if rollup else None
+
+    # Node ids allow actions to be sent as batched GraphQL mutations
+    head_ref = pr.get("headRef") or {}
+
+    pr_with_repo = {
+        "id": pr.get("id", ""),
+        "headRefId": head_ref.get("id", ""),
+        "title": pr.get("title", ""),
+        "url": pr.get("url", ""),
+        "isDraft": pr.get("isDraft", False),
+        "author": author,
+        "reviews": reviews,
+        "latestReviews": latest_reviews,
+        "reviewRequests": review_requests,
+        "comments": comments_data.get("totalCount", 0),
+        "commentNodes": comment_nodes,
+        "reviewThreads": review_threads,
+        "commits": commits_data.get("totalCount", 0),
+        "lastCommitAt": head_commit.get("committedDate"),
+        "autoMergeRequest": pr.get("autoMergeRequest"),
+        "mergeable": pr.get("mergeable", ""),
+        "mergeStateStatus": pr.get("mergeStateStatus", ""),
+        "statusCheckRollup": status_check_state,
+        "reviewDecision": pr.get("reviewDecision"),
+        "state": pr.get("state", ""),
+        "repository": {"name": repo_name, "owner": owner},
+    }
+    return pr_with_repo
 
 
 def get_pr_details_batch(repos: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -22,15 +214,28 @@ def get_pr_details_batch(repos: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     Returns:
         List of PR data matching the format expected by determine_phase()
     """
-    if not repos:
-        return []
+    return [pr for batch_prs in iter_pr_details_batches(repos) for pr in batch_prs]
+
+
+def count_pr_detail_batches(repos: List[Dict[str, Any]]) -> int:
+    """Number of GraphQL queries (batches) iter_pr_details_batches makes for repos"""
+    return (len(repos) + REPOSITORIES_BATCH_SIZE - 1) // REPOSITORIES_BATCH_SIZE
+
+
+def iter_pr_details_batches(repos: List[Dict[str, Any]]) -> Iterator[List[Dict[str, Any]]]:
+    """Get PR details batch by batch, yielding the PRs of each query as soon as it returns
 
+    Args:
+        repos: List of repository dicts with 'name' and 'owner' keys
+
+    Yields:
+        PR data of one batch of up to REPOSITORIES_BATCH_SIZE repositories
+    """
     # Build GraphQL query with aliases for multiple repositories
     # Limit to REPOSITORIES_BATCH_SIZE repos per query to avoid overly complex queries
-    all_prs = []
-
     for i in range(0, len(repos), REPOSITORIES_BATCH_SIZE):
         batch = repos[i : i + REPOSITORIES_BATCH_SIZE]
+        all_prs = []
 
         # Build query fragments for each repository
         repo_queries = []
@@ -54,69 +259,7 @@ def get_pr_details_batch(repos: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
               }}
               pullRequests(first: 100, states: OPEN, orderBy: {{field: UPDATED_AT, direction: DESC}}) {{
                 nodes {{
-                  title
-                  url
-                  isDraft
-                  author {{
-                    login
-                  }}
-                  reviews(last: 50) {{
-                    nodes {{
-                      author {{
-                        login
-                      }}
-                      state
-                      body
-                    }}
-                  }}
-                  latestReviews(first: 50) {{
-                    nodes {{
-                      author {{
-                        login
-                      }}
-                      state
-                    }}
-                  }}
-                  reviewRequests(first: 10) {{
-                    nodes {{
-                      requestedReviewer {{
-                        ... on User {{
-                          login
-                        }}
-                        ... on Team {{
-                          name
-                        }}
-                      }}
-                    }}
-                  }}
-                  comments(last: 10) {{
-                    totalCount
-                    nodes {{
-                      reactionGroups {{
-                        content
-                        users {{
-                          totalCount
-                        }}
-                      }}
-                    }}
-                  }}
-                  # Note: We fetch only the first 100 review threads; PRs with more than 100
-                  # threads will be truncated unless pagination is added.
-                  reviewThreads(first: 100) {{
-                    nodes {{
-                      isResolved
-                      isOutdated
-                    }}
-                  }}
-                  commits(last: 1) {{
-                    totalCount
-                  }}
-                  autoMergeRequest {{
-                    enabledAt
-                  }}
-                  mergeable
-                  reviewDecision
-                  state
+                  {PR_DETAIL_FIELDS}
                 }}
               }}
             }}
@@ -150,83 +293,68 @@ def get_pr_details_batch(repos: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
 
                 # Transform GraphQL data to match expected format
                 for pr in prs:
-                    # Transform reviews - handle null authors
-                    reviews = []
-                    for review in pr.get("reviews", {}).get("nodes", []):
-                        author_data = review.get("author")
-                        if author_data is None:
-                            # Deleted account - use placeholder
-                            author = {"login": "[deleted]"}
-                        else:
-                            author = {"login": author_data.get("login", "")}
-                        reviews.append(
-                            {"author": author, "state": review.get("state", ""), "body": review.get("body", "")}
-                        )
-
-                    # Transform latestReviews - handle null authors
-                    latest_reviews = []
-                    for review in pr.get("latestReviews", {}).get("nodes", []):
-                        author_data = review.get("author")
-                        if author_data is None:
-                            # Deleted account - use placeholder
-                            author = {"login": "[deleted]"}
-                        else:
-                            author = {"login": author_data.get("login", "")}
-                        latest_reviews.append({"author": author, "state": review.get("state", "")})
-
-                    # Transform reviewRequests
-                    review_requests = []
-                    for req in pr.get("reviewRequests", {}).get("nodes", []):
-                        reviewer = req.get("requestedReviewer", {})
-                        login = reviewer.get("login") or reviewer.get("name", "")
-                        if login:
-                            review_requests.append({"login": login})
-
-                    # Handle null PR author
-                    author_data = pr.get("author")
-                    if author_data is None:
-                        # Deleted account - use placeholder
-                        author = {"login": "[deleted]"}
-                    else:
-                        author = {"login": author_data.get("login", "")}
-
-                    # Extract comment nodes with reactionGroups
-                    comments_data = pr.get("comments", {})
-                    comment_nodes = comments_data.get("nodes", [])
-
-                    # Extract review threads
-                    review_threads_data = pr.get("reviewThreads", {})
-                    review_threads = review_threads_data.get("nodes", [])
-
-                    # Add repository info to PR
-                    pr_with_repo = {
-                        "title": pr.get("title", ""),
-                        "url": pr.get("url", ""),
-                        "isDraft": pr.get("isDraft", False),
-                        "author": author,
-                        "reviews": reviews,
-                        "latestReviews": latest_reviews,
-                        "reviewRequests": review_requests,
-                        "comments": comments_data.get("totalCount", 0),
-                        "commentNodes": comment_nodes,
-                        "reviewThreads": review_threads,
-                        "commits": pr.get("commits", {}).get("totalCount", 0),
-                        "autoMergeRequest": pr.get("autoMergeRequest"),
-                        "mergeable": pr.get("mergeable", ""),
-                        "reviewDecision": pr.get("reviewDecision"),
-                        "state": pr.get("state", ""),
-                        "repository": {"name": repo_name, "owner": owner},
-                    }
-                    all_prs.append(pr_with_repo)
-
-        # Print rate limit info
-        rate_limit = data.get("data", {}).get("rateLimit", {})
-        if rate_limit:
-            print(f"  GraphQL API - Cost: {rate_limit.get('cost')}, Remaining: {rate_limit.get('remaining')}")
+                    all_prs.append(_transform_pr(pr, repo_name, owner))
 
+        _record_rate_limit(data)
+        yield all_prs
+
+
+def get_prs_by_node_ids(node_ids: List[str]) -> List[Dict[str, Any]]:
+    """Refetch individual PRs by GraphQL node id
+
+    Args:
+        node_ids: PR node ids ('id' of the PR data)
+
+    Returns:
+        PR data in the same format as get_pr_details_batch(), in the order of node_ids.
+        PRs that were deleted are omitted; closed or merged PRs are returned with their
+        'state' so the caller can drop them.
+    """
+    all_prs = []
+    for i in range(0, len(node_ids), PR_NODES_BATCH_SIZE):
+        batch = node_ids[i : i + PR_NODES_BATCH_SIZE]
+        query = f"""
+        query {{
+          nodes(ids: {json.dumps(batch)}) {{
+            ... on PullRequest {{
+              {PR_DETAIL_FIELDS}
+              repository {{
+                name
+                owner {{
+                  login
+                }}
+              }}
+            }}
+          }}
+          rateLimit {{
+            cost
+            remaining
+            resetAt
+          }}
+        }}
+        """
+        data = execute_graphql_query(query)
+        for node in data.get("data", {}).get("nodes") or []:
+            if not node or not node.get("url"):
+                continue
+            repository = node.get("repository") or {}
+            owner = (repository.get("owner") or {}).get("login", "")
+            all_prs.append(_transform_pr(node, repository.get("name", ""), owner))
+        _record_rate_limit(data)
     return all_prs
 
 
+def _record_rate_limit(data: Dict[str, Any]) -> None:
+    """Remember and print the rateLimit of a query response"""
+    global _last_rate_limit
+
+    # Print rate limit info
+    rate_limit = data.get("data", {}).get("rateLimit", {})
+    if rate_limit:
+        _last_rate_limit = rate_limit
+        print(f"  GraphQL API - Cost: {rate_limit.get('cost')}, Remaining: {rate_limit.get('remaining')}")
+
+
 def get_pr_data(repo_dir: Path) -> List[Dict[str, Any]]:
     """Get PR data from GitHub CLI (Legacy function - kept for compatibility)
 
@@ -0,0 +1,113 @@
+"""
+Readiness polling for browser automation
+
+Instead of sleeping a fixed `wait_seconds` for the page to load and
+`button_delay` between clicks, the automation flows can poll for the next
+button at a short interval until a deadline and click it as soon as it is
+found (`readiness_polling = true`).
+
+The observed time-to-ready of every button is recorded, in memory and
+optionally appended to a JSON Lines file (`readiness_log`), so the defaults
+can be tuned from real data. The polling loop only needs a locate callable,
+so it can be driven by a fake screen provider and a fake clock in tests.
+"""
+
+import json
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+# Default deadline (in seconds) for a button to appear
+DEFAULT_READY_TIMEOUT = 30.0
+
+# Default interval (in seconds) between two lookups
+DEFAULT_POLL_INTERVAL = 0.5
+
+T = TypeVar("T")
+
+# Observed time-to-ready per button: button name -> list of seconds (None = timed out)
+_time_to_ready: Dict[str, List[Optional[float]]] = {}
+_lock = threading.Lock()
+
+
+def wait_for_ready(
+    locate: Callable[[], Optional[T]],
+    timeout: float,
+    poll_interval: float,
+    clock: Callable[[], float] = time.monotonic,
+    sleep: Callable[[float], None] = time.sleep,
+) -> Tuple[Optional[T], float]:
+    """Poll until `locate` finds its target or the deadline passes
+
+    The first lookup happens immediately. Lookup errors that only mean "not found"
+    (pyautogui's ImageNotFoundException) count as a miss; other errors propagate.
+
+    Args:
+        locate: Returns the target (e.g., a button location) or None if not visible yet
+        timeout: Deadline in seconds
+        poll_interval: Seconds between lookups
+        clock: Monotonic clock (injectable for tests)
+        sleep: Sleep function (injectable for tests)
+
+    Returns:
+        (target, elapsed seconds); target is None if the deadline passed
+    """
+    start = clock()
+    deadline = start + timeout
+    while True:
+        try:
+            found = locate()
+        except Exception as e:
+            if type(e).__name__ != "ImageNotFoundException":
+                raise
+            found = None
+        now = clock()
+        if found is not None:
+            return found, now - start
+        if now >= deadline:
+            return None, now - start
+        sleep(min(poll_interval, deadline - now))
+
+
+def record_time_to_ready(button_name: str, seconds: Optional[float], log_path: str = "") -> None:
+    """Record how long a button took to appear
+
+    Args:
+        button_name: Name of the button
+        seconds: Observed time-to-ready, or None if the button did not appear before the deadline
+        log_path: Optional JSON Lines file the observation is appended to
+    """
+    with _lock:
+        _time_to_ready.setdefault(button_name, []).append(seconds)
+    if log_path:
+        entry = {"button": button_name, "time_to_ready": seconds, "timed_out": seconds is None, "time": time.time()}
+        try:
+            with open(log_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry) + "\n")
+        except OSError as e:
+            print(f"  ⚠ Could not write readiness log '{log_path}': {e}")
+
+
+def get_time_to_ready_summary() -> Dict[str, Dict[str, Any]]:
+    """Summarize the observed time-to-ready per button
+
+    Returns:
+        Button name -> {"count", "timeouts", "avg", "max"} (avg/max over successful lookups, None if none)
+    """
+    with _lock:
+        summary = {}
+        for button_name, observations in _time_to_ready.items():
+            ready = [seconds for seconds in observations if seconds is not None]
+            summary[button_name] = {
+                "count": len(observations),
+                "timeouts": len(observations) - len(ready),
+                "avg": sum(ready) / len(ready) if ready else None,
+                "max": max(ready) if ready else None,
+            }
+        return summary
+
+
+def reset_time_to_ready() -> None:
+    """Forget all recorded observations"""
+    with _lock:
+        _time_to_ready.clear()
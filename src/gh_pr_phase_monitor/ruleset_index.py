@@ -0,0 +1,184 @@
+"""
+Pre-compiled ruleset index for per-repository execution config lookup
+
+Rulesets are compiled once (at config load / hot reload) into an index so that
+resolving the execution config for a repository does not re-walk every ruleset
+and re-validate every flag on each call.
+
+Supported repository patterns:
+- "all": matches every repository (case-insensitive)
+- "repo-name": exact repository name
+- "owner/repo-name": exact owner and repository name
+- Glob patterns such as "cat-*" or "cat2151/*-watcher"
+- Regular expressions prefixed with "re:", such as "re:^cat-.*$"
+
+Patterns containing "/" are matched against "owner/name", all others against the name only.
+"""
+
+import fnmatch
+import re
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Execution flags and feature settings that rulesets can override
+RULESET_FLAGS = (
+    "enable_execution_phase1_to_phase2",
+    "enable_execution_phase2_to_phase3",
+    "enable_execution_phase3_send_ntfy",
+    "enable_execution_phase3_to_merge",
+    "assign_good_first_old",
+    "assign_old",
+)
+
+# Prefix that marks a repository pattern as a regular expression
+REGEX_PATTERN_PREFIX = "re:"
+
+_GLOB_CHARS = ("*", "?", "[")
+
+
+def _validate_boolean_flag(value: Any, flag_name: str) -> bool:
+    """Validate that a configuration flag is a boolean value
+
+    Args:
+        value: The value to validate
+        flag_name: Name of the flag for error messages
+
+    Returns:
+        The boolean value
+
+    Raises:
+        ValueError: If the value is not a boolean
+    """
+    if not isinstance(value, bool):
+        raise ValueError(
+            f"Configuration flag '{flag_name}' must be a boolean (true/false), got {type(value).__name__}: {value}"
+        )
+    return value
+
+
+def _compile_pattern(pattern: str) -> Tuple[str, Any]:
+    """Compile a single repository pattern
+
+    Args:
+        pattern: Repository pattern string from a ruleset
+
+    Returns:
+        Tuple of (kind, value) where kind is one of "all", "name", "full" or "match".
+        For "match", value is a callable taking (owner, name).
+
+    Raises:
+        ValueError: If a regular expression pattern is invalid
+    """
+    if pattern.lower() == "all":
+        return "all", None
+
+    if pattern.startswith(REGEX_PATTERN_PREFIX):
+        source = pattern[len(REGEX_PATTERN_PREFIX) :]
+        try:
+            regex = re.compile(source)
+        except re.error as e:
+            raise ValueError(f"Invalid regular expression in ruleset repositories: '{pattern}': {e}") from e
+        if "/" in source:
+            return "match", lambda owner, name: regex.fullmatch(f"{owner}/{name}") is not None
+        return "match", lambda owner, name: regex.fullmatch(name) is not None
+
+    if any(char in pattern for char in _GLOB_CHARS):
+        if "/" in pattern:
+            return "match", lambda owner, name: fnmatch.fnmatchcase(f"{owner}/{name}", pattern)
+        return "match", lambda owner, name: fnmatch.fnmatchcase(name, pattern)
+
+    if "/" in pattern:
+        return "full", pattern
+
+    return "name", pattern
+
+
+class RulesetIndex:
+    """Compiled view of the [[rulesets]] configuration
+
+    Exact names map directly to the rulesets that reference them; "all", glob and
+    regex patterns are kept as a short list of compiled matchers. Resolved results
+    are memoized per repository, so repeated lookups are a single dict hit.
+    """
+
+    def __init__(self, rulesets: Any):
+        """Compile rulesets into the index
+
+        Args:
+            rulesets: The "rulesets" value from the configuration (a list of dicts)
+
+        Raises:
+            ValueError: If a ruleset contains an invalid regex pattern
+        """
+        # Validated overrides for each applicable ruleset, in definition order
+        self._overrides: List[Dict[str, bool]] = []
+        # Validation errors per ruleset, raised only when that ruleset applies to a repository
+        self._errors: Dict[int, str] = {}
+        self._by_name: Dict[str, List[int]] = {}
+        self._by_full_name: Dict[str, List[int]] = {}
+        self._matchers: List[Tuple[int, Optional[Callable[[str, str], bool]]]] = []
+        self._resolved: Dict[Tuple[str, str], Dict[str, bool]] = {}
+
+        if not isinstance(rulesets, list):
+            return
+
+        for ruleset in rulesets:
+            if not isinstance(ruleset, dict):
+                continue
+            repositories = ruleset.get("repositories", [])
+            if not isinstance(repositories, list):
+                continue
+
+            position = len(self._overrides)
+            try:
+                overrides = {
+                    flag: _validate_boolean_flag(ruleset[flag], flag) for flag in RULESET_FLAGS if flag in ruleset
+                }
+            except ValueError as e:
+                overrides = {}
+                self._errors[position] = str(e)
+            self._overrides.append(overrides)
+
+            for repo_pattern in repositories:
+                if not isinstance(repo_pattern, str):
+                    continue
+                kind, value = _compile_pattern(repo_pattern)
+                if kind == "name":
+                    self._by_name.setdefault(value, []).append(position)
+                elif kind == "full":
+                    self._by_full_name.setdefault(value, []).append(position)
+                else:
+                    self._matchers.append((position, value))
+
+    def _matching_positions(self, repo_owner: str, repo_name: str) -> List[int]:
+        """Get the sorted positions of all rulesets that apply to a repository"""
+        positions = set(self._by_name.get(repo_name, ()))
+        positions.update(self._by_full_name.get(f"{repo_owner}/{repo_name}", ()))
+        for position, matcher in self._matchers:
+            if matcher is None or matcher(repo_owner, repo_name):
+                positions.add(position)
+        return sorted(positions)
+
+    def resolve(self, repo_owner: str, repo_name: str) -> Dict[str, bool]:
+        """Resolve execution flags for a repository
+
+        Args:
+            repo_owner: Repository owner
+            repo_name: Repository name
+
+        Returns:
+            Dictionary with all RULESET_FLAGS, later rulesets overriding earlier ones
+
+        Raises:
+            ValueError: If an applicable ruleset contains a non-boolean flag
+        """
+        key = (repo_owner, repo_name)
+        resolved = self._resolved.get(key)
+        if resolved is None:
+            resolved = {flag: False for flag in RULESET_FLAGS}
+            for position in self._matching_positions(repo_owner, repo_name):
+                if position in self._errors:
+                    raise ValueError(self._errors[position])
+                resolved.update(self._overrides[position])
+            self._resolved[key] = resolved
+        # Return a copy so callers cannot corrupt the memoized result
+        return dict(resolved)
@@ -0,0 +1,169 @@
+"""
+Snapshot diffing between monitoring cycles
+
+Compares the PRs fetched in the current cycle with the previous cycle so that
+action handlers and per-PR output only run for PRs that were added, changed
+phase, or had any other field change. A periodic full reconcile processes
+every PR regardless, as a safety net.
+"""
+
+import json
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+# Previous cycle snapshot: PR URL -> (phase, fingerprint)
+_previous_snapshot: Dict[str, Tuple[str, str]] = {}
+
+# Timestamp of the last full reconcile (None = never, so the first cycle is always full)
+_last_full_reconcile_time: Optional[float] = None
+
+
+class SnapshotDiff:
+    """Differences between the previous and the current cycle
+
+    Attributes:
+        added: URLs of PRs that were not present in the previous cycle
+        removed: URLs of PRs that are no longer present
+        phase_changed: URLs of PRs whose phase changed
+        changed: URLs of PRs whose phase is unchanged but whose fields changed
+        unchanged: URLs of PRs that are identical to the previous cycle
+        phases: Current phase for each PR URL
+    """
+
+    def __init__(
+        self,
+        added: List[str],
+        removed: List[str],
+        phase_changed: List[str],
+        changed: List[str],
+        unchanged: List[str],
+        phases: Dict[str, str],
+    ):
+        self.added = added
+        self.removed = removed
+        self.phase_changed = phase_changed
+        self.changed = changed
+        self.unchanged = unchanged
+        self.phases = phases
+        self._delta = set(added) | set(phase_changed) | set(changed)
+
+    @property
+    def phases_changed(self) -> bool:
+        """True if PRs were added or removed, or any PR changed phase"""
+        return bool(self.added or self.removed or self.phase_changed)
+
+    def is_delta(self, url: str) -> bool:
+        """Check if a PR needs processing because it was added or changed
+
+        Args:
+            url: PR URL
+
+        Returns:
+            True if the PR was added, changed phase, or had changed fields
+        """
+        return url in self._delta
+
+    def format_summary(self) -> str:
+        """Format a one-line summary of the diff"""
+        return (
+            f"{len(self.added)} added, {len(self.removed)} removed, "
+            f"{len(self.phase_changed)} phase changed, {len(self.changed)} updated, "
+            f"{len(self.unchanged)} unchanged"
+        )
+
+
+def pr_fingerprint(pr: Dict[str, Any]) -> str:
+    """Compute a fingerprint of all fetched PR fields
+
+    Args:
+        pr: PR data dictionary
+
+    Returns:
+        Stable string that changes whenever any fetched field changes
+    """
+    return json.dumps(pr, sort_keys=True, ensure_ascii=False, default=str)
+
+
+def diff_snapshot(all_prs: List[Dict[str, Any]], pr_phases: List[str]) -> SnapshotDiff:
+    """Diff the current cycle against the previous one and store it as the new baseline
+
+    Args:
+        all_prs: List of all PRs fetched in this cycle
+        pr_phases: List of phase strings corresponding to all_prs
+
+    Returns:
+        SnapshotDiff describing what changed since the previous cycle
+    """
+    current: Dict[str, Tuple[str, str]] = {}
+    for pr, phase in zip(all_prs, pr_phases):
+        current[pr.get("url", "")] = (phase, pr_fingerprint(pr))
+
+    added = []
+    phase_changed = []
+    changed = []
+    unchanged = []
+    for url, (phase, fingerprint) in current.items():
+        previous = _previous_snapshot.get(url)
+        if previous is None:
+            added.append(url)
+        elif previous[0] != phase:
+            phase_changed.append(url)
+        elif previous[1] != fingerprint:
+            changed.append(url)
+        else:
+            unchanged.append(url)
+    removed = [url for url in _previous_snapshot if url not in current]
+
+    _previous_snapshot.clear()
+    _previous_snapshot.update(current)
+
+    phases = {url: phase for url, (phase, _fingerprint) in current.items()}
+    return SnapshotDiff(added, removed, phase_changed, changed, unchanged, phases)
+
+
+def is_pr_delta(pr: Dict[str, Any], phase: str) -> bool:
+    """Check a single PR against the previous snapshot without updating it
+
+    Gives the same answer as SnapshotDiff.is_delta for the diff_snapshot call
+    that later ends the cycle, so PRs can be processed before all are fetched.
+
+    Args:
+        pr: PR data dictionary
+        phase: Current phase of the PR
+
+    Returns:
+        True if the PR was added, changed phase, or had changed fields
+    """
+    return _previous_snapshot.get(pr.get("url", "")) != (phase, pr_fingerprint(pr))
+
+
+def is_full_reconcile_due(reconcile_interval_seconds: int, current_time: Optional[float] = None) -> bool:
+    """Check if a full reconcile (process every PR) is due, and record it if so
+
+    Args:
+        reconcile_interval_seconds: Minimum seconds between full reconciles (0 = every cycle)
+        current_time: Current timestamp (defaults to time.time())
+
+    Returns:
+        True if every PR should be processed in this cycle
+    """
+    global _last_full_reconcile_time
+    if current_time is None:
+        current_time = time.time()
+    if _last_full_reconcile_time is None or current_time - _last_full_reconcile_time >= reconcile_interval_seconds:
+        _last_full_reconcile_time = current_time
+        return True
+    return False
+
+
+def request_full_reconcile() -> None:
+    """Make the next cycle a full reconcile (e.g., after a config hot reload)"""
+    global _last_full_reconcile_time
+    _last_full_reconcile_time = None
+
+
+def reset_snapshot() -> None:
+    """Forget the previous snapshot so the next cycle is a full reconcile"""
+    global _last_full_reconcile_time
+    _previous_snapshot.clear()
+    _last_full_reconcile_time = None
@@ -0,0 +1,375 @@
+"""
+Template matching for button images
+
+A faster replacement for `pyautogui.locateOnScreen` used by browser automation:
+
+- Button templates are decoded once and cached (reloaded only when the file changes).
+- The search can be limited to a region of interest: a configured `search_region`,
+  and first the area around the last hit of the same button.
+- Matching runs on grayscale images, coarse-to-fine: candidates are found on a
+  downscaled pyramid level with the sum of absolute differences, refined level by
+  level, and the best full-resolution position is scored with zero-mean
+  normalized cross-correlation (the same score as OpenCV's TM_CCOEFF_NORMED used
+  by pyautogui, so `confidence` keeps its meaning).
+
+The matcher works on GrayImage objects and takes the screen from a provider
+callable, so it does not need a real display (see benchmark_template_matcher.py).
+Pillow is only needed to load templates from disk and convert screenshots.
+"""
+
+import math
+import operator
+import os
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+# Downscale factors tried for the coarse pyramid level, largest first
+PYRAMID_FACTORS = (8, 4, 2)
+
+# A template must keep at least this many pixels per side on the coarse level
+MIN_COARSE_TEMPLATE_SIZE = 6
+
+# Number of coarse candidates refined to full resolution
+DEFAULT_CANDIDATES = 5
+
+# Margin (in pixels) searched around the last hit of a button before the full region
+LAST_HIT_MARGIN = 64
+
+# Region as (left, top, width, height)
+Region = Tuple[int, int, int, int]
+
+
+class Match(NamedTuple):
+    """Location of a template on screen (compatible with pyautogui.center())"""
+
+    left: int
+    top: int
+    width: int
+    height: int
+    score: float
+
+
+class GrayImage:
+    """8-bit grayscale image stored as a list of byte rows
+
+    Args:
+        width: Image width in pixels
+        height: Image height in pixels
+        rows: One bytes object of length `width` per row
+    """
+
+    __slots__ = ("width", "height", "rows")
+
+    def __init__(self, width: int, height: int, rows: Sequence[bytes]):
+        self.width = width
+        self.height = height
+        self.rows = list(rows)
+
+    @classmethod
+    def from_pil(cls, image) -> "GrayImage":
+        """Convert a Pillow image to grayscale
+
+        Args:
+            image: PIL.Image.Image
+
+        Returns:
+            GrayImage with the same size
+        """
+        gray = image.convert("L")
+        width, height = gray.size
+        data = gray.tobytes()
+        return cls(width, height, [data[y * width : (y + 1) * width] for y in range(height)])
+
+    def crop(self, left: int, top: int, width: int, height: int) -> "GrayImage":
+        """Cut out a region (clipped to the image)
+
+        Args:
+            left: Left edge
+            top: Top edge
+            width: Region width
+            height: Region height
+
+        Returns:
+            Cropped image
+        """
+        left, top = max(0, left), max(0, top)
+        right, bottom = min(self.width, left + width), min(self.height, top + height)
+        return GrayImage(max(0, right - left), max(0, bottom - top), [row[left:right] for row in self.rows[top:bottom]])
+
+    def downscale(self, factor: int) -> "GrayImage":
+        """Downscale by an integer factor with box averaging (trailing pixels are dropped)
+
+        Args:
+            factor: Downscale factor
+
+        Returns:
+            Downscaled image
+        """
+        if factor == 1:
+            return self
+        width, height = self.width // factor, self.height // factor
+        area = factor * factor
+        rows = []
+        for y in range(height):
+            # Sum the block's rows column by column, then sum groups of `factor` columns
+            column_sums = list(map(sum, zip(*self.rows[y * factor : (y + 1) * factor])))
+            rows.append(bytes(sum(column_sums[x * factor : (x + 1) * factor]) // area for x in range(width)))
+        return GrayImage(width, height, rows)
+
+
+def _sad(screen: GrayImage, template: GrayImage, left: int, top: int, limit: float) -> float:
+    """Sum of absolute differences at a position, stopping early once it exceeds `limit`"""
+    total = 0
+    width = template.width
+    screen_rows = screen.rows
+    for dy, template_row in enumerate(template.rows):
+        total += sum(map(abs, map(operator.sub, screen_rows[top + dy][left : left + width], template_row)))
+        if total > limit:
+            return total
+    return total
+
+
+def _ncc(screen: GrayImage, template: GrayImage, left: int, top: int) -> float:
+    """Zero-mean normalized cross-correlation of the template at a position"""
+    width = template.width
+    count = width * template.height
+    sum_s = sum_ss = sum_st = sum_t = sum_tt = 0
+    for dy, template_row in enumerate(template.rows):
+        window = screen.rows[top + dy][left : left + width]
+        sum_s += sum(window)
+        sum_ss += sum(map(operator.mul, window, window))
+        sum_st += sum(map(operator.mul, window, template_row))
+        sum_t += sum(template_row)
+        sum_tt += sum(map(operator.mul, template_row, template_row))
+    var_s = sum_ss - sum_s * sum_s / count
+    var_t = sum_tt - sum_t * sum_t / count
+    if var_s <= 0 or var_t <= 0:
+        # Flat image or template: fall back to a mean absolute difference score
+        return 1.0 - _sad(screen, template, left, top, math.inf) / (255.0 * count)
+    return (sum_st - sum_s * sum_t / count) / math.sqrt(var_s * var_t)
+
+
+def _integral(image: GrayImage) -> List[List[int]]:
+    """Summed-area table with a leading row and column of zeros"""
+    table = [[0] * (image.width + 1)]
+    for row in image.rows:
+        running = 0
+        previous = table[-1]
+        current = [0]
+        for x, value in enumerate(row):
+            running += value
+            current.append(previous[x + 1] + running)
+        table.append(current)
+    return table
+
+
+def _best_positions(
+    screen: GrayImage,
+    template: GrayImage,
+    positions: Sequence[Tuple[int, int]],
+    keep: int,
+    integral: Optional[List[List[int]]] = None,
+) -> List[Tuple[float, int, int]]:
+    """Keep the `keep` positions with the lowest SAD (branch and bound on the current worst kept)
+
+    With a summed-area table of the screen, positions whose window sum alone proves
+    the SAD exceeds the current bound (SAD >= |sum(window) - sum(template)|) are skipped.
+    """
+    best: List[Tuple[float, int, int]] = []
+    limit = math.inf
+    template_sum = sum(map(sum, template.rows))
+    width, height = template.width, template.height
+    for left, top in positions:
+        if integral is not None and limit != math.inf:
+            top_row, bottom_row = integral[top], integral[top + height]
+            window_sum = bottom_row[left + width] - bottom_row[left] - top_row[left + width] + top_row[left]
+            if abs(window_sum - template_sum) > limit:
+                continue
+        score = _sad(screen, template, left, top, limit)
+        if score < limit or len(best) < keep:
+            best.append((score, left, top))
+            best.sort()
+            del best[keep:]
+            if len(best) == keep:
+                limit = best[-1][0]
+    return best
+
+
+def _choose_factor(template: GrayImage) -> int:
+    for factor in PYRAMID_FACTORS:
+        if min(template.width, template.height) // factor >= MIN_COARSE_TEMPLATE_SIZE:
+            return factor
+    return 1
+
+
+def find_template(
+    screen: GrayImage,
+    template: GrayImage,
+    confidence: float,
+    candidates: int = DEFAULT_CANDIDATES,
+    template_pyramid: Optional[Dict[int, GrayImage]] = None,
+) -> Optional[Match]:
+    """Find the best match of a template on a screen image
+
+    Args:
+        screen: Screen (or region) image
+        template: Template image
+        confidence: Minimum normalized cross-correlation (0.0 - 1.0)
+        candidates: Number of coarse candidates refined to full resolution
+        template_pyramid: Cached downscaled templates by factor (filled as needed)
+
+    Returns:
+        Match in screen image coordinates, or None if no position reaches `confidence`
+    """
+    if template.width == 0 or template.height == 0:
+        return None
+    if template.width > screen.width or template.height > screen.height:
+        return None
+    pyramid = template_pyramid if template_pyramid is not None else {}
+
+    def template_at(factor: int) -> GrayImage:
+        if factor not in pyramid:
+            pyramid[factor] = template.downscale(factor)
+        return pyramid[factor]
+
+    # Coarse level: exhaustive search on the downscaled screen
+    factor = _choose_factor(template)
+    coarse_screen = screen.downscale(factor)
+    coarse_template = template_at(factor)
+    positions = [
+        (x, y)
+        for y in range(coarse_screen.height - coarse_template.height + 1)
+        for x in range(coarse_screen.width - coarse_template.width + 1)
+    ]
+    found = [
+        (left * factor, top * factor)
+        for _sad_score, left, top in _best_positions(
+            coarse_screen, coarse_template, positions, candidates, _integral(coarse_screen)
+        )
+    ]
+
+    # Refinement: halve the factor and search the neighborhood of each candidate
+    while factor > 1:
+        next_factor = factor // 2
+        level_template = template_at(next_factor)
+        refined: List[Tuple[float, int, int]] = []
+        for left, top in found:
+            # Cut the candidate's neighborhood out of the full-resolution screen
+            margin = factor * 2
+            region_left, region_top = max(0, left - margin), max(0, top - margin)
+            local = screen.crop(
+                region_left, region_top, template.width + 2 * margin, template.height + 2 * margin
+            ).downscale(next_factor)
+            local_positions = [
+                (x, y)
+                for y in range(local.height - level_template.height + 1)
+                for x in range(local.width - level_template.width + 1)
+            ]
+            for sad_score, x, y in _best_positions(local, level_template, local_positions, 1):
+                refined.append((sad_score, region_left + x * next_factor, region_top + y * next_factor))
+        refined.sort()
+        found = [(left, top) for _sad_score, left, top in refined[:candidates]]
+        factor = next_factor
+
+    best: Optional[Match] = None
+    for left, top in dict.fromkeys(found):
+        if left + template.width > screen.width or top + template.height > screen.height:
+            continue
+        score = _ncc(screen, template, left, top)
+        if score >= confidence and (best is None or score > best.score):
+            best = Match(left, top, template.width, template.height, score)
+    return best
+
+
+def _load_template_with_pillow(path: str) -> GrayImage:
+    from PIL import Image
+
+    with Image.open(path) as image:
+        return GrayImage.from_pil(image)
+
+
+class TemplateMatcher:
+    """Locates button templates on screen with cached templates and a learned region of interest
+
+    Args:
+        screen_provider: Returns a GrayImage of the given region (None = entire screen)
+        template_loader: Loads a template file as a GrayImage (default: Pillow)
+        candidates: Number of coarse candidates refined to full resolution
+    """
+
+    def __init__(
+        self,
+        screen_provider: Callable[[Optional[Region]], GrayImage],
+        template_loader: Optional[Callable[[str], GrayImage]] = None,
+        candidates: int = DEFAULT_CANDIDATES,
+    ):
+        self.screen_provider = screen_provider
+        self.template_loader = template_loader or _load_template_with_pillow
+        self.candidates = candidates
+        # Template path -> (mtime, template, pyramid)
+        self._templates: Dict[str, Tuple[float, GrayImage, Dict[int, GrayImage]]] = {}
+        # Template path -> last hit location (left, top) in screen coordinates
+        self._last_hits: Dict[str, Tuple[int, int]] = {}
+
+    def _template(self, path: str) -> Tuple[GrayImage, Dict[int, GrayImage]]:
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            mtime = 0.0
+        cached = self._templates.get(path)
+        if cached is None or cached[0] != mtime:
+            cached = (mtime, self.template_loader(path), {})
+            self._templates[path] = cached
+        return cached[1], cached[2]
+
+    def _search(
+        self, template: GrayImage, pyramid: Dict[int, GrayImage], confidence: float, region: Optional[Region]
+    ) -> Optional[Match]:
+        screen = self.screen_provider(region)
+        match = find_template(screen, template, confidence, self.candidates, pyramid)
+        if match is None or region is None:
+            return match
+        # Translate region coordinates back to screen coordinates
+        return match._replace(left=match.left + region[0], top=match.top + region[1])
+
+    def locate(self, path: str, confidence: float, region: Optional[Region] = None) -> Optional[Match]:
+        """Locate a template on screen
+
+        The area around the last hit of the same template is searched first;
+        if the button is not there, the whole `region` (or screen) is searched.
+
+        Args:
+            path: Path of the template image
+            confidence: Minimum match score (0.0 - 1.0)
+            region: Region of interest (left, top, width, height), or None for the entire screen
+
+        Returns:
+            Match in screen coordinates, or None if not found
+        """
+        template, pyramid = self._template(path)
+        last_hit = self._last_hits.get(path)
+        match = None
+        if last_hit is not None:
+            hint = (
+                max(0, last_hit[0] - LAST_HIT_MARGIN),
+                max(0, last_hit[1] - LAST_HIT_MARGIN),
+                template.width + 2 * LAST_HIT_MARGIN,
+                template.height + 2 * LAST_HIT_MARGIN,
+            )
+            if region is not None:
+                hint = _intersect(hint, region)
+            if hint is not None:
+                match = self._search(template, pyramid, confidence, hint)
+        if match is None:
+            match = self._search(template, pyramid, confidence, region)
+        if match is not None:
+            self._last_hits[path] = (match.left, match.top)
+        return match
+
+
+def _intersect(a: Region, b: Region) -> Optional[Region]:
+    """Intersection of two regions, or None if they do not overlap"""
+    left, top = max(a[0], b[0]), max(a[1], b[1])
+    right, bottom = min(a[0] + a[2], b[0] + b[2]), min(a[1] + a[3], b[1] + b[3])
+    if right <= left or bottom <= top:
+        return None
+    return (left, top, right - left, bottom - top)
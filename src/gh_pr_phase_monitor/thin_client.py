@@ -0,0 +1,206 @@
+"""
+Thin client mode
+
+With `[thin_client] server = "http://host:8765"`, this process does not query
+GitHub at all. It follows the event stream (GET /events) of a monitor running
+with the control API enabled, renders the same status summary from it, and
+runs the local-only action: opening phase3 PRs in this machine's browser.
+Everything with side effects on GitHub (ready, comments, merges, assignments,
+notifications) stays with the server, so it happens once however many clients
+are connected.
+
+When the connection drops, the client reconnects every `reconnect_interval`
+and starts over from the snapshot sent on connect.
+"""
+
+import json
+import sys
+import time
+import urllib.error
+import urllib.request
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from .config import get_thin_client_config, parse_interval
+from .control_api import EVENT_KEEPALIVE_SECONDS
+from .display import display_status_summary
+from .phase_detector import PHASE_3
+from .pr_actions import open_browser
+from .state_tracker import get_pr_state_time, set_pr_state_time
+from .time_utils import parse_github_timestamp
+
+# Socket timeout of the event stream; the server sends a keep-alive every EVENT_KEEPALIVE_SECONDS
+STREAM_TIMEOUT_SECONDS = EVENT_KEEPALIVE_SECONDS * 4
+
+
+def read_events(lines: Iterable[bytes]) -> Iterator[Tuple[str, str]]:
+    """Parse a server-sent events stream
+
+    Args:
+        lines: Lines of the stream (bytes, with line endings)
+
+    Yields:
+        (event name, data) for each dispatched event
+    """
+    event, data = "message", []
+    for raw in lines:
+        line = raw.decode("utf-8").rstrip("\r\n")
+        if not line:
+            if data:
+                yield event, "\n".join(data)
+            event, data = "message", []
+        elif line.startswith(":"):
+            # Comment (keep-alive)
+            continue
+        else:
+            field, _, value = line.partition(":")
+            value = value[1:] if value.startswith(" ") else value
+            if field == "event":
+                event = value
+            elif field == "data":
+                data.append(value)
+
+
+class ThinClientState:
+    """PRs and check information mirrored from the server's events"""
+
+    def __init__(self):
+        self.prs: Dict[str, Dict[str, Any]] = {}
+        self.info: Dict[str, Any] = {}
+
+    def apply(self, event: str, data: Dict[str, Any]) -> bool:
+        """Apply a snapshot or delta event
+
+        Returns:
+            True if the event was understood
+        """
+        if event == "snapshot":
+            self.prs = {entry["url"]: entry for entry in data.get("prs", [])}
+        elif event == "delta":
+            for url in data.get("removed", []):
+                self.prs.pop(url, None)
+            for entry in data.get("changed", []):
+                self.prs[entry["url"]] = entry
+        else:
+            return False
+        self.info = {key: value for key, value in data.items() if key not in ("prs", "changed", "removed")}
+        return True
+
+    def sync_phase_times(self) -> None:
+        """Record when each PR entered its phase as measured by the server, for the elapsed time display"""
+        for entry in self.prs.values():
+            entered_at = parse_github_timestamp(entry.get("entered_phase_at"))
+            if entered_at is not None and get_pr_state_time(entry["url"], entry.get("phase", "")) != entered_at:
+                set_pr_state_time(entry["url"], entry.get("phase", ""), entered_at)
+
+    def prs_and_phases(self) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """PRs in the shape of fetched PR data, and their phases"""
+        all_prs, pr_phases = [], []
+        for entry in self.prs.values():
+            owner, _, name = entry.get("repository", "").partition("/")
+            all_prs.append(
+                {"url": entry["url"], "title": entry.get("title", ""), "repository": {"owner": owner, "name": name}}
+            )
+            pr_phases.append(entry.get("phase", ""))
+        return all_prs, pr_phases
+
+
+class ThinClient:
+    """Renders the server's state and opens phase3 PRs in the local browser"""
+
+    def __init__(self, config: Dict[str, Any]):
+        self.config = config
+        self.settings = get_thin_client_config(config)
+        self.state = ThinClientState()
+        # (url, phase) pairs already opened in the browser, like pr_actions._browser_opened
+        self._browser_opened: Set[Tuple[str, str]] = set()
+
+    def handle_event(self, event: str, data: str) -> None:
+        """Apply one event from the stream and refresh the display"""
+        if not self.state.apply(event, json.loads(data)):
+            return
+        self.state.sync_phase_times()
+        self.render()
+        if self.settings["open_browser"]:
+            self.open_phase3_prs()
+
+    def render(self) -> None:
+        info = self.state.info
+        print(f"\n{'=' * 50}")
+        print(f"Server check #{info.get('check', 0)} at {info.get('checked_at') or '-'}")
+        if info.get("next_check_at"):
+            print(f"Next server check at {info['next_check_at']}")
+        if info.get("paused"):
+            print("Actions are paused on the server")
+        all_prs, pr_phases = self.state.prs_and_phases()
+        display_status_summary(all_prs, pr_phases, [])
+
+    def open_phase3_prs(self) -> None:
+        """Open each phase3 PR once; pages refused by the cooldown are retried on the next event"""
+        for entry in self.state.prs.values():
+            key = (entry["url"], entry.get("phase", ""))
+            if key[1] != PHASE_3 or key in self._browser_opened:
+                continue
+            print(f"  Opening browser: {entry['url']}")
+            if not open_browser(entry["url"], self.config):
+                break
+            self._browser_opened.add(key)
+
+    def _open_stream(self):
+        request = urllib.request.Request(self.settings["server"].rstrip("/") + "/events")
+        if self.settings["token"]:
+            request.add_header("Authorization", f"Bearer {self.settings['token']}")
+        return urllib.request.urlopen(request, timeout=STREAM_TIMEOUT_SECONDS)
+
+    def follow(self) -> None:
+        """Follow the event stream until the connection ends"""
+        with self._open_stream() as response:
+            print(f"Connected to {self.settings['server']}")
+            for event, data in read_events(response):
+                self.handle_event(event, data)
+
+    def run(self, max_connections: Optional[int] = None) -> None:
+        """Follow the server, reconnecting after errors
+
+        Args:
+            max_connections: Stop after this many connection attempts (None = forever, for testing)
+        """
+        reconnect_seconds = parse_interval(self.settings["reconnect_interval"])
+        attempts = 0
+        while max_connections is None or attempts < max_connections:
+            attempts += 1
+            try:
+                self.follow()
+                print("\nServer closed the event stream")
+            except urllib.error.HTTPError as e:
+                print(f"\nServer refused the event stream: HTTP {e.code}")
+            except (OSError, ValueError) as e:
+                # Connection errors, timeouts and malformed events
+                print(f"\nLost connection to {self.settings['server']}: {e}")
+            if max_connections is None or attempts < max_connections:
+                print(f"Reconnecting in {self.settings['reconnect_interval']}...")
+                time.sleep(reconnect_seconds)
+
+
+def is_thin_client_enabled(config: Optional[Dict[str, Any]]) -> bool:
+    """Check if [thin_client] server is set"""
+    return bool(get_thin_client_config(config or {})["server"])
+
+
+def run_thin_client(config: Dict[str, Any]) -> None:
+    """Run the thin client until CTRL+C
+
+    Args:
+        config: Configuration dictionary
+    """
+    server = get_thin_client_config(config)["server"]
+    print("GitHub PR Phase Monitor (thin client)")
+    print("=" * 50)
+    print(f"Following {server}")
+    print("Press CTRL+C to stop")
+    print("=" * 50)
+    try:
+        ThinClient(config).run()
+    except KeyboardInterrupt:
+        print("\n\nMonitoring interrupted by user (CTRL+C)")
+        print("Exiting...")
+        sys.exit(0)
@@ -2,6 +2,9 @@
 Time formatting utilities
 """
 
+from datetime import datetime
+from typing import Optional
+
 
 def format_elapsed_time(seconds: float) -> str:
     """Format elapsed time in Japanese style
@@ -19,3 +22,20 @@ def format_elapsed_time(seconds: float) -> str:
         return f"{minutes}分{secs}秒"
     else:
         return f"{secs}秒"
+
+
+def parse_github_timestamp(value: Optional[str]) -> Optional[float]:
+    """Parse a GitHub ISO 8601 timestamp (e.g. "2024-01-01T00:00:00Z")
+
+    Args:
+        value: Timestamp string (None or empty allowed)
+
+    Returns:
+        Seconds since epoch, or None if missing or invalid
+    """
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
@@ -0,0 +1,210 @@
+"""
+Wakeup sources for the event-driven wait between checks
+
+With `event_driven_wait = true`, the wait between checks blocks in a single
+`select()` on:
+
+- A ConfigWatcher: an inotify descriptor watching the config file's directory
+  (Linux; editors that save by renaming are covered). Where inotify is not
+  available, the config mtime is polled every CONFIG_POLL_INTERVAL_SECONDS
+  instead of every second
+- A self-pipe, written by `request_immediate_check()` (SIGUSR1 or a control
+  command) to end the wait and check right away
+
+so an idle wait only wakes up for the countdown display, a config change or
+an immediate check request.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import signal
+import struct
+import threading
+from typing import List, Optional
+
+# Config mtime polling period (in seconds) when inotify is not available
+CONFIG_POLL_INTERVAL_SECONDS = 5
+
+# inotify event masks (linux/inotify.h)
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+CONFIG_WATCH_MASK = IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+
+# struct inotify_event header: wd, mask, cookie, len
+_INOTIFY_EVENT_HEADER = struct.Struct("iIII")
+
+
+def is_event_driven_wait_supported() -> bool:
+    """Check if select() can wait on pipes (POSIX); elsewhere the polling wait is used"""
+    return os.name == "posix"
+
+
+class WakeupPipe:
+    """Self-pipe whose read end becomes readable when wake() is called
+
+    wake() only writes one byte to a non-blocking pipe, so it is safe to call
+    from signal handlers and other threads.
+    """
+
+    def __init__(self):
+        self._read_fd, self._write_fd = os.pipe()
+        os.set_blocking(self._read_fd, False)
+        os.set_blocking(self._write_fd, False)
+
+    def fileno(self) -> int:
+        return self._read_fd
+
+    def wake(self) -> None:
+        try:
+            os.write(self._write_fd, b"\0")
+        except BlockingIOError:
+            # The pipe is full, so a wakeup is already pending
+            pass
+
+    def drain(self) -> bool:
+        """Consume pending wakeups
+
+        Returns:
+            True if wake() was called since the last drain
+        """
+        woken = False
+        while True:
+            try:
+                data = os.read(self._read_fd, 512)
+            except BlockingIOError:
+                return woken
+            if not data:
+                return woken
+            woken = True
+
+
+class ConfigWatcher:
+    """inotify watch on the directory of the config file
+
+    Use ConfigWatcher.create(), which returns None where inotify is not available.
+    """
+
+    def __init__(self, fd: int, file_name: str):
+        self._fd = fd
+        self._file_name = file_name.encode()
+
+    @classmethod
+    def create(cls, config_path: str) -> Optional["ConfigWatcher"]:
+        """Start watching config_path
+
+        Args:
+            config_path: Path to the config file
+
+        Returns:
+            Watcher, or None if inotify is not available
+        """
+        if not config_path or not hasattr(os, "O_CLOEXEC"):
+            return None
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            inotify_init1 = libc.inotify_init1
+            inotify_add_watch = libc.inotify_add_watch
+        except (OSError, AttributeError):
+            return None
+        fd = inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            return None
+        directory = os.path.dirname(os.path.abspath(config_path))
+        if inotify_add_watch(fd, os.fsencode(directory), CONFIG_WATCH_MASK) < 0:
+            os.close(fd)
+            return None
+        return cls(fd, os.path.basename(config_path))
+
+    def fileno(self) -> int:
+        return self._fd
+
+    def drain(self) -> bool:
+        """Consume pending inotify events
+
+        Returns:
+            True if any event concerned the config file
+        """
+        touched = False
+        while True:
+            try:
+                data = os.read(self._fd, 4096)
+            except BlockingIOError:
+                return touched
+            offset = 0
+            while offset + _INOTIFY_EVENT_HEADER.size <= len(data):
+                _wd, _mask, _cookie, name_length = _INOTIFY_EVENT_HEADER.unpack_from(data, offset)
+                offset += _INOTIFY_EVENT_HEADER.size
+                name = data[offset : offset + name_length].rstrip(b"\0")
+                offset += name_length
+                if name == self._file_name:
+                    touched = True
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+def wait_for_events(sources: List[object], timeout: float) -> List[object]:
+    """Block until one of the sources is readable or the timeout expires
+
+    Args:
+        sources: Objects with a fileno() method
+        timeout: Maximum seconds to wait
+
+    Returns:
+        Readable sources (empty on timeout)
+    """
+    readable, _writable, _errors = select.select(sources, [], [], max(0.0, timeout))
+    return readable
+
+
+# Self-pipe shared by the wait and request_immediate_check() (created on first use)
+_wakeup_pipe: Optional[WakeupPipe] = None
+_wakeup_lock = threading.Lock()
+
+# Config watchers by config path (kept across waits)
+_config_watchers: dict = {}
+
+
+def get_wakeup_pipe() -> WakeupPipe:
+    """Get the self-pipe that ends the current wait"""
+    global _wakeup_pipe
+    with _wakeup_lock:
+        if _wakeup_pipe is None:
+            _wakeup_pipe = WakeupPipe()
+        return _wakeup_pipe
+
+
+def get_config_watcher(config_path: str) -> Optional[ConfigWatcher]:
+    """Get the inotify watcher of a config file, or None to poll its mtime"""
+    if config_path not in _config_watchers:
+        _config_watchers[config_path] = ConfigWatcher.create(config_path)
+    return _config_watchers[config_path]
+
+
+def request_immediate_check() -> None:
+    """End the current wait so the next check starts right away (SIGUSR1, control commands)"""
+    if is_event_driven_wait_supported():
+        get_wakeup_pipe().wake()
+
+
+def consume_immediate_check_request() -> bool:
+    """Check for (and consume) an immediate check request without blocking (polling wait)"""
+    return _wakeup_pipe is not None and _wakeup_pipe.drain()
+
+
+def install_immediate_check_signal() -> bool:
+    """Make SIGUSR1 trigger an immediate check
+
+    Returns:
+        True if installed (False where SIGUSR1 does not exist)
+    """
+    if not is_event_driven_wait_supported() or not hasattr(signal, "SIGUSR1"):
+        return False
+    get_wakeup_pipe()
+    signal.signal(signal.SIGUSR1, lambda _signum, _frame: request_immediate_check())
+    return True
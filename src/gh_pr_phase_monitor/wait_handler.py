@@ -2,31 +2,179 @@
 Wait and countdown handling with hot reload support
 """
 
+import sys
 import time
 from typing import Any, Dict, Tuple
 
 import tomli
 
-from .config import get_config_mtime, load_config, parse_interval, print_config
+from .browser_worker import get_pending_browser_jobs, poll_browser_worker
+from .config import get_config_mtime, get_duration_setting, load_config, print_config
 from .time_utils import format_elapsed_time
+from .wait_events import (
+    CONFIG_POLL_INTERVAL_SECONDS,
+    consume_immediate_check_request,
+    get_config_watcher,
+    get_wakeup_pipe,
+    is_event_driven_wait_supported,
+    wait_for_events,
+)
+
+# Countdown refresh period (in seconds) of the event-driven wait when stdout is not a terminal,
+# so logs redirected to a file do not get one line per second
+NON_TTY_COUNTDOWN_SECONDS = 600
+
+# Period (in seconds) at which the event-driven wait collects browser worker results while jobs are pending
+BROWSER_WORKER_POLL_SECONDS = 1
+
+
+class _WaitState:
+    """Config values that may be updated during a wait"""
+
+    def __init__(self, interval_seconds: int, interval_str: str, last_config_mtime: float):
+        self.config: Dict[str, Any] = {}
+        self.interval_seconds = interval_seconds
+        self.interval_str = interval_str
+        self.mtime = last_config_mtime
+
+    def reload_if_changed(self, config_path: str) -> None:
+        """Reload the config file if its modification time changed"""
+        try:
+            new_mtime = get_config_mtime(config_path)
+            if new_mtime != self.mtime:
+                # Config file has been modified, reload it
+                print(f"\n\n{'=' * 50}")
+                print("設定ファイルの変更を検知しました。再読み込みします...")
+                print(f"{'=' * 50}")
+
+                try:
+                    # load_config() validates and precomputes everything, so a broken
+                    # config never replaces the current one
+                    new_config = load_config(config_path)
+                    new_interval_str, new_interval_seconds = get_duration_setting(new_config, "interval")
+
+                    # Update current values
+                    self.config = new_config
+                    self.interval_seconds = new_interval_seconds
+                    self.interval_str = new_interval_str
+                    self.mtime = new_mtime
+
+                    print("設定を再読み込みしました。")
+                    print(f"新しい監視間隔: {new_interval_str} ({new_interval_seconds}秒)")
+
+                    # Print config if verbose mode is enabled
+                    if new_config.get("verbose", False):
+                        print_config(new_config)
+
+                    print(f"{'=' * 50}")
+                    print(f"Waiting {self.interval_str} until next check...")
+                    print(f"{'=' * 50}")
+
+                except (ValueError, tomli.TOMLDecodeError) as e:
+                    # Config file has invalid format (TOML parsing error or invalid interval)
+                    # Update mtime to avoid repeatedly trying to reload the same broken config
+                    self.mtime = new_mtime
+                    print(f"設定ファイルの再読み込みに失敗しました: {e}")
+                    print("前の設定を使い続けます。")
+                    print(f"{'=' * 50}")
+                    print(f"Waiting {self.interval_str} until next check...")
+                    print(f"{'=' * 50}")
+
+        except FileNotFoundError:
+            # Config file was deleted, continue with current config
+            pass
+        except (OSError, PermissionError):
+            # File system errors (e.g., permission issues), ignore and continue
+            pass
+
+
+def _wait_for_events(interval_seconds: int, config_path: str, state: _WaitState) -> None:
+    """Event-driven wait: block until the deadline, a config change or an immediate check request
+
+    The countdown is redrawn every second on a terminal and every NON_TTY_COUNTDOWN_SECONDS
+    otherwise. Without inotify, the config mtime is polled every CONFIG_POLL_INTERVAL_SECONDS.
+    While browser worker jobs are pending, their results are collected every
+    BROWSER_WORKER_POLL_SECONDS.
+    """
+    wakeup_pipe = get_wakeup_pipe()
+    watcher = get_config_watcher(config_path) if config_path else None
+    sources = [wakeup_pipe] + ([watcher] if watcher is not None else [])
+    poll_config = bool(config_path) and watcher is None
+    is_tty = sys.stdout.isatty()
+    render_period = 1 if is_tty else NON_TTY_COUNTDOWN_SECONDS
+
+    start = time.monotonic()
+    deadline = start + interval_seconds
+    next_render = start
+    next_poll = start + CONFIG_POLL_INTERVAL_SECONDS
+    next_worker_poll = start + BROWSER_WORKER_POLL_SECONDS
+
+    while True:
+        now = time.monotonic()
+        if now >= deadline:
+            break
+
+        if now >= next_render:
+            remaining_str = format_elapsed_time(deadline - now)
+            if is_tty:
+                print(f"\rWaiting {remaining_str}     ", end="", flush=True)
+            else:
+                print(f"Waiting {remaining_str}", flush=True)
+            next_render = now + render_period
+
+        wake_at = min(deadline, next_render, next_poll) if poll_config else min(deadline, next_render)
+        poll_worker = bool(get_pending_browser_jobs())
+        if poll_worker:
+            wake_at = min(wake_at, next_worker_poll)
+        ready = wait_for_events(sources, wake_at - now)
+
+        if poll_worker and time.monotonic() >= next_worker_poll:
+            poll_browser_worker()
+            next_worker_poll = time.monotonic() + BROWSER_WORKER_POLL_SECONDS
+
+        if wakeup_pipe in ready and wakeup_pipe.drain():
+            print("\n即時チェックが要求されました。待機を終了します。")
+            return
+
+        config_touched = watcher is not None and watcher in ready and watcher.drain()
+        if poll_config and time.monotonic() >= next_poll:
+            config_touched = True
+            next_poll = time.monotonic() + CONFIG_POLL_INTERVAL_SECONDS
+        if config_touched:
+            state.reload_if_changed(config_path)
+
+    if is_tty:
+        print(f"\rWaiting {format_elapsed_time(0)}     ", flush=True)
+        print()  # New line after countdown completes
 
 
 def wait_with_countdown(
-    interval_seconds: int, interval_str: str, config_path: str = "", last_config_mtime: float = 0.0
+    interval_seconds: int,
+    interval_str: str,
+    config_path: str = "",
+    last_config_mtime: float = 0.0,
+    event_driven: bool = False,
 ) -> Tuple[Dict[str, Any], int, str, float]:
     """Wait for the specified interval with a live countdown display and hot reload support
 
     This function checks the config file's modification timestamp every second during the wait.
     If the config file has been modified, it reloads the configuration and updates the interval.
+    Results of browser worker jobs are also collected every second.
 
     Note: The filesystem check every second is intentional per the issue requirements for
     hot reload functionality during the wait state.
 
+    With event_driven, the wait instead blocks until the config file changes (inotify), an
+    immediate check is requested (SIGUSR1, see wait_events) or the countdown needs redrawing.
+    An immediate check request ends the wait early. On systems without select() on pipes,
+    the polling wait is used.
+
     Args:
         interval_seconds: Number of seconds to wait
         interval_str: Human-readable interval string (e.g., "1m", "30s")
         config_path: Path to the configuration file (empty string disables hot reload)
         last_config_mtime: Last known modification time of the config file
+        event_driven: Wait for events instead of polling every second
 
     Returns:
         Tuple of (config, interval_seconds, interval_str, new_config_mtime)
@@ -36,10 +184,11 @@ def wait_with_countdown(
     print(f"{'=' * 50}")
 
     # Current config values (may be updated during wait)
-    current_config = {}
-    current_interval_seconds = interval_seconds
-    current_interval_str = interval_str
-    current_mtime = last_config_mtime
+    state = _WaitState(interval_seconds, interval_str, last_config_mtime)
+
+    if event_driven and is_event_driven_wait_supported():
+        _wait_for_events(interval_seconds, config_path, state)
+        return state.config, state.interval_seconds, state.interval_str, state.mtime
 
     # Track actual elapsed time from the start of wait
     wait_start_time = time.time()
@@ -61,59 +210,22 @@ def wait_with_countdown(
         sleep_duration = min(1, remaining)
         time.sleep(sleep_duration)
 
+        # Apply results of browser worker jobs (and fail hung ones) without waiting for the next check
+        poll_browser_worker()
+
+        # An immediate check request (SIGUSR1, control API) ends the wait within a second
+        if consume_immediate_check_request():
+            print("\n即時チェックが要求されました。待機を終了します。")
+            break
+
         # Check if config file has been modified (only if config_path is provided)
         # Note: This check happens every second as per hot reload requirements
         if config_path:
-            try:
-                new_mtime = get_config_mtime(config_path)
-                if new_mtime != current_mtime:
-                    # Config file has been modified, reload it
-                    print(f"\n\n{'=' * 50}")
-                    print("設定ファイルの変更を検知しました。再読み込みします...")
-                    print(f"{'=' * 50}")
-
-                    try:
-                        new_config = load_config(config_path)
-                        new_interval_str = new_config.get("interval", "1m")
-                        new_interval_seconds = parse_interval(new_interval_str)
-
-                        # Update current values
-                        current_config = new_config
-                        current_interval_seconds = new_interval_seconds
-                        current_interval_str = new_interval_str
-                        current_mtime = new_mtime
-
-                        print("設定を再読み込みしました。")
-                        print(f"新しい監視間隔: {new_interval_str} ({new_interval_seconds}秒)")
-
-                        # Print config if verbose mode is enabled
-                        if new_config.get("verbose", False):
-                            print_config(new_config)
-
-                        print(f"{'=' * 50}")
-                        print(f"Waiting {current_interval_str} until next check...")
-                        print(f"{'=' * 50}")
-
-                    except (ValueError, tomli.TOMLDecodeError) as e:
-                        # Config file has invalid format (TOML parsing error or invalid interval)
-                        # Update mtime to avoid repeatedly trying to reload the same broken config
-                        current_mtime = new_mtime
-                        print(f"設定ファイルの再読み込みに失敗しました: {e}")
-                        print("前の設定を使い続けます。")
-                        print(f"{'=' * 50}")
-                        print(f"Waiting {current_interval_str} until next check...")
-                        print(f"{'=' * 50}")
-
-            except FileNotFoundError:
-                # Config file was deleted, continue with current config
-                pass
-            except (OSError, PermissionError):
-                # File system errors (e.g., permission issues), ignore and continue
-                pass
+            state.reload_if_changed(config_path)
 
     # Final update - show countdown complete (0 remaining)
     final_str = format_elapsed_time(0)
     print(f"\rWaiting {final_str}     ", flush=True)
     print()  # New line after countdown completes
 
-    return current_config, current_interval_seconds, current_interval_str, current_mtime
+    return state.config, state.interval_seconds, state.interval_str, state.mtime
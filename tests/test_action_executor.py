@@ -0,0 +1,148 @@
+"""
+Tests for the parallel PR action executor
+"""
+
+import threading
+import time
+
+import pytest
+
+from src.gh_pr_phase_monitor import action_executor
+from src.gh_pr_phase_monitor.action_executor import (
+    browser_operation,
+    content_request,
+    execute_pr_actions,
+    get_action_latency_summary,
+    record_action_latency,
+    reset_action_latencies,
+)
+
+
+def _make_items(count):
+    """Create (pr, phase) items with distinct URLs"""
+    return [({"url": f"https://github.com/owner/repo/pull/{i}"}, "phase3") for i in range(count)]
+
+
+class TestExecutePrActions:
+    """Test execute_pr_actions ordering and concurrency"""
+
+    def setup_method(self):
+        """Reset global state before each test"""
+        reset_action_latencies()
+        action_executor.configure_action_limits({})
+
+    def test_serial_mode_runs_in_caller_thread(self):
+        """max_parallel_actions = 1 processes PRs one at a time in order"""
+        calls = []
+
+        def process(pr, config, phase):
+            calls.append((pr["url"], threading.current_thread()))
+
+        items = _make_items(3)
+        execute_pr_actions(items, {"max_parallel_actions": 1}, process)
+
+        assert [url for url, _thread in calls] == [pr["url"] for pr, _phase in items]
+        assert all(thread is threading.current_thread() for _url, thread in calls)
+
+    def test_output_written_in_pr_order(self, capsys):
+        """Per-PR output is not interleaved and follows the original order"""
+
+        def process(pr, config, phase):
+            number = int(pr["url"].rsplit("/", 1)[1])
+            print(f"start {number}")
+            # Later PRs finish first
+            time.sleep(0.01 * (4 - number))
+            print(f"end {number}")
+
+        execute_pr_actions(_make_items(4), {"max_parallel_actions": 4}, process)
+
+        lines = capsys.readouterr().out.splitlines()
+        expected = []
+        for i in range(4):
+            expected += [f"start {i}", f"end {i}"]
+        assert lines == expected
+
+    def test_prs_run_concurrently(self):
+        """Different PRs are processed at the same time"""
+        barrier = threading.Barrier(3, timeout=5)
+
+        def process(pr, config, phase):
+            # Would time out if the PRs were processed serially
+            barrier.wait()
+
+        execute_pr_actions(_make_items(3), {"max_parallel_actions": 3}, process)
+
+    def test_content_requests_are_capped(self):
+        """No more than max_parallel_content_requests run at once"""
+        lock = threading.Lock()
+        active = [0]
+        peak = [0]
+
+        def process(pr, config, phase):
+            with content_request("comment"):
+                with lock:
+                    active[0] += 1
+                    peak[0] = max(peak[0], active[0])
+                time.sleep(0.02)
+                with lock:
+                    active[0] -= 1
+
+        config = {"max_parallel_actions": 6, "max_parallel_content_requests": 2}
+        execute_pr_actions(_make_items(6), config, process)
+
+        assert peak[0] == 2
+        assert get_action_latency_summary()["comment"][0] == 6
+
+    def test_browser_operations_are_serialized(self):
+        """Browser operations never overlap"""
+        lock = threading.Lock()
+        active = [0]
+        peak = [0]
+
+        def process(pr, config, phase):
+            with browser_operation("open_browser"):
+                with lock:
+                    active[0] += 1
+                    peak[0] = max(peak[0], active[0])
+                time.sleep(0.01)
+                with lock:
+                    active[0] -= 1
+
+        execute_pr_actions(_make_items(4), {"max_parallel_actions": 4}, process)
+
+        assert peak[0] == 1
+
+    def test_exception_propagates(self):
+        """Errors from a PR are raised to the caller like serial processing"""
+
+        def process(pr, config, phase):
+            if pr["url"].endswith("/1"):
+                raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError, match="boom"):
+            execute_pr_actions(_make_items(3), {"max_parallel_actions": 3}, process)
+
+
+class TestActionLatency:
+    """Test per-action latency recording"""
+
+    def setup_method(self):
+        """Reset global state before each test"""
+        reset_action_latencies()
+
+    def test_summary_statistics(self):
+        """Summary reports count, average and max per action"""
+        record_action_latency("merge", 1.0)
+        record_action_latency("merge", 3.0)
+
+        assert get_action_latency_summary() == {"merge": (2, 2.0, 3.0)}
+
+    def test_summary_printed_after_batch(self, capsys):
+        """A latency summary is printed when actions were recorded"""
+
+        def process(pr, config, phase):
+            record_action_latency("mark_ready", 0.5)
+
+        execute_pr_actions(_make_items(1), {}, process)
+
+        assert "mark_ready: 1 call(s), avg 0.50s, max 0.50s" in capsys.readouterr().out
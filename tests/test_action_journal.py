@@ -0,0 +1,145 @@
+"""
+Tests for the durable action journal (outbox)
+"""
+
+import json
+from unittest.mock import patch
+
+from src.gh_pr_phase_monitor import pr_actions
+from src.gh_pr_phase_monitor.action_journal import (
+    ActionJournal,
+    configure_action_journal,
+    make_action_key,
+)
+from src.gh_pr_phase_monitor.phase_detector import PHASE_3
+from src.gh_pr_phase_monitor.pr_actions import process_pr
+
+PR_URL = "https://github.com/owner/repo/pull/1"
+
+
+def _write_entries(path, entries):
+    """Write journal entries as JSON Lines"""
+    with open(path, "w", encoding="utf-8") as f:
+        for entry in entries:
+            f.write(json.dumps(entry) + "\n")
+
+
+class TestActionJournal:
+    """Test journal replay and idempotency semantics"""
+
+    def test_completed_comment_not_repeated_after_restart(self, tmp_path):
+        """A completed at-most-once action is skipped by a new journal instance"""
+        path = str(tmp_path / "journal.jsonl")
+        key = make_action_key(PR_URL, PHASE_3, "merge_comment")
+
+        journal = ActionJournal(path)
+        assert journal.begin(key, "merge_comment", PR_URL) is True
+        journal.finish(key, "merge_comment", PR_URL, True)
+
+        restarted = ActionJournal(path)
+        assert restarted.is_done(key)
+        assert restarted.begin(key, "merge_comment", PR_URL) is False
+
+    def test_interrupted_comment_not_repeated(self, tmp_path):
+        """A comment that started but never finished is treated as done (at most once)"""
+        path = str(tmp_path / "journal.jsonl")
+        key = make_action_key(PR_URL, PHASE_3, "merge_comment")
+        _write_entries(path, [{"key": key, "status": "started", "action": "merge_comment", "url": PR_URL}])
+
+        journal = ActionJournal(path)
+
+        assert journal.begin(key, "merge_comment", PR_URL) is False
+        assert journal.is_done(key)
+
+    def test_interrupted_merge_is_retried(self, tmp_path):
+        """Idempotent actions run again after an interruption"""
+        path = str(tmp_path / "journal.jsonl")
+        key = make_action_key(PR_URL, PHASE_3, "merge")
+        _write_entries(path, [{"key": key, "status": "started", "action": "merge", "url": PR_URL}])
+
+        journal = ActionJournal(path)
+
+        assert journal.begin(key, "merge", PR_URL) is True
+
+    def test_failed_action_can_run_again(self, tmp_path):
+        """A failed at-most-once action is not considered done"""
+        path = str(tmp_path / "journal.jsonl")
+        key = make_action_key(PR_URL, PHASE_3, "ntfy")
+
+        journal = ActionJournal(path)
+        journal.begin(key, "ntfy", PR_URL)
+        journal.finish(key, "ntfy", PR_URL, False)
+
+        assert ActionJournal(path).begin(key, "ntfy", PR_URL) is True
+
+    def test_replay_compacts_and_ignores_torn_lines(self, tmp_path):
+        """Replay keeps only the latest entry per key and skips a partially written line"""
+        path = tmp_path / "journal.jsonl"
+        key = make_action_key(PR_URL, PHASE_3, "ntfy")
+        _write_entries(
+            str(path),
+            [
+                {"key": key, "status": "started", "action": "ntfy", "url": PR_URL, "time": 9e9},
+                {"key": key, "status": "done", "action": "ntfy", "url": PR_URL, "time": 9e9},
+            ],
+        )
+        with open(path, "a", encoding="utf-8") as f:
+            f.write('{"key": "torn')
+
+        journal = ActionJournal(str(path))
+
+        assert journal.is_done(key)
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 1
+        assert json.loads(lines[0])["status"] == "done"
+
+
+class TestProcessPrWithJournal:
+    """Test crash recovery between the pre-merge comment and the merge"""
+
+    def setup_method(self):
+        """Reset global state before each test"""
+        pr_actions._merged_prs.clear()
+        pr_actions._merge_comment_posted.clear()
+        pr_actions._actions_pending.clear()
+        pr_actions._browser_opened.clear()
+        pr_actions._notifications_sent.clear()
+
+    def teardown_method(self):
+        """Disable the journal after each test"""
+        configure_action_journal({})
+
+    @patch("src.gh_pr_phase_monitor.pr_actions.open_browser", return_value=True)
+    @patch("src.gh_pr_phase_monitor.pr_actions.merge_pr", return_value=True)
+    @patch("src.gh_pr_phase_monitor.pr_actions.post_phase3_comment", return_value=True)
+    def test_restart_after_comment_does_not_repost(self, mock_comment, mock_merge, _mock_browser, tmp_path):
+        """After a crash between comment and merge, only the merge runs on restart"""
+        path = str(tmp_path / "journal.jsonl")
+        comment_key = make_action_key(PR_URL, PHASE_3, "merge_comment")
+        merge_key = make_action_key(PR_URL, PHASE_3, "merge")
+        _write_entries(
+            path,
+            [
+                {"key": comment_key, "status": "done", "action": "merge_comment", "url": PR_URL, "time": 9e9},
+                {"key": merge_key, "status": "started", "action": "merge", "url": PR_URL, "time": 9e9},
+            ],
+        )
+        config = {
+            "action_journal": path,
+            "rulesets": [{"repositories": ["all"], "enable_execution_phase3_to_merge": True}],
+            "phase3_merge": {"comment": "merging"},
+        }
+        configure_action_journal(config)
+        pr = {"url": PR_URL, "title": "t", "repository": {"name": "repo", "owner": "owner"}}
+
+        process_pr(pr, config, PHASE_3)
+
+        mock_comment.assert_not_called()
+        mock_merge.assert_called_once()
+        assert PR_URL in pr_actions._merged_prs
+        assert configure_action_journal(config).is_done(merge_key)
+
+    def test_disabled_by_default(self):
+        """No journal is used unless action_journal is configured"""
+        assert configure_action_journal({}) is None
+        assert configure_action_journal(None) is None
@@ -9,6 +9,7 @@ from src.gh_pr_phase_monitor.browser_automation import (
     is_pyautogui_available,
     merge_pr_automated,
 )
+from src.gh_pr_phase_monitor.debug_artifacts import flush_debug_artifacts
 
 
 class TestIsPyAutoGUIAvailable:
@@ -398,6 +399,7 @@ class TestSaveDebugInfo:
 
             config = {"debug_dir": str(tmp_path)}
             _save_debug_info("test_button", 0.8, config)
+            flush_debug_artifacts()
 
             # Verify screenshot was taken and saved
             mock_pyautogui.screenshot.assert_called_once()
@@ -423,6 +425,7 @@ class TestSaveDebugInfo:
 
             config = {"debug_dir": str(tmp_path)}
             _save_debug_info("test_button", 0.8, config)
+            flush_debug_artifacts()
 
             # Check that JSON file was created
             json_files = list(tmp_path.glob("test_button_fail_*.json"))
@@ -510,6 +513,7 @@ class TestSaveDebugInfo:
 
             config = {"debug_dir": str(tmp_path)}
             result = _click_button_with_image("test_button", config)
+            flush_debug_artifacts()
 
             # Should return False
             assert result is False
@@ -533,6 +537,7 @@ class TestSaveDebugInfo:
 
             config = {"debug_dir": str(tmp_path)}
             result = _click_button_with_image("test_button", config)
+            flush_debug_artifacts()
 
             # Should return False
             assert result is False
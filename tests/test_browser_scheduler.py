@@ -0,0 +1,202 @@
+"""
+Tests for the cooldown-aware browser operation queue
+"""
+
+import threading
+import time
+from unittest.mock import patch
+
+from src.gh_pr_phase_monitor import browser_automation, browser_scheduler, pr_actions
+from src.gh_pr_phase_monitor.action_executor import pause_actions, resume_actions
+from src.gh_pr_phase_monitor.browser_scheduler import (
+    OPERATION_ASSIGN,
+    OPERATION_MERGE,
+    OPERATION_REVIEW,
+    BrowserScheduler,
+)
+from src.gh_pr_phase_monitor.config import get_browser_queue_config
+from src.gh_pr_phase_monitor.phase_detector import PHASE_3
+from src.gh_pr_phase_monitor.pr_actions import process_pr
+
+PR_URL = "https://github.com/owner/repo/pull/1"
+ISSUE_URL = "https://github.com/owner/repo/issues/2"
+
+
+class TestBrowserScheduler:
+    """Test priority order, cooldown gating and deduplication"""
+
+    def setup_method(self):
+        """Reset the browser cooldown before each test"""
+        browser_automation._last_browser_open_time = None
+
+    def teardown_method(self):
+        """Reset the browser cooldown after each test"""
+        browser_automation._last_browser_open_time = None
+
+    def test_dispatched_in_priority_order(self):
+        """Merges run before review pages, which run before assignments"""
+        ran = []
+        scheduler = BrowserScheduler()
+        for kind, url in [(OPERATION_ASSIGN, ISSUE_URL), (OPERATION_REVIEW, PR_URL), (OPERATION_MERGE, PR_URL)]:
+            scheduler.schedule(kind, url, lambda kind=kind: ran.append(kind) or True)
+
+        assert [op.kind for op in scheduler.pending()] == [OPERATION_MERGE, OPERATION_REVIEW, OPERATION_ASSIGN]
+        while scheduler.run_next() is not None:
+            pass
+
+        assert ran == [OPERATION_MERGE, OPERATION_REVIEW, OPERATION_ASSIGN]
+
+    def test_not_run_during_cooldown(self):
+        """Nothing is dispatched while the cooldown is in effect"""
+        browser_automation._last_browser_open_time = time.time()
+        scheduler = BrowserScheduler()
+        scheduler.schedule(OPERATION_REVIEW, PR_URL, lambda: True)
+
+        assert scheduler.run_next() is None
+        assert scheduler.is_scheduled(OPERATION_REVIEW, PR_URL)
+
+    def test_result_callback(self):
+        """The result callback receives the operation's success flag"""
+        results = []
+        scheduler = BrowserScheduler()
+        scheduler.schedule(OPERATION_REVIEW, PR_URL, lambda: False, results.append)
+
+        assert scheduler.run_next() is False
+        assert results == [False]
+
+    def test_dedupe_modes(self):
+        """Duplicates are dropped per operation, per URL, or not at all"""
+        by_operation = BrowserScheduler(dedupe="operation")
+        assert by_operation.schedule(OPERATION_REVIEW, PR_URL, lambda: True) is True
+        assert by_operation.schedule(OPERATION_REVIEW, PR_URL, lambda: True) is False
+        assert by_operation.schedule(OPERATION_MERGE, PR_URL, lambda: True) is True
+
+        by_url = BrowserScheduler(dedupe="url")
+        by_url.schedule(OPERATION_REVIEW, PR_URL, lambda: True)
+        assert by_url.schedule(OPERATION_MERGE, PR_URL, lambda: True) is True
+        assert by_url.schedule(OPERATION_REVIEW, PR_URL, lambda: True) is False
+        assert [op.kind for op in by_url.pending()] == [OPERATION_MERGE]
+
+        no_dedupe = BrowserScheduler(dedupe="none")
+        no_dedupe.schedule(OPERATION_REVIEW, PR_URL, lambda: True)
+        assert no_dedupe.schedule(OPERATION_REVIEW, PR_URL, lambda: True) is True
+        assert len(no_dedupe.pending()) == 2
+
+    def test_custom_priorities(self):
+        """Configured priorities change the dispatch order"""
+        scheduler = BrowserScheduler(priorities={"merge": 5, "review": 1, "assign": 0})
+        scheduler.schedule(OPERATION_MERGE, PR_URL, lambda: True)
+        scheduler.schedule(OPERATION_ASSIGN, ISSUE_URL, lambda: True)
+
+        assert [op.kind for op in scheduler.pending()] == [OPERATION_ASSIGN, OPERATION_MERGE]
+
+    def test_dispatcher_runs_when_cooldown_expires(self):
+        """The dispatcher thread runs a queued operation as soon as the cooldown expires"""
+        browser_automation._last_browser_open_time = (
+            time.time() - browser_automation.BROWSER_OPEN_COOLDOWN_SECONDS + 0.2
+        )
+        done = threading.Event()
+        scheduler = BrowserScheduler()
+        scheduler.schedule(OPERATION_REVIEW, PR_URL, lambda: done.set() or True)
+
+        scheduler.start()
+
+        assert done.wait(timeout=5)
+        assert browser_automation._get_remaining_cooldown() == 0
+
+    def test_disable_and_reenable_on_hot_reload(self):
+        """Disabling refuses new operations but runs the queued ones; re-enabling reuses the dispatcher"""
+        browser_automation._last_browser_open_time = time.time()
+        done = threading.Event()
+        enabled = {"browser_queue": {"enabled": True}}
+        scheduler = browser_scheduler.configure_browser_scheduler(enabled)
+        try:
+            assert browser_scheduler.schedule_browser_operation(OPERATION_REVIEW, PR_URL, lambda: done.set() or True)
+
+            assert browser_scheduler.configure_browser_scheduler({}) is None
+            assert browser_scheduler.schedule_browser_operation(OPERATION_MERGE, PR_URL, lambda: True) is False
+            assert [op.kind for op in browser_scheduler.get_scheduled_browser_operations()] == [OPERATION_REVIEW]
+
+            dispatchers = [thread.name for thread in threading.enumerate()].count("browser-queue")
+            assert browser_scheduler.configure_browser_scheduler(enabled) is scheduler
+            assert [thread.name for thread in threading.enumerate()].count("browser-queue") == dispatchers
+
+            browser_automation._last_browser_open_time = None
+            scheduler.wake()
+            assert done.wait(timeout=5)
+        finally:
+            browser_scheduler.configure_browser_scheduler({})
+
+    def test_paused_operations_stay_queued(self):
+        """While actions are paused, queued operations are not run; resuming dispatches them"""
+        done = threading.Event()
+        scheduler = browser_scheduler.configure_browser_scheduler({"browser_queue": {"enabled": True}})
+        try:
+            pause_actions()
+            scheduler.schedule(OPERATION_MERGE, PR_URL, lambda: done.set() or True)
+
+            assert not done.wait(timeout=0.5)
+            assert scheduler.run_next() is None
+            assert scheduler.is_scheduled(OPERATION_MERGE, PR_URL)
+
+            resume_actions()
+            assert done.wait(timeout=5)
+        finally:
+            resume_actions()
+            browser_scheduler.configure_browser_scheduler({})
+
+
+class TestGetBrowserQueueConfig:
+    """Test browser_queue defaults"""
+
+    def test_defaults_and_priority_merge(self):
+        """User priorities are merged with the default priorities"""
+        config = get_browser_queue_config({"browser_queue": {"enabled": True, "priorities": {"assign": -1}}})
+
+        assert config["enabled"] is True
+        assert config["dedupe"] == "operation"
+        assert config["priorities"] == {"merge": 0, "review": 1, "assign": -1}
+        assert get_browser_queue_config({})["enabled"] is False
+
+
+class TestProcessPrWithBrowserQueue:
+    """Test that operations refused by the cooldown are queued"""
+
+    def setup_method(self):
+        """Reset global state before each test"""
+        pr_actions._merged_prs.clear()
+        pr_actions._merge_comment_posted.clear()
+        pr_actions._actions_pending.clear()
+        pr_actions._browser_opened.clear()
+        pr_actions._notifications_sent.clear()
+        browser_automation._last_browser_open_time = time.time()
+
+    def teardown_method(self):
+        """Reset the browser cooldown after each test"""
+        browser_automation._last_browser_open_time = None
+
+    @patch("src.gh_pr_phase_monitor.pr_actions.schedule_browser_operation", return_value=True)
+    @patch("src.gh_pr_phase_monitor.pr_actions.open_browser")
+    def test_review_page_queued_during_cooldown(self, mock_open_browser, mock_schedule):
+        """The review page is queued instead of retried in the next cycle"""
+        pr = {"url": PR_URL, "title": "t", "repository": {"name": "repo", "owner": "owner"}}
+
+        process_pr(pr, {}, PHASE_3)
+
+        mock_open_browser.assert_not_called()
+        assert mock_schedule.call_args[0][:2] == (OPERATION_REVIEW, PR_URL)
+        assert not pr_actions.has_pending_actions(PR_URL)
+
+        on_result = mock_schedule.call_args[0][3]
+        on_result(True)
+        assert (PR_URL, PHASE_3) in pr_actions._browser_opened
+
+    @patch("src.gh_pr_phase_monitor.pr_actions.open_browser", return_value=False)
+    def test_queue_disabled_keeps_retry_next_cycle(self, mock_open_browser):
+        """Without the queue, a cooldown-refused open is retried in the next cycle"""
+        pr = {"url": PR_URL, "title": "t", "repository": {"name": "repo", "owner": "owner"}}
+
+        process_pr(pr, {}, PHASE_3)
+
+        mock_open_browser.assert_called_once()
+        assert pr_actions.has_pending_actions(PR_URL)
@@ -0,0 +1,174 @@
+"""
+Tests for the browser automation worker process
+"""
+
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src.gh_pr_phase_monitor import browser_automation, browser_worker, pr_actions
+from src.gh_pr_phase_monitor.action_executor import pause_actions, resume_actions
+from src.gh_pr_phase_monitor.browser_worker import JOB_KIND_MERGE, BrowserWorker
+from src.gh_pr_phase_monitor.phase_detector import PHASE_3
+from src.gh_pr_phase_monitor.pr_actions import process_pr
+from src.gh_pr_phase_monitor.wait_handler import wait_with_countdown
+
+PR_URL = "https://github.com/owner/repo/pull/1"
+
+
+def _poll_until_finished(worker, timeout=30.0):
+    """Poll the worker until a job finishes or the timeout expires"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if worker.poll():
+            return True
+        time.sleep(0.05)
+    return False
+
+
+class TestBrowserWorker:
+    """Test job execution, deduplication and hang handling of the worker process"""
+
+    def setup_method(self):
+        """Reset the browser cooldown before each test"""
+        browser_automation._last_browser_open_time = None
+        self.worker = BrowserWorker()
+
+    def teardown_method(self):
+        """Stop the worker process and reset the browser cooldown"""
+        self.worker.stop()
+        browser_automation._last_browser_open_time = None
+
+    @pytest.mark.skipif(browser_automation.PYAUTOGUI_AVAILABLE, reason="would open a real browser")
+    def test_result_reported_asynchronously(self, capsys):
+        """A job runs in the worker and its result and output are delivered by poll()"""
+        results = []
+
+        assert self.worker.submit(JOB_KIND_MERGE, PR_URL, {"phase3_merge": {}}, results.append) is True
+        assert self.worker.is_pending(JOB_KIND_MERGE, PR_URL)
+
+        assert _poll_until_finished(self.worker)
+        assert results == [False]
+        assert not self.worker.is_pending(JOB_KIND_MERGE, PR_URL)
+        assert "PyAutoGUI is not installed" in capsys.readouterr().out
+
+    @pytest.mark.skipif(browser_automation.PYAUTOGUI_AVAILABLE, reason="would open a real browser")
+    def test_paused_jobs_held_until_resumed(self):
+        """While actions are paused, the worker does not start jobs; resuming runs them"""
+        results = []
+        try:
+            pause_actions()
+            assert browser_worker.submit_browser_job(JOB_KIND_MERGE, PR_URL, {"phase3_merge": {}}, results.append)
+
+            time.sleep(2)
+            assert browser_worker.poll_browser_worker() == 0
+            assert browser_worker._worker._jobs[0].started_at is None
+
+            resume_actions()
+            assert _poll_until_finished(browser_worker._worker)
+            assert results == [False]
+        finally:
+            resume_actions()
+            browser_worker.stop_browser_worker()
+
+    def test_duplicate_job_not_queued(self):
+        """A job already queued for the same kind and URL is not queued again"""
+        # Keep the job waiting for the cooldown in the worker
+        browser_automation._last_browser_open_time = time.time()
+
+        assert self.worker.submit(JOB_KIND_MERGE, PR_URL, {}) is True
+        assert self.worker.submit(JOB_KIND_MERGE, PR_URL, {}) is False
+        assert self.worker.pending_jobs() == [(JOB_KIND_MERGE, PR_URL)]
+
+    def test_worker_dying_before_start_fails_job(self):
+        """A worker that keeps exiting before it starts a job is not restarted forever"""
+        results = []
+        self.worker.submit(JOB_KIND_MERGE, PR_URL, {}, results.append)
+        self.worker.stop()
+
+        with patch.object(self.worker, "_start") as mock_start, patch("builtins.print"):
+            polls = [self.worker.poll() for _ in range(browser_worker.MAX_RESTARTS_BEFORE_START + 1)]
+
+        assert polls == [0] * browser_worker.MAX_RESTARTS_BEFORE_START + [1]
+        assert mock_start.call_count == browser_worker.MAX_RESTARTS_BEFORE_START
+        assert results == [False]
+        assert self.worker.pending_jobs() == []
+
+    def test_hung_job_fails_and_worker_restarts(self):
+        """A started job exceeding the timeout is failed and the worker is restarted for the rest"""
+        browser_automation._last_browser_open_time = time.time()
+        results = []
+        self.worker.timeout_seconds = 1
+        self.worker.submit(JOB_KIND_MERGE, PR_URL, {}, results.append)
+        self.worker.submit(JOB_KIND_MERGE, "https://github.com/owner/repo/pull/2", {})
+        first_process = self.worker._process
+        self.worker._jobs[0].started_at = time.monotonic() - 10
+
+        assert self.worker.poll() == 1
+
+        assert results == [False]
+        assert self.worker.pending_jobs() == [(JOB_KIND_MERGE, "https://github.com/owner/repo/pull/2")]
+        assert self.worker._process is not first_process
+        assert self.worker._process.is_alive()
+
+
+class TestPollingDuringWait:
+    def test_polling_wait_collects_results_every_second(self):
+        """The polling wait collects browser worker results every second, not only at the next check"""
+        with (
+            patch("builtins.print"),
+            patch("src.gh_pr_phase_monitor.wait_handler.poll_browser_worker") as mock_poll,
+        ):
+            wait_with_countdown(2, "2s")
+
+        assert mock_poll.call_count == 2
+
+
+class TestProcessPrWithBrowserWorker:
+    """Test that browser-automated merges are queued instead of blocking process_pr"""
+
+    def setup_method(self):
+        """Reset global state before each test"""
+        pr_actions._merged_prs.clear()
+        pr_actions._merge_comment_posted.clear()
+        pr_actions._actions_pending.clear()
+        pr_actions._browser_opened.clear()
+        pr_actions._notifications_sent.clear()
+
+    def _config(self):
+        return {
+            "browser_worker": True,
+            "rulesets": [{"repositories": ["all"], "enable_execution_phase3_to_merge": True}],
+            "phase3_merge": {"comment": "merging", "automated": True},
+        }
+
+    def _pr(self):
+        return {"url": PR_URL, "title": "t", "repository": {"name": "repo", "owner": "owner"}}
+
+    @patch("src.gh_pr_phase_monitor.pr_actions.open_browser", return_value=True)
+    @patch("src.gh_pr_phase_monitor.pr_actions.post_phase3_comment", return_value=True)
+    @patch("src.gh_pr_phase_monitor.pr_actions.merge_pr_automated")
+    @patch("src.gh_pr_phase_monitor.pr_actions.submit_browser_job", return_value=True)
+    def test_merge_queued_and_result_applied_later(self, mock_submit, mock_merge_automated, _mock_comment, _browser):
+        """The merge is handed to the worker and the PR is marked merged when the result arrives"""
+        process_pr(self._pr(), self._config(), PHASE_3)
+
+        mock_merge_automated.assert_not_called()
+        mock_submit.assert_called_once()
+        assert PR_URL not in pr_actions._merged_prs
+
+        on_result = mock_submit.call_args[0][3]
+        on_result(True)
+
+        assert PR_URL in pr_actions._merged_prs
+        assert not pr_actions.has_pending_actions(PR_URL)
+
+    @patch("src.gh_pr_phase_monitor.pr_actions.open_browser", return_value=True)
+    @patch("src.gh_pr_phase_monitor.pr_actions.post_phase3_comment")
+    @patch("src.gh_pr_phase_monitor.pr_actions.is_browser_job_pending", return_value=True)
+    def test_no_comment_while_merge_in_progress(self, _mock_pending, mock_comment, _browser):
+        """A PR whose merge job is still running is not commented on again"""
+        process_pr(self._pr(), self._config(), PHASE_3)
+
+        mock_comment.assert_not_called()
@@ -0,0 +1,142 @@
+"""
+Tests for the immutable compiled config snapshot produced by load_config()
+"""
+
+import os
+import tempfile
+from unittest.mock import patch
+
+import pytest
+
+from src.gh_pr_phase_monitor import state_tracker
+from src.gh_pr_phase_monitor.config import (
+    DEFAULT_PHASE3_MERGE_CONFIG,
+    CompiledConfig,
+    get_assign_to_copilot_config,
+    get_duration_setting,
+    get_phase3_merge_config,
+    load_config,
+    validate_phase3_merge_config_required,
+)
+from src.gh_pr_phase_monitor.monitor import check_no_state_change_timeout
+
+
+def _load(content: str) -> CompiledConfig:
+    """Write content to a temporary TOML file and load it"""
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".toml", delete=False, encoding="utf-8") as f:
+        f.write(content)
+        config_path = f.name
+    try:
+        return load_config(config_path)
+    finally:
+        os.unlink(config_path)
+
+
+class TestCompiledConfig:
+    """Test CompiledConfig construction and immutability"""
+
+    def test_load_config_returns_compiled_config(self):
+        """load_config returns a dict-compatible CompiledConfig"""
+        config = _load('interval = "30s"\n')
+
+        assert isinstance(config, CompiledConfig)
+        assert config["interval"] == "30s"
+        assert config.get("verbose", False) is False
+
+    def test_config_is_immutable(self):
+        """Modifying a compiled config raises TypeError"""
+        config = _load('interval = "30s"\n')
+
+        with pytest.raises(TypeError):
+            config["interval"] = "1m"
+        with pytest.raises(TypeError):
+            config.update({"interval": "1m"})
+        with pytest.raises(TypeError):
+            del config["interval"]
+
+    def test_durations_are_precomputed(self):
+        """Duration settings are parsed once with defaults applied"""
+        config = _load('interval = "30s"\nno_change_timeout = ""\n')
+
+        assert config.durations["interval"] == ("30s", 30)
+        assert config.durations["no_change_timeout"] == ("", 0)
+        assert config.durations["reduced_frequency_interval"] == ("1h", 3600)
+
+    def test_invalid_duration_rejected_at_load(self):
+        """Invalid durations fail the load so hot reload keeps the previous config"""
+        with pytest.raises(ValueError):
+            _load('reduced_frequency_interval = "soon"\n')
+
+    def test_get_duration_setting_uses_precomputed_value(self):
+        """Compiled configs do not re-parse durations"""
+        config = _load('interval = "2m"\n')
+
+        with patch("src.gh_pr_phase_monitor.config.parse_interval") as mock_parse:
+            assert get_duration_setting(config, "interval") == ("2m", 120)
+
+        mock_parse.assert_not_called()
+
+    def test_get_duration_setting_plain_dict(self):
+        """Plain dictionaries are parsed on the fly with defaults"""
+        assert get_duration_setting({}, "interval") == ("1m", 60)
+        assert get_duration_setting(None, "no_change_timeout") == ("30m", 1800)
+
+    def test_section_configs_precomputed(self):
+        """phase3_merge and assign_to_copilot defaults are merged once"""
+        config = _load('[phase3_merge]\ncomment = "merge it"\n')
+
+        phase3_merge = get_phase3_merge_config(config)
+        assert phase3_merge is config.phase3_merge
+        assert phase3_merge["comment"] == "merge it"
+        assert phase3_merge["automated"] == DEFAULT_PHASE3_MERGE_CONFIG["automated"]
+        assert get_assign_to_copilot_config(config) is config.assign_to_copilot
+        with pytest.raises(TypeError):
+            phase3_merge["comment"] = "changed"
+
+
+class TestValidationOncePerVersion:
+    """Test that phase3_merge validation runs once per config version"""
+
+    def test_validation_cached_per_repo(self):
+        """A repository is only validated on the first call"""
+        config = _load(
+            '[[rulesets]]\nrepositories = ["repo1"]\nenable_execution_phase3_to_merge = true\n'
+            '[phase3_merge]\ncomment = "merge"\n'
+        )
+
+        with patch(
+            "src.gh_pr_phase_monitor.config._check_phase3_merge_comment_configured",
+        ) as mock_check:
+            validate_phase3_merge_config_required(config, "owner", "repo1")
+            validate_phase3_merge_config_required(config, "owner", "repo1")
+
+        assert mock_check.call_count == 1
+
+    def test_failed_validation_is_not_cached(self):
+        """A missing comment keeps failing on every call"""
+        config = _load('[[rulesets]]\nrepositories = ["repo1"]\nenable_execution_phase3_to_merge = true\n')
+
+        with patch("builtins.print"):
+            for _ in range(2):
+                with pytest.raises(SystemExit):
+                    validate_phase3_merge_config_required(config, "owner", "repo1")
+
+
+class TestMonitorWithCompiledConfig:
+    """Test that the monitor uses the precomputed no_change_timeout"""
+
+    def setup_method(self):
+        """Reset global state before each test"""
+        state_tracker.set_last_state(None)
+        state_tracker.set_reduced_frequency_mode(False)
+
+    def test_no_parse_per_cycle(self):
+        """check_no_state_change_timeout does not re-parse durations for compiled configs"""
+        config = _load('no_change_timeout = "5m"\n')
+
+        with patch("src.gh_pr_phase_monitor.config.parse_interval") as mock_parse:
+            check_no_state_change_timeout([], [], config)
+            check_no_state_change_timeout([], [], config)
+
+        mock_parse.assert_not_called()
+        assert state_tracker.get_last_state() is not None
@@ -0,0 +1,197 @@
+"""
+Tests for the local control API
+"""
+
+import http.client
+import json
+import os
+import socket
+import threading
+import time
+import urllib.request
+from unittest.mock import patch
+
+import pytest
+
+from src.gh_pr_phase_monitor import action_executor, control_api, snapshot_diff, wait_events
+from src.gh_pr_phase_monitor.action_executor import execute_pr_actions
+from src.gh_pr_phase_monitor.control_api import configure_control_api, publish_state
+from src.gh_pr_phase_monitor.state_tracker import set_pr_state_time
+from src.gh_pr_phase_monitor.thin_client import read_events
+from src.gh_pr_phase_monitor.wait_handler import wait_with_countdown
+
+PR = {
+    "url": "https://github.com/o/repo/pull/1",
+    "title": "Fix",
+    "repository": {"name": "repo", "owner": "o"},
+}
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, path):
+        super().__init__("localhost", timeout=5)
+        self.path = path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(self.path)
+
+
+@pytest.fixture
+def api():
+    configure_control_api({"control_api": {"enabled": True, "port": 0}})
+    host, port = control_api._server.server_address[:2]
+    yield lambda: http.client.HTTPConnection(host, port, timeout=5)
+    configure_control_api({})
+    action_executor.resume_actions()
+    snapshot_diff.reset_snapshot()
+
+
+def _request(connection, method, path, headers=None):
+    connection.request(method, path, headers=headers or {})
+    response = connection.getresponse()
+    return response.status, json.loads(response.read())
+
+
+class TestControlApi:
+    def test_state_snapshot(self, api):
+        """GET /state returns the PRs of the last check with phase and time in phase"""
+        set_pr_state_time(PR["url"], "phase3", 1_700_000_000.0)
+        publish_state([PR], ["phase3"], 7, next_check_seconds=60, now=1_700_000_120.0)
+
+        status, state = _request(api(), "GET", "/state")
+
+        assert status == 200
+        assert state["check"] == 7
+        assert state["next_check_at"] == "2023-11-14T22:16:20Z"
+        assert state["paused"] is False
+        assert state["prs"] == [
+            {
+                "url": PR["url"],
+                "title": "Fix",
+                "repository": "o/repo",
+                "phase": "phase3",
+                "entered_phase_at": "2023-11-14T22:13:20Z",
+                "time_in_phase_seconds": 120,
+                "pending_actions": False,
+            }
+        ]
+
+    def test_refresh_ends_wait(self, api):
+        """POST /refresh ends the current (polling) wait within a second"""
+        wait_events.get_wakeup_pipe().drain()
+        threading.Timer(0.2, lambda: _request(api(), "POST", "/refresh")).start()
+
+        started = time.monotonic()
+        with patch("builtins.print"):
+            wait_with_countdown(30, "30s")
+
+        assert time.monotonic() - started < 5
+
+    def test_pause_and_resume(self, api):
+        """While paused, PR actions are skipped; resuming requests a full reconcile"""
+        processed = []
+        snapshot_diff.is_full_reconcile_due(600, current_time=1000.0)
+
+        assert _request(api(), "POST", "/pause") == (200, {"ok": True, "paused": True})
+        with patch("builtins.print"):
+            execute_pr_actions([(PR, "phase3")], {}, lambda pr, config, phase: processed.append(pr))
+        assert processed == []
+        assert _request(api(), "GET", "/state")[1]["paused"] is True
+
+        assert _request(api(), "POST", "/resume") == (200, {"ok": True, "paused": False})
+        assert snapshot_diff.is_full_reconcile_due(600, current_time=1001.0)
+
+    def test_requests_from_web_pages_refused(self, api):
+        """POST requests with an Origin header are refused"""
+        status, _body = _request(api(), "POST", "/pause", {"Origin": "https://example.com"})
+
+        assert status == 403
+        assert not action_executor.are_actions_paused()
+
+    def test_web_pages_cannot_read_state(self, api):
+        """GET requests with an Origin header, or a Host that is not loopback (DNS rebinding), are refused"""
+        port = control_api._server.server_address[1]
+
+        assert _request(api(), "GET", "/state", {"Origin": "https://example.com"})[0] == 403
+        assert _request(api(), "GET", "/state", {"Host": f"rebind.example.com:{port}"})[0] == 403
+        assert _request(api(), "GET", "/state", {"Host": f"localhost:{port}"})[0] == 200
+        assert _request(api(), "GET", "/state", {"Host": f"[::1]:{port}"})[0] == 200
+
+    def test_event_stream_sends_snapshot_then_deltas(self, api):
+        """GET /events starts with the current state, then sends only what changed per check"""
+        other = {**PR, "url": "https://github.com/o/repo/pull/2", "title": "Other"}
+        publish_state([PR, other], ["phase1", "phase2"], 1)
+        host, port = control_api._server.server_address[:2]
+
+        with urllib.request.urlopen(f"http://{host}:{port}/events", timeout=5) as response:
+            events = read_events(response)
+            event, data = next(events)
+            assert event == "snapshot"
+            assert [pr["url"] for pr in json.loads(data)["prs"]] == [PR["url"], other["url"]]
+
+            publish_state([PR], ["phase3"], 2)
+            event, data = next(events)
+
+        delta = json.loads(data)
+        assert event == "delta"
+        assert delta["check"] == 2
+        assert [(pr["url"], pr["phase"]) for pr in delta["changed"]] == [(PR["url"], "phase3")]
+        assert delta["removed"] == [other["url"]]
+
+    def test_token_required(self, api):
+        """With a token, requests without the bearer token are refused"""
+        configure_control_api({"control_api": {"enabled": True, "port": 0, "token": "secret"}})
+        host, port = control_api._server.server_address[:2]
+        connection = lambda: http.client.HTTPConnection(host, port, timeout=5)  # noqa: E731
+
+        assert _request(connection(), "GET", "/state")[0] == 401
+        assert _request(connection(), "POST", "/pause")[0] == 401
+        assert _request(connection(), "GET", "/state", {"Authorization": "Bearer secret"})[0] == 200
+
+    @pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix sockets are not available")
+    def test_unix_socket(self, tmp_path):
+        """With socket set, the API is served on a Unix socket only accessible to the user"""
+        path = str(tmp_path / "monitor.sock")
+        configure_control_api({"control_api": {"enabled": True, "socket": path}})
+        try:
+            publish_state([], [], 1)
+            status, state = _request(UnixHTTPConnection(path), "GET", "/state")
+            assert (status, state["check"]) == (200, 1)
+        finally:
+            configure_control_api({})
+
+    @pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix sockets are not available")
+    def test_unix_socket_replaces_only_stale_sockets(self, tmp_path):
+        """A socket left by a previous run is replaced; a regular file or a live socket is kept"""
+        path = str(tmp_path / "monitor.sock")
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(path)
+        stale.close()
+        try:
+            configure_control_api({"control_api": {"enabled": True, "socket": path}})
+            assert control_api.get_control_api_address() == path
+            assert os.stat(path).st_mode & 0o777 == 0o600
+        finally:
+            configure_control_api({})
+
+        # Another instance is listening on the socket
+        other_instance = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        other_instance.bind(path)
+        other_instance.listen()
+        try:
+            with patch("builtins.print") as mock_print:
+                configure_control_api({"control_api": {"enabled": True, "socket": path}})
+            assert control_api._server is None
+            assert "in use" in str(mock_print.call_args)
+            assert os.path.exists(path)
+        finally:
+            other_instance.close()
+
+        regular_file = tmp_path / "notes.txt"
+        regular_file.write_text("keep me")
+        with patch("builtins.print") as mock_print:
+            configure_control_api({"control_api": {"enabled": True, "socket": str(regular_file)}})
+        assert control_api._server is None
+        assert "not a socket" in str(mock_print.call_args)
+        assert regular_file.read_text() == "keep me"
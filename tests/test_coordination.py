@@ -0,0 +1,158 @@
+"""
+Tests for the cross-instance coordination (lease and leader election)
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from src.gh_pr_phase_monitor import action_journal
+from src.gh_pr_phase_monitor.action_journal import configure_action_journal
+from src.gh_pr_phase_monitor.control_api import get_state, publish_state
+from src.gh_pr_phase_monitor.coordination import (
+    Coordinator,
+    InstanceLease,
+    check_leadership,
+    configure_coordinated_journal,
+    configure_coordination,
+    read_leader_snapshot,
+    share_snapshot,
+    stop_coordination,
+)
+
+PR = {
+    "url": "https://github.com/o/repo/pull/1",
+    "title": "Fix",
+    "repository": {"name": "repo", "owner": "o"},
+}
+
+
+@pytest.fixture
+def database(tmp_path):
+    yield str(tmp_path / "coordination.db")
+    stop_coordination()
+
+
+def _configure(database):
+    with patch("builtins.print"):
+        configure_coordination({"coordination": {"enabled": True, "database": database, "lease_ttl": "30s"}})
+
+
+class TestInstanceLease:
+    def test_single_holder_until_expiry(self, database):
+        """Only one instance holds the lease; it can be taken once the holder stops renewing"""
+        first = InstanceLease(database, 30, holder="first")
+        second = InstanceLease(database, 30, holder="second")
+
+        assert first.try_acquire(now=0)
+        assert not second.try_acquire(now=10)
+        assert first.try_acquire(now=20)
+        assert not second.try_acquire(now=49)
+        assert second.try_acquire(now=51)
+        assert not first.try_acquire(now=52)
+        assert second.current_holder(now=52) == "second"
+
+    def test_release(self, database):
+        """A released lease can be acquired at once"""
+        first = InstanceLease(database, 30, holder="first")
+        second = InstanceLease(database, 30, holder="second")
+        first.try_acquire()
+        first.release()
+
+        assert second.try_acquire()
+
+
+class TestCoordination:
+    def test_disabled_always_leads(self):
+        configure_coordination({})
+        assert check_leadership()
+
+    def test_follower_reads_leader_snapshot(self, database):
+        """While another instance leads, this one follows and shows the leader's snapshot"""
+        leader = InstanceLease(database, 30, holder="desktop:1")
+        leader.try_acquire()
+        publish_state([PR], ["phase3"], 4)
+        leader.write_snapshot(json.dumps(get_state()))
+        _configure(database)
+
+        with patch("builtins.print"):
+            assert not check_leadership()
+            all_prs, phases = read_leader_snapshot()
+
+        assert [(pr["url"], pr["repository"]) for pr in all_prs] == [(PR["url"], {"owner": "o", "name": "repo"})]
+        assert phases == ["phase3"]
+
+    def test_leader_shares_snapshot_and_releases_on_stop(self, database):
+        """The leader writes its snapshot for the followers and releases the lease on exit"""
+        _configure(database)
+        with patch("builtins.print"):
+            assert check_leadership()
+        publish_state([PR], ["phase2"], 7)
+        share_snapshot(get_state())
+
+        _holder, _written_at, body = InstanceLease(database, 30, holder="other").read_snapshot()
+        assert json.loads(body)["check"] == 7
+        stop_coordination()
+        assert InstanceLease(database, 30, holder="other").try_acquire()
+
+    def test_hung_leader_loses_lease(self, database):
+        """A leader whose loop stops reporting progress stops renewing, and another instance takes over"""
+        lease = InstanceLease(database, 30, holder="hung")
+        standby = InstanceLease(database, 30, holder="standby")
+        coordinator = Coordinator(lease, {})
+        try:
+            assert lease.try_acquire(now=1000)
+            coordinator.is_leader = True
+            # The loop reported progress before a 60 second wait
+            coordinator.report_progress(60, now=1000)
+
+            with patch("builtins.print"):
+                assert coordinator.renew_if_progressing(now=1080)
+                assert not standby.try_acquire(now=1100)
+                # No check started after the wait: the loop is stuck, so the lease is not renewed
+                assert not coordinator.renew_if_progressing(now=1095)
+                assert not standby.try_acquire(now=1105)
+                assert standby.try_acquire(now=1111)
+        finally:
+            coordinator.stop()
+
+    def test_takeover_replays_journal_and_reconciles(self, database):
+        """A follower that takes over replays the action journal and processes every PR"""
+        leader = InstanceLease(database, 30, holder="desktop:1")
+        leader.try_acquire()
+        _configure(database)
+        with (
+            patch("src.gh_pr_phase_monitor.coordination.configure_action_journal") as mock_journal,
+            patch("src.gh_pr_phase_monitor.coordination.request_full_reconcile") as mock_reconcile,
+            patch("builtins.print"),
+        ):
+            assert not check_leadership()
+            leader.release()
+            assert check_leadership()
+
+        assert mock_journal.call_args.kwargs == {"reopen": True}
+        mock_reconcile.assert_called_once()
+
+    def test_follower_does_not_open_journal(self, database, tmp_path):
+        """Only the leader opens (and compacts) the shared action journal"""
+        journal_path = tmp_path / "journal.jsonl"
+        journal_path.write_text('{"key": "k", "status": "done", "action": "merge", "url": "u", "time": 9e9}\n')
+        leader = InstanceLease(database, 30, holder="desktop:1")
+        leader.try_acquire()
+        config = {
+            "action_journal": str(journal_path),
+            "coordination": {"enabled": True, "database": database, "lease_ttl": "30s"},
+        }
+        try:
+            with patch("builtins.print"):
+                configure_coordination(config)
+                configure_coordinated_journal(config)
+                assert not check_leadership()
+                assert action_journal._journal is None
+
+                leader.release()
+                assert check_leadership()
+            assert action_journal._journal.is_done("k")
+        finally:
+            configure_action_journal({})
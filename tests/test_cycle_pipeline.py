@@ -0,0 +1,146 @@
+"""
+Tests for the pipelined monitoring cycle
+"""
+
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from src.gh_pr_phase_monitor import snapshot_diff
+from src.gh_pr_phase_monitor.cycle_pipeline import run_pipelined_cycle
+from src.gh_pr_phase_monitor.pr_fetcher import REPOSITORIES_BATCH_SIZE, iter_pr_details_batches
+from src.gh_pr_phase_monitor.snapshot_diff import diff_snapshot, is_pr_delta
+
+
+def _pr(number, review_requested=False):
+    # A draft PR is "LLM working" until a review is requested (phase1)
+    return {
+        "isDraft": True,
+        "reviews": [],
+        "latestReviews": [],
+        "reviewRequests": [{"login": "user1"}] if review_requested else [],
+        "repository": {"name": "repo", "owner": "o"},
+        "title": f"PR {number}",
+        "url": f"https://github.com/o/repo/pull/{number}",
+    }
+
+
+def _repos(count):
+    return [{"name": f"repo{i}", "owner": "o"} for i in range(count)]
+
+
+@pytest.fixture(autouse=True)
+def clean_snapshot():
+    snapshot_diff.reset_snapshot()
+    yield
+    snapshot_diff.reset_snapshot()
+
+
+class TestRunPipelinedCycle:
+    def test_first_batch_processed_before_second_is_fetched(self):
+        """Actions of the first batch run while the next batch is still being fetched"""
+        first_processed = threading.Event()
+        processed = []
+
+        def batches(_repos):
+            yield [_pr(1), _pr(2)]
+            # The second query only returns once the first batch was acted on
+            assert first_processed.wait(5)
+            yield [_pr(3)]
+
+        def process(pr, _config, _phase):
+            processed.append(pr["url"])
+            first_processed.set()
+
+        with (
+            patch("src.gh_pr_phase_monitor.cycle_pipeline.iter_pr_details_batches", batches),
+            patch("src.gh_pr_phase_monitor.cycle_pipeline.get_repositories_with_no_prs_and_open_issues"),
+        ):
+            result = run_pipelined_cycle(_repos(REPOSITORIES_BATCH_SIZE + 1), {}, process, full_reconcile=True)
+
+        assert [pr["url"] for pr in result.all_prs] == processed
+        assert len(processed) == 3
+        assert result.time_to_first_action is not None
+
+    def test_unchanged_prs_skipped(self):
+        """Without a full reconcile, only PRs changed since the previous snapshot are processed"""
+        prs = [_pr(1), _pr(2, review_requested=True)]
+        diff_snapshot([prs[0]], ["LLM working"])
+        processed = []
+
+        with patch("src.gh_pr_phase_monitor.cycle_pipeline.iter_pr_details_batches", lambda _repos: iter([prs])):
+            result = run_pipelined_cycle(_repos(1), {}, lambda pr, c, p: processed.append(pr["url"]), False)
+
+        assert processed == ["https://github.com/o/repo/pull/2"]
+        assert result.skipped_count == 1
+        assert result.pr_phases == ["LLM working", "phase1"]
+
+    def test_fetch_error_raised(self):
+        """An error of the fetch thread is raised in the caller"""
+
+        def batches(_repos):
+            yield [_pr(1)]
+            raise RuntimeError("GraphQL query failed")
+
+        with patch("src.gh_pr_phase_monitor.cycle_pipeline.iter_pr_details_batches", batches):
+            with pytest.raises(RuntimeError, match="GraphQL query failed"):
+                run_pipelined_cycle(_repos(REPOSITORIES_BATCH_SIZE + 1), {}, lambda *args: None, True)
+
+    def test_issue_prefetch_when_all_llm_working(self):
+        """Repositories with open issues are fetched in the background when all PRs are LLM working"""
+        with (
+            patch("src.gh_pr_phase_monitor.cycle_pipeline.iter_pr_details_batches", lambda _repos: iter([[_pr(1)]])),
+            patch(
+                "src.gh_pr_phase_monitor.cycle_pipeline.get_repositories_with_no_prs_and_open_issues",
+                return_value=[{"name": "other", "owner": "o", "openIssueCount": 2}],
+            ),
+        ):
+            result = run_pipelined_cycle(_repos(1), {}, lambda *args: None, True)
+            assert result.prefetched_repos_with_issues() == [{"name": "other", "owner": "o", "openIssueCount": 2}]
+
+    def test_no_issue_prefetch_with_actionable_prs(self):
+        """Nothing is prefetched when a PR is not LLM working"""
+        with (
+            patch(
+                "src.gh_pr_phase_monitor.cycle_pipeline.iter_pr_details_batches",
+                lambda _repos: iter([[_pr(1), _pr(2, review_requested=True)]]),
+            ),
+            patch("src.gh_pr_phase_monitor.cycle_pipeline.get_repositories_with_no_prs_and_open_issues") as mock_fetch,
+        ):
+            result = run_pipelined_cycle(_repos(1), {}, lambda *args: None, True)
+
+        assert result.prefetched_repos_with_issues() is None
+        mock_fetch.assert_not_called()
+
+
+class TestIsPrDelta:
+    def test_matches_snapshot_diff(self):
+        """is_pr_delta agrees with the diff computed at the end of the cycle"""
+        unchanged, changed = _pr(1), _pr(2)
+        diff_snapshot([unchanged, changed], ["LLM working", "LLM working"])
+        changed = {**changed, "title": "Renamed"}
+        added = _pr(3)
+
+        deltas = [is_pr_delta(pr, "LLM working") for pr in (unchanged, changed, added)]
+        diff = diff_snapshot([unchanged, changed, added], ["LLM working"] * 3)
+
+        assert deltas == [diff.is_delta(pr["url"]) for pr in (unchanged, changed, added)] == [False, True, True]
+
+
+class TestIterPrDetailsBatches:
+    def test_one_query_per_batch(self):
+        """Each batch's PRs are yielded after its own query"""
+        calls = []
+
+        def query(_query):
+            calls.append(_query)
+            return {"data": {}}
+
+        repos = _repos(REPOSITORIES_BATCH_SIZE + 1)
+        with patch("src.gh_pr_phase_monitor.pr_fetcher.execute_graphql_query", side_effect=query):
+            batches = iter_pr_details_batches(repos)
+            assert next(batches) == []
+            assert len(calls) == 1
+            assert list(batches) == [[]]
+            assert len(calls) == 2
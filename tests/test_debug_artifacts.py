@@ -0,0 +1,149 @@
+"""
+Tests for the bounded debug artifact store
+"""
+
+import json
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+from src.gh_pr_phase_monitor import debug_artifacts
+from src.gh_pr_phase_monitor.debug_artifacts import DebugArtifactStore, perceptual_hash
+
+
+class FakeImage:
+    """Minimal PIL image stand-in: 9x8 grayscale thumbnail and a fixed encoded size"""
+
+    def __init__(self, pixels, size=1000, gate=None):
+        self.pixels = pixels
+        self.size = size
+        self.gate = gate
+
+    def convert(self, mode):
+        if self.gate is not None:
+            self.gate.wait(5)
+        return self
+
+    def resize(self, size):
+        return self
+
+    def getdata(self):
+        return self.pixels
+
+    def save(self, path, optimize=False):
+        Path(path).write_bytes(b"x" * self.size)
+
+
+def _image(seed, size=1000):
+    """Image whose gradient pattern (and therefore hash) depends on seed"""
+    return FakeImage([(i * (seed + 1) * 37) % 256 for i in range(72)], size)
+
+
+BASE_TIME = datetime(2026, 1, 1, 12, 0, 0)
+
+
+def _submit(store, button, image, minutes):
+    store.submit(button, image, {"button_name": button}, BASE_TIME + timedelta(minutes=minutes))
+    store.flush()
+
+
+class TestPerceptualHash:
+    def test_similar_images_hash_alike(self):
+        """Small brightness changes do not change the difference hash"""
+        pixels = [(i * 37) % 256 for i in range(72)]
+        brighter = [min(255, p + 3) if p < 250 else p for p in pixels]
+
+        assert perceptual_hash(FakeImage(pixels)) is not None
+        assert bin(perceptual_hash(FakeImage(pixels)) ^ perceptual_hash(FakeImage(brighter))).count("1") <= 4
+
+    def test_unhashable_image(self):
+        """Images that cannot be reduced are not hashed (and never deduplicated)"""
+        assert perceptual_hash(object()) is None
+        assert perceptual_hash(FakeImage([])) is None
+
+
+class TestDebugArtifactStore:
+    def test_identical_failures_recorded_once(self, tmp_path):
+        """A repeated failure only increments occurrences in the existing JSON"""
+        store = DebugArtifactStore(tmp_path)
+        _submit(store, "merge_pull_request", _image(1), 0)
+        _submit(store, "merge_pull_request", _image(1), 5)
+
+        assert len(list(tmp_path.glob("*.png"))) == 1
+        info = json.loads(next(tmp_path.glob("*.json")).read_text(encoding="utf-8"))
+        assert info["occurrences"] == 2
+        assert info["last_seen"] == (BASE_TIME + timedelta(minutes=5)).isoformat()
+
+    def test_same_screen_for_other_button_is_kept(self, tmp_path):
+        """Deduplication is per button"""
+        store = DebugArtifactStore(tmp_path)
+        _submit(store, "merge_pull_request", _image(1), 0)
+        _submit(store, "confirm_merge", _image(1), 1)
+
+        assert len(list(tmp_path.glob("*.png"))) == 2
+
+    def test_ring_capped_by_count(self, tmp_path):
+        """The oldest artifacts are deleted once max_files is exceeded"""
+        store = DebugArtifactStore(tmp_path, max_files=2)
+        for minutes in range(3):
+            _submit(store, "assign", _image(minutes), minutes)
+
+        stems = sorted(path.stem for path in tmp_path.glob("*.png"))
+        assert stems == ["assign_fail_20260101_120100_000000", "assign_fail_20260101_120200_000000"]
+        assert len(list(tmp_path.glob("*.json"))) == 2
+
+    def test_ring_capped_by_bytes(self, tmp_path):
+        """The oldest artifacts are deleted once max_bytes is exceeded"""
+        store = DebugArtifactStore(tmp_path, max_bytes=5000)
+        for minutes in range(3):
+            _submit(store, "assign", _image(minutes, size=2000), minutes)
+
+        count, total = store.stats()
+        assert count == 2
+        assert total <= 5000
+
+    def test_previous_run_artifacts_counted(self, tmp_path):
+        """Artifacts left by a previous run are part of the ring"""
+        for name in ("old_fail_1.png", "old_fail_1.json", "unrelated.txt"):
+            (tmp_path / name).write_bytes(b"x")
+        store = DebugArtifactStore(tmp_path, max_files=1)
+
+        _submit(store, "assign", _image(1), 0)
+
+        assert not (tmp_path / "old_fail_1.png").exists()
+        assert (tmp_path / "unrelated.txt").exists()
+
+    def test_backlog_full_drops_capture(self, tmp_path):
+        """Captures are dropped instead of piling up while the writer is busy"""
+        gate = threading.Event()
+        store = DebugArtifactStore(tmp_path)
+        try:
+            results = [
+                store.submit("assign", FakeImage(list(range(72)), gate=gate), {})
+                for _ in range(debug_artifacts.MAX_PENDING_CAPTURES + 1)
+            ]
+        finally:
+            gate.set()
+            store.flush()
+
+        assert results[-1] is False
+        assert all(results[:-1])
+
+
+class TestSaveDebugInfoRegion:
+    @patch("src.gh_pr_phase_monitor.browser_automation.PYAUTOGUI_AVAILABLE", True)
+    @patch("src.gh_pr_phase_monitor.browser_automation._get_screenshot_path", return_value=None)
+    def test_captures_search_region_only(self, _mock_get_path, tmp_path):
+        """With a search_region, only that region is captured and it is recorded in the JSON"""
+        from src.gh_pr_phase_monitor.browser_automation import _save_debug_info
+
+        with patch("src.gh_pr_phase_monitor.browser_automation.pyautogui") as mock_pyautogui:
+            mock_pyautogui.screenshot.return_value = _image(3)
+            _save_debug_info("assign", 0.8, {"debug_dir": str(tmp_path), "search_region": [10, 20, 300, 200]})
+            debug_artifacts.flush_debug_artifacts()
+
+        mock_pyautogui.screenshot.assert_called_once_with(region=(10, 20, 300, 200))
+        info = json.loads(next(tmp_path.glob("*.json")).read_text(encoding="utf-8"))
+        assert info["search_region"] == [10, 20, 300, 200]
+        assert info["occurrences"] == 1
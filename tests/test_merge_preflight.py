@@ -0,0 +1,110 @@
+"""
+Tests for merge pre-flight gating on the fetched merge state
+"""
+
+from unittest.mock import patch
+
+from src.gh_pr_phase_monitor import merge_preflight, pr_actions
+from src.gh_pr_phase_monitor.merge_preflight import get_merge_block_reason
+from src.gh_pr_phase_monitor.pr_actions import process_pr
+
+PR_URL = "https://github.com/test-owner/test-repo/pull/1"
+
+
+def _pr(**fields):
+    pr = {
+        "url": PR_URL,
+        "title": "Test PR",
+        "repository": {"name": "test-repo", "owner": "test-owner"},
+        "mergeable": "MERGEABLE",
+        "mergeStateStatus": "CLEAN",
+        "statusCheckRollup": "SUCCESS",
+    }
+    pr.update(fields)
+    return pr
+
+
+class TestGetMergeBlockReason:
+    """Test evaluation of mergeable, mergeStateStatus and check rollup"""
+
+    def setup_method(self):
+        """Reset the merge wait state before each test"""
+        merge_preflight._merge_waiting.clear()
+
+    def test_clean_pr_can_merge(self):
+        """A clean PR with passing checks is not blocked"""
+        assert get_merge_block_reason(_pr()) is None
+
+    def test_no_checks_can_merge(self):
+        """A PR without any checks configured is not blocked"""
+        assert get_merge_block_reason(_pr(statusCheckRollup=None)) is None
+
+    def test_blocked_states(self):
+        """Conflicts, pending checks and non-clean states block the merge"""
+        assert get_merge_block_reason(_pr(mergeable="CONFLICTING", mergeStateStatus="DIRTY")) == "mergeable=CONFLICTING"
+        assert get_merge_block_reason(_pr(mergeStateStatus="BEHIND")) == "mergeStateStatus=BEHIND"
+        assert get_merge_block_reason(_pr(mergeStateStatus="BLOCKED")) == "mergeStateStatus=BLOCKED"
+        assert get_merge_block_reason(_pr(statusCheckRollup="PENDING")) == "checks=PENDING"
+
+    def test_pr_without_merge_state_not_gated(self):
+        """PRs without fetched merge state are not gated"""
+        pr = _pr()
+        del pr["mergeStateStatus"]
+
+        assert get_merge_block_reason(pr) is None
+
+    def test_wait_state_reevaluated_only_on_change(self):
+        """The decision is cached until the PR fingerprint changes"""
+        blocked = _pr(statusCheckRollup="PENDING")
+        assert get_merge_block_reason(blocked) == "checks=PENDING"
+
+        with patch("src.gh_pr_phase_monitor.merge_preflight._evaluate_merge_state") as mock_evaluate:
+            assert get_merge_block_reason(blocked) == "checks=PENDING"
+            mock_evaluate.assert_not_called()
+
+        assert get_merge_block_reason(_pr(statusCheckRollup="SUCCESS")) is None
+        assert PR_URL not in merge_preflight._merge_waiting
+
+
+class TestProcessPrMergeGate:
+    """Test that process_pr skips the comment and merge while the PR is not mergeable"""
+
+    def setup_method(self):
+        """Reset global state before each test"""
+        merge_preflight._merge_waiting.clear()
+        pr_actions._browser_opened.clear()
+        pr_actions._notifications_sent.clear()
+        pr_actions._merged_prs.clear()
+        pr_actions._merge_comment_posted.clear()
+        pr_actions._actions_pending.clear()
+
+    def _config(self):
+        return {
+            "phase3_merge": {"comment": "Merging"},
+            "rulesets": [{"repositories": ["test-repo"], "enable_execution_phase3_to_merge": True}],
+        }
+
+    def test_blocked_pr_gets_no_comment(self):
+        """No pre-merge comment or merge while checks are failing, and no retry is scheduled"""
+        with (
+            patch("src.gh_pr_phase_monitor.pr_actions.open_browser", return_value=True),
+            patch("src.gh_pr_phase_monitor.pr_actions.post_phase3_comment") as mock_comment,
+            patch("src.gh_pr_phase_monitor.pr_actions.merge_pr") as mock_merge,
+        ):
+            process_pr(_pr(statusCheckRollup="FAILURE"), self._config(), "phase3")
+
+            mock_comment.assert_not_called()
+            mock_merge.assert_not_called()
+            assert not pr_actions.has_pending_actions(PR_URL)
+
+    def test_clean_pr_is_merged(self):
+        """A clean PR is commented on and merged"""
+        with (
+            patch("src.gh_pr_phase_monitor.pr_actions.open_browser", return_value=True),
+            patch("src.gh_pr_phase_monitor.pr_actions.post_phase3_comment", return_value=True) as mock_comment,
+            patch("src.gh_pr_phase_monitor.pr_actions.merge_pr", return_value=True) as mock_merge,
+        ):
+            process_pr(_pr(), self._config(), "phase3")
+
+            mock_comment.assert_called_once()
+            mock_merge.assert_called_once()
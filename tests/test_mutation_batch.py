@@ -0,0 +1,281 @@
+"""
+Tests for batched GraphQL mutations of PR actions
+"""
+
+import json
+import subprocess
+from unittest.mock import patch
+
+from src.gh_pr_phase_monitor import pr_actions
+from src.gh_pr_phase_monitor.graphql_client import execute_graphql_mutation
+from src.gh_pr_phase_monitor.mutation_batch import (
+    MutationBatch,
+    batched_mutations,
+    get_active_batch,
+)
+from src.gh_pr_phase_monitor.phase_detector import PHASE_1, PHASE_3
+from src.gh_pr_phase_monitor.pr_actions import process_pr
+
+PR_URL = "https://github.com/owner/repo/pull/1"
+
+
+class TestMutationBatch:
+    """Test mutation document building and per-alias result mapping"""
+
+    @patch("src.gh_pr_phase_monitor.mutation_batch.execute_graphql_mutation")
+    def test_actions_sent_in_one_document(self, mock_execute):
+        """Independent actions are sent in a single aliased mutation"""
+        mock_execute.return_value = {"data": {"a0": {"clientMutationId": None}, "a1": {"clientMutationId": None}}}
+        batch = MutationBatch()
+        batch.add_mark_ready("PR_1", PR_URL)
+        batch.add_comment("PR_2", "https://github.com/owner/repo/pull/2", 'say "hi"')
+
+        results = batch.execute()
+
+        assert results == {"a0": True, "a1": True}
+        assert mock_execute.call_count == 1
+        document = mock_execute.call_args[0][0]
+        assert 'a0: markPullRequestReadyForReview(input: {pullRequestId: "PR_1"})' in document
+        assert 'a1: addComment(input: {subjectId: "PR_2", body: "say \\"hi\\""})' in document
+
+    @patch("src.gh_pr_phase_monitor.mutation_batch.execute_graphql_mutation")
+    def test_per_alias_failure(self, mock_execute):
+        """Errors are mapped back to the failing alias only"""
+        mock_execute.return_value = {
+            "data": {"a0": None, "a1": {"clientMutationId": None}},
+            "errors": [{"path": ["a0"], "message": "Pull request is not a draft"}],
+        }
+        outcomes = []
+        batch = MutationBatch()
+        batch.add_mark_ready("PR_1", PR_URL, on_result=lambda success, error: outcomes.append((success, error)))
+        batch.add_mark_ready("PR_2", PR_URL)
+
+        results = batch.execute()
+
+        assert results == {"a0": False, "a1": True}
+        assert outcomes == [(False, "Pull request is not a draft")]
+
+    @patch("src.gh_pr_phase_monitor.mutation_batch.execute_graphql_mutation")
+    def test_dependent_action_sent_in_next_round(self, mock_execute):
+        """A merge is only sent after its pre-merge comment succeeded"""
+        mock_execute.side_effect = [
+            {"data": {"a0": {"clientMutationId": None}}},
+            {"data": {"a1": {"pullRequest": {"merged": True}}}},
+        ]
+        batch = MutationBatch()
+        comment_key = batch.add_comment("PR_1", PR_URL, "merging")
+        batch.add_merge("PR_1", PR_URL, depends_on=comment_key)
+
+        results = batch.execute()
+
+        assert results == {"a0": True, "a1": True}
+        assert batch.request_count == 2
+        assert "mergeMethod: SQUASH" in mock_execute.call_args_list[1][0][0]
+
+    @patch("src.gh_pr_phase_monitor.mutation_batch.execute_graphql_mutation")
+    def test_dependent_action_skipped_on_failure(self, mock_execute):
+        """A merge is not sent when the pre-merge comment failed"""
+        mock_execute.return_value = {"data": {"a0": None}, "errors": [{"path": ["a0"], "message": "denied"}]}
+        batch = MutationBatch()
+        comment_key = batch.add_comment("PR_1", PR_URL, "merging")
+        merge_key = batch.add_merge("PR_1", PR_URL, depends_on=comment_key)
+        batch.add_delete_ref("REF_1", PR_URL, depends_on=merge_key)
+
+        results = batch.execute()
+
+        assert results == {"a0": False, "a1": False, "a2": False}
+        assert mock_execute.call_count == 1
+
+    @patch("src.gh_pr_phase_monitor.mutation_batch.execute_graphql_mutation")
+    def test_request_failure_fails_round(self, mock_execute):
+        """A failed request marks every action of the round as failed"""
+        mock_execute.side_effect = RuntimeError("network down")
+        batch = MutationBatch()
+        batch.add_mark_ready("PR_1", PR_URL)
+        batch.add_mark_ready("PR_2", PR_URL)
+
+        assert batch.execute() == {"a0": False, "a1": False}
+
+
+class TestExecuteGraphqlMutation:
+    """Test that partial GraphQL errors are returned instead of raised"""
+
+    @patch("src.gh_pr_phase_monitor.graphql_client.subprocess.run")
+    def test_partial_errors_returned(self, mock_run):
+        """gh exits non-zero on GraphQL errors but the body is still parsed"""
+        body = {"data": {"a0": None}, "errors": [{"path": ["a0"], "message": "denied"}]}
+        mock_run.side_effect = subprocess.CalledProcessError(
+            1, ["gh"], output=json.dumps(body), stderr="GraphQL: denied"
+        )
+
+        assert execute_graphql_mutation("mutation { a0: x }") == body
+
+
+class TestProcessPrWithBatch:
+    """Test that process_pr queues actions while a batch is active"""
+
+    def setup_method(self):
+        """Reset global state before each test"""
+        pr_actions._merged_prs.clear()
+        pr_actions._merge_comment_posted.clear()
+        pr_actions._actions_pending.clear()
+        pr_actions._browser_opened.clear()
+        pr_actions._notifications_sent.clear()
+        pr_actions._auto_merge_enabled.clear()
+
+    def _config(self, **flags):
+        return {"rulesets": [{"repositories": ["all"], **flags}], "phase3_merge": {"comment": "merging"}}
+
+    @patch("src.gh_pr_phase_monitor.pr_actions.mark_pr_ready")
+    @patch("src.gh_pr_phase_monitor.mutation_batch.execute_graphql_mutation")
+    def test_mark_ready_is_batched(self, mock_execute, mock_mark_ready):
+        """Phase1 mark ready is sent as a mutation instead of gh pr ready"""
+        mock_execute.return_value = {"data": {"a0": {"clientMutationId": None}}}
+        pr = {"id": "PR_1", "url": PR_URL, "title": "t", "repository": {"name": "repo", "owner": "owner"}}
+
+        with batched_mutations(True):
+            process_pr(pr, self._config(enable_execution_phase1_to_phase2=True), PHASE_1)
+
+        mock_mark_ready.assert_not_called()
+        assert "markPullRequestReadyForReview" in mock_execute.call_args[0][0]
+        assert get_active_batch() is None
+
+    @patch("src.gh_pr_phase_monitor.pr_actions.open_browser", return_value=True)
+    @patch("src.gh_pr_phase_monitor.pr_actions.merge_pr")
+    @patch("src.gh_pr_phase_monitor.mutation_batch.execute_graphql_mutation")
+    def test_merge_is_batched(self, mock_execute, mock_merge_pr, _mock_open_browser):
+        """Phase3 comment, merge and branch deletion are batched and the PR is marked merged"""
+        mock_execute.side_effect = [
+            {"data": {"a0": {"clientMutationId": None}}},
+            {"data": {"a1": {"pullRequest": {"merged": True}}}},
+            {"data": {"a2": {"clientMutationId": None}}},
+        ]
+        pr = {
+            "id": "PR_1",
+            "headRefId": "REF_1",
+            "url": PR_URL,
+            "title": "t",
+            "repository": {"name": "repo", "owner": "owner"},
+        }
+
+        with batched_mutations(True):
+            process_pr(pr, self._config(enable_execution_phase3_to_merge=True), PHASE_3)
+
+        mock_merge_pr.assert_not_called()
+        assert mock_execute.call_count == 3
+        assert "deleteRef" in mock_execute.call_args_list[2][0][0]
+        assert PR_URL in pr_actions._merged_prs
+        assert not pr_actions.has_pending_actions(PR_URL)
+
+    @patch("src.gh_pr_phase_monitor.pr_actions.open_browser", return_value=True)
+    @patch("src.gh_pr_phase_monitor.mutation_batch.execute_graphql_mutation")
+    def test_auto_merge_is_batched(self, mock_execute, _mock_open_browser):
+        """With auto_merge, enablePullRequestAutoMerge replaces the merge and branch deletion"""
+        mock_execute.side_effect = [
+            {"data": {"a0": {"clientMutationId": None}}},
+            {"data": {"a1": {"clientMutationId": None}}},
+        ]
+        pr = {
+            "id": "PR_1",
+            "headRefId": "REF_1",
+            "url": PR_URL,
+            "title": "t",
+            "repository": {"name": "repo", "owner": "owner"},
+        }
+        config = self._config(enable_execution_phase3_to_merge=True)
+        config["phase3_merge"]["auto_merge"] = True
+
+        with batched_mutations(True):
+            process_pr(pr, config, PHASE_3)
+
+        assert mock_execute.call_count == 2
+        assert "enablePullRequestAutoMerge" in mock_execute.call_args_list[1][0][0]
+        assert PR_URL in pr_actions._auto_merge_enabled
+        assert PR_URL not in pr_actions._merged_prs
+
+    @patch("src.gh_pr_phase_monitor.pr_actions.open_browser", return_value=True)
+    @patch("src.gh_pr_phase_monitor.mutation_batch.execute_graphql_mutation")
+    def test_clean_pr_merged_instead_of_auto_merge(self, mock_execute, _mock_open_browser):
+        """With auto_merge, a PR that is already CLEAN is merged (GitHub refuses auto-merge on it)"""
+        mock_execute.side_effect = [
+            {"data": {"a0": {"clientMutationId": None}}},
+            {"data": {"a1": {"pullRequest": {"merged": True}}}},
+            {"data": {"a2": {"clientMutationId": None}}},
+        ]
+        pr = {
+            "id": "PR_1",
+            "headRefId": "REF_1",
+            "url": PR_URL,
+            "title": "t",
+            "repository": {"name": "repo", "owner": "owner"},
+            "mergeable": "MERGEABLE",
+            "mergeStateStatus": "CLEAN",
+            "statusCheckRollup": "SUCCESS",
+        }
+        config = self._config(enable_execution_phase3_to_merge=True)
+        config["phase3_merge"]["auto_merge"] = True
+
+        with batched_mutations(True):
+            process_pr(pr, config, PHASE_3)
+
+        documents = [call[0][0] for call in mock_execute.call_args_list]
+        assert not any("enablePullRequestAutoMerge" in document for document in documents)
+        assert "mergePullRequest" in documents[1]
+        assert "deleteRef" in documents[2]
+        assert PR_URL in pr_actions._merged_prs
+
+    @patch("src.gh_pr_phase_monitor.pr_actions.open_browser", return_value=True)
+    @patch("src.gh_pr_phase_monitor.mutation_batch.execute_graphql_mutation")
+    def test_failed_merge_does_not_repeat_comment(self, mock_execute, _mock_open_browser):
+        """Without an action journal, a retried merge does not post the pre-merge comment again"""
+        mock_execute.side_effect = [
+            {"data": {"a0": {"clientMutationId": None}}},
+            {"data": {"a1": None}, "errors": [{"path": ["a1"], "message": "Base branch was modified"}]},
+            {"data": {"a0": {"pullRequest": {"merged": True}}}},
+            {"data": {"a1": {"clientMutationId": None}}},
+        ]
+        pr = {
+            "id": "PR_1",
+            "headRefId": "REF_1",
+            "url": PR_URL,
+            "title": "t",
+            "repository": {"name": "repo", "owner": "owner"},
+        }
+        config = self._config(enable_execution_phase3_to_merge=True)
+
+        for _cycle in range(2):
+            with batched_mutations(True):
+                process_pr(pr, config, PHASE_3)
+
+        documents = [call[0][0] for call in mock_execute.call_args_list]
+        assert sum("addComment" in document for document in documents) == 1
+        assert "mergePullRequest" in documents[2]
+        assert PR_URL in pr_actions._merged_prs
+
+    @patch("src.gh_pr_phase_monitor.mutation_batch.execute_graphql_mutation")
+    def test_failed_mutation_marks_pending(self, mock_execute):
+        """A failed batched action is retried in the next cycle"""
+        mock_execute.return_value = {"data": {"a0": None}, "errors": [{"path": ["a0"], "message": "denied"}]}
+        pr = {"id": "PR_1", "url": PR_URL, "title": "t", "repository": {"name": "repo", "owner": "owner"}}
+
+        with batched_mutations(True):
+            process_pr(pr, self._config(enable_execution_phase1_to_phase2=True), PHASE_1)
+
+        assert pr_actions.has_pending_actions(PR_URL)
+
+    @patch("src.gh_pr_phase_monitor.pr_actions.mark_pr_ready", return_value=True)
+    def test_pr_without_node_id_runs_immediately(self, mock_mark_ready):
+        """PRs without a node id fall back to the gh CLI"""
+        pr = {"url": PR_URL, "title": "t", "repository": {"name": "repo", "owner": "owner"}}
+
+        with batched_mutations(True) as batch:
+            process_pr(pr, self._config(enable_execution_phase1_to_phase2=True), PHASE_1)
+            assert len(batch) == 0
+
+        mock_mark_ready.assert_called_once()
+
+    def test_batching_disabled(self):
+        """No batch is active when batching is disabled"""
+        with batched_mutations(False) as batch:
+            assert batch is None
+            assert get_active_batch() is None
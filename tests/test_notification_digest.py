@@ -0,0 +1,173 @@
+"""
+Tests for coalescing phase3 notifications into digests
+"""
+
+from unittest.mock import patch
+
+from src.gh_pr_phase_monitor import notification_digest, pr_actions
+from src.gh_pr_phase_monitor.notification_digest import (
+    NotificationDigest,
+    build_digest_notification,
+    flush_notification_digest,
+    notify_all_phase3_transition,
+)
+from src.gh_pr_phase_monitor.pr_actions import process_pr
+
+CONFIG = {
+    "ntfy": {"enabled": True, "topic": "my-topic", "message": "Ready: {url}", "digest": True},
+    "rulesets": [{"repositories": ["repo"], "enable_execution_phase3_send_ntfy": True}],
+}
+
+
+def _items(count):
+    return [(f"https://github.com/o/repo/pull/{i}", f"PR {i}", None) for i in range(1, count + 1)]
+
+
+def _pr(number):
+    return {
+        "isDraft": False,
+        "reviews": [{"author": {"login": "copilot-pull-request-reviewer"}, "state": "APPROVED", "body": "LGTM"}],
+        "latestReviews": [{"author": {"login": "copilot-pull-request-reviewer"}, "state": "APPROVED"}],
+        "repository": {"name": "repo", "owner": "o"},
+        "title": f"PR {number}",
+        "url": f"https://github.com/o/repo/pull/{number}",
+    }
+
+
+class TestNotificationDigest:
+    def test_duplicate_pr_collected_once(self):
+        """A PR added twice appears once in the digest"""
+        digest = NotificationDigest()
+        digest.add("https://github.com/o/repo/pull/1", "PR 1")
+        digest.add("https://github.com/o/repo/pull/1", "PR 1")
+
+        assert digest.pending() == ["https://github.com/o/repo/pull/1"]
+
+    def test_debounce_window(self):
+        """Notifications are held until none was added for the window"""
+        digest = NotificationDigest()
+        digest.add("https://github.com/o/repo/pull/1", "PR 1")
+        added = digest._last_added
+
+        assert digest.take_if_due(300, now=added + 10) == []
+        assert len(digest.take_if_due(300, now=added + 300)) == 1
+        assert digest.pending() == []
+
+
+class TestBuildDigestNotification:
+    def test_single_pr_uses_phase3_notification(self):
+        """One PR gets the usual phase3 message"""
+        notification = build_digest_notification(CONFIG, _items(1))
+
+        assert notification["message"] == "Ready: https://github.com/o/repo/pull/1"
+        assert notification["actions"] == "view,Open PR,https://github.com/o/repo/pull/1"
+
+    def test_many_prs_summarised_with_three_actions(self):
+        """Every PR is listed, but only the first three get action buttons"""
+        notification = build_digest_notification(CONFIG, _items(5))
+
+        assert notification["title"] == "5 PRs ready for review"
+        lines = notification["message"].split("\n")
+        assert lines[0] == "5 PRs are ready for review (buttons for the first 3)"
+        assert lines[1:] == [f"- PR {i}: https://github.com/o/repo/pull/{i}" for i in range(1, 6)]
+        assert notification["actions"].count("view, ") == 3
+        assert notification["priority"] == 4
+
+    def test_action_label_sanitised(self):
+        """Commas and semicolons in titles do not break the Actions header"""
+        items = [("https://github.com/o/repo/pull/9", "Fix a, b; c", None)] + _items(1)
+        notification = build_digest_notification(CONFIG, items)
+
+        assert notification["actions"].startswith("view, Fix a b c, https://github.com/o/repo/pull/9; ")
+
+    def test_not_configured(self):
+        """Without a topic there is nothing to send"""
+        assert build_digest_notification({"ntfy": {"enabled": True}}, _items(2)) is None
+
+
+class TestFlushNotificationDigest:
+    def setup_method(self):
+        notification_digest._digest = NotificationDigest()
+
+    def test_flush_sends_one_message(self):
+        """The collected notifications are sent as one message and each callback gets the result"""
+        results = []
+        for url, title, _on_result in _items(2):
+            notification_digest.add_to_digest(url, title, results.append)
+
+        with patch("src.gh_pr_phase_monitor.notification_digest.send_ntfy_notification", return_value=True) as mock:
+            assert flush_notification_digest(CONFIG) == 2
+            assert flush_notification_digest(CONFIG) == 0
+
+        mock.assert_called_once()
+        assert results == [True, True]
+
+    def test_flush_waits_for_window(self):
+        """Nothing is sent while the debounce window is running"""
+        config = {**CONFIG, "ntfy": {**CONFIG["ntfy"], "digest_window": "5m"}}
+        notification_digest.add_to_digest("https://github.com/o/repo/pull/1", "PR 1")
+
+        with patch("src.gh_pr_phase_monitor.notification_digest.send_ntfy_notification") as mock:
+            assert flush_notification_digest(config) == 0
+
+        mock.assert_not_called()
+        assert notification_digest.get_digest_pending() == ["https://github.com/o/repo/pull/1"]
+
+
+class TestAllPhase3Transition:
+    def setup_method(self):
+        notification_digest._all_phase3 = False
+
+    def test_sent_once_on_transition(self):
+        """The all-phase3 message is sent when all PRs reach phase3, not on every cycle"""
+        prs = [_pr(1), _pr(2)]
+        with patch(
+            "src.gh_pr_phase_monitor.notification_digest.send_all_phase3_notification", return_value=True
+        ) as mock:
+            assert notify_all_phase3_transition(CONFIG, prs, ["phase2", "phase3"]) is False
+            assert notify_all_phase3_transition(CONFIG, prs, ["phase3", "phase3"]) is True
+            assert notify_all_phase3_transition(CONFIG, prs, ["phase3", "phase3"]) is False
+
+        mock.assert_called_once_with(CONFIG)
+
+    def test_dry_run_without_execution(self):
+        """Without enable_execution_phase3_send_ntfy the message is not sent"""
+        config = {"ntfy": CONFIG["ntfy"]}
+        with patch("src.gh_pr_phase_monitor.notification_digest.send_all_phase3_notification") as mock:
+            assert notify_all_phase3_transition(config, [_pr(1)], ["phase3"]) is False
+
+        mock.assert_not_called()
+
+    def test_disabled_without_digest(self):
+        """Without digest mode the all-phase3 message is left to the caller"""
+        config = {**CONFIG, "ntfy": {**CONFIG["ntfy"], "digest": False}}
+        with patch("src.gh_pr_phase_monitor.notification_digest.send_all_phase3_notification") as mock:
+            assert notify_all_phase3_transition(config, [_pr(1)], ["phase3"]) is False
+
+        mock.assert_not_called()
+
+
+class TestProcessPrDigest:
+    def setup_method(self):
+        notification_digest._digest = NotificationDigest()
+        pr_actions._browser_opened.clear()
+        pr_actions._notifications_sent.clear()
+
+    def teardown_method(self):
+        notification_digest._digest = NotificationDigest()
+        pr_actions._notifications_sent.clear()
+
+    def test_phase3_pr_added_to_digest(self):
+        """In digest mode phase3 PRs are collected instead of notified one by one"""
+        with (
+            patch("src.gh_pr_phase_monitor.pr_actions.open_browser"),
+            patch("src.gh_pr_phase_monitor.pr_actions.send_phase3_notification") as mock_notify,
+        ):
+            process_pr(_pr(1), CONFIG)
+            process_pr(_pr(2), CONFIG)
+
+        mock_notify.assert_not_called()
+        assert notification_digest.get_digest_pending() == [
+            "https://github.com/o/repo/pull/1",
+            "https://github.com/o/repo/pull/2",
+        ]
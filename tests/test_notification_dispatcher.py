@@ -0,0 +1,194 @@
+"""
+Tests for the asynchronous ntfy notification dispatcher
+"""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+from src.gh_pr_phase_monitor import notification_dispatcher, pr_actions
+from src.gh_pr_phase_monitor.notification_dispatcher import NotificationDispatcher, QueuedNotification
+from src.gh_pr_phase_monitor.notifier import queue_phase3_notification
+
+
+class FakeNtfyServer:
+    """Local ntfy stand-in recording requests; answers with queued status codes (default 200)"""
+
+    def __init__(self):
+        self.requests = []
+        self.statuses = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                server.requests.append((self.path, body, dict(self.headers), self.client_address, time.monotonic()))
+                status = server.statuses.pop(0) if server.statuses else 200
+                self.send_response(status)
+                self.send_header("Content-Length", "2")
+                self.end_headers()
+                self.wfile.write(b"{}")
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        threading.Thread(target=self.httpd.serve_forever, args=(0.05,), daemon=True).start()
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+class TestNotificationDispatcher:
+    def setup_method(self):
+        self.server = FakeNtfyServer()
+        self.results = []
+
+    def teardown_method(self):
+        self.server.close()
+
+    def _dispatcher(self, **kwargs):
+        kwargs.setdefault("rate_limit_seconds", 0)
+        kwargs.setdefault("retry_backoff_seconds", 0.01)
+        return NotificationDispatcher(self.server.url, **kwargs)
+
+    def _notification(self, topic="topic", body=b"hello"):
+        return QueuedNotification(topic, body, {"Title": "PR"}, self.results.append)
+
+    def test_connection_reused(self):
+        """Several pushes share one keep-alive connection"""
+        dispatcher = self._dispatcher()
+        for i in range(3):
+            assert dispatcher.submit(self._notification(body=f"n{i}".encode()))
+        assert dispatcher.flush(timeout=5)
+        dispatcher.stop()
+
+        assert [request[1] for request in self.server.requests] == [b"n0", b"n1", b"n2"]
+        assert self.server.requests[0][0] == "/topic"
+        assert self.server.requests[0][2]["Title"] == "PR"
+        assert len({request[3] for request in self.server.requests}) == 1
+        assert dispatcher.connections_opened == 1
+        assert self.results == [True, True, True]
+
+    def test_retries_with_backoff(self):
+        """Server errors are retried until delivered"""
+        self.server.statuses = [503, 429]
+        dispatcher = self._dispatcher(max_retries=3)
+        dispatcher.submit(self._notification())
+        assert dispatcher.flush(timeout=5)
+        dispatcher.stop()
+
+        assert len(self.server.requests) == 3
+        assert self.results == [True]
+        assert dispatcher.outcomes["retried"] == 2
+        assert dispatcher.outcomes["sent"] == 1
+
+    def test_gives_up_after_max_retries(self):
+        """The result callback reports the failure once retries are exhausted"""
+        self.server.statuses = [500, 500, 500]
+        dispatcher = self._dispatcher(max_retries=1)
+        dispatcher.submit(self._notification())
+        assert dispatcher.flush(timeout=5)
+        dispatcher.stop()
+
+        assert len(self.server.requests) == 2
+        assert self.results == [False]
+        assert "HTTP 500" in dispatcher.last_error
+
+    def test_client_error_not_retried(self):
+        """4xx responses other than 429 fail immediately"""
+        self.server.statuses = [400]
+        dispatcher = self._dispatcher(max_retries=3)
+        dispatcher.submit(self._notification())
+        assert dispatcher.flush(timeout=5)
+        dispatcher.stop()
+
+        assert len(self.server.requests) == 1
+        assert self.results == [False]
+
+    def test_network_error_retried(self):
+        """Connection errors are retried over a new connection"""
+        dispatcher = NotificationDispatcher("http://127.0.0.1:1", max_retries=1, retry_backoff_seconds=0.01)
+        dispatcher.submit(self._notification())
+        assert dispatcher.flush(timeout=5)
+        dispatcher.stop()
+
+        assert self.results == [False]
+        assert dispatcher.outcomes["retried"] == 1
+
+    def test_per_topic_rate_limit(self):
+        """Pushes to one topic are spaced out; other topics are not held back"""
+        dispatcher = self._dispatcher(rate_limit_seconds=0.3)
+        dispatcher.submit(self._notification("a", b"a1"))
+        dispatcher.submit(self._notification("a", b"a2"))
+        dispatcher.submit(self._notification("b", b"b1"))
+        assert dispatcher.flush(timeout=5)
+        dispatcher.stop()
+
+        bodies = [request[1] for request in self.server.requests]
+        assert bodies == [b"a1", b"b1", b"a2"]
+        times = {request[1]: request[4] for request in self.server.requests}
+        assert times[b"a2"] - times[b"a1"] >= 0.25
+
+    def test_bounded_queue(self):
+        """Notifications beyond queue_size are refused"""
+        dispatcher = self._dispatcher(queue_size=1, rate_limit_seconds=60)
+        dispatcher.submit(self._notification())
+        dispatcher.flush(timeout=5)
+        dispatcher.submit(self._notification())  # waits for the rate limit
+
+        assert dispatcher.submit(self._notification()) is False
+        assert dispatcher.outcomes["dropped"] == 1
+        dispatcher.stop()
+
+
+class TestPhase3NotificationViaDispatcher:
+    def setup_method(self):
+        self.server = FakeNtfyServer()
+        notification_dispatcher._dispatcher = NotificationDispatcher(self.server.url, rate_limit_seconds=0)
+        pr_actions._notifications_sent.clear()
+
+    def teardown_method(self):
+        notification_dispatcher._dispatcher.stop()
+        notification_dispatcher._dispatcher = None
+        self.server.close()
+        pr_actions._notifications_sent.clear()
+
+    def test_queue_phase3_notification(self):
+        """The phase3 notification is built as in the synchronous path and delivered in the background"""
+        config = {"ntfy": {"enabled": True, "topic": "my-topic", "message": "Ready: {url}"}}
+        results = []
+
+        assert queue_phase3_notification(config, "https://github.com/o/r/pull/1", "Fix", results.append)
+        notification_dispatcher._dispatcher.flush(timeout=5)
+
+        path, body, headers, _client, _time = self.server.requests[0]
+        assert path == "/my-topic"
+        assert body == b"Ready: https://github.com/o/r/pull/1"
+        assert headers["Actions"] == "view,Open PR,https://github.com/o/r/pull/1"
+        assert headers["Priority"] == "4"
+        assert results == [True]
+
+    def test_failed_delivery_allows_retry_next_cycle(self):
+        """A notification given up after retries is not remembered as sent"""
+        key = ("https://github.com/o/r/pull/1", "phase3")
+        pr_actions._notifications_sent.add(key)
+
+        with patch("src.gh_pr_phase_monitor.pr_actions.finish_action") as mock_finish:
+            pr_actions._notification_result_handler(*key)(False)
+
+        mock_finish.assert_called_once_with(key[0], key[1], "ntfy", False)
+        assert key not in pr_actions._notifications_sent
+
+    def test_summary_reports_outcomes(self):
+        """The status summary shows the delivery outcomes"""
+        config = {"ntfy": {"enabled": True, "topic": "my-topic"}}
+        queue_phase3_notification(config, "https://github.com/o/r/pull/1", "Fix")
+        notification_dispatcher._dispatcher.flush(timeout=5)
+
+        assert notification_dispatcher.get_notification_summary()[0].startswith("sent 1, pending 0")
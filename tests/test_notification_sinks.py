@@ -0,0 +1,277 @@
+"""
+Tests for the pluggable notification sinks
+"""
+
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.gh_pr_phase_monitor import notification_sinks, pr_actions
+from src.gh_pr_phase_monitor.notification_sinks import (
+    DesktopSink,
+    FileSink,
+    NotificationFanOut,
+    NotificationSink,
+    NtfySink,
+    WebhookSink,
+    build_notification_sinks,
+    parse_actions,
+)
+from src.gh_pr_phase_monitor.notifier import send_phase3_notification
+
+NOTIFICATION = {
+    "topic": "my-topic",
+    "message": "Ready: https://github.com/o/repo/pull/1",
+    "title": "Fix",
+    "priority": 4,
+    "actions": "view,Open PR,https://github.com/o/repo/pull/1",
+}
+
+
+class RecordingServer:
+    """Local HTTP endpoint recording POST requests"""
+
+    def __init__(self):
+        self.requests = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                server.requests.append((self.path, body, dict(self.headers)))
+                self.send_response(200)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        threading.Thread(target=self.httpd.serve_forever, args=(0.05,), daemon=True).start()
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def server():
+    recording_server = RecordingServer()
+    yield recording_server
+    recording_server.close()
+
+
+class FakeSink(NotificationSink):
+    """Sink answering from a list of results, optionally blocking until released"""
+
+    def __init__(self, name, results=(True,), gate=None, **policy):
+        super().__init__(name, **policy)
+        self.results = list(results)
+        self.gate = gate
+        self.calls = 0
+
+    def _send_once(self, notification):
+        self.calls += 1
+        if self.gate is not None:
+            self.gate.wait(5)
+        result = self.results.pop(0) if self.results else True
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+class TestSinks:
+    def test_ntfy_sink_self_hosted_server(self, server):
+        """The ntfy sink posts to its own server instead of ntfy.sh"""
+        assert NtfySink("local", server.url, "my-topic").send(NOTIFICATION)
+
+        path, body, headers = server.requests[0]
+        assert path == "/my-topic"
+        assert body == NOTIFICATION["message"].encode()
+        assert headers["Title"] == "Fix"
+
+    def test_ntfy_server_from_config(self, server):
+        """[ntfy] server also applies to the synchronous phase3 notification"""
+        config = {"ntfy": {"enabled": True, "topic": "t", "server": server.url + "/"}}
+
+        assert send_phase3_notification(config, "https://github.com/o/repo/pull/1", "Fix")
+        assert server.requests[0][0] == "/t"
+
+    def test_webhook_sink_posts_json(self, server):
+        """The webhook receives the notification as JSON with parsed action links"""
+        sink = WebhookSink("hook", server.url + "/hook", {"Authorization": "Bearer x"})
+
+        assert sink.send(NOTIFICATION)
+        path, body, headers = server.requests[0]
+        assert path == "/hook"
+        assert headers["Authorization"] == "Bearer x"
+        assert json.loads(body) == {
+            "title": "Fix",
+            "message": NOTIFICATION["message"],
+            "priority": 4,
+            "actions": [{"label": "Open PR", "url": "https://github.com/o/repo/pull/1"}],
+        }
+
+    def test_file_sink_appends_json_lines(self, tmp_path):
+        """Each notification is one JSON line"""
+        path = tmp_path / "notifications.jsonl"
+        sink = FileSink("file", str(path))
+
+        assert sink.send(NOTIFICATION)
+        assert sink.send(NOTIFICATION)
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 2
+        assert json.loads(lines[0])["message"] == NOTIFICATION["message"]
+
+    @pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="FIFOs need a POSIX system")
+    def test_fifo_without_reader_fails_fast(self, tmp_path):
+        """Writing to a FIFO nobody reads fails instead of blocking"""
+        path = tmp_path / "fifo"
+        os.mkfifo(path)
+        sink = FileSink("fifo", str(path), max_retries=0)
+
+        started = time.monotonic()
+        assert sink.send(NOTIFICATION) is False
+        assert time.monotonic() - started < 1
+        assert "no reader" in sink.last_error
+
+    def test_desktop_sink_runs_notify_send(self):
+        """notify-send receives the title, message and an urgency derived from the priority"""
+        with patch("src.gh_pr_phase_monitor.notification_sinks.subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0)
+            assert DesktopSink("desktop", timeout=3).send({**NOTIFICATION, "priority": 5})
+
+        args = mock_run.call_args[0][0]
+        assert args == ["notify-send", "--urgency", "critical", "Fix", NOTIFICATION["message"]]
+        assert mock_run.call_args[1]["timeout"] == 3
+
+    def test_retry_policy(self):
+        """Failures and exceptions are retried up to max_retries"""
+        sink = FakeSink("flaky", results=[False, OSError("down"), True], max_retries=2, retry_backoff_seconds=0)
+        assert sink.send(NOTIFICATION)
+        assert sink.calls == 3
+
+        sink = FakeSink("broken", results=[False, False], max_retries=1, retry_backoff_seconds=0)
+        assert sink.send(NOTIFICATION) is False
+        assert sink.outcomes == {"sent": 0, "failed": 1}
+
+    def test_sink_without_send_once_cannot_be_created(self):
+        """NotificationSink is abstract: a subclass must implement _send_once"""
+
+        class IncompleteSink(NotificationSink):
+            pass
+
+        with pytest.raises(TypeError):
+            IncompleteSink("incomplete")
+
+    def test_parse_actions(self):
+        """Digest actions ("view, label, url; ...") are parsed as well"""
+        assert parse_actions("view, A, https://a; view, B, https://b") == [
+            {"label": "A", "url": "https://a"},
+            {"label": "B", "url": "https://b"},
+        ]
+        assert parse_actions(None) == []
+
+
+class TestFanOut:
+    def test_slow_sink_does_not_delay_others(self):
+        """A blocked sink neither delays the other sinks nor the caller"""
+        gate = threading.Event()
+        slow = FakeSink("slow", gate=gate)
+        fast = FakeSink("fast")
+        results = []
+        fan_out = NotificationFanOut([slow, fast])
+
+        started = time.monotonic()
+        slow_future, fast_future = fan_out.submit(NOTIFICATION, results.append)
+        assert time.monotonic() - started < 0.5
+        assert fast_future.result(timeout=5) is True
+        assert results == []
+
+        gate.set()
+        slow_future.result(timeout=5)
+        fan_out.shutdown(wait=True)
+        assert results == [True]
+
+    def test_result_true_if_any_sink_delivered(self):
+        """The result callback reports success when at least one sink delivered"""
+        results = []
+        fan_out = NotificationFanOut([FakeSink("a", results=[False], max_retries=0), FakeSink("b")])
+        fan_out.submit(NOTIFICATION, results.append)
+        fan_out.shutdown(wait=True)
+
+        assert results == [True]
+
+
+class TestBuildNotificationSinks:
+    def test_defaults_from_ntfy_section(self):
+        """ntfy sinks default to the [ntfy] server and topic"""
+        config = {
+            "ntfy": {"topic": "t", "server": "https://ntfy.example.com"},
+            "notification_sinks": [{"type": "ntfy", "timeout": 2, "max_retries": 0}],
+        }
+        (sink,) = build_notification_sinks(config)
+
+        assert (sink.server, sink.topic, sink.timeout, sink.max_retries) == ("https://ntfy.example.com", "t", 2, 0)
+
+    def test_invalid_entries_skipped(self):
+        """Unknown types and incomplete entries are ignored; invalid policies fall back to defaults"""
+        config = {
+            "notification_sinks": [
+                {"type": "carrier-pigeon"},
+                {"type": "webhook", "url": "ftp://example.com"},
+                {"type": "file"},
+                {"type": "desktop", "command": "no-such-notify-command"},
+                {"type": "file", "path": "/tmp/n.jsonl", "timeout": -1},
+            ]
+        }
+        (sink,) = build_notification_sinks(config)
+
+        assert isinstance(sink, FileSink)
+        assert sink.timeout == notification_sinks.DEFAULT_SINK_TIMEOUT_SECONDS
+
+
+class TestProcessPrFanOut:
+    def setup_method(self):
+        pr_actions._browser_opened.clear()
+        pr_actions._notifications_sent.clear()
+
+    def teardown_method(self):
+        notification_sinks.configure_notification_sinks({})
+        pr_actions._notifications_sent.clear()
+
+    def test_phase3_notification_fanned_out(self, tmp_path):
+        """With sinks configured, the phase3 notification goes to the sinks instead of ntfy.sh"""
+        path = tmp_path / "n.jsonl"
+        config = {
+            "ntfy": {"enabled": True, "message": "Ready: {url}"},
+            "notification_sinks": [{"type": "file", "path": str(path)}],
+            "rulesets": [{"repositories": ["repo"], "enable_execution_phase3_send_ntfy": True}],
+        }
+        notification_sinks.configure_notification_sinks(config)
+        pr = {
+            "isDraft": False,
+            "reviews": [{"author": {"login": "copilot-pull-request-reviewer"}, "state": "APPROVED", "body": "LGTM"}],
+            "latestReviews": [{"author": {"login": "copilot-pull-request-reviewer"}, "state": "APPROVED"}],
+            "repository": {"name": "repo", "owner": "o"},
+            "title": "Fix",
+            "url": "https://github.com/o/repo/pull/1",
+        }
+
+        with (
+            patch("src.gh_pr_phase_monitor.pr_actions.open_browser"),
+            patch("src.gh_pr_phase_monitor.pr_actions.send_phase3_notification") as mock_notify,
+        ):
+            pr_actions.process_pr(pr, config)
+        notification_sinks._fan_out.shutdown(wait=True)
+
+        mock_notify.assert_not_called()
+        record = json.loads(path.read_text(encoding="utf-8"))
+        assert record["message"] == "Ready: https://github.com/o/repo/pull/1"
+        assert notification_sinks.get_sink_summary() == ["file#1: sent 1, failed 0"]
@@ -5,7 +5,7 @@ Tests for Phase3 merge functionality
 from unittest.mock import MagicMock, patch
 
 from src.gh_pr_phase_monitor import pr_actions
-from src.gh_pr_phase_monitor.pr_actions import merge_pr, process_pr
+from src.gh_pr_phase_monitor.pr_actions import enable_auto_merge, merge_pr, process_pr
 
 
 class TestPhase3Merge:
@@ -16,6 +16,7 @@ class TestPhase3Merge:
         pr_actions._browser_opened.clear()
         pr_actions._notifications_sent.clear()
         pr_actions._merged_prs.clear()
+        pr_actions._merge_comment_posted.clear()
 
     def test_merge_not_attempted_when_disabled(self):
         """Merge should not be attempted when disabled via enable_execution_phase3_to_merge=false"""
@@ -478,3 +479,80 @@ class TestPhase3Merge:
             assert pr_url in cmd
             assert "--squash" in cmd
             assert "--delete-branch" in cmd
+
+
+class TestPhase3AutoMerge:
+    """Test native GitHub auto-merge (phase3_merge.auto_merge = true)"""
+
+    def setup_method(self):
+        """Clear the tracking before each test"""
+        pr_actions._browser_opened.clear()
+        pr_actions._notifications_sent.clear()
+        pr_actions._merged_prs.clear()
+        pr_actions._merge_comment_posted.clear()
+        pr_actions._auto_merge_enabled.clear()
+        pr_actions._actions_pending.clear()
+
+    def _pr(self, auto_merge_request=None):
+        return {
+            "repository": {"name": "test-repo", "owner": "test-owner"},
+            "title": "Test PR",
+            "url": "https://github.com/test-owner/test-repo/pull/1",
+            "autoMergeRequest": auto_merge_request,
+        }
+
+    def _config(self):
+        return {
+            "phase3_merge": {"comment": "Merging", "auto_merge": True},
+            "rulesets": [{"repositories": ["test-repo"], "enable_execution_phase3_to_merge": True}],
+        }
+
+    def test_auto_merge_enabled_once(self):
+        """Auto-merge is enabled instead of merging, and not repeated on the next cycle"""
+        with (
+            patch("src.gh_pr_phase_monitor.pr_actions.open_browser"),
+            patch("src.gh_pr_phase_monitor.pr_actions.merge_pr") as mock_merge,
+            patch("src.gh_pr_phase_monitor.pr_actions.post_phase3_comment", return_value=True) as mock_comment,
+            patch("src.gh_pr_phase_monitor.pr_actions.enable_auto_merge", return_value=True) as mock_auto_merge,
+        ):
+            process_pr(self._pr(), self._config(), "phase3")
+            process_pr(self._pr(), self._config(), "phase3")
+
+            mock_merge.assert_not_called()
+            mock_comment.assert_called_once()
+            mock_auto_merge.assert_called_once()
+            assert "https://github.com/test-owner/test-repo/pull/1" not in pr_actions._merged_prs
+
+    def test_already_armed_auto_merge_is_skipped(self):
+        """An existing autoMergeRequest means no comment and no mutation"""
+        with (
+            patch("src.gh_pr_phase_monitor.pr_actions.open_browser"),
+            patch("src.gh_pr_phase_monitor.pr_actions.post_phase3_comment") as mock_comment,
+            patch("src.gh_pr_phase_monitor.pr_actions.enable_auto_merge") as mock_auto_merge,
+        ):
+            process_pr(self._pr({"enabledAt": "2026-01-01T00:00:00Z"}), self._config(), "phase3")
+
+            mock_comment.assert_not_called()
+            mock_auto_merge.assert_not_called()
+
+    def test_failed_auto_merge_is_retried(self):
+        """A failure to enable auto-merge keeps the PR pending"""
+        with (
+            patch("src.gh_pr_phase_monitor.pr_actions.open_browser"),
+            patch("src.gh_pr_phase_monitor.pr_actions.post_phase3_comment", return_value=True),
+            patch("src.gh_pr_phase_monitor.pr_actions.enable_auto_merge", return_value=False),
+        ):
+            process_pr(self._pr(), self._config(), "phase3")
+
+            assert pr_actions.has_pending_actions("https://github.com/test-owner/test-repo/pull/1")
+
+    def test_enable_auto_merge_command(self):
+        """enable_auto_merge uses gh pr merge --auto --squash"""
+        pr_url = "https://github.com/test-owner/test-repo/pull/123"
+
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0)
+            assert enable_auto_merge(pr_url) is True
+
+            cmd = mock_run.call_args[0][0]
+            assert cmd == ["gh", "pr", "merge", pr_url, "--auto", "--squash"]
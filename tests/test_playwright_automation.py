@@ -0,0 +1,269 @@
+"""
+Tests for the DOM-based Playwright automation backend
+"""
+
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src.gh_pr_phase_monitor import browser_automation, playwright_automation, readiness
+from src.gh_pr_phase_monitor.playwright_automation import (
+    DEFAULT_SELECTORS,
+    is_playwright_backend,
+    merge_pr_playwright,
+)
+
+# Local stand-in of the GitHub PR page: each button appears shortly after the previous click
+MERGE_PAGE_HTML = """<!DOCTYPE html>
+<html><body>
+<button id="merge" onclick="setTimeout(() => { document.getElementById('confirm').hidden = false }, 200)">
+  Merge pull request
+</button>
+<button id="confirm" hidden onclick="setTimeout(() => { document.getElementById('delete').hidden = false }, 200)">
+  Confirm merge
+</button>
+<button id="delete" hidden>Delete branch</button>
+</body></html>
+"""
+
+# Local stand-in of the PR page of a repository that squash merges and deletes head branches automatically
+SQUASH_MERGE_PAGE_HTML = """<!DOCTYPE html>
+<html><body>
+<button id="merge" onclick="document.getElementById('confirm').hidden = false">Squash and merge</button>
+<button id="confirm" hidden>Confirm squash and merge</button>
+</body></html>
+"""
+
+# Local stand-in of the GitHub issue page
+ISSUE_PAGE_HTML = """<!DOCTYPE html>
+<html><body>
+<button onclick="document.getElementById('assign').hidden = false">Assign to Copilot</button>
+<div><button id="assign" hidden>Assign</button></div>
+</body></html>
+"""
+
+
+class FakeLocator:
+    def __init__(self, page, selector):
+        self.page = page
+        self.selector = selector
+
+    @property
+    def first(self):
+        return self
+
+    def wait_for(self, state, timeout):
+        self.page.waits.append((self.selector, timeout))
+        if self.selector not in self.page.visible:
+            raise TimeoutError(f"Timeout {timeout}ms exceeded")
+
+    def click(self):
+        self.page.clicks.append(self.selector)
+
+
+class FakePage:
+    def __init__(self, visible):
+        self.visible = visible
+        self.clicks = []
+        self.waits = []
+        self.url = None
+        self.closed = False
+
+    def goto(self, url, wait_until):
+        self.url = url
+
+    def locator(self, selector):
+        return FakeLocator(self, selector)
+
+    def close(self):
+        self.closed = True
+
+
+class FakeContext:
+    def __init__(self, visible):
+        self.visible = visible
+        self.pages = []
+        self.closed = False
+
+    def on(self, event, handler):
+        pass
+
+    def new_page(self):
+        page = FakePage(self.visible)
+        self.pages.append(page)
+        return page
+
+    def close(self):
+        self.closed = True
+
+
+class FakeBrowserType:
+    def __init__(self, visible):
+        self.visible = visible
+        self.launches = []
+
+    def launch_persistent_context(self, user_data_dir, **options):
+        self.launches.append((user_data_dir, options))
+        return FakeContext(self.visible)
+
+
+class FakePlaywright:
+    def __init__(self, visible):
+        self.chromium = FakeBrowserType(visible)
+
+    def start(self):
+        return self
+
+    def stop(self):
+        pass
+
+
+class TestBackendSelection:
+    """Test when the Playwright backend is used"""
+
+    def test_requires_user_data_dir_and_playwright(self):
+        """The backend needs a persistent profile directory and an installed Playwright"""
+        with patch.object(playwright_automation, "PLAYWRIGHT_AVAILABLE", True):
+            assert is_playwright_backend({"user_data_dir": "~/profile"}) is True
+            assert is_playwright_backend({"automation_backend": "playwright"}) is False
+            assert is_playwright_backend({"automation_backend": "pyautogui", "user_data_dir": "~/profile"}) is False
+        with patch.object(playwright_automation, "PLAYWRIGHT_AVAILABLE", False):
+            assert is_playwright_backend({"user_data_dir": "~/profile"}) is False
+
+    def test_merge_pr_automated_dispatches_without_cooldown(self):
+        """merge_pr_automated uses the Playwright backend, even during the browser cooldown"""
+        browser_automation._record_browser_open()
+        config = {"phase3_merge": {"user_data_dir": "~/profile"}}
+        try:
+            with (
+                patch.object(playwright_automation, "PLAYWRIGHT_AVAILABLE", True),
+                patch(
+                    "src.gh_pr_phase_monitor.browser_automation.merge_pr_playwright", return_value=True
+                ) as mock_merge,
+                patch("src.gh_pr_phase_monitor.browser_automation.webbrowser") as mock_webbrowser,
+            ):
+                assert browser_automation.merge_pr_automated("https://github.com/o/r/pull/1", config) is True
+
+            mock_merge.assert_called_once_with("https://github.com/o/r/pull/1", {"user_data_dir": "~/profile"})
+            mock_webbrowser.open.assert_not_called()
+        finally:
+            browser_automation._last_browser_open_time = None
+
+
+class TestPersistentContext:
+    """Test the shared persistent context with a fake Playwright"""
+
+    def setup_method(self):
+        readiness.reset_time_to_ready()
+        self.fake = FakePlaywright(set(DEFAULT_SELECTORS.values()))
+        self.patches = [
+            patch.object(playwright_automation, "PLAYWRIGHT_AVAILABLE", True),
+            patch.object(playwright_automation, "sync_playwright", lambda: self.fake),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def teardown_method(self):
+        playwright_automation.close_playwright_session()
+        for p in self.patches:
+            p.stop()
+
+    def test_context_reused_across_operations(self, tmp_path):
+        """The browser is launched once and each operation only opens (and closes) a page"""
+        config = {"user_data_dir": str(tmp_path), "headless": True}
+
+        assert merge_pr_playwright("https://github.com/o/r/pull/1", config) is True
+        assert playwright_automation.assign_issue_to_copilot_playwright("https://github.com/o/r/issues/2", config)
+
+        assert self.fake.chromium.launches == [(str(tmp_path), {"headless": True})]
+        pages = playwright_automation._session._context.pages
+        assert [page.url for page in pages] == ["https://github.com/o/r/pull/1", "https://github.com/o/r/issues/2"]
+        assert all(page.closed for page in pages)
+        assert pages[0].clicks == [
+            DEFAULT_SELECTORS["merge_pull_request"],
+            DEFAULT_SELECTORS["confirm_merge"],
+            DEFAULT_SELECTORS["delete_branch"],
+        ]
+
+    def test_missing_required_button_fails(self, tmp_path):
+        """A required button that never appears fails the operation and is recorded as a timeout"""
+        self.fake.chromium.visible.discard(DEFAULT_SELECTORS["confirm_merge"])
+
+        assert merge_pr_playwright("https://github.com/o/r/pull/1", {"user_data_dir": str(tmp_path)}) is False
+        assert readiness.get_time_to_ready_summary()["confirm_merge"]["timeouts"] == 1
+
+    def test_missing_delete_branch_is_optional(self, tmp_path):
+        """The merge succeeds when the branch was already deleted"""
+        self.fake.chromium.visible.discard(DEFAULT_SELECTORS["delete_branch"])
+
+        assert merge_pr_playwright("https://github.com/o/r/pull/1", {"user_data_dir": str(tmp_path)}) is True
+
+    def test_missing_delete_branch_waits_briefly(self, tmp_path):
+        """The optional "Delete branch" button is waited for briefly, not for the full ready_timeout"""
+        self.fake.chromium.visible.discard(DEFAULT_SELECTORS["delete_branch"])
+
+        assert merge_pr_playwright("https://github.com/o/r/pull/1", {"user_data_dir": str(tmp_path)}) is True
+
+        waits = dict(playwright_automation._session._context.pages[0].waits)
+        assert waits[DEFAULT_SELECTORS["confirm_merge"]] == 30_000
+        assert waits[DEFAULT_SELECTORS["delete_branch"]] == playwright_automation.OPTIONAL_READY_TIMEOUT * 1000
+        assert "delete_branch" not in readiness.get_time_to_ready_summary()
+
+    def test_settings_change_relaunches(self, tmp_path):
+        """Changing the browser settings closes the old context and launches a new one"""
+        merge_pr_playwright("https://github.com/o/r/pull/1", {"user_data_dir": str(tmp_path)})
+        old_context = playwright_automation._session._context
+
+        merge_pr_playwright("https://github.com/o/r/pull/1", {"user_data_dir": str(tmp_path), "headless": True})
+
+        assert old_context.closed is True
+        assert len(self.fake.chromium.launches) == 2
+
+
+class TestAgainstLocalPages:
+    """Run the real Playwright backend against local HTML stand-ins of the GitHub pages"""
+
+    @pytest.fixture(autouse=True)
+    def _require_browser(self):
+        sync_api = pytest.importorskip("playwright.sync_api")
+        try:
+            with sync_api.sync_playwright() as p:
+                p.chromium.launch(headless=True).close()
+        except Exception as e:
+            pytest.skip(f"Chromium for Playwright is not installed: {e}")
+        readiness.reset_time_to_ready()
+        yield
+        playwright_automation.close_playwright_session()
+
+    def _config(self, tmp_path, html):
+        page = tmp_path / "page.html"
+        page.write_text(html, encoding="utf-8")
+        config = {"user_data_dir": str(tmp_path / "profile"), "headless": True, "ready_timeout": 5}
+        return page.as_uri(), config
+
+    def test_merge_page(self, tmp_path):
+        """All three merge buttons are clicked as soon as they appear"""
+        url, config = self._config(tmp_path, MERGE_PAGE_HTML)
+
+        assert merge_pr_playwright(url, config) is True
+        summary = readiness.get_time_to_ready_summary()
+        assert all(summary[name]["timeouts"] == 0 for name in ("merge_pull_request", "confirm_merge", "delete_branch"))
+
+    def test_squash_merge_page(self, tmp_path):
+        """The squash merge buttons are matched; the absent "Delete branch" button does not fail the merge"""
+        url, config = self._config(tmp_path, SQUASH_MERGE_PAGE_HTML)
+        config["ready_timeout"] = 30
+
+        started = time.monotonic()
+        assert merge_pr_playwright(url, config) is True
+        assert time.monotonic() - started < 20
+        summary = readiness.get_time_to_ready_summary()
+        assert all(summary[name]["timeouts"] == 0 for name in ("merge_pull_request", "confirm_merge"))
+
+    def test_issue_page(self, tmp_path):
+        """The "Assign to Copilot" button and then the exact "Assign" button are clicked"""
+        url, config = self._config(tmp_path, ISSUE_PAGE_HTML)
+
+        assert playwright_automation.assign_issue_to_copilot_playwright(url, config) is True
+        assert readiness.get_time_to_ready_summary()["assign"]["timeouts"] == 0
@@ -0,0 +1,153 @@
+"""
+Tests for the adaptive polling controller
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from src.gh_pr_phase_monitor import polling_controller, pr_actions
+from src.gh_pr_phase_monitor.config import get_adaptive_polling_config, load_config
+from src.gh_pr_phase_monitor.polling_controller import (
+    MAX_GROWTH_FACTOR,
+    AdaptivePollingController,
+    count_hot_prs,
+    decide_next_interval,
+)
+from src.gh_pr_phase_monitor.snapshot_diff import SnapshotDiff
+
+NOW = 1_700_000_000.0
+NO_HOT_PRS = {"fresh_commits": 0, "pending_actions": 0}
+
+
+def _config(**adaptive):
+    return {"interval": "1m", "adaptive_polling": {"enabled": True, "max_interval": "1h", **adaptive}}
+
+
+def _iso(timestamp):
+    return datetime.fromtimestamp(timestamp, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _diff(changed=0):
+    urls = [f"https://github.com/o/repo/pull/{i}" for i in range(changed)]
+    return SnapshotDiff([], [], [], urls, [], {})
+
+
+@pytest.fixture(autouse=True)
+def fresh_controller():
+    polling_controller.reset_polling_controller()
+    pr_actions._actions_pending.clear()
+    yield
+    polling_controller.reset_polling_controller()
+    pr_actions._actions_pending.clear()
+
+
+class TestAdaptivePollingController:
+    def test_quiet_cycles_grow_gradually_up_to_max(self):
+        """Without changes, the interval grows by at most MAX_GROWTH_FACTOR per cycle until max_interval"""
+        controller = AdaptivePollingController()
+        config = _config()
+        now = NOW
+        intervals = []
+        for _ in range(15):
+            decision = controller.decide(config, 0, NO_HOT_PRS, now=now)
+            intervals.append(decision.interval_seconds)
+            now += decision.interval_seconds
+
+        assert intervals[0] == 60
+        assert intervals[1] == 60 * MAX_GROWTH_FACTOR
+        assert all(later >= earlier for earlier, later in zip(intervals, intervals[1:]))
+        assert intervals[-1] == 3600
+
+    def test_change_returns_to_normal_interval(self):
+        """A change after a quiet period brings the interval back to the normal interval at once"""
+        controller = AdaptivePollingController()
+        config = _config()
+        now = NOW
+        for _ in range(10):
+            now += controller.decide(config, 0, NO_HOT_PRS, now=now).interval_seconds
+
+        decision = controller.decide(config, 1, NO_HOT_PRS, now=now)
+        assert decision.interval_seconds == 60
+        assert "1 change(s) this check" in decision.format_reasoning()
+
+    def test_high_change_rate_polls_faster_within_min_interval(self):
+        """A sustained change rate shortens the interval, but never below min_interval"""
+        controller = AdaptivePollingController()
+        config = _config(min_interval="45s")
+        now = NOW
+        for _ in range(20):
+            decision = controller.decide(config, 3, NO_HOT_PRS, now=now)
+            now += decision.interval_seconds
+
+        assert decision.interval_seconds == 45
+        assert "min_interval 45s" in decision.reasons
+
+    def test_fresh_commits_cap_interval(self):
+        """LLM working PRs with fresh commits keep the interval at the normal interval"""
+        controller = AdaptivePollingController()
+        config = _config()
+        now = NOW
+        for _ in range(10):
+            now += controller.decide(config, 0, NO_HOT_PRS, now=now).interval_seconds
+
+        decision = controller.decide(config, 0, {"fresh_commits": 2, "pending_actions": 0}, now=now)
+        assert decision.interval_seconds == 60
+        assert "2 LLM working PR(s) with fresh commits" in decision.format_reasoning()
+
+    def test_rate_budget_floor(self):
+        """Points used per check are kept within rate_budget of the points left until the reset"""
+        controller = AdaptivePollingController()
+        config = _config(rate_budget=0.5)
+        reset_at = _iso(NOW + 3600)
+
+        controller.decide(config, 5, NO_HOT_PRS, {"cost": 1, "remaining": 1000, "resetAt": reset_at}, now=NOW)
+        # 100 points per check, 0.5 * 900 points left -> 4.5 checks in the remaining 3540s
+        decision = controller.decide(
+            config, 5, NO_HOT_PRS, {"cost": 1, "remaining": 900, "resetAt": reset_at}, now=NOW + 60
+        )
+
+        assert decision.interval_seconds == round(3540 / 4.5)
+        assert "rate budget (900 points left)" in decision.format_reasoning()
+
+
+class TestCountHotPrs:
+    def test_fresh_commits_and_pending_actions(self):
+        """Only LLM working PRs with commits inside hot_window count as fresh; pending actions count in any phase"""
+        prs = [
+            {"url": "https://github.com/o/repo/pull/1", "lastCommitAt": _iso(NOW - 60)},
+            {"url": "https://github.com/o/repo/pull/2", "lastCommitAt": _iso(NOW - 3600)},
+            {"url": "https://github.com/o/repo/pull/3", "lastCommitAt": _iso(NOW - 60)},
+            {"url": "https://github.com/o/repo/pull/4", "lastCommitAt": None},
+        ]
+        pr_actions._actions_pending.add("https://github.com/o/repo/pull/4")
+
+        counts = count_hot_prs(prs, ["LLM working", "LLM working", "phase3", "phase1"], 900, NOW)
+
+        assert counts == {"fresh_commits": 1, "pending_actions": 1}
+
+
+class TestDecideNextInterval:
+    def test_uses_snapshot_diff_and_verbose_reasoning(self):
+        """The module-level controller counts the diff's changes and explains its decision"""
+        decision = decide_next_interval(_config(), [], [], _diff(), now=NOW)
+        assert decision.reasons == ["first check: interval 1分0秒"]
+
+        decision = decide_next_interval(_config(), [], [], _diff(changed=2), now=NOW + 60)
+        assert decision.interval_seconds == 60
+        assert decision.format_reasoning().startswith("Adaptive polling: next check in 1分0秒 (")
+
+
+class TestAdaptivePollingConfig:
+    def test_invalid_settings_fall_back(self, tmp_path):
+        """Invalid durations and rate budgets fall back to defaults; min_interval above max_interval caps both"""
+        config_path = tmp_path / "config.toml"
+        config_path.write_text(
+            '[adaptive_polling]\nenabled = true\nmin_interval = "2h"\nhot_window = "soon"\nrate_budget = 2\n'
+        )
+
+        settings = get_adaptive_polling_config(load_config(str(config_path)))
+
+        assert settings["hot_window"] == "15m"
+        assert settings["rate_budget"] == 0.5
+        assert settings["max_interval"] == "2h"
@@ -0,0 +1,193 @@
+"""
+Tests for the per-repository and per-PR polling tiers
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.gh_pr_phase_monitor import polling_tiers, pr_actions
+from src.gh_pr_phase_monitor.phase_detector import determine_phase
+from src.gh_pr_phase_monitor.polling_tiers import (
+    TIER_COLD,
+    TIER_HOT,
+    TIER_WARM,
+    classify_pr_tier,
+    fetch_due_pr_details,
+    update_polling_tiers,
+)
+from src.gh_pr_phase_monitor.pr_fetcher import get_prs_by_node_ids
+from src.gh_pr_phase_monitor.snapshot_diff import diff_snapshot, reset_snapshot
+
+NOW = 1_700_000_000.0
+CONFIG = {"polling_tiers": {"enabled": True, "warm_interval": "5m", "cold_interval": "30m", "idle_after": "1d"}}
+APPROVED = [{"author": {"login": "copilot-pull-request-reviewer"}, "state": "APPROVED", "body": "LGTM"}]
+
+
+def _pr(repo, number, phase3=False):
+    # Drafts without review requests are "LLM working"; approved non-drafts are phase3
+    return {
+        "id": f"PR_{repo}_{number}",
+        "isDraft": not phase3,
+        "reviews": APPROVED if phase3 else [],
+        "latestReviews": [{"author": {"login": "copilot-pull-request-reviewer"}, "state": "APPROVED"}]
+        if phase3
+        else [],
+        "reviewRequests": [],
+        "repository": {"name": repo, "owner": "o"},
+        "title": f"PR {number}",
+        "url": f"https://github.com/o/{repo}/pull/{number}",
+        "state": "OPEN",
+    }
+
+
+def _repo(name, count):
+    return {"name": name, "owner": "o", "openPRCount": count}
+
+
+@pytest.fixture(autouse=True)
+def clean_state():
+    polling_tiers.reset_polling_tiers()
+    reset_snapshot()
+    yield
+    polling_tiers.reset_polling_tiers()
+    reset_snapshot()
+
+
+class Server:
+    """Fake GitHub answering repository and node id queries from a dict of open PRs"""
+
+    def __init__(self, prs):
+        self.prs = {pr["id"]: pr for pr in prs}
+        self.repo_fetches = []
+        self.node_fetches = []
+
+    def get_pr_details_batch(self, repos):
+        self.repo_fetches.append([repo["name"] for repo in repos])
+        names = {repo["name"] for repo in repos}
+        return [pr for pr in self.prs.values() if pr["repository"]["name"] in names and pr["state"] == "OPEN"]
+
+    def get_prs_by_node_ids(self, node_ids):
+        self.node_fetches.append(list(node_ids))
+        return [self.prs[node_id] for node_id in node_ids if node_id in self.prs]
+
+
+def _check(server, repos, now):
+    with (
+        patch("src.gh_pr_phase_monitor.polling_tiers.get_pr_details_batch", server.get_pr_details_batch),
+        patch("src.gh_pr_phase_monitor.polling_tiers.get_prs_by_node_ids", server.get_prs_by_node_ids),
+    ):
+        all_prs = fetch_due_pr_details(repos, CONFIG, now=now)
+    phases = [determine_phase(pr) for pr in all_prs]
+    update_polling_tiers(CONFIG, all_prs, phases, diff_snapshot(all_prs, phases), now=now)
+    return all_prs
+
+
+class TestClassifyPrTier:
+    def test_tiers_from_phase_and_activity(self):
+        """phase2 and active LLM working are hot, phase3 is cold, idle LLM working and phase1 are warm"""
+        pr = {"url": "https://github.com/o/r/pull/1", "lastCommitAt": "2023-11-14T22:00:00Z"}
+        idle_pr = {**pr, "lastCommitAt": "2023-10-01T00:00:00Z"}
+
+        assert classify_pr_tier(pr, "phase2", False, 86400, NOW) == TIER_HOT
+        assert classify_pr_tier(pr, "LLM working", False, 86400, NOW) == TIER_HOT
+        assert classify_pr_tier(idle_pr, "LLM working", False, 86400, NOW) == TIER_WARM
+        assert classify_pr_tier(pr, "phase1", False, 86400, NOW) == TIER_WARM
+        assert classify_pr_tier(pr, "phase3", False, 86400, NOW) == TIER_COLD
+        assert classify_pr_tier(pr, "phase3", True, 86400, NOW) == TIER_HOT
+
+    def test_pending_actions_are_hot(self):
+        """PRs whose last action failed or was deferred are hot in any phase"""
+        pr_actions._actions_pending.add("https://github.com/o/r/pull/1")
+        try:
+            assert classify_pr_tier({"url": "https://github.com/o/r/pull/1"}, "phase3", False, 86400, NOW) == TIER_HOT
+        finally:
+            pr_actions._actions_pending.clear()
+
+
+class TestFetchDuePrDetails:
+    def test_only_due_subset_fetched(self):
+        """After the first check, hot PRs are refetched by node id and cold PRs are reused"""
+        working, waiting = _pr("a", 1), _pr("b", 2, phase3=True)
+        server = Server([working, waiting])
+        repos = [_repo("a", 1), _repo("b", 1)]
+
+        assert _check(server, repos, NOW) == [working, waiting]
+        assert server.repo_fetches == [["a", "b"]]
+        # Both PRs were added in the first check, so they are hot for one more check
+        _check(server, repos, NOW + 60)
+        assert server.node_fetches == [["PR_a_1", "PR_b_2"]]
+
+        server.prs["PR_a_1"] = {**working, "title": "Updated"}
+        all_prs = _check(server, repos, NOW + 120)
+
+        assert server.node_fetches[-1] == ["PR_a_1"]
+        assert [pr["title"] for pr in all_prs] == ["Updated", "PR 2"]
+        assert len(server.repo_fetches) == 1
+
+    def test_cold_pr_refetched_after_cold_interval(self):
+        """A phase3 PR is not fetched again until cold_interval has passed"""
+        waiting = _pr("b", 2, phase3=True)
+        server = Server([waiting])
+        repos = [_repo("b", 1)]
+        for offset in (0, 60, 120):
+            _check(server, repos, NOW + offset)
+        assert server.node_fetches == [["PR_b_2"]]
+
+        _check(server, repos, NOW + 60 + 1800)
+        # The repository itself is cold as well, so its PR list is refetched instead
+        assert server.repo_fetches == [["b"], ["b"]]
+
+    def test_open_pr_count_change_refetches_repository(self):
+        """A new PR counted by Phase 1 triggers a refetch of its repository in the same check"""
+        server = Server([_pr("a", 1)])
+        _check(server, [_repo("a", 1)], NOW)
+
+        new_pr = _pr("a", 2)
+        server.prs[new_pr["id"]] = new_pr
+        all_prs = _check(server, [_repo("a", 2)], NOW + 60)
+
+        assert server.repo_fetches == [["a"], ["a"]]
+        assert new_pr in all_prs
+
+    def test_closed_pr_dropped_and_repository_due(self):
+        """A PR refetched as closed is dropped and its repository is refetched in the next check"""
+        working = _pr("a", 1)
+        server = Server([working])
+        _check(server, [_repo("a", 1)], NOW)
+
+        server.prs["PR_a_1"] = {**working, "state": "MERGED"}
+        assert _check(server, [_repo("a", 1)], NOW + 60) == []
+
+        _check(server, [_repo("a", 1)], NOW + 120)
+        assert server.repo_fetches == [["a"], ["a"]]
+
+
+class TestGetPrsByNodeIds:
+    def test_nodes_query(self):
+        """PRs are queried with nodes(ids:) and transformed like repository query results"""
+        response = {
+            "data": {
+                "nodes": [
+                    {
+                        "id": "PR_1",
+                        "url": "https://github.com/o/a/pull/1",
+                        "title": "Fix",
+                        "state": "OPEN",
+                        "repository": {"name": "a", "owner": {"login": "o"}},
+                    },
+                    None,
+                ],
+                "rateLimit": {"cost": 1, "remaining": 4999, "resetAt": "2023-11-15T00:00:00Z"},
+            }
+        }
+        with (
+            patch("src.gh_pr_phase_monitor.pr_fetcher.execute_graphql_query", return_value=response) as mock_query,
+            patch("builtins.print"),
+        ):
+            prs = get_prs_by_node_ids(["PR_1", "PR_deleted"])
+
+        assert 'nodes(ids: ["PR_1", "PR_deleted"])' in mock_query.call_args[0][0]
+        assert [(pr["id"], pr["title"], pr["repository"]) for pr in prs] == [
+            ("PR_1", "Fix", {"name": "a", "owner": "o"})
+        ]
@@ -10,12 +10,14 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from src.gh_pr_phase_monitor import (
+    comment_manager,
     get_current_user,
     get_existing_comments,
     has_copilot_apply_comment,
     mark_pr_ready,
     post_phase2_comment,
 )
+from src.gh_pr_phase_monitor.comment_manager import phase2_comment_exists
 
 
 class TestGetExistingComments:
@@ -149,6 +151,10 @@ class TestGetCurrentUser:
 class TestPostPhase2Comment:
     """Test the post_phase2_comment function"""
 
+    def setup_method(self):
+        """Reset the index of known phase2 comments before each test"""
+        comment_manager._phase2_comment_known.clear()
+
     @patch("src.gh_pr_phase_monitor.comment_manager.get_existing_comments")
     @patch("src.gh_pr_phase_monitor.comment_manager.subprocess.run")
     def test_post_comment_success(self, mock_run, mock_get_comments):
@@ -250,6 +256,57 @@ class TestPostPhase2Comment:
         assert result is False
 
 
+class TestPhase2CommentExists:
+    """Test answering the phase2 comment check without fetching comments"""
+
+    def setup_method(self):
+        """Reset the index of known phase2 comments before each test"""
+        comment_manager._phase2_comment_known.clear()
+
+    @patch("src.gh_pr_phase_monitor.comment_manager.get_existing_comments")
+    def test_found_in_fetched_slice(self, mock_get_comments):
+        """The comment slice from the Phase 2 query answers the check"""
+        pr = {
+            "url": "https://github.com/user/repo/pull/1",
+            "comments": 12,
+            "commentNodes": [{"body": "@copilot apply changes based on the comments in [this pull request](x)"}],
+        }
+
+        assert phase2_comment_exists(pr) is True
+        mock_get_comments.assert_not_called()
+
+    @patch("src.gh_pr_phase_monitor.comment_manager.get_existing_comments")
+    def test_slice_covers_all_comments(self, mock_get_comments):
+        """When every comment was fetched, absence needs no extra call"""
+        pr = {"url": "https://github.com/user/repo/pull/1", "comments": 1, "commentNodes": [{"body": "LGTM"}]}
+
+        assert phase2_comment_exists(pr) is False
+        mock_get_comments.assert_not_called()
+
+    @patch("src.gh_pr_phase_monitor.comment_manager.get_existing_comments")
+    def test_older_comments_fetched_once(self, mock_get_comments):
+        """Comments beyond the slice are fetched once, then answered from the local index"""
+        mock_get_comments.return_value = [{"body": "@copilot apply changes based on the comments"}]
+        pr = {"url": "https://github.com/user/repo/pull/1", "comments": 30, "commentNodes": [{"body": "LGTM"}]}
+
+        assert phase2_comment_exists(pr) is True
+        assert phase2_comment_exists(pr) is True
+        assert mock_get_comments.call_count == 1
+
+    @patch("src.gh_pr_phase_monitor.comment_manager.get_existing_comments")
+    @patch("src.gh_pr_phase_monitor.comment_manager.subprocess.run")
+    def test_posted_comment_is_indexed(self, mock_run, mock_get_comments):
+        """A comment posted by the monitor is remembered for later cycles"""
+        mock_get_comments.return_value = []
+        mock_run.return_value = MagicMock(returncode=0)
+        pr = {"url": "https://github.com/user/repo/pull/1", "reviews": []}
+
+        assert post_phase2_comment(pr) is True
+        assert post_phase2_comment(pr) is None
+        assert mock_run.call_count == 1
+        assert mock_get_comments.call_count == 1
+
+
 class TestMarkPRReady:
     """Test the mark_pr_ready function"""
 
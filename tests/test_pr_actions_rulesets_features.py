@@ -16,6 +16,7 @@ class TestProcessPRWithRulesetPhase3MergeFlag:
         pr_actions._browser_opened.clear()
         pr_actions._notifications_sent.clear()
         pr_actions._merged_prs.clear()
+        pr_actions._merge_comment_posted.clear()
 
     def test_ruleset_enables_phase3_merge_for_specific_repo(self):
         """Ruleset should enable phase3_merge using global settings for specific repository"""
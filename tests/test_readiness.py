@@ -0,0 +1,162 @@
+"""
+Tests for readiness polling in browser automation flows
+"""
+
+import json
+from unittest.mock import patch
+
+from src.gh_pr_phase_monitor import browser_automation, readiness
+from src.gh_pr_phase_monitor.readiness import get_time_to_ready_summary, record_time_to_ready, wait_for_ready
+from src.gh_pr_phase_monitor.template_matcher import GrayImage, TemplateMatcher
+
+BUTTONS = {"merge_pull_request": (40, 40), "confirm_merge": (40, 120), "delete_branch": (200, 40)}
+
+
+class FakeClock:
+    """Clock advanced only by the fake sleep"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _blank_screen(width=320, height=200):
+    return GrayImage(width, height, [bytes([246]) * width for _ in range(height)])
+
+
+def _draw_button(screen, left, top, seed, width=64, height=24):
+    """Draw a button whose label pattern depends on `seed` and return its image"""
+    for dy in range(height):
+        row = bytearray(screen.rows[top + dy])
+        for dx in range(width):
+            label = 6 <= dy < height - 6 and 8 <= dx < width - 8 and (dx // (2 + seed) + dy // 3) % 2 == 0
+            row[left + dx] = 30 if dy in (0, height - 1) or dx in (0, width - 1) else (250 if label else 70)
+        screen.rows[top + dy] = bytes(row)
+    return screen.crop(left, top, width, height)
+
+
+class TestWaitForReady:
+    """Test the polling loop with a fake clock"""
+
+    def test_returns_as_soon_as_found(self):
+        """The target is returned on the first lookup that finds it"""
+        clock = FakeClock()
+        results = iter([None, None, "button"])
+
+        found, elapsed = wait_for_ready(lambda: next(results), 10, 0.5, lambda: clock.now, clock.sleep)
+
+        assert found == "button"
+        assert elapsed == 1.0
+        assert clock.sleeps == [0.5, 0.5]
+
+    def test_deadline(self):
+        """None is returned once the deadline passes, without oversleeping it"""
+        clock = FakeClock()
+
+        found, elapsed = wait_for_ready(lambda: None, 1.2, 0.5, lambda: clock.now, clock.sleep)
+
+        assert found is None
+        assert round(elapsed, 6) == 1.2
+        assert round(clock.sleeps[-1], 6) == 0.2
+
+    def test_image_not_found_exception_is_a_miss(self):
+        """pyautogui's ImageNotFoundException counts as 'not visible yet'"""
+
+        class ImageNotFoundException(Exception):
+            pass
+
+        clock = FakeClock()
+        calls = []
+
+        def locate():
+            calls.append(1)
+            if len(calls) < 3:
+                raise ImageNotFoundException()
+            return "button"
+
+        assert wait_for_ready(locate, 10, 1, lambda: clock.now, clock.sleep)[0] == "button"
+
+
+class TestTimeToReady:
+    """Test recording of observed time-to-ready"""
+
+    def setup_method(self):
+        readiness.reset_time_to_ready()
+
+    def test_summary_and_log(self, tmp_path):
+        """Observations are summarized per button and appended to the readiness log"""
+        log_path = tmp_path / "readiness.jsonl"
+        record_time_to_ready("merge_pull_request", 2.0, str(log_path))
+        record_time_to_ready("merge_pull_request", 4.0, str(log_path))
+        record_time_to_ready("merge_pull_request", None, str(log_path))
+
+        summary = get_time_to_ready_summary()["merge_pull_request"]
+
+        assert summary == {"count": 3, "timeouts": 1, "avg": 3.0, "max": 4.0}
+        entries = [json.loads(line) for line in log_path.read_text(encoding="utf-8").splitlines()]
+        assert [entry["time_to_ready"] for entry in entries] == [2.0, 4.0, None]
+        assert entries[2]["timed_out"] is True
+
+
+class TestMergeWithReadinessPolling:
+    """Test the merge flow against a fake screen provider"""
+
+    def setup_method(self):
+        readiness.reset_time_to_ready()
+        browser_automation._last_browser_open_time = None
+        self.loaded_screen = _blank_screen()
+        self.templates = {
+            name: _draw_button(self.loaded_screen, left, top, seed)
+            for seed, (name, (left, top)) in enumerate(BUTTONS.items())
+        }
+        self.captures = 0
+
+        def provider(region):
+            # The page "loads" after three screen captures
+            self.captures += 1
+            screen = self.loaded_screen if self.captures > 3 else _blank_screen()
+            return screen if region is None else screen.crop(*region)
+
+        def loader(path):
+            return self.templates[path.rsplit("/", 1)[-1].split(".")[0]]
+
+        browser_automation._template_matcher = TemplateMatcher(provider, loader)
+
+    def teardown_method(self):
+        browser_automation._template_matcher = None
+        browser_automation._last_browser_open_time = None
+
+    def test_clicks_as_soon_as_ready_without_fixed_sleeps(self, tmp_path):
+        """Buttons are clicked when they appear and no fixed wait_seconds/button_delay sleep happens"""
+        for name in BUTTONS:
+            (tmp_path / f"{name}.png").write_bytes(b"png")
+        merge_config = {
+            "screenshot_dir": str(tmp_path),
+            "image_matcher": "pyramid",
+            "readiness_polling": True,
+            "poll_interval": 0.01,
+            "ready_timeout": 5,
+            "wait_seconds": 30,
+        }
+
+        with (
+            patch("src.gh_pr_phase_monitor.browser_automation.PYAUTOGUI_AVAILABLE", True),
+            patch("src.gh_pr_phase_monitor.browser_automation.pyautogui") as mock_pyautogui,
+            patch("src.gh_pr_phase_monitor.browser_automation.webbrowser"),
+            patch("src.gh_pr_phase_monitor.browser_automation.time.sleep") as mock_fixed_sleep,
+        ):
+            mock_pyautogui.center.side_effect = lambda match: (match.left + match.width // 2, match.top)
+            result = browser_automation.merge_pr_automated(
+                "https://github.com/owner/repo/pull/1", {"phase3_merge": merge_config}
+            )
+
+        assert result is True
+        mock_fixed_sleep.assert_not_called()
+        assert [call[0][0] for call in mock_pyautogui.click.call_args_list] == [(72, 40), (72, 120), (232, 40)]
+        summary = get_time_to_ready_summary()
+        assert set(summary) == set(BUTTONS)
+        assert all(entry["timeouts"] == 0 for entry in summary.values())
@@ -0,0 +1,130 @@
+"""
+Tests for the pre-compiled ruleset index
+"""
+
+import os
+import tempfile
+from unittest.mock import patch
+
+import pytest
+
+from src.gh_pr_phase_monitor.config import (
+    get_ruleset_index,
+    load_config,
+    resolve_execution_config_for_repo,
+)
+from src.gh_pr_phase_monitor.ruleset_index import RulesetIndex
+
+
+class TestRulesetIndexPatterns:
+    """Test repository pattern matching in the ruleset index"""
+
+    def test_exact_name(self):
+        """Exact repository names match regardless of owner"""
+        index = RulesetIndex([{"repositories": ["repo1"], "enable_execution_phase1_to_phase2": True}])
+
+        assert index.resolve("owner", "repo1")["enable_execution_phase1_to_phase2"] is True
+        assert index.resolve("other", "repo1")["enable_execution_phase1_to_phase2"] is True
+        assert index.resolve("owner", "repo2")["enable_execution_phase1_to_phase2"] is False
+
+    def test_owner_and_name(self):
+        """'owner/name' patterns only match that owner's repository"""
+        index = RulesetIndex([{"repositories": ["owner/repo1"], "enable_execution_phase1_to_phase2": True}])
+
+        assert index.resolve("owner", "repo1")["enable_execution_phase1_to_phase2"] is True
+        assert index.resolve("other", "repo1")["enable_execution_phase1_to_phase2"] is False
+
+    def test_glob_pattern(self):
+        """Glob patterns match repository names"""
+        index = RulesetIndex([{"repositories": ["cat-*"], "enable_execution_phase3_send_ntfy": True}])
+
+        assert index.resolve("owner", "cat-github-watcher")["enable_execution_phase3_send_ntfy"] is True
+        assert index.resolve("owner", "dog-watcher")["enable_execution_phase3_send_ntfy"] is False
+
+    def test_glob_pattern_with_owner(self):
+        """Glob patterns containing '/' match 'owner/name'"""
+        index = RulesetIndex([{"repositories": ["owner/*"], "assign_old": True}])
+
+        assert index.resolve("owner", "anything")["assign_old"] is True
+        assert index.resolve("other", "anything")["assign_old"] is False
+
+    def test_regex_pattern(self):
+        """'re:' patterns are full-matched as regular expressions"""
+        index = RulesetIndex([{"repositories": ["re:tool-[0-9]+"], "assign_good_first_old": True}])
+
+        assert index.resolve("owner", "tool-42")["assign_good_first_old"] is True
+        assert index.resolve("owner", "tool-42-extra")["assign_good_first_old"] is False
+
+    def test_invalid_regex_raises(self):
+        """Invalid regular expressions are rejected at compile time"""
+        with pytest.raises(ValueError) as exc_info:
+            RulesetIndex([{"repositories": ["re:("]}])
+
+        assert "re:(" in str(exc_info.value)
+
+    def test_later_rulesets_override_across_pattern_kinds(self):
+        """Ruleset order is preserved even when matched through different pattern kinds"""
+        index = RulesetIndex(
+            [
+                {"repositories": ["repo1"], "enable_execution_phase1_to_phase2": True},
+                {"repositories": ["all"], "enable_execution_phase1_to_phase2": False},
+                {"repositories": ["owner/repo1"], "enable_execution_phase3_to_merge": True},
+            ]
+        )
+
+        result = index.resolve("owner", "repo1")
+        assert result["enable_execution_phase1_to_phase2"] is False
+        assert result["enable_execution_phase3_to_merge"] is True
+
+
+class TestRulesetIndexCaching:
+    """Test that the index is compiled once and lookups are memoized"""
+
+    def test_invalid_flag_raised_only_for_matching_repos(self):
+        """Non-boolean flags are validated once but only reported for repositories they apply to"""
+        index = RulesetIndex([{"repositories": ["bad-repo"], "assign_old": "yes"}])
+
+        assert index.resolve("owner", "good-repo")["assign_old"] is False
+        with pytest.raises(ValueError):
+            index.resolve("owner", "bad-repo")
+
+    def test_resolve_is_memoized(self):
+        """Matchers are only evaluated on the first lookup of a repository"""
+        index = RulesetIndex([{"repositories": ["cat-*"], "assign_old": True}])
+
+        with patch("src.gh_pr_phase_monitor.ruleset_index.fnmatch.fnmatchcase", return_value=True) as mock_match:
+            index.resolve("owner", "cat-a")
+            index.resolve("owner", "cat-a")
+
+        assert mock_match.call_count == 1
+
+    def test_resolve_returns_copy(self):
+        """Mutating a resolved result does not affect later lookups"""
+        index = RulesetIndex([{"repositories": ["all"], "assign_old": True}])
+
+        result = index.resolve("owner", "repo")
+        result["assign_old"] = False
+
+        assert index.resolve("owner", "repo")["assign_old"] is True
+
+    def test_load_config_attaches_index(self):
+        """load_config compiles the index once and resolve uses it"""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".toml", delete=False, encoding="utf-8") as f:
+            f.write('[[rulesets]]\nrepositories = ["repo1"]\nenable_execution_phase1_to_phase2 = true\n')
+            config_path = f.name
+
+        try:
+            config = load_config(config_path)
+        finally:
+            os.unlink(config_path)
+
+        index = config.ruleset_index
+        assert isinstance(index, RulesetIndex)
+        assert get_ruleset_index(config) is index
+        assert resolve_execution_config_for_repo(config, "owner", "repo1")["enable_execution_phase1_to_phase2"] is True
+
+    def test_plain_dict_config_compiles_on_the_fly(self):
+        """Plain dictionaries without a compiled index still resolve correctly"""
+        config = {"rulesets": [{"repositories": ["repo1"], "assign_old": True}]}
+
+        assert resolve_execution_config_for_repo(config, "owner", "repo1")["assign_old"] is True
@@ -0,0 +1,144 @@
+"""
+Tests for snapshot diffing between monitoring cycles
+"""
+
+from unittest.mock import patch
+
+from src.gh_pr_phase_monitor import pr_actions, snapshot_diff, state_tracker
+from src.gh_pr_phase_monitor.monitor import check_no_state_change_timeout
+from src.gh_pr_phase_monitor.phase_detector import PHASE_1, PHASE_2, PHASE_3
+from src.gh_pr_phase_monitor.snapshot_diff import diff_snapshot, is_full_reconcile_due, request_full_reconcile
+
+
+def _pr(number: int, title: str = "PR") -> dict:
+    return {
+        "title": f"{title} {number}",
+        "url": f"https://github.com/owner/repo/pull/{number}",
+        "repository": {"name": "repo", "owner": "owner"},
+    }
+
+
+class TestDiffSnapshot:
+    """Test the diff_snapshot function"""
+
+    def setup_method(self):
+        """Reset snapshot state before each test"""
+        snapshot_diff.reset_snapshot()
+
+    def test_first_cycle_marks_all_added(self):
+        """All PRs are added on the first cycle"""
+        diff = diff_snapshot([_pr(1), _pr(2)], [PHASE_1, PHASE_2])
+
+        assert len(diff.added) == 2
+        assert diff.phases_changed is True
+        assert diff.is_delta(_pr(1)["url"])
+
+    def test_unchanged_cycle(self):
+        """Identical cycles produce no deltas"""
+        diff_snapshot([_pr(1)], [PHASE_1])
+        diff = diff_snapshot([_pr(1)], [PHASE_1])
+
+        assert diff.unchanged == [_pr(1)["url"]]
+        assert diff.phases_changed is False
+        assert not diff.is_delta(_pr(1)["url"])
+
+    def test_phase_changed_and_removed(self):
+        """Phase changes and removed PRs are reported"""
+        diff_snapshot([_pr(1), _pr(2)], [PHASE_1, PHASE_2])
+        diff = diff_snapshot([_pr(1)], [PHASE_3])
+
+        assert diff.phase_changed == [_pr(1)["url"]]
+        assert diff.removed == [_pr(2)["url"]]
+        assert diff.phases_changed is True
+
+    def test_field_change_without_phase_change(self):
+        """Field changes are reported separately and do not count as phase changes"""
+        diff_snapshot([_pr(1)], [PHASE_2])
+        diff = diff_snapshot([_pr(1, title="Renamed")], [PHASE_2])
+
+        assert diff.changed == [_pr(1)["url"]]
+        assert diff.phases_changed is False
+        assert diff.is_delta(_pr(1)["url"])
+
+
+class TestFullReconcile:
+    """Test the periodic full reconcile"""
+
+    def setup_method(self):
+        """Reset snapshot state before each test"""
+        snapshot_diff.reset_snapshot()
+
+    def test_first_cycle_is_full(self):
+        """The first cycle is always a full reconcile"""
+        assert is_full_reconcile_due(600, current_time=1000.0) is True
+        assert is_full_reconcile_due(600, current_time=1100.0) is False
+        assert is_full_reconcile_due(600, current_time=1600.0) is True
+
+    def test_zero_interval_is_always_full(self):
+        """A zero interval reconciles every cycle"""
+        assert is_full_reconcile_due(0, current_time=1000.0) is True
+        assert is_full_reconcile_due(0, current_time=1000.0) is True
+
+    def test_request_full_reconcile(self):
+        """A requested reconcile happens on the next check"""
+        is_full_reconcile_due(600, current_time=1000.0)
+        request_full_reconcile()
+
+        assert is_full_reconcile_due(600, current_time=1001.0) is True
+
+
+class TestMonitorReusesDiff:
+    """Test that check_no_state_change_timeout can use the cycle diff"""
+
+    def setup_method(self):
+        """Reset global state before each test"""
+        snapshot_diff.reset_snapshot()
+        state_tracker.set_last_state(None)
+        state_tracker.set_reduced_frequency_mode(False)
+
+    def test_unchanged_diff_keeps_state_start_time(self):
+        """An unchanged diff keeps the original state timestamp"""
+        prs = [_pr(1)]
+        check_no_state_change_timeout(prs, [PHASE_1], {}, diff_snapshot(prs, [PHASE_1]))
+        first_state = state_tracker.get_last_state()
+
+        check_no_state_change_timeout(prs, [PHASE_1], {}, diff_snapshot(prs, [PHASE_1]))
+
+        assert state_tracker.get_last_state() == first_state
+
+    def test_phase_change_resets_reduced_mode(self):
+        """A phase change in the diff returns to normal frequency mode"""
+        prs = [_pr(1)]
+        check_no_state_change_timeout(prs, [PHASE_1], {}, diff_snapshot(prs, [PHASE_1]))
+        state_tracker.set_reduced_frequency_mode(True)
+
+        with patch("builtins.print"):
+            result = check_no_state_change_timeout(prs, [PHASE_2], {}, diff_snapshot(prs, [PHASE_2]))
+
+        assert result is False
+        assert state_tracker.get_last_state()[0] == frozenset({(_pr(1)["url"], PHASE_2)})
+
+
+class TestPendingActions:
+    """Test that failed or deferred actions keep a PR in the processing set"""
+
+    def setup_method(self):
+        """Reset PR action state before each test"""
+        pr_actions._browser_opened.clear()
+        pr_actions._notifications_sent.clear()
+        pr_actions._merged_prs.clear()
+        pr_actions._merge_comment_posted.clear()
+        pr_actions._actions_pending.clear()
+
+    def test_browser_cooldown_marks_pending(self):
+        """A browser open deferred by cooldown is retried next cycle"""
+        pr = _pr(1)
+        with patch("src.gh_pr_phase_monitor.pr_actions.open_browser", return_value=False), patch("builtins.print"):
+            pr_actions.process_pr(pr, {}, PHASE_3)
+
+        assert pr_actions.has_pending_actions(pr["url"]) is True
+
+        with patch("src.gh_pr_phase_monitor.pr_actions.open_browser", return_value=True), patch("builtins.print"):
+            pr_actions.process_pr(pr, {}, PHASE_3)
+
+        assert pr_actions.has_pending_actions(pr["url"]) is False
@@ -0,0 +1,169 @@
+"""
+Tests for cached coarse-to-fine button template matching
+"""
+
+import os
+import random
+from unittest.mock import MagicMock, patch
+
+from src.gh_pr_phase_monitor import browser_automation
+from src.gh_pr_phase_monitor.template_matcher import GrayImage, Match, TemplateMatcher, find_template
+
+
+def _synthetic_screen(width=480, height=320, seed=1):
+    """Light page with gray panels and text-like noise"""
+    rng = random.Random(seed)
+    rows = [bytearray([246]) * width for _ in range(height)]
+    for _ in range(15):
+        w, h = rng.randint(20, width // 3), rng.randint(6, height // 5)
+        x, y = rng.randint(0, width - w), rng.randint(0, height - h)
+        level = rng.randint(180, 240)
+        for row in rows[y : y + h]:
+            row[x : x + w] = bytes([level]) * w
+    for _ in range(60):
+        w = rng.randint(20, 120)
+        x, y = rng.randint(0, width - w), rng.randint(0, height - 8)
+        for row in rows[y : y + 6]:
+            row[x : x + w] = bytes(rng.choice((40, 90, 246)) for _ in range(w))
+    return GrayImage(width, height, [bytes(row) for row in rows])
+
+
+def _draw_button(screen, left, top, width=96, height=28):
+    """Draw a button with a label-like pattern and return its image"""
+    for dy in range(height):
+        row = bytearray(screen.rows[top + dy])
+        for dx in range(width):
+            label = 8 <= dy < height - 8 and 12 <= dx < width - 12 and (dx // 3 + dy // 4) % 3 == 0
+            row[left + dx] = 30 if dy in (0, height - 1) or dx in (0, width - 1) else (250 if label else 70)
+        screen.rows[top + dy] = bytes(row)
+    return screen.crop(left, top, width, height)
+
+
+class TestFindTemplate:
+    """Test the coarse-to-fine search on synthetic screenshots"""
+
+    def test_finds_exact_position(self):
+        """The button is found at its exact position with a perfect score"""
+        screen = _synthetic_screen()
+        template = _draw_button(screen, 301, 187)
+
+        match = find_template(screen, template, 0.9)
+
+        assert (match.left, match.top, match.width, match.height) == (301, 187, 96, 28)
+        assert match.score > 0.999
+
+    def test_missing_button_not_found(self):
+        """A template that is not on screen does not reach the confidence threshold"""
+        screen = _synthetic_screen()
+        template = _draw_button(_synthetic_screen(seed=2), 100, 100)
+
+        assert find_template(screen, template, 0.9) is None
+
+    def test_downscale_box_average(self):
+        """Downscaling averages each block"""
+        image = GrayImage(4, 2, [bytes([0, 10, 100, 200]), bytes([20, 30, 100, 200])])
+
+        small = image.downscale(2)
+
+        assert (small.width, small.height, small.rows) == (2, 1, [bytes([15, 150])])
+
+
+class TestTemplateMatcher:
+    """Test template caching and the region of interest"""
+
+    def setup_method(self):
+        self.screen = _synthetic_screen()
+        self.template = _draw_button(self.screen, 301, 187)
+        self.regions = []
+
+        def provider(region):
+            self.regions.append(region)
+            return self.screen if region is None else self.screen.crop(*region)
+
+        self.loader = MagicMock(return_value=self.template)
+        self.matcher = TemplateMatcher(provider, self.loader)
+
+    def test_template_decoded_once_until_changed(self, tmp_path):
+        """Templates are cached and reloaded only when the file changes"""
+        path = tmp_path / "merge.png"
+        path.write_bytes(b"png")
+
+        self.matcher.locate(str(path), 0.9)
+        self.matcher.locate(str(path), 0.9)
+        assert self.loader.call_count == 1
+
+        os.utime(path, (1, 1))
+        self.matcher.locate(str(path), 0.9)
+        assert self.loader.call_count == 2
+
+    def test_search_region_in_screen_coordinates(self):
+        """A match inside a configured region is reported in screen coordinates"""
+        match = self.matcher.locate("merge.png", 0.9, region=(200, 100, 280, 220))
+
+        assert (match.left, match.top) == (301, 187)
+        assert self.regions == [(200, 100, 280, 220)]
+
+    def test_last_hit_searched_first(self):
+        """After a hit, only the area around it is captured and searched"""
+        self.matcher.locate("merge.png", 0.9)
+        self.regions.clear()
+
+        match = self.matcher.locate("merge.png", 0.9)
+
+        assert (match.left, match.top) == (301, 187)
+        assert self.regions == [(237, 123, 224, 156)]
+
+    def test_falls_back_to_full_search_when_button_moved(self):
+        """If the button is no longer near its last hit, the whole screen is searched"""
+        self.matcher.locate("merge.png", 0.9)
+        self.screen = _synthetic_screen()
+        _draw_button(self.screen, 20, 30)
+        self.regions.clear()
+
+        match = self.matcher.locate("merge.png", 0.9)
+
+        assert (match.left, match.top) == (20, 30)
+        assert self.regions[-1] is None
+
+
+class TestClickButtonWithPyramidMatcher:
+    """Test the image_matcher and search_region settings of _click_button_with_image"""
+
+    def setup_method(self):
+        browser_automation._template_matcher = None
+
+    def teardown_method(self):
+        browser_automation._template_matcher = None
+
+    def test_pyramid_matcher_used(self, tmp_path):
+        """image_matcher = "pyramid" uses the template matcher instead of locateOnScreen"""
+        (tmp_path / "merge_pull_request.png").write_bytes(b"png")
+        config = {"screenshot_dir": str(tmp_path), "image_matcher": "pyramid", "search_region": [0, 0, 800, 600]}
+        matcher = MagicMock()
+        matcher.locate.return_value = Match(10, 20, 30, 40, 0.99)
+        browser_automation._template_matcher = matcher
+
+        with (
+            patch("src.gh_pr_phase_monitor.browser_automation.PYAUTOGUI_AVAILABLE", True),
+            patch("src.gh_pr_phase_monitor.browser_automation.pyautogui") as mock_pyautogui,
+            patch("src.gh_pr_phase_monitor.browser_automation.time.sleep"),
+        ):
+            assert browser_automation._click_button_with_image("merge_pull_request", config) is True
+
+            mock_pyautogui.locateOnScreen.assert_not_called()
+            assert matcher.locate.call_args[0][1:] == (0.8, (0, 0, 800, 600))
+            mock_pyautogui.center.assert_called_once_with(Match(10, 20, 30, 40, 0.99))
+
+    def test_search_region_passed_to_locate_on_screen(self, tmp_path):
+        """With the default matcher, search_region is passed to locateOnScreen"""
+        (tmp_path / "merge_pull_request.png").write_bytes(b"png")
+        config = {"screenshot_dir": str(tmp_path), "search_region": [100, 200, 300, 400]}
+
+        with (
+            patch("src.gh_pr_phase_monitor.browser_automation.PYAUTOGUI_AVAILABLE", True),
+            patch("src.gh_pr_phase_monitor.browser_automation.pyautogui") as mock_pyautogui,
+            patch("src.gh_pr_phase_monitor.browser_automation.time.sleep"),
+        ):
+            browser_automation._click_button_with_image("merge_pull_request", config)
+
+            assert mock_pyautogui.locateOnScreen.call_args[1]["region"] == (100, 200, 300, 400)
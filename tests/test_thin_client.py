@@ -0,0 +1,100 @@
+"""
+Tests for the thin client mode
+"""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src.gh_pr_phase_monitor import control_api
+from src.gh_pr_phase_monitor.control_api import configure_control_api, publish_state, stop_control_api
+from src.gh_pr_phase_monitor.thin_client import ThinClient, ThinClientState, is_thin_client_enabled, read_events
+
+PR = {
+    "url": "https://github.com/o/repo/pull/1",
+    "title": "Fix",
+    "repository": {"name": "repo", "owner": "o"},
+}
+
+
+def _entry(url, phase):
+    return {"url": url, "title": "Fix", "repository": "o/repo", "phase": phase, "entered_phase_at": None}
+
+
+class TestReadEvents:
+    def test_parses_events_and_skips_comments(self):
+        """Events are split on blank lines; keep-alive comments are ignored"""
+        lines = [b"event: snapshot\n", b'data: {"prs": []}\n', b"\n", b": keepalive\n", b"\n", b"data: x\r\n", b"\n"]
+
+        assert list(read_events(lines)) == [("snapshot", '{"prs": []}'), ("message", "x")]
+
+
+class TestThinClientState:
+    def test_snapshot_then_delta(self):
+        """A delta replaces changed PRs and drops removed ones"""
+        state = ThinClientState()
+        state.apply("snapshot", {"check": 1, "prs": [_entry("u1", "phase1"), _entry("u2", "phase2")]})
+        state.apply("delta", {"check": 2, "changed": [_entry("u1", "phase3")], "removed": ["u2"]})
+
+        all_prs, phases = state.prs_and_phases()
+        assert [(pr["url"], pr["repository"]) for pr in all_prs] == [("u1", {"owner": "o", "name": "repo"})]
+        assert phases == ["phase3"]
+        assert state.info == {"check": 2}
+
+    def test_enabled_by_server(self):
+        assert is_thin_client_enabled({"thin_client": {"server": "http://desktop:8765"}})
+        assert not is_thin_client_enabled({})
+
+
+class TestThinClientWithServer:
+    @pytest.fixture
+    def server_url(self):
+        configure_control_api({"control_api": {"enabled": True, "port": 0}})
+        host, port = control_api._server.server_address[:2]
+        yield f"http://{host}:{port}"
+        stop_control_api()
+
+    def test_follows_server_and_opens_phase3_locally(self, server_url):
+        """The client renders the server's PRs and opens phase3 PRs in the local browser once"""
+        publish_state([PR], ["phase2"], 1)
+        client = ThinClient({"thin_client": {"server": server_url}})
+        opened = []
+        with (
+            patch(
+                "src.gh_pr_phase_monitor.thin_client.open_browser",
+                side_effect=lambda url, config: opened.append(url) or True,
+            ),
+            patch("builtins.print"),
+        ):
+            follower = threading.Thread(target=client.follow)
+            follower.start()
+            deadline = time.monotonic() + 5
+            while not control_api._subscribers and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+            publish_state([PR], ["phase3"], 2)
+            publish_state([PR], ["phase3"], 3)
+            while client.state.info.get("check") != 3 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            # Closing the server ends the stream
+            stop_control_api()
+            follower.join(5)
+
+        assert not follower.is_alive()
+        assert [entry["phase"] for entry in client.state.prs.values()] == ["phase3"]
+        assert opened == [PR["url"]]
+
+    def test_reconnects_after_errors(self):
+        """Connection errors are reported and retried after reconnect_interval"""
+        client = ThinClient({"thin_client": {"server": "http://127.0.0.1:9", "reconnect_interval": "1s"}})
+        with (
+            patch.object(client, "follow", side_effect=OSError("refused")) as mock_follow,
+            patch("src.gh_pr_phase_monitor.thin_client.time.sleep") as mock_sleep,
+            patch("builtins.print"),
+        ):
+            client.run(max_connections=2)
+
+        assert mock_follow.call_count == 2
+        mock_sleep.assert_called_once_with(1)
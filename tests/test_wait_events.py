@@ -0,0 +1,132 @@
+"""
+Tests for the event-driven wait
+"""
+
+import os
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src.gh_pr_phase_monitor import wait_events
+from src.gh_pr_phase_monitor.wait_events import (
+    ConfigWatcher,
+    WakeupPipe,
+    get_wakeup_pipe,
+    request_immediate_check,
+    wait_for_events,
+)
+from src.gh_pr_phase_monitor.wait_handler import wait_with_countdown
+
+pytestmark = pytest.mark.skipif(
+    not wait_events.is_event_driven_wait_supported(), reason="The event-driven wait needs select() on pipes"
+)
+
+
+@pytest.fixture(autouse=True)
+def drained_wakeup_pipe():
+    get_wakeup_pipe().drain()
+    yield
+    get_wakeup_pipe().drain()
+
+
+class TestWakeupPipe:
+    def test_wake_makes_pipe_readable(self):
+        """wait_for_events returns as soon as wake() is called, and drain() consumes the wakeup"""
+        pipe = WakeupPipe()
+        assert wait_for_events([pipe], 0) == []
+
+        pipe.wake()
+        assert wait_for_events([pipe], 5) == [pipe]
+        assert pipe.drain() is True
+        assert pipe.drain() is False
+
+
+class TestConfigWatcher:
+    def test_write_to_config_file_is_reported(self, tmp_path):
+        """Writing the config file makes the watcher readable; other files in the directory are ignored"""
+        config_path = tmp_path / "config.toml"
+        config_path.write_text('interval = "1m"\n')
+        watcher = ConfigWatcher.create(str(config_path))
+        if watcher is None:
+            pytest.skip("inotify is not available")
+
+        try:
+            (tmp_path / "other.txt").write_text("x")
+            assert wait_for_events([watcher], 5) == [watcher]
+            assert watcher.drain() is False
+
+            config_path.write_text('interval = "2m"\n')
+            assert wait_for_events([watcher], 5) == [watcher]
+            assert watcher.drain() is True
+        finally:
+            watcher.close()
+
+
+class TestEventDrivenWait:
+    def test_immediate_check_ends_wait(self):
+        """request_immediate_check() from another thread ends a long wait right away"""
+        threading.Timer(0.2, request_immediate_check).start()
+
+        started = time.monotonic()
+        with patch("builtins.print"):
+            config, interval_seconds, interval_str, mtime = wait_with_countdown(30, "30s", event_driven=True)
+
+        assert time.monotonic() - started < 5
+        assert (config, interval_seconds, interval_str, mtime) == ({}, 30, "30s", 0.0)
+
+    def test_config_change_reloaded(self, tmp_path):
+        """A config change during the wait is reloaded without waiting for a polling tick"""
+        config_path = tmp_path / "config.toml"
+        config_path.write_text('interval = "1m"\n')
+        initial_mtime = os.path.getmtime(config_path)
+
+        def modify():
+            config_path.write_text('interval = "2m"\n')
+            # Make sure the mtime changes even on filesystems with coarse timestamps
+            os.utime(config_path, (initial_mtime + 1, initial_mtime + 1))
+
+        threading.Timer(0.2, modify).start()
+        with (
+            patch("builtins.print"),
+            patch.object(wait_events, "CONFIG_POLL_INTERVAL_SECONDS", 0.1),
+            patch("src.gh_pr_phase_monitor.wait_handler.CONFIG_POLL_INTERVAL_SECONDS", 0.1),
+        ):
+            config, interval_seconds, interval_str, mtime = wait_with_countdown(
+                1, "1s", str(config_path), initial_mtime, event_driven=True
+            )
+
+        assert interval_seconds == 120
+        assert interval_str == "2m"
+        assert config["interval"] == "2m"
+        assert mtime == initial_mtime + 1
+
+    def test_non_tty_countdown_not_redrawn(self):
+        """Without a terminal, the countdown is printed as a plain line, not redrawn every second"""
+        with (
+            patch("builtins.print") as mock_print,
+            patch("src.gh_pr_phase_monitor.wait_handler.sys.stdout.isatty", return_value=False),
+        ):
+            wait_with_countdown(2, "2s", event_driven=True)
+
+        printed = [str(call.args[0]) if call.args else "" for call in mock_print.call_args_list]
+        countdown_lines = [line for line in printed if line.startswith("Waiting") and "until next check" not in line]
+        assert len(countdown_lines) == 1
+        assert not any("\r" in line for line in printed)
+
+    def test_browser_worker_polled_during_wait(self):
+        """While browser worker jobs are pending, their results are collected during the wait"""
+        with (
+            patch("builtins.print"),
+            patch("src.gh_pr_phase_monitor.wait_handler.sys.stdout.isatty", return_value=False),
+            patch("src.gh_pr_phase_monitor.wait_handler.BROWSER_WORKER_POLL_SECONDS", 0.1),
+            patch(
+                "src.gh_pr_phase_monitor.wait_handler.get_pending_browser_jobs",
+                return_value=[("merge", "https://github.com/o/repo/pull/1")],
+            ),
+            patch("src.gh_pr_phase_monitor.wait_handler.poll_browser_worker") as mock_poll,
+        ):
+            wait_with_countdown(1, "1s", event_driven=True)
+
+        assert mock_poll.call_count >= 5